@@ -6,6 +6,7 @@
     InvalidOutputErrorInfo as InvalidOutputErrorInfo,
     ReloadRepositoryLocationInfo as ReloadRepositoryLocationInfo,
     ReloadRepositoryLocationStatus as ReloadRepositoryLocationStatus,
+    ReportAssetEventResult as ReportAssetEventResult,
     ShutdownRepositoryLocationInfo as ShutdownRepositoryLocationInfo,
     ShutdownRepositoryLocationStatus as ShutdownRepositoryLocationStatus,
 )
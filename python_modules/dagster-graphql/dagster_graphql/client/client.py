@@ -1,7 +1,9 @@
+import json
 from itertools import chain
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
 
 import dagster._check as check
+import requests
 import requests.exceptions
 from dagster import DagsterRunStatus
 from dagster._annotations import deprecated, public
@@ -27,6 +29,7 @@
     JobInfo,
     ReloadRepositoryLocationInfo,
     ReloadRepositoryLocationStatus,
+    ReportAssetEventResult,
     ShutdownRepositoryLocationInfo,
     ShutdownRepositoryLocationStatus,
 )
@@ -76,12 +79,13 @@ def __init__(
         self._hostname = check.str_param(hostname, "hostname")
         self._port_number = check.opt_int_param(port_number, "port_number")
         self._use_https = check.bool_param(use_https, "use_https")
+        self._timeout = timeout
+        self._headers = check.opt_dict_param(headers, "headers", key_type=str, value_type=str)
 
-        self._url = (
-            ("https://" if self._use_https else "http://")
-            + (f"{self._hostname}:{self._port_number}" if self._port_number else self._hostname)
-            + "/graphql"
+        self._base_url = ("https://" if self._use_https else "http://") + (
+            f"{self._hostname}:{self._port_number}" if self._port_number else self._hostname
         )
+        self._url = self._base_url + "/graphql"
 
         self._transport = check.opt_inst_param(
             transport,
@@ -440,3 +444,59 @@ def terminate_runs(self, run_ids: List[str]):
                 raise DagsterGraphQLClientError(
                     "TerminateRunsError", f"All run terminations failed: {errors}"
                 )
+
+    def report_asset_events(
+        self, events: Sequence[Mapping[str, Any]], batch_size: int = 1000
+    ) -> List[ReportAssetEventResult]:
+        """Reports asset materializations, observations, and asset check evaluations that happened
+        outside of Dagster runs, in bulk. This is useful when an external system produces many
+        asset events, where reporting each one with its own request would be slow.
+
+        Events are sent in requests of `batch_size` events to the `/report_asset_events` endpoint,
+        using the `headers` and `timeout` of the client. A custom `transport` is not used.
+
+        Args:
+            events (Sequence[Mapping[str, Any]]): The events to report. Each event has a `type`,
+                one of `asset_materialization`, `asset_observation` or `asset_check_evaluation`,
+                and an `asset_key`, either a string or a list of strings. Events may also have the
+                properties supported by the `/report_asset_materialization`,
+                `/report_asset_observation` and `/report_asset_check` endpoints, respectively,
+                such as `metadata`, `partition` or `passed`.
+            batch_size (int): The maximum number of events to send in a single request.
+                Defaults to 1000.
+
+        Returns:
+            List[ReportAssetEventResult]: The result of reporting each event, in the order of
+            `events`. Invalid events are not recorded, and do not prevent valid events from being
+            recorded.
+        """
+        check.sequence_param(events, "events", of_type=Mapping)
+        check.int_param(batch_size, "batch_size")
+
+        results: List[ReportAssetEventResult] = []
+        for start in range(0, len(events), batch_size):
+            chunk = events[start : start + batch_size]
+            try:
+                response = requests.post(
+                    self._base_url + "/report_asset_events",
+                    data="\n".join(json.dumps(event) for event in chunk),
+                    headers={**self._headers, "Content-Type": "application/x-ndjson"},
+                    timeout=self._timeout,
+                )
+            except requests.exceptions.RequestException as exc:
+                raise DagsterGraphQLClientError(
+                    f"Exception occured while reporting asset events to {self._base_url}"
+                ) from exc
+
+            if response.status_code != 200:
+                raise DagsterGraphQLClientError(
+                    f"Server error with code {response.status_code} while reporting asset events",
+                    body=response.text,
+                )
+
+            results.extend(
+                ReportAssetEventResult(success=result["success"], error=result.get("error"))
+                for result in response.json()["results"]
+            )
+
+        return results
@@ -56,6 +56,20 @@ class ShutdownRepositoryLocationInfo(NamedTuple):
     message: Optional[str] = None
 
 
+class ReportAssetEventResult(NamedTuple):
+    """This class gives information about the result of reporting an asset event with
+    `DagsterGraphQLClient.report_asset_events`.
+
+    Args:
+        success (bool): Whether the event was recorded.
+        error (Optional[str], optional): the reason the event was not recorded if `success` is
+            False. Defaults to None.
+    """
+
+    success: bool
+    error: Optional[str] = None
+
+
 class JobInfo(NamedTuple):
     repository_location_name: str
     repository_name: str
@@ -1,4 +1,5 @@
 import datetime
+import os
 from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
@@ -45,6 +46,8 @@
 
 _DELIMITER = "::"
 
+MAX_EVENT_CONNECTION_SIZE = int(os.getenv("DAGSTER_UI_MAX_EVENT_CONNECTION_SIZE", "10000"))
+
 
 async def gen_run_by_id(
     graphene_info: "ResolveInfo", run_id: str
@@ -376,18 +379,37 @@ def get_logs_for_run(
     cursor: Optional[str] = None,
     limit: Optional[int] = None,
 ) -> Union["GrapheneRunNotFoundError", "GrapheneEventConnection"]:
-    from dagster_graphql.implementation.events import from_event_record
     from dagster_graphql.schema.errors import GrapheneRunNotFoundError
-    from dagster_graphql.schema.pipelines.pipeline import GrapheneEventConnection
 
     instance = graphene_info.context.instance
     run = instance.get_run_by_id(run_id)
     if not run:
         return GrapheneRunNotFoundError(run_id)
 
-    conn = instance.get_records_for_run(run_id, cursor=cursor, limit=limit)
+    return get_event_connection_for_run(instance, run_id, run.job_name, cursor, limit)
+
+
+def get_event_connection_for_run(
+    instance: DagsterInstance,
+    run_id: str,
+    job_name: str,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> "GrapheneEventConnection":
+    from dagster_graphql.implementation.events import from_event_record
+    from dagster_graphql.schema.pipelines.pipeline import GrapheneEventConnection
+
+    # Without a limit, return at most a bounded number of events, so that the log of a very large
+    # run is never loaded into memory at once. The returned cursor and hasMore let clients fetch
+    # the rest of the log.
+    conn = instance.get_records_for_run(
+        run_id, cursor=cursor, limit=limit or MAX_EVENT_CONNECTION_SIZE
+    )
     return GrapheneEventConnection(
-        events=[from_event_record(record.event_log_entry, run.job_name) for record in conn.records],
+        events=[
+            from_event_record(event_record.event_log_entry, job_name)
+            for event_record in conn.records
+        ],
         cursor=conn.cursor,
         hasMore=conn.has_more,
     )
@@ -24,11 +24,16 @@
 from dagster._utils.tags import get_boolean_tag_value
 from dagster._utils.yaml_utils import dump_run_config_yaml
 
-from dagster_graphql.implementation.events import from_event_record, iterate_metadata_entries
+from dagster_graphql.implementation.events import iterate_metadata_entries
 from dagster_graphql.implementation.fetch_asset_checks import get_asset_checks_for_run_id
 from dagster_graphql.implementation.fetch_assets import get_assets_for_run, get_unique_asset_id
 from dagster_graphql.implementation.fetch_pipelines import get_job_reference_or_raise
-from dagster_graphql.implementation.fetch_runs import get_runs, get_stats, get_step_stats
+from dagster_graphql.implementation.fetch_runs import (
+    get_event_connection_for_run,
+    get_runs,
+    get_stats,
+    get_step_stats,
+)
 from dagster_graphql.implementation.fetch_schedules import get_schedules_for_pipeline
 from dagster_graphql.implementation.fetch_sensors import get_sensors_for_pipeline
 from dagster_graphql.implementation.utils import (
@@ -564,16 +569,12 @@ def resolve_assetMaterializations(self, graphene_info: ResolveInfo):
         ]
 
     def resolve_eventConnection(self, graphene_info: ResolveInfo, afterCursor=None, limit=None):
-        conn = graphene_info.context.instance.get_records_for_run(
-            self.run_id, cursor=afterCursor, limit=limit
-        )
-        return GrapheneEventConnection(
-            events=[
-                from_event_record(record.event_log_entry, self.dagster_run.job_name)
-                for record in conn.records
-            ],
-            cursor=conn.cursor,
-            hasMore=conn.has_more,
+        return get_event_connection_for_run(
+            graphene_info.context.instance,
+            self.run_id,
+            self.dagster_run.job_name,
+            cursor=afterCursor,
+            limit=limit,
         )
 
     def resolve_startTime(self, graphene_info: ResolveInfo):
@@ -0,0 +1,52 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from dagster_graphql import DagsterGraphQLClientError, ReportAssetEventResult
+
+from dagster_graphql_tests.client_tests.conftest import MockClient, python_client_test_suite
+
+
+def _response(status_code: int, results=None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = {"results": results or []}
+    return response
+
+
+@python_client_test_suite
+def test_report_asset_events_success(mock_client: MockClient):
+    events = [
+        {"type": "asset_materialization", "asset_key": ["a", "b"], "metadata": {"rows": 1}},
+        {"type": "asset_observation", "asset_key": "c"},
+        {"type": "asset_check_evaluation", "asset_key": "c", "check_name": "d"},
+    ]
+
+    with patch("dagster_graphql.client.client.requests.post") as mock_post:
+        mock_post.side_effect = [
+            _response(200, [{"success": True}, {"success": True}]),
+            _response(200, [{"success": False, "error": "Missing required parameter 'passed'."}]),
+        ]
+        results = mock_client.python_client.report_asset_events(events, batch_size=2)
+
+    assert results == [
+        ReportAssetEventResult(success=True),
+        ReportAssetEventResult(success=True),
+        ReportAssetEventResult(success=False, error="Missing required parameter 'passed'."),
+    ]
+
+    assert mock_post.call_count == 2
+    first_call = mock_post.call_args_list[0]
+    assert first_call.args == ("http://localhost/report_asset_events",)
+    assert first_call.kwargs["headers"]["Content-Type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in first_call.kwargs["data"].split("\n")] == events[:2]
+
+
+@python_client_test_suite
+def test_report_asset_events_server_error(mock_client: MockClient):
+    with patch("dagster_graphql.client.client.requests.post") as mock_post:
+        mock_post.return_value = _response(400)
+        with pytest.raises(DagsterGraphQLClientError):
+            mock_client.python_client.report_asset_events(
+                [{"type": "asset_observation", "asset_key": "c"}]
+            )
@@ -2,12 +2,14 @@
 import time
 import uuid
 from typing import Any, Optional
+from unittest import mock
 
 from dagster._core.storage.dagster_run import RunsFilter
 from dagster._core.test_utils import wait_for_runs_to_finish
 from dagster._core.utils import make_new_run_id
 from dagster._core.workspace.context import WorkspaceRequestContext
 from dagster._utils import file_relative_path
+from dagster_graphql.implementation import fetch_runs
 from dagster_graphql.client.query import (
     LAUNCH_PIPELINE_EXECUTION_MUTATION,
     METADATA_ENTRY_FRAGMENT,
@@ -76,6 +78,21 @@
     + METADATA_ENTRY_FRAGMENT
 )
 
+RUN_EVENTS_PAGE_QUERY = """
+query pipelineRunEventsPage($runId: ID!, $cursor: String) {
+  logsForRun(runId: $runId, afterCursor: $cursor) {
+    __typename
+    ... on EventConnection {
+      events {
+        __typename
+      }
+      cursor
+      hasMore
+    }
+  }
+}
+"""
+
 
 class TestExecutePipeline(ExecutingGraphQLContextTestMatrix):
     def test_start_pipeline_execution(self, graphql_context: WorkspaceRequestContext):
@@ -393,6 +410,50 @@ def test_basic_start_pipeline_and_fetch(self, graphql_context: WorkspaceRequestC
             or non_engine_event_types == self._legacy_csv_hello_world_event_sequence()
         )
 
+    def test_logs_for_run_without_limit_are_bounded(
+        self, graphql_context: WorkspaceRequestContext
+    ):
+        selector = infer_job_selector(graphql_context, "csv_hello_world")
+        exc_result = execute_dagster_graphql(
+            graphql_context,
+            LAUNCH_PIPELINE_EXECUTION_MUTATION,
+            variables={
+                "executionParams": {
+                    "selector": selector,
+                    "runConfigData": csv_hello_world_ops_config(),
+                }
+            },
+        )
+        assert exc_result.data["launchPipelineExecution"]["__typename"] == "LaunchRunSuccess"
+        run_id = exc_result.data["launchPipelineExecution"]["run"]["runId"]
+        wait_for_runs_to_finish(graphql_context.instance)
+
+        def _fetch_events(cursor):
+            events_result = execute_dagster_graphql(
+                graphql_context,
+                RUN_EVENTS_PAGE_QUERY,
+                variables={"runId": run_id, "cursor": cursor},
+            )
+            assert not events_result.errors
+            assert events_result.data["logsForRun"]["__typename"] == "EventConnection"
+            return events_result.data["logsForRun"]
+
+        all_event_types = [event["__typename"] for event in _fetch_events(None)["events"]]
+        assert len(all_event_types) > 3
+
+        paged_event_types = []
+        cursor = None
+        with mock.patch.object(fetch_runs, "MAX_EVENT_CONNECTION_SIZE", 3):
+            while True:
+                connection = _fetch_events(cursor)
+                assert len(connection["events"]) <= 3
+                paged_event_types.extend(event["__typename"] for event in connection["events"])
+                cursor = connection["cursor"]
+                if not connection["hasMore"]:
+                    break
+
+        assert paged_event_types == all_event_types
+
     def test_basic_start_pipeline_and_poll(self, graphql_context: WorkspaceRequestContext):
         selector = infer_job_selector(graphql_context, "csv_hello_world")
         exc_result = execute_dagster_graphql(
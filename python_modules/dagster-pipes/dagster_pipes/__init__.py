@@ -4,6 +4,7 @@
 import json
 import logging
 import os
+import socket
 import sys
 import time
 import warnings
@@ -12,7 +13,7 @@
 from contextlib import ExitStack, contextmanager
 from io import StringIO
 from queue import Queue
-from threading import Event, Thread
+from threading import Event, Lock, Thread
 from traceback import TracebackException
 from typing import (
     IO,
@@ -23,6 +24,7 @@
     Generic,
     Iterable,
     Iterator,
+    List,
     Literal,
     Mapping,
     Optional,
@@ -678,10 +680,13 @@ class PipesDefaultMessageWriter(PipesMessageWriter):
     The write location is configured by the params received by the writer. If the params include a
     key `path`, then messages will be written to a file at the specified path. If the params instead
     include a key `stdio`, then messages then the corresponding value must specify either `stderr`
-    or `stdout`, and messages will be written to the selected stream.
+    or `stdout`, and messages will be written to the selected stream. If the params include a key
+    `socket`, then messages will be written to the Unix domain socket at the specified path, as by
+    :py:class:`PipesSocketMessageWriter`.
     """
 
     FILE_PATH_KEY = "path"
+    SOCKET_PATH_KEY = "socket"
     STDIO_KEY = "stdio"
     BUFFERED_STDIO_KEY = "buffered_stdio"
     STDERR = "stderr"
@@ -720,6 +725,10 @@ def open(self, params: PipesParams) -> Iterator[PipesMessageWriterChannel]:
             finally:
                 channel.flush()
 
+        elif self.SOCKET_PATH_KEY in params:
+            with PipesSocketMessageWriter().open(params) as socket_channel:
+                yield socket_channel
+
         else:
             raise DagsterPipesError(
                 f'Invalid params for {self.__class__.__name__}, expected key "path" or "std",'
@@ -835,6 +844,134 @@ def load_messages_params(self) -> PipesParams:
         return decode_param(args.dagster_pipes_messages)
 
 
+# ########################
+# ##### IO - SOCKET
+# ########################
+
+
+class PipesSocketMessageWriter(PipesMessageWriter["PipesSocketMessageWriterChannel"]):
+    """Message writer that writes messages to a Unix domain socket, for use with the
+    orchestration-side :py:class:`~dagster.PipesSocketMessageReader`.
+
+    Messages are sent in batches, so that processes that report many messages do not pay for a
+    write per message. A batch is sent once it holds `batch_size` messages, or `interval` seconds
+    after its first message was written. Writing a message blocks while the orchestration process
+    is too far behind in reading messages.
+
+    On close, the writer sends any remaining messages and then waits for the orchestration process
+    to acknowledge that it has read all of them.
+
+    Args:
+        batch_size (int): The maximum number of messages to send at once.
+        interval (float): The maximum number of seconds a message is held before it is sent.
+    """
+
+    SOCKET_PATH_KEY = "socket"
+
+    def __init__(self, *, batch_size: int = 100, interval: float = 0.1):
+        self.batch_size = batch_size
+        self.interval = interval
+
+    @contextmanager
+    def open(self, params: PipesParams) -> Iterator["PipesSocketMessageWriterChannel"]:
+        """Connect to the socket specified by the params and yield a channel that writes to it.
+
+        Args:
+            params (PipesParams): The params provided by the message reader in the orchestration
+                process.
+
+        Yields:
+            PipesSocketMessageWriterChannel: Channel that writes messages to the socket.
+        """
+        path = _assert_env_param_type(params, self.SOCKET_PATH_KEY, str, self.__class__)
+        channel = PipesSocketMessageWriterChannel(
+            path, batch_size=self.batch_size, interval=self.interval
+        )
+        try:
+            yield channel
+        finally:
+            channel.close()
+
+
+class PipesSocketMessageWriterChannel(PipesMessageWriterChannel):
+    """Message writer channel that writes batches of messages, one message per line, to a Unix
+    domain socket.
+
+    Args:
+        path (str): The path of the socket to connect to.
+        batch_size (int): The maximum number of messages to send at once.
+        interval (float): The maximum number of seconds a message is held before it is sent.
+        close_timeout (float): The maximum number of seconds to wait on close for the orchestration
+            process to acknowledge that it has read all messages.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        batch_size: int = 100,
+        interval: float = 0.1,
+        close_timeout: float = 60,
+    ):
+        if not hasattr(socket, "AF_UNIX"):
+            raise DagsterPipesError("Unix domain sockets are not supported on this platform.")
+
+        self._batch_size = batch_size
+        self._close_timeout = close_timeout
+        self._buffer: List[str] = []
+        self._lock = Lock()
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(path)
+
+        self._is_closed = Event()
+        self._flush_thread = Thread(target=self._flush_loop, args=(interval,), daemon=True)
+        self._flush_thread.start()
+
+    def write_message(self, message: PipesMessage) -> None:
+        line = json.dumps(message)
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) >= self._batch_size:
+                self._send_buffer()
+
+    def flush(self) -> None:
+        """Send all buffered messages."""
+        with self._lock:
+            self._send_buffer()
+
+    def close(self) -> None:
+        """Send all buffered messages, signal the end of the stream, and wait for the orchestration
+        process to acknowledge it by closing its end of the socket.
+        """
+        self._is_closed.set()
+        self._flush_thread.join()
+        try:
+            self.flush()
+            self._socket.shutdown(socket.SHUT_WR)
+            self._socket.settimeout(self._close_timeout)
+            while self._socket.recv(4096):
+                pass
+        except OSError:
+            # the orchestration process has already closed the socket
+            pass
+        finally:
+            self._socket.close()
+
+    def _send_buffer(self) -> None:
+        if self._buffer:
+            # sendall blocks while the socket buffer is full, which applies backpressure when
+            # the orchestration process is not keeping up with the messages
+            self._socket.sendall(("\n".join(self._buffer) + "\n").encode("utf-8"))
+            self._buffer = []
+
+    def _flush_loop(self, interval: float) -> None:
+        while not self._is_closed.wait(interval):
+            try:
+                self.flush()
+            except OSError:
+                return
+
+
 # ########################
 # ##### IO - S3
 # ########################
@@ -0,0 +1,149 @@
+# ruff: noqa: T201
+import argparse
+import time
+from collections import deque
+from typing import List
+
+from dagster import DynamicOut, DynamicOutput, job, op
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.active import ActiveExecution
+from dagster._core.execution.plan.objects import StepSuccessData
+from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
+from dagster._core.execution.retries import RetryMode
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the scheduling overhead of `ActiveExecution` for a plan with a dynamic fan-out of N mapped
+steps, followed by a collect step:
+
+    (emit) --[N mapping keys]--> (process[0..N-1]) ----> (collect)
+
+N is configurable via the `--num-steps` arg. No ops are actually executed; the benchmark drives the
+`ActiveExecution` state machine directly with step output and success events, in the same way the
+multiprocess and step-delegating executors do. Per-completion cost is reported for the first and last
+`--sample-size` mapped step completions, which should be roughly constant regardless of N.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="active_execution",
+    description=DESC,
+)
+
+parser.add_argument("--num-steps", type=int, default=50000, help="Number of mapped steps.")
+parser.add_argument(
+    "--sample-size",
+    type=int,
+    default=1000,
+    help="Number of completions to time at the start and end of the mapped steps.",
+)
+parser.add_argument(
+    "--max-concurrent", type=int, default=8, help="Maximum number of steps in flight at once."
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+@op(out=DynamicOut())
+def emit():
+    yield DynamicOutput(0, mapping_key="0")
+
+
+@op
+def process(x):
+    return x
+
+
+@op
+def collect(xs):
+    return xs
+
+
+@job
+def fan_out_job():
+    collect(emit().map(process).collect())
+
+
+def _success_event(step_key: str) -> DagsterEvent:
+    return DagsterEvent(
+        DagsterEventType.STEP_SUCCESS.value,
+        job_name=fan_out_job.name,
+        event_specific_data=StepSuccessData(duration_ms=1.0),
+        step_key=step_key,
+    )
+
+
+def _output_event(step_key: str, mapping_key: str) -> DagsterEvent:
+    return DagsterEvent(
+        DagsterEventType.STEP_OUTPUT.value,
+        job_name=fan_out_job.name,
+        event_specific_data=StepOutputData(
+            StepOutputHandle(step_key=step_key, output_name="result", mapping_key=mapping_key)
+        ),
+        step_key=step_key,
+    )
+
+
+def _complete(active_execution: ActiveExecution, step_key: str) -> None:
+    active_execution.handle_event(
+        DagsterEvent(
+            DagsterEventType.STEP_START.value, job_name=fan_out_job.name, step_key=step_key
+        )
+    )
+    active_execution.handle_event(_output_event(step_key, None))  # type: ignore
+    active_execution.handle_event(_success_event(step_key))
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_steps: int, sample_size: int, max_concurrent: int) -> None:
+    session = ProfilingSession(
+        name="ActiveExecution dynamic fan-out",
+        experiment_settings={
+            "num_steps": num_steps,
+            "sample_size": sample_size,
+            "max_concurrent": max_concurrent,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    with session.logged_execution_time("Create execution plan"):
+        plan = create_execution_plan(fan_out_job)
+
+    completion_times: List[float] = []
+    with plan.start(RetryMode.DISABLED, max_concurrent=max_concurrent) as active_execution:
+        with session.logged_execution_time(f"Resolve {num_steps} mapped steps"):
+            [emit_step] = active_execution.get_steps_to_execute()
+            for i in range(num_steps):
+                active_execution.handle_event(_output_event(emit_step.key, str(i)))
+            active_execution.handle_event(_success_event(emit_step.key))
+
+        with session.logged_execution_time(f"Execute {num_steps} mapped steps and collect"):
+            in_flight = deque(active_execution.get_steps_to_execute())
+            while in_flight:
+                step = in_flight.popleft()
+                start = time.perf_counter()
+                _complete(active_execution, step.key)
+                in_flight.extend(active_execution.get_steps_to_execute())
+                completion_times.append(time.perf_counter() - start)
+
+    session.log_result_summary()
+
+    # the last completion is the collect step
+    mapped_times = completion_times[:num_steps]
+    first = mapped_times[:sample_size]
+    last = mapped_times[-sample_size:]
+    print(f"Mean cost of the first {len(first)} completions: {sum(first) / len(first) * 1e6:.1f}us")
+    print(f"Mean cost of the last {len(last)} completions: {sum(last) / len(last) * 1e6:.1f}us")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_steps, args.sample_size, args.max_concurrent)
@@ -0,0 +1,259 @@
+# ruff: noqa: T201
+import argparse
+import time
+from enum import Enum
+from typing import Any, Callable, List, Mapping, Optional
+
+from dagster import Config, ConfigurableResource, Definitions, In, Nothing, job, op
+from dagster._config import ConfigType, EvaluateValueResult, Shape
+from dagster._config.post_process import post_process_config
+from dagster._config.validate import process_config, validate_config_from_snap
+from dagster._core.instance.config import dagster_instance_config_schema
+from dagster._core.test_utils import environ
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the time spent validating config and resolving its defaults, comparing the compiled config
+programs used by `process_config` against the recursive interpreter in `validate.py` and
+`post_process.py` that they replace for valid config.
+
+Two schemas are used:
+
+- `run config`: the run config schema of a job with `--num-ops` ops and `--num-resources`
+  resources, all configured with nested Pythonic config, and a run config that configures every
+  op and resource, as built for every run launch and in every step worker.
+- `instance config`: the schema of `dagster.yaml`, and a representative instance config.
+
+Each config value is processed `--iterations` times by each strategy.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="config_validation",
+    description=DESC,
+)
+
+parser.add_argument("--num-ops", type=int, default=100, help="Number of configured ops.")
+parser.add_argument("--num-resources", type=int, default=20, help="Number of configured resources.")
+parser.add_argument(
+    "--iterations", type=int, default=50, help="Number of times each config is processed."
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+class Mode(Enum):
+    FULL = "FULL"
+    INCREMENTAL = "INCREMENTAL"
+
+
+class ColumnConfig(Config):
+    name: str
+    dtype: str = "string"
+    nullable: bool = True
+    tests: List[str] = []
+
+
+class TableConfig(Config):
+    schema_name: str
+    table: str
+    mode: Mode = Mode.FULL
+    columns: List[ColumnConfig]
+    partition_column: Optional[str] = None
+    options: Mapping[str, str] = {}
+
+
+class OpConfig(Config):
+    source: TableConfig
+    destination: TableConfig
+    batch_size: int = 10000
+    sample_rate: float = 1.0
+    dry_run: bool = False
+
+
+class WarehouseResource(ConfigurableResource):
+    account: str
+    user: str
+    password: str
+    warehouse: Optional[str] = None
+    role: str = "TRANSFORMER"
+    connect_timeout: int = 30
+    session_parameters: Mapping[str, str] = {}
+
+
+def get_run_config_schema_and_value(num_ops: int, num_resources: int):
+    def _make_op(i: int):
+        @op(
+            name=f"op_{i}",
+            ins={"start": In(Nothing)},
+            required_resource_keys={f"warehouse_{i % num_resources}"},
+        )
+        def _op(config: OpConfig) -> None: ...
+
+        return _op
+
+    ops = [_make_op(i) for i in range(num_ops)]
+
+    @job
+    def benchmark_job():
+        for _op in ops:
+            _op()
+
+    resources = {
+        f"warehouse_{i}": WarehouseResource.configure_at_launch() for i in range(num_resources)
+    }
+    defs = Definitions(jobs=[benchmark_job], resources=resources)
+    job_def = defs.get_job_def("benchmark_job")
+
+    def _table_config(i: int) -> Mapping[str, Any]:
+        return {
+            "schema_name": "analytics",
+            "table": f"table_{i}",
+            "mode": "INCREMENTAL",
+            "columns": [
+                {"name": f"column_{j}", "tests": ["not_null", "unique"]} for j in range(10)
+            ],
+            "options": {"compression": "zstd"},
+        }
+
+    run_config = {
+        "ops": {
+            f"op_{i}": {
+                "config": {
+                    "source": _table_config(i),
+                    "destination": _table_config(i),
+                    "batch_size": 5000,
+                }
+            }
+            for i in range(num_ops)
+        },
+        "resources": {
+            f"warehouse_{i}": {
+                "config": {
+                    "account": "benchmark",
+                    "user": "dagster",
+                    "password": {"env": "BENCHMARK_WAREHOUSE_PASSWORD"},
+                    "session_parameters": {"QUERY_TAG": "benchmark"},
+                }
+            }
+            for i in range(num_resources)
+        },
+        "execution": {"config": {"multiprocess": {"max_concurrent": 4}}},
+    }
+    return job_def.run_config_schema.run_config_schema_type, run_config
+
+
+def get_instance_config_schema_and_value():
+    instance_config = {
+        "run_coordinator": {
+            "module": "dagster.core.run_coordinator",
+            "class": "QueuedRunCoordinator",
+            "config": {
+                "max_concurrent_runs": 25,
+                "tag_concurrency_limits": [{"key": "database", "value": "redshift", "limit": 4}],
+            },
+        },
+        "run_launcher": {
+            "module": "dagster_k8s.launcher",
+            "class": "K8sRunLauncher",
+            "config": {"service_account_name": "dagster", "job_namespace": "dagster"},
+        },
+        "storage": {
+            "postgres": {
+                "postgres_db": {
+                    "username": "dagster",
+                    "password": {"env": "BENCHMARK_WAREHOUSE_PASSWORD"},
+                    "hostname": "localhost",
+                    "db_name": "dagster",
+                    "port": 5432,
+                }
+            }
+        },
+        "run_monitoring": {"enabled": True, "start_timeout_seconds": 180},
+        "run_retries": {"enabled": True, "max_retries": 3},
+        "retention": {"schedule": {"purge_after_days": 90}},
+        "sensors": {"use_threads": True, "num_workers": 8},
+        "schedules": {"use_threads": True, "num_workers": 8},
+        "telemetry": {"enabled": False},
+    }
+    return Shape(dagster_instance_config_schema()), instance_config
+
+
+def process_config_interpreted(config_type: ConfigType, config_value: Any) -> EvaluateValueResult:
+    validate_evr = validate_config_from_snap(
+        config_schema_snapshot=config_type.get_schema_snapshot(),
+        config_type_key=config_type.key,
+        config_value=config_value,
+    )
+    if not validate_evr.success:
+        return validate_evr
+    return post_process_config(config_type, validate_evr.value)
+
+
+def time_processing(
+    fn: Callable[[ConfigType, Any], EvaluateValueResult],
+    config_type: ConfigType,
+    config_value: Any,
+    iterations: int,
+) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        evr = fn(config_type, config_value)
+        assert evr.success, evr.errors
+    return (time.perf_counter() - start) / iterations
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_ops: int, num_resources: int, iterations: int) -> None:
+    session = ProfilingSession(
+        name="config validation",
+        experiment_settings={
+            "num_ops": num_ops,
+            "num_resources": num_resources,
+            "iterations": iterations,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    with session.logged_execution_time("Build schemas"):
+        schemas = {
+            "run config": get_run_config_schema_and_value(num_ops, num_resources),
+            "instance config": get_instance_config_schema_and_value(),
+        }
+
+    results = {}
+    with environ({"BENCHMARK_WAREHOUSE_PASSWORD": "hunter2"}):
+        for label, (config_type, config_value) in schemas.items():
+            with session.logged_execution_time(f"Compile {label} program"):
+                config_type.get_compiled_program()
+
+            expected = process_config_interpreted(config_type, config_value)
+            assert process_config(config_type, config_value).value == expected.value
+
+            with session.logged_execution_time(f"Process {label} ({iterations} iterations)"):
+                results[label] = (
+                    time_processing(
+                        process_config_interpreted, config_type, config_value, iterations
+                    ),
+                    time_processing(process_config, config_type, config_value, iterations),
+                )
+
+    session.log_result_summary()
+
+    for label, (interpreted, compiled) in results.items():
+        print(
+            f"{label}: interpreted {interpreted * 1e3:.3f}ms, compiled {compiled * 1e3:.3f}ms"
+            f" ({interpreted / compiled:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_ops, args.num_resources, args.iterations)
@@ -0,0 +1,170 @@
+# ruff: noqa: T201
+import argparse
+import os
+import time
+from typing import List
+
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.instance import DagsterInstance
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.remote_representation.origin import (
+    GrpcServerCodeLocationOrigin,
+    RemoteJobOrigin,
+    RemoteRepositoryOrigin,
+)
+from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus
+from dagster._core.storage.tags import PRIORITY_TAG
+from dagster._core.utils import make_new_run_id
+from dagster._daemon.run_coordinator import QueuedRunCoordinatorDaemon
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the time the QueuedRunCoordinatorDaemon spends picking the runs to launch from a large run
+queue. `--num-runs` runs are queued up front, spread over `--num-databases` values of a `database`
+tag that has a tag concurrency limit, with a mix of priorities. Each iteration picks up to
+`--max-concurrent-runs` runs to launch, which are then marked as finished before the next
+iteration, as if they had completed.
+
+The daemon is run once with its default run queue index, which only fetches the runs updated since
+the previous iteration, and once with an index that is fully resynced on every iteration, which
+costs about as much as paging through the entire queue.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="run_queue",
+    description=DESC,
+)
+
+parser.add_argument("--num-runs", type=int, default=50000, help="Number of queued runs.")
+parser.add_argument(
+    "--num-databases", type=int, default=20, help="Number of distinct `database` tag values."
+)
+parser.add_argument(
+    "--max-concurrent-runs", type=int, default=50, help="Maximum number of runs in progress."
+)
+parser.add_argument("--iterations", type=int, default=20, help="Number of daemon iterations.")
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def get_run_coordinator_config(num_databases: int, max_concurrent_runs: int):
+    return {
+        "module": "dagster._core.run_coordinator",
+        "class": "QueuedRunCoordinator",
+        "config": {
+            "max_concurrent_runs": max_concurrent_runs,
+            "tag_concurrency_limits": [
+                {"key": "database", "value": f"db_{i}", "limit": 2} for i in range(num_databases)
+            ],
+        },
+    }
+
+
+job_origin = RemoteJobOrigin(
+    repository_origin=RemoteRepositoryOrigin(
+        code_location_origin=GrpcServerCodeLocationOrigin(
+            host="localhost", port=4000, location_name="benchmark_location"
+        ),
+        repository_name="benchmark_repo",
+    ),
+    job_name="benchmark_job",
+)
+
+
+def queue_runs(instance: DagsterInstance, num_runs: int, num_databases: int) -> None:
+    for i in range(num_runs):
+        instance.add_run(
+            DagsterRun(
+                job_name="benchmark_job",
+                run_id=make_new_run_id(),
+                status=DagsterRunStatus.QUEUED,
+                remote_job_origin=job_origin,
+                tags={"database": f"db_{i % num_databases}", PRIORITY_TAG: str(i % 3)},
+            )
+        )
+
+
+def finish_runs(instance: DagsterInstance, runs: List[DagsterRun]) -> None:
+    for run in runs:
+        for event_type in [DagsterEventType.PIPELINE_STARTING, DagsterEventType.PIPELINE_SUCCESS]:
+            instance.handle_run_event(
+                run.run_id, DagsterEvent(event_type_value=event_type.value, job_name=run.job_name)
+            )
+
+
+def run_daemon_iterations(
+    session: ProfilingSession,
+    label: str,
+    num_runs: int,
+    num_databases: int,
+    max_concurrent_runs: int,
+    iterations: int,
+) -> float:
+    with instance_for_test(
+        overrides={
+            "run_coordinator": get_run_coordinator_config(num_databases, max_concurrent_runs)
+        }
+    ) as instance:
+        with session.logged_execution_time(f"Queue {num_runs} runs ({label})"):
+            queue_runs(instance, num_runs, num_databases)
+
+        daemon = QueuedRunCoordinatorDaemon(interval_seconds=1)
+        run_queue_config = instance.run_coordinator.get_run_queue_config()  # type: ignore
+
+        with session.logged_execution_time(f"First iteration ({label})"):
+            runs = daemon._get_runs_to_dequeue(instance, run_queue_config, None)  # noqa: SLF001
+        finish_runs(instance, runs)
+
+        elapsed = 0.0
+        for _ in range(iterations):
+            start = time.perf_counter()
+            runs = daemon._get_runs_to_dequeue(instance, run_queue_config, None)  # noqa: SLF001
+            elapsed += time.perf_counter() - start
+            finish_runs(instance, runs)
+
+        return elapsed / iterations
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_runs: int, num_databases: int, max_concurrent_runs: int, iterations: int) -> None:
+    session = ProfilingSession(
+        name="run queue",
+        experiment_settings={
+            "num_runs": num_runs,
+            "num_databases": num_databases,
+            "max_concurrent_runs": max_concurrent_runs,
+            "iterations": iterations,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    results = {}
+    results["incremental"] = run_daemon_iterations(
+        session, "incremental", num_runs, num_databases, max_concurrent_runs, iterations
+    )
+
+    os.environ["DAGSTER_RUN_QUEUE_INDEX_FULL_RESYNC_INTERVAL_SECONDS"] = "0"
+    try:
+        results["full resync"] = run_daemon_iterations(
+            session, "full resync", num_runs, num_databases, max_concurrent_runs, iterations
+        )
+    finally:
+        del os.environ["DAGSTER_RUN_QUEUE_INDEX_FULL_RESYNC_INTERVAL_SECONDS"]
+
+    session.log_result_summary()
+
+    for label, elapsed in results.items():
+        print(f"{label}: {elapsed * 1e3:.3f}ms per iteration")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_runs, args.num_databases, args.max_concurrent_runs, args.iterations)
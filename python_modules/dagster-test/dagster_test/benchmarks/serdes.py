@@ -0,0 +1,147 @@
+# ruff: noqa: T201
+import argparse
+import time
+from typing import Callable, List, Mapping, Sequence
+
+from dagster import (
+    AssetExecutionContext,
+    AssetKey,
+    Definitions,
+    MetadataValue,
+    StaticPartitionsDefinition,
+    asset,
+    materialize,
+)
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.remote_representation.external_data import RepositorySnap
+from dagster._serdes import serdes
+from dagster._serdes.serdes import deserialize_value, serialize_value
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze deserialization time for representative serialized payloads:
+
+- `EventLogEntry`: every event log entry emitted while materializing a chain of assets that log
+  metadata, as stored in the event log.
+- `DagsterRun`: the run record for that materialization, as stored in the run storage.
+- `RepositorySnap`: the snapshot of a repository with `--num-assets` partitioned assets, as
+  sent from a code server to the webserver and daemon.
+
+Each payload is deserialized `--iterations` times, once with the stdlib json parse and once with the
+orjson parse (enabled in production with `DAGSTER_SERDES_USE_ORJSON`), so the two JSON parsing
+strategies can be compared. The orjson parse is skipped when `orjson` is not installed.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="serdes",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-assets", type=int, default=200, help="Number of assets in the repository snapshot."
+)
+parser.add_argument(
+    "--iterations", type=int, default=100, help="Number of times each payload is deserialized."
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+partitions_def = StaticPartitionsDefinition([str(i) for i in range(10)])
+
+
+def _make_asset(i: int, partitioned: bool):
+    @asset(
+        name=f"asset_{i}",
+        deps=[AssetKey(f"asset_{i - 1}")] if i > 0 else [],
+        partitions_def=partitions_def if partitioned else None,
+        metadata={"owner": "benchmark", "index": i},
+    )
+    def _asset(context: AssetExecutionContext) -> None:
+        context.add_output_metadata(
+            {
+                "num_rows": MetadataValue.int(i),
+                "path": MetadataValue.path(f"/tmp/asset_{i}"),
+                "preview": MetadataValue.md(f"# asset {i}"),
+            }
+        )
+
+    return _asset
+
+
+def get_event_log_entry_payloads() -> List[str]:
+    with instance_for_test() as instance:
+        result = materialize(
+            [_make_asset(i, partitioned=False) for i in range(10)], instance=instance
+        )
+        return [serialize_value(entry) for entry in instance.all_logs(result.run_id)]
+
+
+def get_dagster_run_payloads() -> List[str]:
+    with instance_for_test() as instance:
+        result = materialize(
+            [_make_asset(0, partitioned=False)], instance=instance, tags={"team": "benchmark"}
+        )
+        return [serialize_value(instance.get_run_by_id(result.run_id))]
+
+
+def get_repository_snap_payloads(num_assets: int) -> List[str]:
+    defs = Definitions(assets=[_make_asset(i, partitioned=True) for i in range(num_assets)])
+    return [serialize_value(RepositorySnap.from_def(defs.get_repository_def()))]
+
+
+def _time_deserialize(payloads: Sequence[str], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for payload in payloads:
+            deserialize_value(payload)
+    return time.perf_counter() - start
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_assets: int, iterations: int) -> None:
+    session = ProfilingSession(
+        name="serdes deserialization",
+        experiment_settings={
+            "num_assets": num_assets,
+            "iterations": iterations,
+            "orjson_installed": serdes.orjson is not None,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    payload_fns: Mapping[str, Callable[[], List[str]]] = {
+        "EventLogEntry": get_event_log_entry_payloads,
+        "DagsterRun": get_dagster_run_payloads,
+        "RepositorySnap": lambda: get_repository_snap_payloads(num_assets),
+    }
+    payloads = {}
+    for name, fn in payload_fns.items():
+        with session.logged_execution_time(f"Build {name} payloads"):
+            payloads[name] = fn()
+
+    results = {}
+    for use_orjson in [False, True] if serdes.orjson is not None else [False]:
+        for name, serialized in payloads.items():
+            label = f"Deserialize {name} ({'orjson' if use_orjson else 'json'})"
+            serdes.set_use_orjson_for_deserialization(use_orjson)
+            with session.logged_execution_time(label):
+                results[label] = _time_deserialize(serialized, iterations)
+
+    session.log_result_summary()
+
+    for label, elapsed in results.items():
+        num_bytes = sum(len(p) for p in payloads[label.split(" ")[1]])
+        print(f"{label}: {elapsed / iterations * 1e3:.3f}ms per iteration ({num_bytes} bytes)")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.iterations)
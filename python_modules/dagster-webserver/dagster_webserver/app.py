@@ -13,6 +13,8 @@ def create_app_from_workspace_process_context(
     workspace_process_context: IWorkspaceProcessContext,
     path_prefix: str = "",
     live_data_poll_rate: Optional[int] = None,
+    max_graphql_execution_workers: Optional[int] = None,
+    loadable_cache_ttl: Optional[float] = None,
     **kwargs,
 ) -> Starlette:
     check.inst_param(
@@ -36,4 +38,6 @@ def create_app_from_workspace_process_context(
         workspace_process_context,
         path_prefix,
         live_data_poll_rate,
+        max_graphql_execution_workers=max_graphql_execution_workers,
+        loadable_cache_ttl=loadable_cache_ttl,
     ).create_asgi_app(**kwargs)
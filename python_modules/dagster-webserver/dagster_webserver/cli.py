@@ -179,6 +179,25 @@ def create_dagster_webserver_cli():
     default=2000,
     show_default=True,
 )
+@click.option(
+    "--graphql-execution-workers",
+    help=(
+        "Execute GraphQL queries on the server's event loop, running their blocking resolvers and"
+        " batched loads in a dedicated pool of this many threads. By default, each query is"
+        " executed on its own event loop in a thread."
+    ),
+    type=click.INT,
+    required=False,
+)
+@click.option(
+    "--loader-cache-ttl",
+    help=(
+        "Share loaded run and asset records between GraphQL requests for this many seconds."
+        " Disabled by default."
+    ),
+    type=click.FLOAT,
+    required=False,
+)
 @click.version_option(version=__version__, prog_name="dagster-webserver")
 def dagster_webserver(
     host: str,
@@ -194,6 +213,8 @@ def dagster_webserver(
     code_server_log_level: str,
     instance_ref: Optional[str],
     live_data_poll_rate: int,
+    graphql_execution_workers: Optional[int],
+    loader_cache_ttl: Optional[float],
     **kwargs: ClickArgValue,
 ):
     if suppress_warnings:
@@ -230,6 +251,8 @@ def dagster_webserver(
                 path_prefix,
                 uvicorn_log_level,
                 live_data_poll_rate,
+                graphql_execution_workers=graphql_execution_workers,
+                loader_cache_ttl=loader_cache_ttl,
             )
 
 
@@ -253,6 +276,8 @@ def host_dagster_ui_with_workspace_process_context(
     path_prefix: str,
     log_level: str,
     live_data_poll_rate: Optional[int] = None,
+    graphql_execution_workers: Optional[int] = None,
+    loader_cache_ttl: Optional[float] = None,
 ):
     check.inst_param(
         workspace_process_context, "workspace_process_context", IWorkspaceProcessContext
@@ -261,11 +286,18 @@ def host_dagster_ui_with_workspace_process_context(
     check.opt_int_param(port, "port")
     check.str_param(path_prefix, "path_prefix")
     check.opt_int_param(live_data_poll_rate, "live_data_poll_rate")
+    check.opt_int_param(graphql_execution_workers, "graphql_execution_workers")
+    check.opt_numeric_param(loader_cache_ttl, "loader_cache_ttl")
 
     logger = logging.getLogger(WEBSERVER_LOGGER_NAME)
 
     app = create_app_from_workspace_process_context(
-        workspace_process_context, path_prefix, live_data_poll_rate, lifespan=_lifespan
+        workspace_process_context,
+        path_prefix,
+        live_data_poll_rate,
+        max_graphql_execution_workers=graphql_execution_workers,
+        loadable_cache_ttl=loader_cache_ttl,
+        lifespan=_lifespan,
     )
 
     if not port:
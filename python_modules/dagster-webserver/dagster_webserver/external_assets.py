@@ -1,4 +1,4 @@
-from typing import Any
+from typing import AbstractSet, Any, List, Mapping, Union
 
 import dagster._check as check
 from dagster import AssetObservation
@@ -9,8 +9,11 @@
     DATA_VERSION_TAG,
 )
 from dagster._core.definitions.events import AssetKey, AssetMaterialization
+from dagster._core.errors import DagsterEventBatchPartiallyStoredError
+from dagster._core.instance import RUNLESS_ASSET_EVENT_BATCH_SIZE
 from dagster._core.workspace.context import BaseWorkspaceRequestContext
 from dagster._seven import json
+from starlette.concurrency import run_in_threadpool
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
@@ -296,6 +299,156 @@ async def handle_report_asset_observation_request(
     return JSONResponse({})
 
 
+async def handle_report_asset_events_request(
+    context: BaseWorkspaceRequestContext,
+    request: Request,
+) -> JSONResponse:
+    # Record a batch of runless asset materialization, observation and check evaluation events.
+    # The events are passed as a json array or as newline delimited json objects, each with a
+    # `type` and the properties supported by the endpoint for that type of event.
+    # Every event is validated before any are written, and a result is returned for each event.
+    # Valid events are written in chunks, and are only reported as successful once they have been
+    # written.
+
+    body_content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    body = await request.body()
+    if body_content_type == "application/json":
+        try:
+            event_bodies = json.loads(body)
+        except Exception as exc:
+            return JSONResponse(
+                {
+                    "error": f"Error parsing json: {exc}",
+                },
+                status_code=400,
+            )
+        if not isinstance(event_bodies, list):
+            return JSONResponse(
+                {
+                    "error": "Expected a json array of events.",
+                },
+                status_code=400,
+            )
+    elif body_content_type == "application/x-ndjson":
+        event_bodies = []
+        for line in body.splitlines():
+            if not line.strip():
+                continue
+            try:
+                event_bodies.append(json.loads(line))
+            except Exception as exc:
+                event_bodies.append(_InvalidEventBody(f"Error parsing json: {exc}"))
+    else:
+        return JSONResponse(
+            {
+                "error": (
+                    f"Unhandled content type {body_content_type}, expect application/json or"
+                    " application/x-ndjson"
+                ),
+            },
+            status_code=400,
+        )
+
+    results: List[Mapping[str, Any]] = []
+    asset_events = []
+    result_indices = []
+    for event_body in event_bodies:
+        try:
+            asset_events.append(_asset_event_from_json(context, event_body))
+            result_indices.append(len(results))
+            results.append({"success": False, "error": "Event was not written."})
+        except Exception as exc:
+            results.append({"success": False, "error": str(exc)})
+
+    for start in range(0, len(asset_events), RUNLESS_ASSET_EVENT_BATCH_SIZE):
+        chunk = asset_events[start : start + RUNLESS_ASSET_EVENT_BATCH_SIZE]
+        error = None
+        try:
+            # writing events can take a while, so don't block the event loop
+            await run_in_threadpool(context.instance.report_runless_asset_events, chunk)
+            num_stored = len(chunk)
+        except Exception as exc:
+            # a failed chunk does not stop the following chunks from being written
+            num_stored = (
+                exc.num_stored if isinstance(exc, DagsterEventBatchPartiallyStoredError) else 0
+            )
+            error = f"Error writing event: {exc}"
+
+        for position, result_index in enumerate(result_indices[start : start + len(chunk)]):
+            results[result_index] = (
+                {"success": True} if position < num_stored else {"success": False, "error": error}
+            )
+
+    return JSONResponse({"results": results})
+
+
+class _InvalidEventBody(Exception):
+    pass
+
+
+def _asset_event_from_json(
+    context: BaseWorkspaceRequestContext, event_body: Any
+) -> Union[AssetMaterialization, AssetObservation, AssetCheckEvaluation]:
+    if isinstance(event_body, _InvalidEventBody):
+        raise event_body
+    if not isinstance(event_body, dict):
+        raise Exception("Expected a json object.")
+
+    event_type = event_body.get(ReportAssetEventsParam.type)
+    if event_type not in REPORT_ASSET_EVENT_PARAMS:
+        raise Exception(
+            f"Unknown event type {event_type}, expected one of"
+            f" {', '.join(sorted(REPORT_ASSET_EVENT_PARAMS))}."
+        )
+
+    supported_params = REPORT_ASSET_EVENT_PARAMS[event_type]
+    unknown_params = set(event_body.keys()) - supported_params - {ReportAssetEventsParam.type}
+    if unknown_params:
+        raise Exception(f"Unknown parameters {', '.join(sorted(unknown_params))}.")
+
+    if not event_body.get(ReportAssetEventsParam.asset_key):
+        raise Exception("Empty asset key, must provide asset_key.")
+    asset_key = AssetKey(event_body[ReportAssetEventsParam.asset_key])
+
+    if event_type == ReportAssetEventType.asset_check_evaluation:
+        if ReportAssetCheckEvalParam.passed not in event_body:
+            raise Exception("Missing required parameter 'passed'.")
+        try:
+            return AssetCheckEvaluation(
+                check_name=event_body.get(ReportAssetCheckEvalParam.check_name),  # type: ignore
+                passed=event_body[ReportAssetCheckEvalParam.passed],
+                asset_key=asset_key,
+                metadata=event_body.get(ReportAssetCheckEvalParam.metadata) or {},
+                severity=AssetCheckSeverity(
+                    event_body.get(ReportAssetCheckEvalParam.severity) or "ERROR"
+                ),
+            )
+        except Exception as exc:
+            raise Exception(f"Error constructing AssetCheckEvaluation: {exc}") from exc
+
+    tags = context.get_reporting_user_tags()
+    data_version = event_body.get(ReportAssetMatParam.data_version)
+    if data_version is not None:
+        tags[DATA_VERSION_TAG] = data_version
+        tags[DATA_VERSION_IS_USER_PROVIDED_TAG] = "true"
+
+    event_class = (
+        AssetMaterialization
+        if event_type == ReportAssetEventType.asset_materialization
+        else AssetObservation
+    )
+    try:
+        return event_class(
+            asset_key=asset_key,
+            partition=event_body.get(ReportAssetMatParam.partition),
+            metadata=event_body.get(ReportAssetMatParam.metadata),
+            description=event_body.get(ReportAssetMatParam.description),
+            tags=tags,
+        )
+    except Exception as exc:
+        raise Exception(f"Error constructing {event_class.__name__}: {exc}") from exc
+
+
 # note: Enum not used to avoid value type problems X(str, Enum) doesn't work as partition conflicts with keyword
 class ReportAssetMatParam:
     """Class to collect all supported args by report_asset_materialization endpoint
@@ -331,3 +484,31 @@ class ReportAssetObsParam:
     metadata = "metadata"
     description = "description"
     partition = "partition"
+
+
+class ReportAssetEventsParam:
+    """Class to collect the args supported by the report_asset_events endpoint for every event, in
+    addition to the args of the endpoint for that type of event.
+    """
+
+    type = "type"
+    asset_key = "asset_key"
+
+
+class ReportAssetEventType:
+    """Class to collect the event types supported by the report_asset_events endpoint."""
+
+    asset_materialization = "asset_materialization"
+    asset_observation = "asset_observation"
+    asset_check_evaluation = "asset_check_evaluation"
+
+
+def _params(param_class: type) -> AbstractSet[str]:
+    return {v for k, v in vars(param_class).items() if not k.startswith("__")}
+
+
+REPORT_ASSET_EVENT_PARAMS: Mapping[str, AbstractSet[str]] = {
+    ReportAssetEventType.asset_materialization: _params(ReportAssetMatParam),
+    ReportAssetEventType.asset_observation: _params(ReportAssetObsParam),
+    ReportAssetEventType.asset_check_evaluation: _params(ReportAssetCheckEvalParam),
+}
@@ -1,10 +1,16 @@
 from abc import ABC, abstractmethod
-from asyncio import Task, get_event_loop, run
+from asyncio import Lock, Task, get_event_loop, get_running_loop, iscoroutinefunction, run
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from enum import Enum
+from functools import partial
+from inspect import isawaitable
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
     Any,
     AsyncGenerator,
+    Callable,
     Dict,
     Generic,
     List,
@@ -17,12 +23,14 @@
 )
 
 import dagster._check as check
+from dagster._core.loader import use_blocking_load_executor
 from dagster._serdes import pack_value
 from dagster._seven import json
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster_graphql.implementation.utils import ErrorCapture
 from graphene import Schema
-from graphql import GraphQLError, GraphQLFormattedError
+from graphene.types.resolver import get_default_resolver
+from graphql import GraphQLError, GraphQLFormattedError, GraphQLObjectType, GraphQLResolveInfo
 from graphql.execution import ExecutionResult
 from starlette import status
 from starlette.applications import Starlette
@@ -59,12 +67,24 @@ class GraphQLWS(str, Enum):
 
 
 class GraphQLServer(ABC, Generic[TRequestContext]):
-    def __init__(self, app_path_prefix: str = ""):
+    def __init__(self, app_path_prefix: str = "", max_execution_workers: Optional[int] = None):
         self._app_path_prefix = app_path_prefix
 
         self._graphql_schema = self.build_graphql_schema()
         self._graphql_middleware = self.build_graphql_middleware()
 
+        # when max_execution_workers is set, queries are executed on the server's event loop rather
+        # than on a fresh event loop in a thread per request, so that concurrent requests share it.
+        # The blocking resolvers and batched loads of each query run in a dedicated, bounded executor
+        self._execution_executor: Optional[ThreadPoolExecutor] = None
+        self._blocking_resolver_fields: AbstractSet[Tuple[str, str]] = frozenset()
+        if max_execution_workers is not None:
+            self._execution_executor = ThreadPoolExecutor(
+                max_workers=check.int_param(max_execution_workers, "max_execution_workers"),
+                thread_name_prefix="graphql_execution",
+            )
+            self._blocking_resolver_fields = get_blocking_resolver_fields(self._graphql_schema)
+
     @abstractmethod
     def build_graphql_schema(self) -> Schema: ...
 
@@ -245,6 +265,14 @@ async def execute_graphql_request(
         variables: Optional[Dict[str, Any]],
         operation_name: Optional[str],
     ) -> ExecutionResult:
+        if self._execution_executor is not None:
+            return await self.execute_graphql_request_on_event_loop(
+                request=request,
+                query=query,
+                variables=variables,
+                operation_name=operation_name,
+            )
+
         # run each query in a separate thread, as much of the schema is sync/blocking
         # use execute_async to allow async resolvers to facilitate dataloader pattern
         return await run_in_threadpool(
@@ -272,6 +300,25 @@ def graphql_execution_thread(
             )
         )
 
+    async def execute_graphql_request_on_event_loop(
+        self,
+        request: Request,
+        query: str,
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> ExecutionResult:
+        executor = check.not_none(self._execution_executor)
+        request_context = await get_running_loop().run_in_executor(
+            executor, partial(copy_context().run, self.make_request_context, request)
+        )
+        with use_blocking_load_executor(executor):
+            return await self.gen_graphql_response(
+                request_context=request_context,
+                query=query,
+                variables=variables,
+                operation_name=operation_name,
+            )
+
     async def gen_graphql_response(
         self,
         request_context: TRequestContext,
@@ -279,12 +326,22 @@ async def gen_graphql_response(
         variables: Optional[Dict[str, Any]],
         operation_name: Optional[str],
     ) -> ExecutionResult:
+        middleware = self._graphql_middleware
+        if self._execution_executor is not None:
+            # listed first so that it wraps the resolvers directly
+            middleware = [
+                BlockingResolverMiddleware(
+                    self._execution_executor, self._blocking_resolver_fields
+                ),
+                *middleware,
+            ]
+
         return await self._graphql_schema.execute_async(
             query,
             variables=variables,
             operation_name=operation_name,
             context=request_context,
-            middleware=self._graphql_middleware,
+            middleware=middleware,
         )
 
     async def execute_graphql_subscription(
@@ -360,6 +417,60 @@ def _determine_status_code(
         return status.HTTP_200_OK
 
 
+def get_blocking_resolver_fields(schema: Schema) -> AbstractSet[Tuple[str, str]]:
+    """The (type name, field name) pairs of the fields in the schema that are resolved by a sync
+    resolver other than the default attribute resolver, which may block on storage calls.
+    """
+    default_resolver = get_default_resolver()
+    fields = set()
+    for type_name, graphql_type in schema.graphql_schema.type_map.items():
+        if not isinstance(graphql_type, GraphQLObjectType):
+            continue
+
+        for field_name, field in graphql_type.fields.items():
+            resolve = field.resolve
+            if resolve is None or iscoroutinefunction(resolve):
+                continue
+            if isinstance(resolve, partial) and resolve.func is default_resolver:
+                continue
+            fields.add((type_name, field_name))
+
+    return frozenset(fields)
+
+
+class BlockingResolverMiddleware:
+    """GraphQL middleware that runs the blocking resolvers of a query in an executor, so that a
+    query executed on the server's event loop does not block it.
+
+    The blocking resolvers of a query run one at a time, as they would in a thread of its own, since
+    the request context is not safe to share between threads.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor, blocking_fields: AbstractSet[Tuple[str, str]]):
+        self._executor = executor
+        self._blocking_fields = blocking_fields
+        self._lock = Lock()
+
+    def resolve(self, next_: Callable, root: Any, info: GraphQLResolveInfo, **args: Any) -> Any:
+        if (info.parent_type.name, info.field_name) not in self._blocking_fields:
+            return next_(root, info, **args)
+
+        return self._resolve_in_executor(next_, root, info, **args)
+
+    async def _resolve_in_executor(
+        self, next_: Callable, root: Any, info: GraphQLResolveInfo, **args: Any
+    ) -> Any:
+        async with self._lock:
+            result = await get_running_loop().run_in_executor(
+                self._executor, partial(copy_context().run, next_, root, info, **args)
+            )
+
+        # sync wrappers of async resolvers return an awaitable to be resolved on the event loop
+        if isawaitable(result):
+            return await result
+        return result
+
+
 async def _handle_async_results(results: AsyncGenerator, operation_id: str, websocket: WebSocket):
     try:
         async for result in results:
@@ -1,14 +1,16 @@
 import gzip
 import io
 import mimetypes
+import re
 import uuid
 from os import path, walk
-from typing import Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, TypeVar
 
 import dagster._check as check
 from dagster import __version__ as dagster_version
 from dagster._annotations import deprecated
 from dagster._core.debug import DebugRunPayload
+from dagster._core.loader import LoadableCache, use_shared_loadable_cache
 from dagster._core.storage.cloud_storage_compute_log_manager import CloudStorageComputeLogManager
 from dagster._core.storage.compute_log_manager import ComputeIOType
 from dagster._core.storage.local_compute_log_manager import LocalComputeLogManager
@@ -19,6 +21,7 @@
 from dagster_graphql import __version__ as dagster_graphql_version
 from dagster_graphql.schema import create_schema
 from graphene import Schema
+from graphql.execution import ExecutionResult
 from starlette.datastructures import MutableHeaders
 from starlette.exceptions import HTTPException
 from starlette.middleware import Middleware
@@ -36,6 +39,7 @@
 
 from dagster_webserver.external_assets import (
     handle_report_asset_check_request,
+    handle_report_asset_events_request,
     handle_report_asset_materialization_request,
     handle_report_asset_observation_request,
 )
@@ -44,6 +48,8 @@
 
 mimetypes.init()
 
+MUTATION_REGEX = re.compile(r"\bmutation\b")
+
 T_IWorkspaceProcessContext = TypeVar("T_IWorkspaceProcessContext", bound=IWorkspaceProcessContext)
 
 
@@ -60,11 +66,15 @@ def __init__(
         app_path_prefix: str = "",
         live_data_poll_rate: Optional[int] = None,
         uses_app_path_prefix: bool = True,
+        max_graphql_execution_workers: Optional[int] = None,
+        loadable_cache_ttl: Optional[float] = None,
     ):
         self._process_context = process_context
         self._live_data_poll_rate = live_data_poll_rate
         self._uses_app_path_prefix = uses_app_path_prefix
-        super().__init__(app_path_prefix)
+        # hot objects like run and asset records are shared between requests for a short TTL
+        self._loadable_cache = LoadableCache(loadable_cache_ttl) if loadable_cache_ttl else None
+        super().__init__(app_path_prefix, max_execution_workers=max_graphql_execution_workers)
 
     def build_graphql_schema(self) -> Schema:
         return create_schema()
@@ -81,6 +91,24 @@ def make_request_context(self, conn: HTTPConnection) -> BaseWorkspaceRequestCont
     def build_middleware(self) -> List[Middleware]:
         return [Middleware(DagsterTracedCounterMiddleware)]
 
+    async def gen_graphql_response(
+        self,
+        request_context: BaseWorkspaceRequestContext,
+        query: str,
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> ExecutionResult:
+        with use_shared_loadable_cache(self._loadable_cache):
+            result = await super().gen_graphql_response(
+                request_context, query, variables, operation_name
+            )
+
+        # don't serve objects that a mutation may have changed from the cache
+        if self._loadable_cache and MUTATION_REGEX.search(query):
+            self._loadable_cache.clear()
+
+        return result
+
     def make_security_headers(self) -> dict:
         return {
             "Cache-Control": "no-store",
@@ -199,6 +227,10 @@ async def report_asset_observation_endpoint(self, request: Request) -> JSONRespo
         context = self.make_request_context(request)
         return await handle_report_asset_observation_request(context, request)
 
+    async def report_asset_events_endpoint(self, request: Request) -> JSONResponse:
+        context = self.make_request_context(request)
+        return await handle_report_asset_events_request(context, request)
+
     def index_html_endpoint(self, request: Request):
         """Serves root html."""
         index_path = self.relative_path("webapp/build/index.html")
@@ -335,6 +367,11 @@ def build_routes(self):
                     self.report_asset_observation_endpoint,
                     methods=["POST"],
                 ),
+                Route(
+                    "/report_asset_events",
+                    self.report_asset_events_endpoint,
+                    methods=["POST"],
+                ),
                 Route("/{path:path}", self.index_html_endpoint),
                 Route("/", self.index_html_endpoint),
             ]
@@ -7,6 +7,7 @@
     job,
     op,
 )
+from dagster._cli.workspace.cli_target import get_workspace_process_context_from_kwargs
 from dagster._core.events import DagsterEventType
 from dagster._serdes import unpack_value
 from dagster._seven import json
@@ -14,6 +15,7 @@
 from dagster_graphql.version import __version__ as dagster_graphql_version
 from dagster_webserver.graphql import GraphQLWS
 from dagster_webserver.version import __version__ as dagster_webserver_version
+from dagster_webserver.webserver import DagsterWebserver
 from starlette.testclient import TestClient
 
 EVENT_LOG_SUBSCRIPTION = """
@@ -299,3 +301,60 @@ def test_download_captured_logs_not_found(test_client: TestClient):
 def test_download_captured_logs_invalid_path(test_client: TestClient):
     with pytest.raises(ValueError, match="Invalid path"):
         test_client.get("/logs/%2e%2e/secret/txt")
+
+
+RUNS_QUERY = """
+query RunsQuery {
+    runsOrError {
+        __typename
+        ... on Runs {
+            results {
+                id
+                status
+                jobName
+                stats {
+                    __typename
+                    ... on RunStatsSnapshot {
+                        stepsSucceeded
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+
+def test_graphql_async_execution(instance, test_client: TestClient):
+    run_id = _add_run(instance)
+
+    process_context = get_workspace_process_context_from_kwargs(
+        instance=instance,
+        version=dagster_version,
+        read_only=False,
+        kwargs={"empty_workspace": True},
+    )
+    async_test_client = TestClient(
+        DagsterWebserver(
+            process_context, max_graphql_execution_workers=2, loadable_cache_ttl=60
+        ).create_asgi_app(debug=True)
+    )
+
+    for query, variables in [
+        (RUN_QUERY, {"runId": run_id}),
+        (RUN_QUERY, {"runId": "missing"}),
+        (RUNS_QUERY, {}),
+        ("{test{alwaysException}}", {}),
+    ]:
+        expected = test_client.post("/graphql", json={"query": query, "variables": variables})
+        # the second request is served from the shared loader cache
+        for _ in range(2):
+            response = async_test_client.post(
+                "/graphql", json={"query": query, "variables": variables}
+            )
+            assert response.status_code == expected.status_code
+            assert response.json()["data"] == expected.json()["data"]
+            # error stacks differ in the frames of the thread the resolver ran on
+            assert [
+                (error["message"], error["path"]) for error in response.json().get("errors", [])
+            ] == [(error["message"], error["path"]) for error in expected.json().get("errors", [])]
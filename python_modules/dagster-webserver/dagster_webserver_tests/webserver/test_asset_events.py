@@ -1,4 +1,5 @@
 import inspect
+from unittest import mock
 
 from dagster import DagsterInstance
 from dagster._core.definitions.asset_check_evaluation import AssetCheckEvaluation
@@ -8,6 +9,8 @@
     DATA_VERSION_TAG,
 )
 from dagster._core.definitions.events import AssetKey, AssetMaterialization
+from dagster._core.errors import DagsterEventBatchPartiallyStoredError
+from dagster._core.instance import RUNLESS_ASSET_EVENT_BATCH_SIZE
 from dagster._seven import json
 from dagster_pipes import PipesContext
 from dagster_webserver.external_assets import (
@@ -336,3 +339,118 @@ def test_report_asset_observation_apis_consistent(
             ), "need to add validation that sample payload content was written successfully"
 
     # expect test to cover PipesContext.report_asset_observation once added
+
+
+def test_report_asset_events_endpoint(instance: DagsterInstance, test_client: TestClient):
+    events = [
+        {
+            "type": "asset_materialization",
+            "asset_key": ["bulk", "mat"],
+            "metadata": {"rows": 10},
+            "data_version": "v1",
+            "partition": "2023-09-23",
+        },
+        {"type": "asset_observation", "asset_key": "bulk_obs", "data_version": "v2"},
+        {
+            "type": "asset_check_evaluation",
+            "asset_key": "bulk_obs",
+            "check_name": "c",
+            "passed": True,
+        },
+        # invalid events
+        {"type": "asset_materialization"},
+        {"type": "asset_check_evaluation", "asset_key": "bulk_obs", "check_name": "c"},
+        {"type": "asset_observation", "asset_key": "bulk_obs", "passed": True},
+        {"type": "asset_snapshot", "asset_key": "bulk_obs"},
+        {"type": "asset_check_evaluation", "asset_key": "x", "passed": True, "severity": "BAD"},
+        ["not", "an", "object"],
+    ]
+
+    response = test_client.post("/report_asset_events", json=events)
+    assert response.status_code == 200, response.json()
+    results = response.json()["results"]
+    assert [result["success"] for result in results] == [True] * 3 + [False] * 6
+    assert "Empty asset key" in results[3]["error"]
+    assert "Missing required parameter 'passed'" in results[4]["error"]
+    assert "Unknown parameters passed" in results[5]["error"]
+    assert "Unknown event type asset_snapshot" in results[6]["error"]
+    assert "Error constructing AssetCheckEvaluation" in results[7]["error"]
+
+    mat_evt = instance.get_latest_materialization_event(AssetKey(["bulk", "mat"]))
+    assert mat_evt
+    mat = mat_evt.asset_materialization
+    assert mat
+    assert mat.partition == "2023-09-23"
+    assert mat.metadata.keys() == {"rows"}
+    assert mat.tags and mat.tags[DATA_VERSION_TAG] == "v1"
+    assert _assert_stored_obs(instance, "bulk_obs").data_version == "v2"
+    assert _assert_stored_check_eval(instance, "bulk_obs", "c").passed
+
+    # newline delimited json, with a result per line
+    ndjson_events = [
+        json.dumps({"type": "asset_materialization", "asset_key": f"bulk_{i}"}) for i in range(250)
+    ]
+    ndjson_events.insert(1, "{not json")
+    response = test_client.post(
+        "/report_asset_events",
+        content="\n".join(ndjson_events) + "\n",
+        headers={"content-type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200, response.json()
+    results = response.json()["results"]
+    assert len(results) == 251
+    assert not results[1]["success"]
+    assert "Error parsing json" in results[1]["error"]
+    assert all(result["success"] for i, result in enumerate(results) if i != 1)
+    for i in range(250):
+        assert instance.get_latest_materialization_event(AssetKey(f"bulk_{i}"))
+
+    # bad requests
+    response = test_client.post("/report_asset_events", json={"type": "asset_materialization"})
+    assert response.status_code == 400
+    response = test_client.post(
+        "/report_asset_events", content="[", headers={"content-type": "application/json"}
+    )
+    assert response.status_code == 400
+    response = test_client.post(
+        "/report_asset_events", content="", headers={"content-type": "text/plain"}
+    )
+    assert response.status_code == 400
+
+
+def test_report_asset_events_endpoint_write_failure(
+    instance: DagsterInstance, test_client: TestClient
+):
+    report_runless_asset_events = instance.report_runless_asset_events
+    num_chunks = 0
+
+    def _fail_second_chunk(asset_events):
+        nonlocal num_chunks
+        num_chunks += 1
+        if num_chunks == 2:
+            report_runless_asset_events(asset_events[:10])
+            raise DagsterEventBatchPartiallyStoredError("Storage is down", num_stored=10)
+        report_runless_asset_events(asset_events)
+
+    events = [
+        {"type": "asset_materialization", "asset_key": f"chunked_{i}"}
+        for i in range(RUNLESS_ASSET_EVENT_BATCH_SIZE * 3)
+    ]
+    events.insert(0, {"type": "asset_materialization"})
+    with mock.patch.object(
+        instance, "report_runless_asset_events", side_effect=_fail_second_chunk
+    ):
+        response = test_client.post("/report_asset_events", json=events)
+    assert response.status_code == 200, response.json()
+    results = response.json()["results"]
+    assert num_chunks == 3
+
+    # events are only reported as successful once their chunk has been written, and a failed
+    # chunk does not stop the following chunks from being written
+    assert "Empty asset key" in results[0]["error"]
+    for i, result in enumerate(results[1:]):
+        stored = i < RUNLESS_ASSET_EVENT_BATCH_SIZE + 10 or i >= RUNLESS_ASSET_EVENT_BATCH_SIZE * 2
+        assert result["success"] == stored
+        if not stored:
+            assert "Storage is down" in result["error"]
+        assert bool(instance.get_latest_materialization_event(AssetKey(f"chunked_{i}"))) == stored
@@ -544,6 +544,7 @@
     PipesFileContextInjector as PipesFileContextInjector,
     PipesFileMessageReader as PipesFileMessageReader,
     PipesLogReader as PipesLogReader,
+    PipesSocketMessageReader as PipesSocketMessageReader,
     PipesTempFileContextInjector as PipesTempFileContextInjector,
     PipesTempFileMessageReader as PipesTempFileMessageReader,
     open_pipes_session as open_pipes_session,
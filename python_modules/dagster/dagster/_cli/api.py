@@ -21,6 +21,7 @@
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
 from dagster._core.execution.context_creation_job import create_context_free_log_manager
+from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.retries import RetryState
 from dagster._core.execution.run_cancellation_thread import start_run_cancellation_thread
 from dagster._core.execution.run_metrics_thread import (
@@ -488,7 +489,10 @@ def _execute_step_command_body(
             if not success:
                 return
 
-        if dagster_run.has_repository_load_data:
+        execution_plan_fragment = args.execution_plan_fragment
+        if execution_plan_fragment:
+            repository_load_data = execution_plan_fragment.repository_load_data
+        elif dagster_run.has_repository_load_data:
             repository_load_data = instance.get_execution_plan_snapshot(
                 check.not_none(dagster_run.execution_plan_snapshot_id)
             ).repository_load_data
@@ -505,13 +509,21 @@ def _execute_step_command_body(
             )
         )
 
-        execution_plan = create_execution_plan(
-            recon_job,
-            run_config=dagster_run.run_config,
-            step_keys_to_execute=args.step_keys_to_execute,
-            known_state=args.known_state,
-            repository_load_data=repository_load_data,
-        )
+        if execution_plan_fragment:
+            # the orchestrator sent the steps to execute along, so the plan for the whole job
+            # does not need to be built
+            execution_plan = ExecutionPlan.rebuild_from_snapshot(
+                dagster_run.job_name,
+                execution_plan_fragment._replace(initial_known_state=args.known_state),
+            )
+        else:
+            execution_plan = create_execution_plan(
+                recon_job,
+                run_config=dagster_run.run_config,
+                step_keys_to_execute=args.step_keys_to_execute,
+                known_state=args.known_state,
+                repository_load_data=repository_load_data,
+            )
 
         yield from execute_plan_iterator(
             execution_plan,
@@ -0,0 +1,454 @@
+"""Compiled config validation and processing.
+
+The functions in validate.py and post_process.py interpret a config type tree recursively,
+building a traversal context, an evaluation stack and an EvaluateValueResult at every node so that
+errors can be reported precisely. That bookkeeping dominates the cost of validating large run
+configs, even though the overwhelming majority of run configs are valid.
+
+A CompiledConfigProgram flattens a config type into a tree of closures that are specialized for
+each node of the type once, up front: field tables, required field names, aliases, defaults and
+post-processing hooks are all resolved at compile time. Running a program does no bookkeeping and
+either returns the same value as the interpreter would or signals that the value is not valid. In
+the latter case the caller falls back to the interpreter, so that errors are always reported by
+the interpreter and are identical to what they were before.
+"""
+
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, cast
+
+from dagster._config.config_type import ConfigScalarKind, ConfigType, ConfigTypeKind
+
+ConfigFn = Callable[[Any], Any]
+
+
+class InvalidConfigValue(Exception):
+    """Raised by a compiled program when a value does not validate. Never escapes this module."""
+
+
+def _invalid() -> Any:
+    raise InvalidConfigValue()
+
+
+class CompiledConfigProgram:
+    """The compiled form of a single config type.
+
+    Programs are memoized on the config type they were compiled from (see
+    ConfigType.get_compiled_program), alongside its snapshot, and reference the programs of the
+    types they contain. Shapes, permissives and selectors are interned by key, so every occurrence
+    of the same schema shares the same program.
+
+    Attributes:
+        validate: Validates a value, returning what validate_config would return.
+        process: Validates a value, resolves defaults and post-processes it, returning what
+            process_config would return.
+        resolve: Resolves defaults and post-processes an already validated value, returning what
+            post_process_config would return. Used for field defaults.
+    """
+
+    __slots__ = ["kind", "validate", "process", "resolve"]
+
+    def __init__(self, config_type: ConfigType):
+        self.kind = config_type.kind
+        self.validate, self.process, self.resolve = _compile(config_type)
+
+    def try_validate(self, config_value: Any) -> Tuple[bool, Any]:
+        try:
+            return True, self.validate(config_value)
+        except Exception:
+            # any failure, including unexpected ones, is left to the interpreter to report
+            return False, None
+
+    def try_process(self, config_value: Any) -> Tuple[bool, Any]:
+        try:
+            return True, self.process(config_value)
+        except Exception:
+            # post-processing may also fail or raise for values that would not have validated. In
+            # either case the interpreter reproduces the exact error or exception.
+            return False, None
+
+
+def _get_post_process(config_type: ConfigType) -> Optional[ConfigFn]:
+    if type(config_type).post_process is ConfigType.post_process:
+        return None
+    return config_type.post_process
+
+
+def _compile(config_type: ConfigType) -> Tuple[ConfigFn, ConfigFn, ConfigFn]:
+    kind = config_type.kind
+    post = _get_post_process(config_type)
+
+    if kind == ConfigTypeKind.ANY:
+        return _compile_any(post)
+    elif kind == ConfigTypeKind.NONEABLE:
+        return _compile_noneable(config_type, post)
+    elif kind == ConfigTypeKind.SCALAR:
+        return _compile_scalar(config_type, post)
+    elif kind == ConfigTypeKind.ENUM:
+        return _compile_enum(config_type, post)
+    elif kind == ConfigTypeKind.SELECTOR:
+        return _compile_selector(config_type, post)
+    elif ConfigTypeKind.is_shape(kind):
+        return _compile_shape(config_type, post)
+    elif kind == ConfigTypeKind.ARRAY:
+        return _compile_array(config_type, post)
+    elif kind == ConfigTypeKind.MAP:
+        return _compile_map(config_type, post)
+    elif kind == ConfigTypeKind.SCALAR_UNION:
+        return _compile_scalar_union(config_type, post)
+    else:
+        raise Exception(f"Unsupported ConfigTypeKind {kind}")
+
+
+def _compile_any(post: Optional[ConfigFn]) -> Tuple[ConfigFn, ConfigFn, ConfigFn]:
+    def validate(value):
+        return value
+
+    resolve = post or validate
+    return validate, resolve, resolve
+
+
+def _compile_noneable(
+    config_type: ConfigType, post: Optional[ConfigFn]
+) -> Tuple[ConfigFn, ConfigFn, ConfigFn]:
+    inner = config_type.inner_type.get_compiled_program()  # type: ignore
+    inner_validate, inner_process, inner_resolve = inner.validate, inner.process, inner.resolve
+
+    def validate(value):
+        return None if value is None else inner_validate(value)
+
+    if post is None:
+
+        def process(value):
+            return None if value is None else inner_process(value)
+
+        def resolve(value):
+            return None if value is None else inner_resolve(value)
+
+    else:
+
+        def process(value):
+            return post(None if value is None else inner_process(value))
+
+        def resolve(value):
+            return post(None if value is None else inner_resolve(value))
+
+    return validate, process, resolve
+
+
+def _get_scalar_validator(config_type: ConfigType) -> Callable[[Any], bool]:
+    from dagster._config.field_utils import EnvVar, IntEnvVar
+
+    scalar_kind = config_type.scalar_kind  # type: ignore
+    if scalar_kind == ConfigScalarKind.INT:
+        return lambda value: not isinstance(value, bool) and isinstance(value, int)
+    elif scalar_kind == ConfigScalarKind.STRING:
+        # EnvVar and IntEnvVar can only be used in structured config
+        return lambda value: isinstance(value, str) and not isinstance(value, (EnvVar, IntEnvVar))
+    elif scalar_kind == ConfigScalarKind.BOOL:
+        return lambda value: isinstance(value, bool)
+    elif scalar_kind == ConfigScalarKind.FLOAT:
+        return lambda value: isinstance(value, (int, float))
+    else:
+        raise Exception(f"Not a supported scalar {config_type.key}")
+
+
+def _compile_scalar(
+    config_type: ConfigType, post: Optional[ConfigFn]
+) -> Tuple[ConfigFn, ConfigFn, ConfigFn]:
+    is_valid = _get_scalar_validator(config_type)
+
+    def validate(value):
+        return value if is_valid(value) else _invalid()
+
+    if post is None:
+        return validate, validate, lambda value: value
+
+    def process(value):
+        return post(value) if is_valid(value) else _invalid()
+
+    return validate, process, post
+
+
+def _compile_enum(
+    config_type: ConfigType, post: Optional[ConfigFn]
+) -> Tuple[ConfigFn, ConfigFn, ConfigFn]:
+    config_values = frozenset(config_type.config_values)  # type: ignore
+
+    def validate(value):
+        return value if isinstance(value, str) and value in config_values else _invalid()
+
+    if post is None:
+        return validate, validate, lambda value: value
+
+    def process(value):
+        return post(validate(value))
+
+    return validate, process, post
+
+
+def _compile_scalar_union(
+    config_type: ConfigType, post: Optional[ConfigFn]
+) -> Tuple[ConfigFn, ConfigFn, ConfigFn]:
+    scalar = config_type.scalar_type.get_compiled_program()  # type: ignore
+    non_scalar = config_type.non_scalar_type.get_compiled_program()  # type: ignore
+
+    def validate(value):
+        if value is None:
+            return _invalid()
+        if isinstance(value, (dict, list)):
+            return non_scalar.validate(value)
+        return scalar.validate(value)
+
+    def _process(value):
+        if value is None:
+            return _invalid()
+        if isinstance(value, (dict, list)):
+            return non_scalar.process(value)
+        return scalar.process(value)
+
+    def _resolve(value):
+        if isinstance(value, (dict, list)):
+            return non_scalar.resolve(value)
+        return scalar.resolve(value)
+
+    if post is None:
+        return validate, _process, _resolve
+
+    return validate, lambda value: post(_process(value)), lambda value: post(_resolve(value))
+
+
+def _compile_array(
+    config_type: ConfigType, post: Optional[ConfigFn]
+) -> Tuple[ConfigFn, ConfigFn, ConfigFn]:
+    inner = config_type.inner_type.get_compiled_program()  # type: ignore
+    inner_validate, inner_process, inner_resolve = inner.validate, inner.process, inner.resolve
+    # the interpreter refuses null members when processing unless the inner type is noneable,
+    # even when the inner type is Any
+    allows_none = inner.kind == ConfigTypeKind.NONEABLE
+
+    def validate(value):
+        if not isinstance(value, list):
+            return _invalid()
+        return [inner_validate(item) for item in value]
+
+    def _process(value):
+        if not isinstance(value, list):
+            return _invalid()
+        if not allows_none and None in value:
+            return _invalid()
+        return [inner_process(item) for item in value]
+
+    def _resolve(value):
+        if not value:
+            return []
+        if not allows_none and any(item is None for item in value):
+            return _invalid()
+        return [inner_resolve(item) for item in value]
+
+    if post is None:
+        return validate, _process, _resolve
+
+    return validate, lambda value: post(_process(value)), lambda value: post(_resolve(value))
+
+
+def _compile_map(
+    config_type: ConfigType, post: Optional[ConfigFn]
+) -> Tuple[ConfigFn, ConfigFn, ConfigFn]:
+    key_validate = config_type.key_type.get_compiled_program().validate  # type: ignore
+    inner = config_type.inner_type.get_compiled_program()  # type: ignore
+    inner_validate, inner_process, inner_resolve = inner.validate, inner.process, inner.resolve
+    allows_none = inner.kind == ConfigTypeKind.NONEABLE
+
+    def validate(value):
+        if not isinstance(value, dict):
+            return _invalid()
+        for key, item in value.items():
+            key_validate(key)
+            inner_validate(item)
+        return value
+
+    def _process(value):
+        if not isinstance(value, dict):
+            return _invalid()
+        for key in value:
+            key_validate(key)
+        return _resolve_items(value, inner_process)
+
+    def _resolve(value):
+        return _resolve_items(value, inner_resolve)
+
+    def _resolve_items(value, item_fn):
+        if not value:
+            return {}
+        if None in value:
+            return _invalid()
+        if not allows_none and any(item is None for item in value.values()):
+            return _invalid()
+        return {key: item_fn(item) for key, item in value.items()}
+
+    if post is None:
+        return validate, _process, _resolve
+
+    return validate, lambda value: post(_process(value)), lambda value: post(_resolve(value))
+
+
+class _CompiledField:
+    __slots__ = ["name", "alias", "program", "is_required", "default_provided", "default_value"]
+
+    def __init__(self, name: str, field: Any, alias: Optional[str]):
+        self.name = name
+        self.alias = alias
+        self.program: CompiledConfigProgram = field.config_type.get_compiled_program()
+        self.is_required: bool = field.is_required
+        self.default_provided: bool = field.default_provided
+        self.default_value = field.default_value if field.default_provided else None
+
+
+def _compile_fields(config_type: ConfigType) -> List[_CompiledField]:
+    # only strict shapes support aliases
+    field_aliases: Mapping[str, str] = (
+        (getattr(config_type, "field_aliases", None) or {})
+        if config_type.kind == ConfigTypeKind.STRICT_SHAPE
+        else {}
+    )
+    return [
+        _CompiledField(name, field, field_aliases.get(name))
+        for name, field in config_type.fields.items()  # type: ignore
+    ]
+
+
+def _compile_shape(
+    config_type: ConfigType, post: Optional[ConfigFn]
+) -> Tuple[ConfigFn, ConfigFn, ConfigFn]:
+    fields = _compile_fields(config_type)
+    is_permissive = config_type.kind == ConfigTypeKind.PERMISSIVE_SHAPE
+    field_names = frozenset(field.name for field in fields)
+    allowed_names = field_names.union(field.alias for field in fields if field.alias)
+    has_aliases = any(field.alias for field in fields)
+    required_fields = [field for field in fields if field.is_required]
+
+    def _check_fields(value):
+        if not isinstance(value, dict):
+            return _invalid()
+        if not is_permissive:
+            for name in value:
+                if name not in allowed_names:
+                    return _invalid()
+        for field in required_fields:
+            if field.name not in value and (field.alias is None or field.alias not in value):
+                return _invalid()
+        if has_aliases:
+            for field in fields:
+                if field.alias is not None and field.alias in value and field.name in value:
+                    return _invalid()
+
+    def validate(value):
+        _check_fields(value)
+        for field in fields:
+            if field.name in value:
+                field.program.validate(value[field.name])
+            elif field.alias is not None and field.alias in value:
+                field.program.validate(value[field.alias])
+        return value
+
+    def _resolve_fields(value, use_process):
+        processed = {}
+        for field in fields:
+            name = field.name
+            if name in value:
+                program = field.program
+                processed[name] = (program.process if use_process else program.resolve)(value[name])
+            elif field.alias is not None and field.alias in value:
+                program = field.program
+                processed[name] = (program.process if use_process else program.resolve)(
+                    value[field.alias]
+                )
+            elif field.default_provided:
+                processed[name] = field.program.resolve(field.default_value)
+            elif field.is_required:
+                return _invalid()
+
+        # fields that are not defined on a permissive shape are passed through as is
+        if is_permissive:
+            processed.update(
+                {name: item for name, item in value.items() if name not in field_names}
+            )
+
+        return processed
+
+    def _process(value):
+        _check_fields(value)
+        return _resolve_fields(value, True)
+
+    def _resolve(value):
+        if value is None:
+            value = {}
+        elif not isinstance(value, Mapping):
+            return _invalid()
+        return _resolve_fields(value, False)
+
+    if post is None:
+        return validate, _process, _resolve
+
+    return validate, lambda value: post(_process(value)), lambda value: post(_resolve(value))
+
+
+def _compile_selector(
+    config_type: ConfigType, post: Optional[ConfigFn]
+) -> Tuple[ConfigFn, ConfigFn, ConfigFn]:
+    fields: Dict[str, _CompiledField] = {
+        field.name: field for field in _compile_fields(config_type)
+    }
+    # a selector with a single optional field can be left empty
+    only_field = next(iter(fields.values())) if len(fields) == 1 else None
+    can_be_empty = only_field is not None and not only_field.is_required
+    # a selected field without a value is filled in from its defaults if it has fields
+    has_fields = {
+        name: ConfigTypeKind.has_fields(field.program.kind) for name, field in fields.items()
+    }
+
+    def _select(value):
+        if not isinstance(value, dict) or len(value) > 1:
+            return _invalid()
+        ((name, item),) = value.items()
+        field = fields.get(name)
+        if field is None:
+            return _invalid()
+        if item is None and has_fields[name]:
+            item = {}
+        return field, item
+
+    def validate(value):
+        if value is None:
+            return _invalid()
+        if value == {}:
+            return {} if can_be_empty else _invalid()
+        field, item = _select(value)
+        return {field.name: field.program.validate(item)}
+
+    def _resolve_empty():
+        field = cast(_CompiledField, only_field)
+        item = field.default_value if field.default_provided else None
+        if item is None and has_fields[field.name]:
+            item = {}
+        return {field.name: field.program.resolve(item)}
+
+    def _process(value):
+        if value is None:
+            return _invalid()
+        if value == {}:
+            return _resolve_empty() if can_be_empty else _invalid()
+        field, item = _select(value)
+        return {field.name: field.program.process(item)}
+
+    def _resolve(value):
+        if not value:
+            if only_field is None:
+                return _invalid()
+            return _resolve_empty()
+        field, item = _select(value)
+        return {field.name: field.program.resolve(item)}
+
+    if post is None:
+        return validate, _process, _resolve
+
+    return validate, lambda value: post(_process(value)), lambda value: post(_resolve(value))
@@ -9,6 +9,7 @@
 from dagster._serdes import whitelist_for_serdes
 
 if TYPE_CHECKING:
+    from dagster._config.compiled import CompiledConfigProgram
     from dagster._config.snap import ConfigSchemaSnapshot, ConfigTypeSnap
 
 
@@ -79,6 +80,9 @@ def __init__(
         # memoized snap representation
         self._snap: Optional["ConfigTypeSnap"] = None
 
+        # memoized compiled validation program
+        self._compiled_program: Optional["CompiledConfigProgram"] = None
+
     @property
     def description(self) -> Optional[str]:
         return self._description
@@ -105,6 +109,14 @@ def get_snapshot(self) -> "ConfigTypeSnap":
 
         return self._snap
 
+    def get_compiled_program(self) -> "CompiledConfigProgram":
+        from dagster._config.compiled import CompiledConfigProgram
+
+        if self._compiled_program is None:
+            self._compiled_program = CompiledConfigProgram(self)
+
+        return self._compiled_program
+
     def type_iterator(self) -> Iterator["ConfigType"]:
         yield self
 
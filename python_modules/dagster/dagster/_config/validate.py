@@ -56,6 +56,12 @@ def is_config_scalar_valid(config_type_snap: ConfigTypeSnap, config_value: objec
 def validate_config(config_schema: object, config_value: T) -> EvaluateValueResult[T]:
     config_type = check.inst(resolve_to_config_type(config_schema), ConfigType)
 
+    # Valid config is handled by the compiled program for the config type. Invalid config is
+    # validated again by the interpreter below, which is responsible for reporting errors.
+    success, value = config_type.get_compiled_program().try_validate(config_value)
+    if success:
+        return EvaluateValueResult.for_value(value)
+
     return validate_config_from_snap(
         config_schema_snapshot=config_type.get_schema_snapshot(),
         config_type_key=config_type.key,
@@ -433,7 +439,17 @@ def process_config(
 ) -> EvaluateValueResult[Mapping[str, Any]]:
     config_type = resolve_to_config_type(config_type)
     config_type = check.inst(cast(ConfigType, config_type), ConfigType)
-    validate_evr = validate_config(config_type, config_dict)
+
+    # see validate_config
+    success, value = config_type.get_compiled_program().try_process(config_dict)
+    if success:
+        return EvaluateValueResult.for_value(value)
+
+    validate_evr = validate_config_from_snap(
+        config_schema_snapshot=config_type.get_schema_snapshot(),
+        config_type_key=config_type.key,
+        config_value=config_dict,
+    )
     if not validate_evr.success:
         return validate_evr
 
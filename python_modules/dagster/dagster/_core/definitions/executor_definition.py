@@ -331,12 +331,20 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = next(iter(start_selector.items()))
 
+    reuse_processes_cfg = config.get("reuse_processes")
+
     return MultiprocessExecutor(
         max_concurrent=check.opt_int_elem(config, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        reuse_processes=reuse_processes_cfg is not None,
+        max_tasks_per_worker=(
+            check.opt_int_elem(reuse_processes_cfg, "max_tasks_per_worker")  # type: ignore
+            if reuse_processes_cfg is not None
+            else None
+        ),
     )
 
 
@@ -389,6 +397,25 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                 "https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods."
             ),
         ),
+        "reuse_processes": Field(
+            {
+                "max_tasks_per_worker": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "The number of steps a worker process executes before it is replaced by a"
+                        " new one. By default, worker processes are only replaced after they crash."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Execute steps in a pool of long-lived worker processes instead of launching a new"
+                " process for each step. Each worker loads the job once and then executes many"
+                " steps, so module-level state is shared between steps that run in the same"
+                " worker."
+            ),
+        ),
         "retries": get_retries_config(),
     },
     description="Execute each step in an individual process.",
@@ -418,6 +445,11 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be None or 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    By default, each step is executed in a newly launched process, which must load your code before
+    the step can run. Set ``reuse_processes: {}`` to instead execute steps in a pool of long-lived
+    worker processes that each load the job once. Use ``reuse_processes.max_tasks_per_worker`` to
+    replace workers after a number of steps.
+
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -1,9 +1,12 @@
 import hashlib
 import itertools
+import json
+from collections import defaultdict
 from datetime import datetime
-from functools import lru_cache, reduce
+from functools import cached_property, lru_cache, reduce
 from typing import (
     Dict,
+    Iterable,
     List,
     Mapping,
     NamedTuple,
@@ -19,6 +22,7 @@
 import dagster._check as check
 from dagster._annotations import public
 from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
     DefaultPartitionsSubset,
     DynamicPartitionsDefinition,
     PartitionsDefinition,
@@ -27,11 +31,17 @@
 )
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.time_window_partitions import (
+    PartitionKeysTimeWindowPartitionsSubset,
+    PersistedTimeWindow,
     TimeWindow,
     TimeWindowPartitionsDefinition,
+    TimeWindowPartitionsSubset,
+    dst_safe_strftime,
 )
+from dagster._core.definitions.timestamp import TimestampWithTimezone
 from dagster._core.errors import (
     DagsterInvalidDefinitionError,
+    DagsterInvalidDeserializationVersionError,
     DagsterInvalidInvocationError,
     DagsterUnknownPartitionError,
 )
@@ -40,6 +50,7 @@
     MULTIDIMENSIONAL_PARTITION_PREFIX,
     get_multidimensional_partition_tag,
 )
+from dagster._serdes import whitelist_for_serdes
 from dagster._time import get_current_datetime
 
 INVALID_STATIC_PARTITIONS_KEY_CHARACTERS = set(["|", ",", "[", "]"])
@@ -219,8 +230,36 @@ def __init__(self, partitions_defs: Mapping[str, PartitionsDefinition]):
 
     @property
     def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        if len(self._get_time_window_dims()) == 1:
+            return MultiPartitionsSubset
         return DefaultPartitionsSubset
 
+    def subset_with_all_partitions(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "PartitionsSubset":
+        if self.partitions_subset_class is not MultiPartitionsSubset:
+            return super().subset_with_all_partitions(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+            )
+
+        all_time_windows = cast(
+            TimeWindowPartitionsSubset,
+            self.time_window_partitions_def.subset_with_all_partitions(current_time=current_time),
+        ).included_time_windows
+        empty_subset = cast(MultiPartitionsSubset, self.empty_subset())
+        return empty_subset.with_time_windows_by_secondary_key(
+            {
+                secondary_key: all_time_windows
+                for secondary_key in self.secondary_dimension.partitions_def.get_partition_keys(
+                    current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+                )
+            }
+            if all_time_windows
+            else {}
+        )
+
     def get_partition_keys_in_range(
         self,
         partition_key_range: PartitionKeyRange,
@@ -549,6 +588,445 @@ def get_num_partitions(
         return reduce(lambda x, y: x * y, dimension_counts, 1)
 
 
+@whitelist_for_serdes
+class MultiPartitionsSubset(
+    PartitionsSubset,
+    NamedTuple(
+        "_MultiPartitionsSubset",
+        [
+            ("time_partitions_def", TimeWindowPartitionsDefinition),
+            ("time_dimension_name", str),
+            ("secondary_dimension_name", str),
+            ("time_windows_by_secondary_key", Mapping[str, Sequence[PersistedTimeWindow]]),
+        ],
+    ),
+):
+    """A PartitionsSubset for a MultiPartitionsDefinition with a single time window dimension,
+    which internally represents the included partitions as a set of time windows for each key in
+    the secondary dimension.
+
+    Compared to storing every included MultiPartitionKey, this keeps the size of the subset
+    proportional to the number of secondary keys rather than the number of partitions, and allows
+    set operations to be taken window-by-window.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # This will ensure that we can gracefully degrade when deserializing old data.
+    SERIALIZATION_VERSION = 1
+
+    def __new__(
+        cls,
+        time_partitions_def: TimeWindowPartitionsDefinition,
+        time_dimension_name: str,
+        secondary_dimension_name: str,
+        time_windows_by_secondary_key: Mapping[
+            str, Sequence[Union[PersistedTimeWindow, TimeWindow]]
+        ],
+    ):
+        check.inst_param(time_partitions_def, "time_partitions_def", TimeWindowPartitionsDefinition)
+        check.mapping_param(
+            time_windows_by_secondary_key, "time_windows_by_secondary_key", key_type=str
+        )
+        return super(MultiPartitionsSubset, cls).__new__(
+            cls,
+            time_partitions_def=time_partitions_def,
+            time_dimension_name=check.str_param(time_dimension_name, "time_dimension_name"),
+            secondary_dimension_name=check.str_param(
+                secondary_dimension_name, "secondary_dimension_name"
+            ),
+            # secondary keys without any included time windows are dropped, so that equivalent
+            # subsets have identical representations
+            time_windows_by_secondary_key={
+                secondary_key: [
+                    PersistedTimeWindow.from_public_time_window(tw, time_partitions_def.timezone)
+                    if isinstance(tw, TimeWindow)
+                    else tw
+                    for tw in time_windows
+                ]
+                for secondary_key, time_windows in time_windows_by_secondary_key.items()
+                if time_windows
+            },
+        )
+
+    def with_time_windows_by_secondary_key(
+        self, time_windows_by_secondary_key: Mapping[str, Sequence[PersistedTimeWindow]]
+    ) -> "MultiPartitionsSubset":
+        return MultiPartitionsSubset(
+            time_partitions_def=self.time_partitions_def,
+            time_dimension_name=self.time_dimension_name,
+            secondary_dimension_name=self.secondary_dimension_name,
+            time_windows_by_secondary_key=time_windows_by_secondary_key,
+        )
+
+    def _with_time_subsets(
+        self, time_subsets_by_secondary_key: Mapping[str, PartitionsSubset]
+    ) -> "MultiPartitionsSubset":
+        return self.with_time_windows_by_secondary_key(
+            {
+                secondary_key: cast(TimeWindowPartitionsSubset, time_subset).included_time_windows
+                for secondary_key, time_subset in time_subsets_by_secondary_key.items()
+            }
+        )
+
+    def get_time_subset(self, secondary_key: str) -> TimeWindowPartitionsSubset:
+        """Returns the subset of the time dimension that is included for the given secondary key."""
+        return TimeWindowPartitionsSubset(
+            partitions_def=self.time_partitions_def,
+            num_partitions=None,  # lazily calculated
+            included_time_windows=self.time_windows_by_secondary_key.get(secondary_key, []),
+        )
+
+    @cached_property
+    def _sorted_dimension_names(self) -> Sequence[str]:
+        return sorted([self.time_dimension_name, self.secondary_dimension_name])
+
+    def _split_partition_key(self, partition_key: str) -> Tuple[str, str]:
+        """Returns the time dimension key and the secondary dimension key of the given key."""
+        # split the string representation rather than using MultiPartitionKey.keys_by_dimension,
+        # since keys are matched by their string value, as in a DefaultPartitionsSubset
+        partition_key_strs = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+        check.invariant(
+            len(partition_key_strs) == len(self._sorted_dimension_names),
+            f"Expected {len(self._sorted_dimension_names)} partition keys in partition key"
+            f" string {partition_key}, but got {len(partition_key_strs)}",
+        )
+        keys_by_dimension = dict(zip(self._sorted_dimension_names, partition_key_strs))
+        return (
+            keys_by_dimension[self.time_dimension_name],
+            keys_by_dimension[self.secondary_dimension_name],
+        )
+
+    def _make_partition_key(self, time_key: str, secondary_key: str) -> MultiPartitionKey:
+        return MultiPartitionKey(
+            {self.time_dimension_name: time_key, self.secondary_dimension_name: secondary_key}
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.time_windows_by_secondary_key) == 0
+
+    @public
+    def get_partition_keys(self) -> Iterable[MultiPartitionKey]:
+        return {
+            self._make_partition_key(time_key, secondary_key)
+            for secondary_key in self.time_windows_by_secondary_key.keys()
+            for time_key in self.get_time_subset(secondary_key).get_partition_keys()
+        }
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[MultiPartitionKey]:
+        secondary_partitions_def = cast(
+            MultiPartitionsDefinition, partitions_def
+        ).get_partitions_def_for_dimension(self.secondary_dimension_name)
+        return {
+            self._make_partition_key(time_key, secondary_key)
+            for secondary_key in secondary_partitions_def.get_partition_keys(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+            )
+            for time_key in self.get_time_subset(secondary_key).get_partition_keys_not_in_subset(
+                self.time_partitions_def, current_time=current_time
+            )
+        }
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        # each range spans a single secondary key, so its cross-product is a single time window
+        return [
+            PartitionKeyRange(
+                self._make_partition_key(time_key_range.start, secondary_key),
+                self._make_partition_key(time_key_range.end, secondary_key),
+            )
+            for secondary_key in sorted(self.time_windows_by_secondary_key.keys())
+            for time_key_range in self.get_time_subset(secondary_key).get_partition_key_ranges(
+                self.time_partitions_def
+            )
+        ]
+
+    def _is_time_key(self, time_key: str) -> bool:
+        """Returns whether the given key is the key of a window of the time dimension, which may
+        be outside of the current bounds of the time dimension.
+        """
+        try:
+            start_time = self.time_partitions_def.start_time_for_partition_key(time_key)
+        except ValueError:
+            return False
+        # keys in another format can parse to the start of a different window
+        return (
+            dst_safe_strftime(
+                start_time,
+                self.time_partitions_def.timezone,
+                self.time_partitions_def.fmt,
+                self.time_partitions_def.cron_schedule,
+            )
+            == time_key
+        )
+
+    def _with_partition_keys_as_default_subset(
+        self, partition_keys: Iterable[str]
+    ) -> DefaultPartitionsSubset:
+        return DefaultPartitionsSubset({*self.get_partition_keys(), *partition_keys})
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> PartitionsSubset:
+        # keys that can't be represented as time windows, e.g. keys left behind by an earlier
+        # version of the partitions definition, are kept as they are in a DefaultPartitionsSubset
+        partition_keys = list(partition_keys)
+        time_keys_by_secondary_key: Dict[str, Set[str]] = defaultdict(set)
+        for partition_key in partition_keys:
+            try:
+                time_key, secondary_key = self._split_partition_key(partition_key)
+            except check.CheckError:
+                return self._with_partition_keys_as_default_subset(partition_keys)
+            if not self._is_time_key(time_key):
+                return self._with_partition_keys_as_default_subset(partition_keys)
+            time_keys_by_secondary_key[secondary_key].add(time_key)
+
+        if not time_keys_by_secondary_key:
+            return self
+
+        time_subsets_by_secondary_key: Dict[str, PartitionsSubset] = {
+            secondary_key: self.get_time_subset(secondary_key)
+            for secondary_key in self.time_windows_by_secondary_key.keys()
+        }
+        for secondary_key, time_keys in time_keys_by_secondary_key.items():
+            # like a DefaultPartitionsSubset, this does not validate that the keys fall within the
+            # bounds of the time dimension at the current time
+            added_time_windows = PartitionKeysTimeWindowPartitionsSubset(
+                self.time_partitions_def, included_partition_keys=time_keys
+            ).included_time_windows
+            time_subsets_by_secondary_key[secondary_key] = self.get_time_subset(
+                secondary_key
+            ) | TimeWindowPartitionsSubset(
+                self.time_partitions_def,
+                num_partitions=None,
+                included_time_windows=added_time_windows,
+            )
+        return self._with_time_subsets(time_subsets_by_secondary_key)
+
+    def _filter_to_compatible_subset(self, other: PartitionsSubset) -> "MultiPartitionsSubset":
+        """Converts a subset of another type into a MultiPartitionsSubset, dropping any partition
+        keys that are not in this subset (and so can't affect an intersection or difference).
+        """
+        if isinstance(other, MultiPartitionsSubset):
+            return other
+        # keys that are in this subset can always be represented as time windows
+        return cast(
+            MultiPartitionsSubset,
+            self.with_time_windows_by_secondary_key({}).with_partition_keys(
+                partition_key
+                for partition_key in other.get_partition_keys()
+                if partition_key in self
+            ),
+        )
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if not isinstance(other, MultiPartitionsSubset):
+            return super().__or__(other)
+        if self is other or other.is_empty:
+            return self
+
+        return self._with_time_subsets(
+            {
+                secondary_key: self.get_time_subset(secondary_key)
+                | other.get_time_subset(secondary_key)
+                for secondary_key in {
+                    *self.time_windows_by_secondary_key.keys(),
+                    *other.time_windows_by_secondary_key.keys(),
+                }
+            }
+        )
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other or isinstance(other, AllPartitionsSubset):
+            return self.with_time_windows_by_secondary_key({})
+        if other.is_empty:
+            return self
+
+        other = self._filter_to_compatible_subset(other)
+        return self._with_time_subsets(
+            {
+                secondary_key: self.get_time_subset(secondary_key)
+                - other.get_time_subset(secondary_key)
+                if secondary_key in other.time_windows_by_secondary_key
+                else self.get_time_subset(secondary_key)
+                for secondary_key in self.time_windows_by_secondary_key.keys()
+            }
+        )
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other or isinstance(other, AllPartitionsSubset):
+            return self
+        if other.is_empty:
+            return self.with_time_windows_by_secondary_key({})
+
+        other = self._filter_to_compatible_subset(other)
+        return self._with_time_subsets(
+            {
+                secondary_key: self.get_time_subset(secondary_key)
+                & other.get_time_subset(secondary_key)
+                for secondary_key in self.time_windows_by_secondary_key.keys()
+                if secondary_key in other.time_windows_by_secondary_key
+            }
+        )
+
+    def serialize(self) -> str:
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                "time_dimension_name": self.time_dimension_name,
+                "secondary_dimension_name": self.secondary_dimension_name,
+                # the time windows for each key are already sorted, so only the keys need to be
+                # sorted to guarantee stable serialization between identical subsets
+                "time_windows_by_secondary_key": {
+                    secondary_key: [
+                        (window.start.timestamp(), window.end.timestamp())
+                        for window in self.time_windows_by_secondary_key[secondary_key]
+                    ]
+                    for secondary_key in sorted(self.time_windows_by_secondary_key.keys())
+                },
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "PartitionsSubset":
+        empty_subset = cls.empty_subset(partitions_def)
+        data = json.loads(serialized)
+
+        if isinstance(data, list) or "subset" in data:
+            # backwards compatibility with subsets serialized as a DefaultPartitionsSubset
+            return empty_subset.with_partition_keys(
+                DefaultPartitionsSubset.from_serialized(
+                    partitions_def, serialized
+                ).get_partition_keys()
+            )
+
+        if data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only version {cls.SERIALIZATION_VERSION} is supported."
+            )
+
+        timezone = empty_subset.time_partitions_def.timezone
+        return empty_subset.with_time_windows_by_secondary_key(
+            {
+                secondary_key: [
+                    PersistedTimeWindow(
+                        TimestampWithTimezone(start, timezone),
+                        TimestampWithTimezone(end, timezone),
+                    )
+                    for start, end in time_windows
+                ]
+                for secondary_key, time_windows in data["time_windows_by_secondary_key"].items()
+            }
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        if (
+            serialized_partitions_def_class_name is not None
+            and serialized_partitions_def_class_name != partitions_def.__class__.__name__
+        ):
+            return False
+
+        data = json.loads(serialized)
+        if isinstance(data, list) or (isinstance(data, dict) and "subset" in data):
+            return DefaultPartitionsSubset.can_deserialize(
+                partitions_def,
+                serialized,
+                serialized_partitions_def_unique_id,
+                serialized_partitions_def_class_name,
+            )
+
+        partitions_def = cast(MultiPartitionsDefinition, partitions_def)
+        return (
+            isinstance(data, dict)
+            and data.get("version") == cls.SERIALIZATION_VERSION
+            and data.get("time_dimension_name") == partitions_def.primary_dimension.name
+            and data.get("secondary_dimension_name") == partitions_def.secondary_dimension.name
+        )
+
+    def __len__(self) -> int:
+        return self.num_partitions
+
+    @cached_property
+    def num_partitions(self) -> int:
+        return sum(
+            self.get_time_subset(secondary_key).num_partitions
+            for secondary_key in self.time_windows_by_secondary_key.keys()
+        )
+
+    def __contains__(self, value) -> bool:
+        if not isinstance(value, str):
+            return False
+        try:
+            time_key, secondary_key = self._split_partition_key(value)
+        except check.CheckError:
+            return False
+        return (
+            secondary_key in self.time_windows_by_secondary_key
+            and time_key in self.get_time_subset(secondary_key)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MultiPartitionsSubset):
+            # subsets of other types are equal if they contain the same partition keys
+            return isinstance(other, PartitionsSubset) and set(self.get_partition_keys()) == set(
+                other.get_partition_keys()
+            )
+        return (
+            self.time_dimension_name == other.time_dimension_name
+            and self.secondary_dimension_name == other.secondary_dimension_name
+            and self.time_windows_by_secondary_key == other.time_windows_by_secondary_key
+        )
+
+    def __repr__(self) -> str:
+        return f"MultiPartitionsSubset({self.get_partition_key_ranges(self.time_partitions_def)})"
+
+    @classmethod
+    def empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "MultiPartitionsSubset":
+        if not isinstance(partitions_def, MultiPartitionsDefinition):
+            check.failed("Partitions definition must be a MultiPartitionsDefinition")
+        return cls(
+            time_partitions_def=partitions_def.time_window_partitions_def,
+            time_dimension_name=partitions_def.primary_dimension.name,
+            secondary_dimension_name=partitions_def.secondary_dimension.name,
+            time_windows_by_secondary_key={},
+        )
+
+    def to_serializable_subset(self) -> "MultiPartitionsSubset":
+        from dagster._core.remote_representation.external_data import TimeWindowPartitionsSnap
+
+        # in cases where the time dimension is (e.g.) a DailyPartitionsDefinition, we need to
+        # convert it into a raw TimeWindowPartitionsDefinition to make it serializable
+        if type(self.time_partitions_def) is TimeWindowPartitionsDefinition:
+            return self
+        return MultiPartitionsSubset(
+            time_partitions_def=TimeWindowPartitionsSnap.from_def(
+                self.time_partitions_def
+            ).get_partitions_definition(),
+            time_dimension_name=self.time_dimension_name,
+            secondary_dimension_name=self.secondary_dimension_name,
+            time_windows_by_secondary_key=self.time_windows_by_secondary_key,
+        )
+
+
 def get_tags_from_multi_partition_key(multi_partition_key: MultiPartitionKey) -> Mapping[str, str]:
     check.inst_param(multi_partition_key, "multi_partition_key", MultiPartitionKey)
 
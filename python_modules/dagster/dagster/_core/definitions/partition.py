@@ -5,6 +5,7 @@
 from collections import defaultdict
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import (
     AbstractSet,
     Any,
@@ -21,7 +22,7 @@
     cast,
 )
 
-from typing_extensions import TypeAlias, TypeVar
+from typing_extensions import Protocol, TypeAlias, TypeVar, runtime_checkable
 
 import dagster._check as check
 from dagster._annotations import PublicAttr, deprecated, deprecated_param, public
@@ -375,6 +376,82 @@ def get_num_partitions(
         return len(set(self.get_partition_keys(current_time, dynamic_partitions_store)))
 
 
+def _update_partition_keys_hash(
+    hash_state: "hashlib._Hash", partition_keys: Sequence[str], is_first: bool
+) -> None:
+    # reproduces the hash of the JSON list of partition keys computed by
+    # PartitionsDefinition.get_serializable_unique_identifier, a chunk of keys at a time
+    if not partition_keys:
+        return
+    serialized_keys = json.dumps(list(partition_keys))[1:-1]
+    hash_state.update((serialized_keys if is_first else f", {serialized_keys}").encode("utf-8"))
+
+
+class VersionedDynamicPartitions:
+    """The partition keys of a dynamic partitions definition, as of a version of the definition.
+
+    Holds a set of the partition keys for membership checks, and the hash state behind the
+    serializable unique identifier of the definition, so that the identifier of a later version
+    that only added partitions can be computed without rehashing the existing partition keys.
+
+    Args:
+        version (Optional[int]): The version of the partitions definition, which is incremented
+            every time partitions are added or deleted. None if the storage does not version the
+            partitions definition.
+        partition_keys (Sequence[str]): The partition keys, in the order they were added.
+    """
+
+    def __init__(
+        self,
+        version: Optional[int],
+        partition_keys: Sequence[str],
+        hash_state: Optional["hashlib._Hash"] = None,
+    ):
+        self.version = check.opt_int_param(version, "version")
+        self.partition_keys: Sequence[str] = tuple(partition_keys)
+        if hash_state is None:
+            hash_state = hashlib.sha1(b"[")
+            _update_partition_keys_hash(hash_state, self.partition_keys, is_first=True)
+        self._hash_state = hash_state
+
+    @cached_property
+    def partition_key_set(self) -> AbstractSet[str]:
+        return frozenset(self.partition_keys)
+
+    @cached_property
+    def serializable_unique_identifier(self) -> str:
+        hash_state = self._hash_state.copy()
+        hash_state.update(b"]")
+        return hash_state.hexdigest()
+
+    def with_partition_keys(
+        self, version: Optional[int], partition_keys: Sequence[str]
+    ) -> "VersionedDynamicPartitions":
+        """Returns the partition keys at another version of the partitions definition, extending
+        the hash state of these partition keys if they are a prefix of the given partition keys.
+        """
+        num_partition_keys = len(self.partition_keys)
+        if (
+            len(partition_keys) < num_partition_keys
+            or tuple(partition_keys[:num_partition_keys]) != self.partition_keys
+        ):
+            return VersionedDynamicPartitions(version, partition_keys)
+
+        hash_state = self._hash_state.copy()
+        _update_partition_keys_hash(
+            hash_state, partition_keys[num_partition_keys:], is_first=num_partition_keys == 0
+        )
+        return VersionedDynamicPartitions(version, partition_keys, hash_state)
+
+
+@runtime_checkable
+class VersionedDynamicPartitionsStore(Protocol):
+    @abstractmethod
+    def get_versioned_dynamic_partitions(
+        self, partitions_def_name: str
+    ) -> VersionedDynamicPartitions: ...
+
+
 class CachingDynamicPartitionsLoader(DynamicPartitionsStore):
     """A batch loader that caches the partition keys for a given dynamic partitions definition,
     to avoid repeated calls to the database for the same partitions definition.
@@ -383,9 +460,15 @@ class CachingDynamicPartitionsLoader(DynamicPartitionsStore):
     def __init__(self, instance: DagsterInstance):
         self._instance = instance
 
+    @cached_method
+    def get_versioned_dynamic_partitions(
+        self, partitions_def_name: str
+    ) -> VersionedDynamicPartitions:
+        return self._instance.get_versioned_dynamic_partitions(partitions_def_name)
+
     @cached_method
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
-        return self._instance.get_dynamic_partitions(partitions_def_name)
+        return list(self.get_versioned_dynamic_partitions(partitions_def_name).partition_keys)
 
     @cached_method
     def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
@@ -536,6 +619,18 @@ def get_partition_keys(
                 partitions_def_name=self._validated_name()
             )
 
+    def get_serializable_unique_identifier(
+        self, dynamic_partitions_store: Optional[DynamicPartitionsStore] = None
+    ) -> str:
+        if not self.partition_fn and isinstance(
+            dynamic_partitions_store, VersionedDynamicPartitionsStore
+        ):
+            return dynamic_partitions_store.get_versioned_dynamic_partitions(
+                self._validated_name()
+            ).serializable_unique_identifier
+
+        return super().get_serializable_unique_identifier(dynamic_partitions_store)
+
     def has_partition_key(
         self,
         partition_key: str,
@@ -1194,6 +1289,10 @@ def can_deserialize(
         )
 
     def __eq__(self, other: object) -> bool:
+        from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
+
+        if isinstance(other, MultiPartitionsSubset):
+            return other == self
         return isinstance(other, DefaultPartitionsSubset) and self.subset == other.subset
 
     def __len__(self) -> int:
@@ -1289,6 +1388,7 @@ def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         return other
 
     def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
         from dagster._core.definitions.time_window_partitions import (
             BaseTimeWindowPartitionsSubset,
             TimeWindowPartitionsSubset,
@@ -1298,6 +1398,14 @@ def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
             return self.partitions_def.empty_subset()
         elif isinstance(other, BaseTimeWindowPartitionsSubset):
             return TimeWindowPartitionsSubset.from_all_partitions_subset(self) - other
+        elif isinstance(other, MultiPartitionsSubset):
+            return (
+                self.partitions_def.subset_with_all_partitions(
+                    current_time=self.current_time,
+                    dynamic_partitions_store=self.dynamic_partitions_store,
+                )
+                - other
+            )
         return self.partitions_def.empty_subset().with_partition_keys(
             set(self.get_partition_keys()).difference(set(other.get_partition_keys()))
         )
@@ -1,6 +1,9 @@
+import bisect
 import functools
 import hashlib
+import itertools
 import json
+import math
 import re
 from abc import abstractmethod, abstractproperty
 from datetime import date, datetime, timedelta
@@ -53,6 +56,7 @@
 from dagster._utils.cronstring import get_fixed_minute_interval, is_basic_daily, is_basic_hourly
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 from dagster._utils.schedules import (
+    CronTickIndex,
     cron_string_iterator,
     cron_string_repeats_every_hour,
     is_valid_cron_schedule,
@@ -231,6 +235,69 @@ def to_public_time_window(self) -> TimeWindow:
         return TimeWindow(start=self.start, end=self.end)
 
 
+# A range of partition indexes, relative to the first partition of a
+# TimeWindowPartitionsDefinition, that is closed at the start and open at the end.
+IndexRange = Tuple[int, int]
+
+
+def _union_index_ranges(index_ranges: Iterable[IndexRange]) -> List[IndexRange]:
+    """Returns the sorted, disjoint, and non-adjacent index ranges covering the given ranges."""
+    result: List[IndexRange] = []
+    for start, end in sorted(index_ranges):
+        if start >= end:
+            continue
+        if result and start <= result[-1][1]:
+            result[-1] = (result[-1][0], max(result[-1][1], end))
+        else:
+            result.append((start, end))
+    return result
+
+
+def _intersect_index_ranges(
+    index_ranges: Sequence[IndexRange], other_index_ranges: Sequence[IndexRange]
+) -> List[IndexRange]:
+    """Intersects two sorted lists of disjoint index ranges."""
+    result: List[IndexRange] = []
+    i = j = 0
+    while i < len(index_ranges) and j < len(other_index_ranges):
+        start = max(index_ranges[i][0], other_index_ranges[j][0])
+        end = min(index_ranges[i][1], other_index_ranges[j][1])
+        if start < end:
+            result.append((start, end))
+
+        # advance past the range that ends first to find the next potential intersection
+        if index_ranges[i][1] < other_index_ranges[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def _subtract_index_ranges(
+    index_ranges: Sequence[IndexRange], other_index_ranges: Sequence[IndexRange]
+) -> List[IndexRange]:
+    """Subtracts a sorted list of disjoint index ranges from another."""
+    result: List[IndexRange] = []
+    j = 0
+    for range_start, end in index_ranges:
+        start = range_start
+        # skip over the subtracted ranges that end before this range starts
+        while j < len(other_index_ranges) and other_index_ranges[j][1] <= start:
+            j += 1
+
+        k = j
+        while k < len(other_index_ranges) and other_index_ranges[k][0] < end:
+            other_start, other_end = other_index_ranges[k]
+            if other_start > start:
+                result.append((start, other_start))
+            start = max(start, other_end)
+            k += 1
+
+        if start < end:
+            result.append((start, end))
+    return result
+
+
 @whitelist_for_serdes
 @record_custom(
     field_to_new_mapping={
@@ -368,6 +435,12 @@ def end(self) -> Optional[datetime]:
             get_timezone(end_timestamp_with_timezone.timezone),
         )
 
+    @cached_property
+    def _tick_index(self) -> CronTickIndex:
+        # partition windows are numbered by the index of the tick they start at, so the first
+        # partition window has index 0
+        return CronTickIndex(self.cron_schedule, self.timezone, self.start.timestamp())
+
     def _get_current_timestamp(self, current_time: Optional[datetime]) -> float:
         if not current_time:
             return get_current_timestamp()
@@ -398,22 +471,58 @@ def get_num_partitions_in_window(self, time_window: TimeWindow) -> int:
             minutes_in_window = (time_window.end.timestamp() - time_window.start.timestamp()) / 60
             return int(minutes_in_window // fixed_minute_interval)
 
-        return len(self.get_partition_keys_in_time_window(time_window))
+        return self._tick_index.get_index_at_or_after(
+            time_window.end.timestamp()
+        ) - self._tick_index.get_index_at_or_after(time_window.start.timestamp())
+
+    @functools.lru_cache(maxsize=256)
+    def _get_num_partitions(self, *, current_timestamp: float) -> int:
+        # the number of partition keys returned by get_partition_keys, without iterating over them.
+        # The partition window with index i ends at the tick with index i + 1.
+        num_partitions = max(self._tick_index.get_index_after(current_timestamp) - 1, 0)
+        num_partitions += max(self.end_offset, 0)
+        if self.end:
+            num_partitions = min(
+                num_partitions, max(self._tick_index.get_index_after(self.end.timestamp()) - 1, 0)
+            )
+        if self.end_offset < 0:
+            num_partitions = max(num_partitions + self.end_offset, 0)
+
+        return num_partitions
+
+    def _get_time_window_for_index(self, index: int) -> TimeWindow:
+        return TimeWindow(self._tick_index.get_tick(index), self._tick_index.get_tick(index + 1))
+
+    def get_index_for_partition_key(self, partition_key: str) -> int:
+        # the index of the partition window returned by time_window_for_partition_key
+        partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
+        return self._tick_index.get_index_at_or_after(partition_key_dt.timestamp())
+
+    def get_index_range_for_time_window(
+        self, time_window: Union[TimeWindow, PersistedTimeWindow]
+    ) -> IndexRange:
+        # the indexes of the partition windows that start within the time window
+        return (
+            self._tick_index.get_index_at_or_after(time_window.start.timestamp()),
+            self._tick_index.get_index_at_or_after(time_window.end.timestamp()),
+        )
+
+    def get_persisted_time_window_for_index_range(
+        self, index_range: IndexRange
+    ) -> PersistedTimeWindow:
+        start_index, end_index = index_range
+        return PersistedTimeWindow(
+            TimestampWithTimezone(self._tick_index.get_tick_timestamp(start_index), self.timezone),
+            TimestampWithTimezone(self._tick_index.get_tick_timestamp(end_index), self.timezone),
+        )
 
     def get_num_partitions(
         self,
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> int:
-        last_partition_window = self.get_last_partition_window(current_time)
-        first_partition_window = self.get_first_partition_window(current_time)
-
-        if not last_partition_window or not first_partition_window:
-            return 0
-
-        return self.get_num_partitions_in_window(
-            TimeWindow(start=first_partition_window.start, end=last_partition_window.end)
-        )
+        current_timestamp = self._get_current_timestamp(current_time=current_time)
+        return self._get_num_partitions(current_timestamp=current_timestamp)
 
     def get_partition_keys_between_indexes(
         self, start_idx: int, end_idx: int, current_time: Optional[datetime] = None
@@ -424,36 +533,21 @@ def get_partition_keys_between_indexes(
         # partition keys included within the indices.
         current_timestamp = self._get_current_timestamp(current_time=current_time)
 
-        partitions_past_current_time = 0
-        partition_keys = []
-        reached_end = False
-
-        for idx, time_window in enumerate(self._iterate_time_windows(self.start.timestamp())):
-            if time_window.end.timestamp() >= current_timestamp:
-                reached_end = True
-            if self.end and time_window.end.timestamp() > self.end.timestamp():
-                reached_end = True
-            if (
-                time_window.end.timestamp() <= current_timestamp
-                or partitions_past_current_time < self.end_offset
-            ):
-                if idx >= start_idx and idx < end_idx:
-                    partition_keys.append(
-                        dst_safe_strftime(
-                            time_window.start, self.timezone, self.fmt, self.cron_schedule
-                        )
-                    )
-                if time_window.end.timestamp() > current_timestamp:
-                    partitions_past_current_time += 1
-            else:
-                break
-            if len(partition_keys) >= end_idx - start_idx:
-                break
-
-        if reached_end and self.end_offset < 0:
-            partition_keys = partition_keys[: self.end_offset]
+        start_idx = max(start_idx, 0)
+        end_idx = min(end_idx, self._get_num_partitions(current_timestamp=current_timestamp))
+        if start_idx >= end_idx:
+            return []
 
-        return partition_keys
+        # jump straight to the first requested partition, then iterate over the rest
+        ticks = cron_string_iterator(
+            start_timestamp=self._tick_index.get_tick(start_idx).timestamp(),
+            cron_string=self.cron_schedule,
+            execution_timezone=self.timezone,
+        )
+        return [
+            dst_safe_strftime(tick, self.timezone, self.fmt, self.cron_schedule)
+            for tick in itertools.islice(ticks, end_idx - start_idx)
+        ]
 
     def get_partition_keys(
         self,
@@ -673,15 +767,8 @@ def _get_last_partition_window(self, *, current_timestamp: float) -> Optional[Ti
         if self.end_offset == 0:
             return next(iter(self._reverse_iterate_time_windows(current_timestamp)))
         else:
-            # TODO: make this efficient
-            last_partition_key = super().get_last_partition_key(
-                datetime.fromtimestamp(current_timestamp, tz=get_timezone(self.timezone))
-            )
-            return (
-                self.time_window_for_partition_key(last_partition_key)
-                if last_partition_key
-                else None
-            )
+            num_partitions = self._get_num_partitions(current_timestamp=current_timestamp)
+            return self._get_time_window_for_index(num_partitions - 1) if num_partitions else None
 
     def get_last_partition_window(
         self, current_time: Optional[datetime] = None
@@ -1706,77 +1793,27 @@ def num_partitions(self) -> int: ...
     @abstractproperty
     def partitions_def(self) -> TimeWindowPartitionsDefinition: ...
 
+    @abstractproperty
+    def included_index_ranges(self) -> Sequence[IndexRange]:
+        """The included partitions, as sorted, disjoint, and non-adjacent ranges of partition
+        indexes. Set operations on subsets of the same partitions definition are done on these
+        ranges, and only converted back to time windows for the result.
+        """
+        ...
+
     def _get_partition_time_windows_not_in_subset(
         self,
         current_time: Optional[datetime] = None,
     ) -> Sequence[PersistedTimeWindow]:
-        """Returns a list of partition time windows that are not in the subset.
-        Each time window is a single partition.
-        """
-        first_tw = cast(
-            TimeWindowPartitionsDefinition, self.partitions_def
-        ).get_first_partition_window(current_time=current_time)
-        last_tw = cast(
-            TimeWindowPartitionsDefinition, self.partitions_def
-        ).get_last_partition_window(current_time=current_time)
-
-        if not first_tw or not last_tw:
-            # no partitions
-            return []
-
-        last_tw_end_timestamp = last_tw.end.timestamp()
-        first_tw_start_timestamp = first_tw.start.timestamp()
-
-        if len(self.included_time_windows) == 0:
-            return [
-                PersistedTimeWindow.from_public_time_window(
-                    TimeWindow(first_tw.start, last_tw.end), self.partitions_def.timezone
-                )
-            ]
-
-        time_windows = []
-        if first_tw_start_timestamp < self.included_time_windows[0].start.timestamp():
-            time_windows.append(
-                PersistedTimeWindow.from_public_time_window(
-                    TimeWindow(first_tw.start, self.included_time_windows[0].start),
-                    self.partitions_def.timezone,
-                )
-            )
-
-        for i in range(len(self.included_time_windows) - 1):
-            if self.included_time_windows[i].start.timestamp() >= last_tw_end_timestamp:
-                break
-            if self.included_time_windows[i].end.timestamp() < last_tw_end_timestamp:
-                if self.included_time_windows[i + 1].start.timestamp() <= last_tw_end_timestamp:
-                    time_windows.append(
-                        PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(
-                                self.included_time_windows[i].end,
-                                self.included_time_windows[i + 1].start,
-                            ),
-                            self.partitions_def.timezone,
-                        )
-                    )
-                else:
-                    time_windows.append(
-                        PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(
-                                self.included_time_windows[i].end,
-                                last_tw.end,
-                            ),
-                            self.partitions_def.timezone,
-                        )
-                    )
-
-        if last_tw_end_timestamp > self.included_time_windows[-1].end.timestamp():
-            time_windows.append(
-                PersistedTimeWindow.from_public_time_window(
-                    TimeWindow(self.included_time_windows[-1].end, last_tw.end),
-                    self.partitions_def.timezone,
-                )
+        """Returns a list of time windows that cover the partitions that are not in the subset."""
+        partitions_def = self.partitions_def
+        num_partitions = partitions_def.get_num_partitions(current_time)
+        return [
+            partitions_def.get_persisted_time_window_for_index_range(index_range)
+            for index_range in _subtract_index_ranges(
+                [(0, num_partitions)] if num_partitions else [], self.included_index_ranges
             )
-
-        return time_windows
+        ]
 
     def get_partition_keys_not_in_subset(
         self,
@@ -1820,88 +1857,24 @@ def get_partition_key_ranges(
             for window in self.included_time_windows
         ]
 
-    def _add_partitions_to_time_windows(
-        self,
-        initial_windows: Sequence[PersistedTimeWindow],
-        partition_keys: Sequence[str],
-        validate: bool = True,
-    ) -> Tuple[Sequence[PersistedTimeWindow], int]:
-        """Merges a set of partition keys into an existing set of time windows, returning the
-        minimized set of time windows and the number of partitions added.
+    def _get_index_ranges_for_partition_keys(
+        self, partition_keys: Iterable[str], validate: bool = True
+    ) -> Sequence[IndexRange]:
+        """Returns the index ranges that cover the given partition keys. If validate is set, keys
+        outside of the partitions definition's current partitions are ignored.
         """
-        result_windows = [*initial_windows]
-        time_windows = cast(
-            TimeWindowPartitionsDefinition, self.partitions_def
-        ).time_windows_for_partition_keys(frozenset(partition_keys), validate=validate)
-
-        num_added_partitions = 0
-        for window in sorted(time_windows, key=lambda tw: tw.start.timestamp()):
-            window_start_timestamp = window.start.timestamp()
-            # go in reverse order because it's more common to add partitions at the end than the
-            # beginning
-            for i in reversed(range(len(result_windows))):
-                included_window = result_windows[i]
-                lt_end_of_range = window_start_timestamp < included_window.end.timestamp()
-                gte_start_of_range = window_start_timestamp >= included_window.start.timestamp()
-
-                if lt_end_of_range and gte_start_of_range:
-                    break
-
-                if not lt_end_of_range:
-                    merge_with_range = included_window.end.timestamp() == window_start_timestamp
-                    merge_with_later_range = i + 1 < len(result_windows) and (
-                        window.end.timestamp() == result_windows[i + 1].start.timestamp()
-                    )
-
-                    if merge_with_range and merge_with_later_range:
-                        result_windows[i] = PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(included_window.start, result_windows[i + 1].end),
-                            self.partitions_def.timezone,
-                        )
-                        del result_windows[i + 1]
-                    elif merge_with_range:
-                        result_windows[i] = PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(included_window.start, window.end),
-                            self.partitions_def.timezone,
-                        )
-                    elif merge_with_later_range:
-                        result_windows[i + 1] = PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(window.start, result_windows[i + 1].end),
-                            self.partitions_def.timezone,
-                        )
-                    else:
-                        result_windows.insert(
-                            i + 1,
-                            PersistedTimeWindow.from_public_time_window(
-                                window, self.partitions_def.timezone
-                            ),
-                        )
-
-                    num_added_partitions += 1
-                    break
-            else:
-                if result_windows and window_start_timestamp == result_windows[0].start.timestamp():
-                    result_windows[0] = PersistedTimeWindow.from_public_time_window(
-                        TimeWindow(window.start, included_window.end), self.partitions_def.timezone
-                    )
-                elif (
-                    result_windows and window.end.timestamp() == result_windows[0].start.timestamp()
-                ):
-                    result_windows[0] = PersistedTimeWindow.from_public_time_window(
-                        TimeWindow(window.start, included_window.end), self.partitions_def.timezone
-                    )
-                else:
-                    result_windows.insert(
-                        0,
-                        PersistedTimeWindow.from_public_time_window(
-                            window,
-                            self.partitions_def.timezone,
-                        ),
-                    )
-
-                num_added_partitions += 1
+        partitions_def = self.partitions_def
+        indexes = sorted(
+            {
+                partitions_def.get_index_for_partition_key(partition_key)
+                for partition_key in partition_keys
+            }
+        )
+        if validate:
+            num_partitions = partitions_def.get_num_partitions()
+            indexes = [index for index in indexes if 0 <= index < num_partitions]
 
-        return result_windows, num_added_partitions
+        return _union_index_ranges((index, index + 1) for index in indexes)
 
     def serialize(self) -> str:
         return json.dumps(
@@ -1996,20 +1969,14 @@ def __contains__(self, partition_key: Optional[str]) -> bool:
             return False
 
         try:
-            time_window = cast(
-                TimeWindowPartitionsDefinition, self.partitions_def
-            ).time_window_for_partition_key(partition_key)
+            index = self.partitions_def.get_index_for_partition_key(partition_key)
         except ValueError:
             # invalid partition key
             return False
 
-        time_window_start_timestamp = time_window.start.timestamp()
-
-        return any(
-            time_window_start_timestamp >= included_time_window.start.timestamp()
-            and time_window_start_timestamp < included_time_window.end.timestamp()
-            for included_time_window in self.included_time_windows
-        )
+        # find the last range that starts at or before the index
+        position = bisect.bisect_right(self.included_index_ranges, (index, math.inf)) - 1
+        return position >= 0 and index < self.included_index_ranges[position][1]
 
     def __eq__(self, other):
         return (
@@ -2050,13 +2017,17 @@ def with_partition_keys(
         )
 
     @cached_property
-    def included_time_windows(self) -> Sequence[PersistedTimeWindow]:
-        result_time_windows, _ = self._add_partitions_to_time_windows(
-            initial_windows=[],
-            partition_keys=list(check.not_none(self._included_partition_keys)),
-            validate=False,
+    def included_index_ranges(self) -> Sequence[IndexRange]:
+        return self._get_index_ranges_for_partition_keys(
+            self._included_partition_keys, validate=False
         )
-        return result_time_windows
+
+    @cached_property
+    def included_time_windows(self) -> Sequence[PersistedTimeWindow]:
+        return [
+            self._partitions_def.get_persisted_time_window_for_index_range(index_range)
+            for index_range in self.included_index_ranges
+        ]
 
     @cached_property
     def num_partitions(self) -> int:
@@ -2269,10 +2240,30 @@ def from_all_partitions_subset(subset: AllPartitionsSubset) -> "TimeWindowPartit
             num_partitions=None,
         )
 
+    @staticmethod
+    def from_index_ranges(
+        partitions_def: TimeWindowPartitionsDefinition, index_ranges: Sequence[IndexRange]
+    ) -> "TimeWindowPartitionsSubset":
+        return TimeWindowPartitionsSubset(
+            partitions_def=partitions_def,
+            num_partitions=sum(end - start for start, end in index_ranges),
+            included_time_windows=[
+                partitions_def.get_persisted_time_window_for_index_range(index_range)
+                for index_range in index_ranges
+            ],
+        )
+
     @cached_property
     def included_time_windows(self) -> Sequence[PersistedTimeWindow]:
         return self._asdict()["included_time_windows"]
 
+    @cached_property
+    def included_index_ranges(self) -> Sequence[IndexRange]:
+        return _union_index_ranges(
+            self.partitions_def.get_index_range_for_time_window(time_window)
+            for time_window in self.included_time_windows
+        )
+
     @property
     def partitions_def(self) -> TimeWindowPartitionsDefinition:
         return self._asdict()["partitions_def"]
@@ -2303,12 +2294,7 @@ def cheap_ends_before(self, dt: datetime, dt_cron_schedule: str) -> bool:
     def num_partitions(self) -> int:
         num_partitions_ = self._asdict()["num_partitions"]
         if num_partitions_ is None:
-            return sum(
-                self.partitions_def.get_num_partitions_in_window(
-                    time_window.to_public_time_window()
-                )
-                for time_window in self.included_time_windows
-            )
+            return sum(end - start for start, end in self.included_index_ranges)
         return num_partitions_
 
     @classmethod
@@ -2331,14 +2317,34 @@ def get_partition_keys(self) -> Iterable[str]:
         ]
 
     def with_partition_keys(self, partition_keys: Iterable[str]) -> "TimeWindowPartitionsSubset":
-        result_windows, added_partitions = self._add_partitions_to_time_windows(
-            self.included_time_windows, list(partition_keys)
+        return TimeWindowPartitionsSubset.from_index_ranges(
+            self.partitions_def,
+            _union_index_ranges(
+                [
+                    *self.included_index_ranges,
+                    *self._get_index_ranges_for_partition_keys(partition_keys),
+                ]
+            ),
         )
 
-        return TimeWindowPartitionsSubset(
-            self.partitions_def,
-            num_partitions=self.num_partitions + added_partitions,
-            included_time_windows=result_windows,
+    def _get_comparable_index_ranges(
+        self, other: "TimeWindowPartitionsSubset"
+    ) -> Optional[Sequence[IndexRange]]:
+        """Returns the index ranges of the other subset, relative to this subset's partitions
+        definition, or None if the partitions definitions' partitions start at different times.
+        """
+        if other.partitions_def == self.partitions_def:
+            return other.included_index_ranges
+
+        if (
+            self.partitions_def.cron_schedule != other.partitions_def.cron_schedule
+            or self.partitions_def.timezone != other.partitions_def.timezone
+        ):
+            return None
+
+        return _union_index_ranges(
+            self.partitions_def.get_index_range_for_time_window(time_window)
+            for time_window in other.included_time_windows
         )
 
     @classmethod
@@ -2372,6 +2378,13 @@ def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__and__(other)
 
+        other_index_ranges = self._get_comparable_index_ranges(other)
+        if other_index_ranges is not None:
+            return TimeWindowPartitionsSubset.from_index_ranges(
+                self.partitions_def,
+                _intersect_index_ranges(self.included_index_ranges, other_index_ranges),
+            )
+
         self_time_windows_iter = iter(
             sorted(self.included_time_windows, key=lambda tw: tw.start.timestamp())
         )
@@ -2412,6 +2425,13 @@ def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__or__(other)
 
+        other_index_ranges = self._get_comparable_index_ranges(other)
+        if other_index_ranges is not None:
+            return TimeWindowPartitionsSubset.from_index_ranges(
+                self.partitions_def,
+                _union_index_ranges([*self.included_index_ranges, *other_index_ranges]),
+            )
+
         input_time_windows = sorted(
             [*self.included_time_windows, *other.included_time_windows],
             key=lambda tw: tw.start.timestamp(),
@@ -2439,6 +2459,13 @@ def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__sub__(other)
 
+        other_index_ranges = self._get_comparable_index_ranges(other)
+        if other_index_ranges is not None:
+            return TimeWindowPartitionsSubset.from_index_ranges(
+                self.partitions_def,
+                _subtract_index_ranges(self.included_index_ranges, other_index_ranges),
+            )
+
         time_windows = sorted(self.included_time_windows, key=lambda tw: tw.start.timestamp())
         other_time_windows = sorted(
             other.included_time_windows, key=lambda tw: tw.start.timestamp()
@@ -234,6 +234,16 @@ def __init__(self, *args, **kwargs):
         super(DagsterRunNotFoundError, self).__init__(*args, **kwargs)
 
 
+class DagsterEventBatchPartiallyStoredError(DagsterError):
+    """Thrown when an error occurs while storing a batch of events, after the first `num_stored`
+    events of the batch have been stored.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.num_stored = check.int_param(kwargs.pop("num_stored"), "num_stored")
+        super(DagsterEventBatchPartiallyStoredError, self).__init__(*args, **kwargs)
+
+
 class DagsterStepOutputNotFoundError(DagsterError):
     """Indicates that previous step outputs required for an execution step to proceed are not
     available.
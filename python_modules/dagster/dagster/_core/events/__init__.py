@@ -237,12 +237,25 @@ class DagsterEventType(str, Enum):
 
 PIPELINE_RUN_STATUS_TO_EVENT_TYPE = {v: k for k, v in EVENT_TYPE_TO_PIPELINE_RUN_STATUS.items()}
 
-# These are the only events currently supported in `EventLogStorage.store_event_batch`
+# These are the events that are explicitly batched via `DagsterEventBatchMetadata` when
+# `DAGSTER_EVENT_BATCH_SIZE` is set. `EventLogStorage.store_event_batch` accepts events of any type.
 BATCH_WRITABLE_EVENTS = {
     DagsterEventType.ASSET_MATERIALIZATION,
     DagsterEventType.ASSET_OBSERVATION,
 }
 
+# When write-behind event buffering is enabled, these events are written immediately (along with
+# any events already buffered for the same run), since other processes wait on them to make
+# orchestration decisions.
+WRITE_THROUGH_EVENTS = {
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+    *PIPELINE_EVENTS,
+}
+
 ASSET_EVENTS = {
     DagsterEventType.ASSET_MATERIALIZATION,
     DagsterEventType.ASSET_OBSERVATION,
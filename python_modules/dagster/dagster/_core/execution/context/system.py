@@ -16,6 +16,7 @@
     Mapping,
     NamedTuple,
     Optional,
+    Sequence,
     Set,
     Union,
     cast,
@@ -78,6 +79,7 @@
     from dagster._core.execution.plan.plan import ExecutionPlan
     from dagster._core.execution.plan.state import KnownExecutionState
     from dagster._core.instance import DagsterInstance
+    from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
 
 
 def is_iterable(obj: Any) -> bool:
@@ -272,6 +274,23 @@ def for_step(self, step: ExecutionStep) -> "IStepContext":
     def resume_from_failure(self) -> bool:
         return self._resume_from_failure
 
+    def get_execution_plan_fragment(
+        self, step_keys_to_execute: Sequence[str]
+    ) -> Optional["ExecutionPlanSnapshot"]:
+        """Snapshot the part of the execution plan that a step worker needs to execute the given
+        steps, or None if the worker needs to build the execution plan itself.
+        """
+        from dagster._core.snap.execution_plan_snapshot import snapshot_from_execution_plan
+
+        job_snapshot_id = self.dagster_run.job_snapshot_id
+        if job_snapshot_id is None:
+            return None
+
+        fragment = self.execution_plan.build_step_fragment(
+            step_keys_to_execute, self.job.get_definition()
+        )
+        return snapshot_from_execution_plan(fragment, job_snapshot_id) if fragment else None
+
 
 class StepOrchestrationContext(PlanOrchestrationContext, IStepContext):
     """Context for the orchestration of a step.
@@ -1,4 +1,7 @@
+import bisect
+import itertools
 import time
+from collections import defaultdict
 from types import TracebackType
 from typing import (
     Any,
@@ -10,6 +13,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -86,7 +90,21 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = dict(self._plan.get_executable_step_deps())
+        self._pending: Dict[str, Set[str]] = {}
+
+        # The deps of every step known to be executable, including steps resolved from dynamic
+        # outputs. Used to re-queue retried steps and to incrementally resolve dynamic outputs.
+        self._step_deps: Dict[str, Set[str]] = dict(self._plan.get_executable_step_deps())
+
+        # Rather than re-checking every pending step on every _update, track for each pending step
+        # the number of its deps that have yet to reach a terminal state, and for each step the
+        # pending steps that depend on it. Pending steps whose deps have all reached a terminal
+        # state are queued in _ready_to_process, ordered by when they were added to _pending.
+        self._pending_unresolved_dep_counts: Dict[str, int] = {}
+        self._pending_dependents: Dict[str, List[str]] = defaultdict(list)
+        self._pending_order: Dict[str, int] = {}
+        self._pending_counter = itertools.count()
+        self._ready_to_process: List[str] = []
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -100,8 +118,11 @@ def __init__(
         # track which upstream deps caused a step to skip
         self._skipped_deps: Dict[str, Sequence[str]] = {}
 
-        # steps move in to these buckets as a result of _update calls
-        self._executable: List[str] = []
+        # steps move in to these buckets as a result of _update calls. _executable is kept sorted
+        # by (sort key, order added) so that it does not need to be re-sorted on every call to
+        # get_steps_to_execute
+        self._executable: List[Tuple[float, int, str]] = []
+        self._executable_counter = itertools.count()
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
@@ -116,12 +137,17 @@ def __init__(
         self._failed: Set[str] = set()
         self._skipped: Set[str] = set()
         self._abandoned: Set[str] = set()
+        # union of the above
+        self._resolved: Set[str] = set()
 
         # see verify_complete
         self._unknown_state: Set[str] = set()
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._step_deps.items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -175,7 +201,10 @@ def __exit__(
     def _pending_state_str(self) -> str:
         assert not self.is_complete
         pending_action = (
-            self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+            [key for _, _, key in self._executable]
+            + self._pending_abandon
+            + self._pending_retry
+            + self._pending_skip
         )
         return "{pending_str}{in_flight_str}{action_str}{retry_str}{claim_str}".format(
             in_flight_str=f"\nSteps still in flight: {self._in_flight}" if self._in_flight else "",
@@ -197,16 +226,16 @@ def _pending_state_str(self) -> str:
             ),
         )
 
-    def _should_skip_step(self, step_key: str, successful_or_skipped_steps: Set[str]) -> bool:
+    def _should_skip_step(self, step_key: str) -> bool:
         step = self.get_step_by_key(step_key)
         for step_input in step.step_inputs:
             missing_source_handles = []
 
             for source_handle in step_input.get_step_output_handle_dependencies():
                 if (
-                    source_handle.step_key in successful_or_skipped_steps
-                    and source_handle not in self._step_outputs
-                ):
+                    source_handle.step_key in self._success
+                    or source_handle.step_key in self._skipped
+                ) and source_handle not in self._step_outputs:
                     missing_source_handles.append(source_handle)
 
             if missing_source_handles:
@@ -219,45 +248,69 @@ def _should_skip_step(self, step_key: str, successful_or_skipped_steps: Set[str]
                     return True
         return False
 
+    def _add_pending(self, step_key: str, depends_on_steps: Set[str]) -> None:
+        self._pending[step_key] = depends_on_steps
+        self._pending_order[step_key] = next(self._pending_counter)
+
+        unresolved_deps = [dep for dep in depends_on_steps if dep not in self._resolved]
+        self._pending_unresolved_dep_counts[step_key] = len(unresolved_deps)
+        for dep in unresolved_deps:
+            self._pending_dependents[dep].append(step_key)
+
+        if not unresolved_deps:
+            self._ready_to_process.append(step_key)
+
+    def _mark_resolved(self, step_key: str) -> None:
+        """Called when a step reaches a terminal state, to update the unresolved dep counts of the
+        pending steps that depend on it.
+        """
+        if step_key in self._resolved:
+            return
+        self._resolved.add(step_key)
+
+        for dependent_key in self._pending_dependents.pop(step_key, []):
+            self._pending_unresolved_dep_counts[dependent_key] -= 1
+            if self._pending_unresolved_dep_counts[dependent_key] == 0:
+                self._ready_to_process.append(dependent_key)
+
+    def _add_executable(self, step_key: str) -> None:
+        bisect.insort(
+            self._executable,
+            (
+                self._sort_key_fn(self.get_step_by_key(step_key)),
+                next(self._executable_counter),
+                step_key,
+            ),
+        )
+
     def _update(self) -> None:
         """Moves steps from _pending to _executable / _pending_skip / _pending_retry
         as a function of what has been _completed.
         """
-        new_steps_to_execute: List[str] = []
-        new_steps_to_skip: List[str] = []
-        new_steps_to_abandon: List[str] = []
-
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-        resolved_steps = self._success | self._skipped | self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
-            new_step_deps = self._plan.resolve(self._completed_dynamic_outputs)
+            new_step_deps = self._plan.resolve(
+                self._completed_dynamic_outputs, known_step_deps=self._step_deps
+            )
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._step_deps[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, depends_on_steps in self._pending.items():
-            if depends_on_steps.issubset(resolved_steps):
-                if self._should_skip_step(step_key, successful_or_skipped_steps):
-                    new_steps_to_skip.append(step_key)
-                elif depends_on_steps.intersection(failed_or_abandoned_steps):
-                    new_steps_to_abandon.append(step_key)
-                else:
-                    new_steps_to_execute.append(step_key)
-
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+        ready_to_process = sorted(self._ready_to_process, key=self._pending_order.__getitem__)
+        self._ready_to_process = []
 
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
+        for step_key in ready_to_process:
+            depends_on_steps = self._pending.pop(step_key)
+            del self._pending_unresolved_dep_counts[step_key]
+            del self._pending_order[step_key]
 
-        for key in new_steps_to_abandon:
-            self._pending_abandon.append(key)
-            del self._pending[key]
+            if self._should_skip_step(step_key):
+                self._pending_skip.append(step_key)
+            elif any(dep in self._failed or dep in self._abandoned for dep in depends_on_steps):
+                self._pending_abandon.append(step_key)
+            else:
+                self._add_executable(step_key)
 
         ready_to_retry = []
         tick_time = time.time()
@@ -266,7 +319,7 @@ def _update(self) -> None:
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._add_executable(key)
             del self._waiting_to_retry[key]
 
     def sleep_interval(self):
@@ -318,11 +371,6 @@ def get_steps_to_execute(
 
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
-
         run_scoped_concurrency_limits_counter = None
         if self._tag_concurrency_limits:
             in_flight_steps = [self.get_step_by_key(key) for key in self._in_flight]
@@ -332,8 +380,9 @@ def get_steps_to_execute(
             )
 
         batch: List[ExecutionStep] = []
+        batch_entries: List[Tuple[float, int, str]] = []
 
-        for step in steps:
+        for entry in self._executable:
             if limit is not None and len(batch) >= limit:
                 break
 
@@ -343,6 +392,8 @@ def get_steps_to_execute(
             ):
                 break
 
+            step = self.get_step_by_key(entry[2])
+
             if run_scoped_concurrency_limits_counter:
                 if run_scoped_concurrency_limits_counter.is_blocked(step):
                     continue
@@ -363,10 +414,11 @@ def get_steps_to_execute(
                     continue
 
             batch.append(step)
+            batch_entries.append(entry)
 
-        for step in batch:
+        for step, entry in zip(batch, batch_entries):
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
+            del self._executable[bisect.bisect_left(self._executable, entry)]
             self._prep_for_dynamic_outputs(step)
 
         return batch
@@ -446,20 +498,24 @@ def plan_events_iterator(
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
 
     def mark_interrupted(self) -> None:
         self._interrupted = True
@@ -479,11 +535,12 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._step_deps[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._mark_resolved(step_key)
 
         self._retry_state.mark_attempt(step_key)
 
@@ -100,6 +100,9 @@
     ExecutionStep, UnresolvedCollectExecutionStep, UnresolvedMappedExecutionStep
 ]
 
+# Step fragments larger than this are not sent to step workers, which build the full plan instead
+MAX_STEP_FRAGMENT_SIZE = 1000
+
 
 class _PlanBuilder:
     """This is the state that is built up during the execution plan build process."""
@@ -209,7 +212,6 @@ def build(self) -> "ExecutionPlan":
                 step_dict_by_key,
                 step_handles_to_execute,
                 self.job_def,
-                self.resolved_run_config,
                 executable_map,
             ),
             executor_name=executor_name,
@@ -776,9 +778,17 @@ def get_executable_step_deps(self) -> Mapping[str, Set[str]]:
     def resolve(
         self,
         mappings: Mapping[str, Mapping[str, Optional[Sequence[str]]]],
+        known_step_deps: Optional[Mapping[str, Set[str]]] = None,
     ) -> Mapping[str, Set[str]]:
-        """Resolve any dynamic map or collect steps with the resolved dynamic mappings."""
-        previous = self.get_executable_step_deps()
+        """Resolve any dynamic map or collect steps with the resolved dynamic mappings.
+
+        If `known_step_deps` (the result of the previous call to `get_executable_step_deps`, plus
+        any steps returned by previous calls to `resolve`) is provided, only the dependencies of
+        newly executable steps are computed.
+        """
+        previous = (
+            known_step_deps if known_step_deps is not None else self.get_executable_step_deps()
+        )
 
         _update_from_resolved_dynamic_outputs(
             self.step_dict,
@@ -789,7 +799,9 @@ def resolve(
             mappings,
         )
 
-        after = self.get_executable_step_deps()
+        after = _get_executable_step_deps(
+            self.step_dict, self.step_handles_to_execute, self.executable_map, previous
+        )
 
         return {key: deps for key, deps in after.items() if key not in previous}
 
@@ -877,13 +889,91 @@ def build_subset_plan(
                 self.step_dict_by_key,
                 step_handles_to_execute,
                 job_def,
-                resolved_run_config,
                 executable_map,
             ),
             executor_name=self.executor_name,
             repository_load_data=self.repository_load_data,
         )
 
+    def build_step_fragment(
+        self,
+        step_keys_to_execute: Sequence[str],
+        job_def: JobDefinition,
+        max_steps: int = MAX_STEP_FRAGMENT_SIZE,
+    ) -> Optional["ExecutionPlan"]:
+        """Build a plan containing only the given executable steps and the steps that produce
+        their inputs, which can be handed to a step worker in place of the full plan. The
+        upstream steps are trimmed to the outputs that the given steps read, and have no inputs.
+
+        Returns None if any of the steps is not yet executable in this plan, or if the fragment
+        would contain more than `max_steps` steps, in which case the worker needs to build the
+        full plan itself.
+        """
+        check.sequence_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+        check.int_param(max_steps, "max_steps")
+
+        step_dict: Dict[StepHandleUnion, IExecutionStep] = {}
+        step_handles_to_execute: List[StepHandleUnion] = []
+        output_names_by_upstream_key: Dict[str, Set[str]] = defaultdict(set)
+        for key in step_keys_to_execute:
+            step = self.step_dict_by_key.get(key)
+            if not isinstance(step, ExecutionStep):
+                return None
+
+            step_handles_to_execute.append(step.handle)
+            step_dict[step.handle] = step
+            for step_input in step.step_inputs:
+                for step_output_handle in step_input.get_step_output_handle_dependencies():
+                    output_names_by_upstream_key[step_output_handle.step_key].add(
+                        step_output_handle.output_name
+                    )
+
+        for upstream_key, output_names in output_names_by_upstream_key.items():
+            upstream_step = self.step_dict_by_key.get(upstream_key)
+            if upstream_step is None:
+                return None
+            if upstream_step.handle in step_dict:
+                continue
+            if isinstance(upstream_step, ExecutionStep):
+                # upstream steps are not executed by the worker, which only needs to know about
+                # the outputs that it loads
+                upstream_step = upstream_step._replace(
+                    step_input_dict={},
+                    step_output_dict={
+                        name: step_output
+                        for name, step_output in upstream_step.step_output_dict.items()
+                        if name in output_names
+                    },
+                )
+            step_dict[upstream_step.handle] = upstream_step
+
+        if len(step_dict) > max_steps:
+            return None
+
+        step_dict_by_key = {step.key: step for step in step_dict.values()}
+        known_state = KnownExecutionState()
+        executable_map, resolvable_map = _compute_step_maps(
+            step_dict, step_dict_by_key, step_handles_to_execute, known_state
+        )
+
+        return ExecutionPlan(
+            step_dict,
+            executable_map,
+            resolvable_map,
+            step_handles_to_execute,
+            known_state,
+            _compute_artifacts_persisted(
+                step_dict,
+                step_dict_by_key,
+                step_handles_to_execute,
+                job_def,
+                executable_map,
+            ),
+            step_dict_by_key=step_dict_by_key,
+            executor_name=self.executor_name,
+            repository_load_data=self.repository_load_data,
+        )
+
     def get_version_for_step_output_handle(
         self, step_output_handle: StepOutputHandle
     ) -> Optional[str]:
@@ -1089,6 +1179,8 @@ def _update_from_resolved_dynamic_outputs(
     resolved_steps: List[ExecutionStep] = []
     key_sets_to_clear: List[FrozenSet[str]] = []
 
+    step_handles_to_execute_set = set(step_handles_to_execute)
+
     # find entries in the resolvable map whose requirements are now all ready
     for required_keys, unresolved_step_handles in resolvable_map.items():
         if not all(key in dynamic_mappings for key in required_keys):
@@ -1098,7 +1190,7 @@ def _update_from_resolved_dynamic_outputs(
 
         for unresolved_step_handle in unresolved_step_handles:
             # don't resolve steps we are not executing
-            if unresolved_step_handle not in step_handles_to_execute:
+            if unresolved_step_handle not in step_handles_to_execute_set:
                 continue
 
             resolvable_step = step_dict[unresolved_step_handle]
@@ -1216,7 +1308,6 @@ def _compute_artifacts_persisted(
     step_dict_by_key: Dict[str, IExecutionStep],
     step_handles_to_execute: Sequence[StepHandleUnion],
     job_def: JobDefinition,
-    resolved_run_config: ResolvedRunConfig,
     executable_map: Mapping[str, Union[StepHandle, ResolvedFromDynamicStepHandle]],
 ) -> bool:
     """Check if all the border steps of the current run have non-in-memory IO managers for reexecution.
@@ -1267,19 +1358,26 @@ def _get_executable_step_deps(
     step_dict: Mapping[StepHandleUnion, IExecutionStep],
     step_handles_to_execute: Sequence[StepHandleUnion],
     executable_map: Mapping[str, Union[StepHandle, ResolvedFromDynamicStepHandle]],
+    known_step_deps: Optional[Mapping[str, Set[str]]] = None,
 ) -> Mapping[str, Set[str]]:
     """Returns:
     Dict[str, Set[str]]: Maps step keys to sets of step keys that they depend on. Includes
-        only steps that are included in step_handles_to_execute.
+        only steps that are included in step_handles_to_execute. The deps of steps in
+        `known_step_deps` are not recomputed, since resolving dynamic outputs only ever makes
+        additional steps executable.
     """
     deps = {}
 
     # for things transitively downstream of unresolved collect steps
     unresolved_set = set()
 
-    step_keys_to_execute = [handle.to_key() for handle in step_handles_to_execute]
+    step_keys_to_execute = {handle.to_key() for handle in step_handles_to_execute}
 
     for key, handle in executable_map.items():
+        if known_step_deps is not None and key in known_step_deps:
+            deps[key] = known_step_deps[key]
+            continue
+
         step = cast(ExecutionStep, step_dict[handle])
         filtered_deps = []
         depends_on_unresolved = False
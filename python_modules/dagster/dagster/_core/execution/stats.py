@@ -19,9 +19,6 @@ def build_run_stats_from_events(
         raise check.ParameterCheckError(
             "Invariant violation for parameter 'records'. Description: Expected iterable."
         ) from exc
-    for i, record in enumerate(entries):
-        check.inst_param(record, f"records[{i}]", EventLogEntry)
-
     steps_succeeded = 0
     steps_failed = 0
     materializations = 0
@@ -31,7 +28,9 @@ def build_run_stats_from_events(
     start_time = None
     end_time = None
 
-    for event in entries:
+    # check each entry as it is consumed, so that entries can be a single-pass iterator
+    for i, event in enumerate(entries):
+        check.inst_param(event, f"records[{i}]", EventLogEntry)
         if not event.is_dagster_event:
             continue
         dagster_event = event.get_dagster_event()
@@ -3,16 +3,18 @@
 import os
 import queue
 import sys
+import threading
 from abc import ABC, abstractmethod
 from multiprocessing import Queue
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, NamedTuple, Optional, Union
 
 from typing_extensions import Literal
 
 import dagster._check as check
 from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._utils import start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
@@ -175,3 +177,257 @@ def execute_child_process_command(
         process.join()
     finally:
         event_queue.close()
+
+
+WORKER_SHUTDOWN_TIMEOUT = 5.0
+"""Seconds to wait for an idle worker process to exit cleanly before it is terminated."""
+
+
+def _execute_commands_in_worker_process(
+    task_queue: Queue,
+    event_queue: Queue,
+    term_event: Any,
+    max_tasks: Optional[int],
+    initializer: Optional[Callable[[], None]],
+) -> None:
+    """Executes ChildProcessCommands received on task_queue, one at a time, until a None sentinel
+    is received or max_tasks commands have been executed.
+
+    Each command is wrapped in the same way as in _execute_command_in_child_process, so the parent
+    sees the same start / done / system error events for every command. The worker exits after a
+    command fails with a system error, since the process may no longer be in a usable state. If the
+    initializer fails, its error is reported as the system error of the first command.
+    """
+    with capture_interrupts():
+        initializer_error_info: Optional[SerializableErrorInfo] = None
+        if initializer:
+            try:
+                initializer()
+            except Exception:
+                initializer_error_info = serializable_error_info_from_exc_info(sys.exc_info())
+
+        pid = os.getpid()
+        tasks_executed = 0
+        while max_tasks is None or tasks_executed < max_tasks:
+            command = task_queue.get()
+            if command is None:
+                break
+
+            tasks_executed += 1
+            if initializer_error_info:
+                event_queue.put(ChildProcessStartEvent(pid=pid))
+                event_queue.put(
+                    ChildProcessSystemErrorEvent(pid=pid, error_info=initializer_error_info)
+                )
+                break
+
+            done_event = threading.Event()
+            termination_thread = start_termination_thread(term_event, done_event)
+            # capture interrupts per command, so that an interrupt received while executing one
+            # command is not raised by the next one
+            with capture_interrupts():
+                event_queue.put(ChildProcessStartEvent(pid=pid))
+                completion_event: ChildProcessEvent
+                try:
+                    for step_event in command.execute():
+                        event_queue.put(step_event)
+                    completion_event = ChildProcessDoneEvent(pid=pid)
+                except (
+                    Exception,
+                    KeyboardInterrupt,
+                    DagsterExecutionInterruptedError,
+                ):
+                    completion_event = ChildProcessSystemErrorEvent(
+                        pid=pid,
+                        error_info=serializable_error_info_from_exc_info(sys.exc_info()),
+                    )
+                finally:
+                    # set events to stop the termination thread
+                    done_event.set()  # waiting on term_event so set done first
+                    term_event.set()
+                    termination_thread.join()
+                    # term_event is shared by every command this worker executes, so it is cleared
+                    # before the parent learns that the command has completed and reuses the worker
+                    term_event.clear()
+
+                event_queue.put(completion_event)
+                if isinstance(completion_event, ChildProcessSystemErrorEvent):
+                    break
+
+
+class ChildProcessWorker:
+    """A long-lived child process that executes ChildProcessCommands sent to it by a
+    ChildProcessWorkerPool, one at a time.
+
+    Commands executed in a worker share the worker's term_event: setting it interrupts whichever
+    command the worker is currently executing.
+    """
+
+    def __init__(
+        self,
+        pool: "ChildProcessWorkerPool",
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_tasks: Optional[int],
+        initializer: Optional[Callable[[], None]],
+    ):
+        self._pool = pool
+        self._max_tasks = max_tasks
+        self._task_queue = multiprocessing_ctx.Queue()
+        self._event_queue = multiprocessing_ctx.Queue()
+        self.term_event = multiprocessing_ctx.Event()
+        self.process: BaseProcess = multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_commands_in_worker_process,
+            args=(
+                self._task_queue,
+                self._event_queue,
+                self.term_event,
+                max_tasks,
+                initializer,
+            ),
+        )
+        self.process.start()
+        self.tasks_started = 0
+        self.is_retired = False
+
+    @property
+    def can_accept_task(self) -> bool:
+        return (
+            not self.is_retired
+            and self.process.is_alive()
+            and (self._max_tasks is None or self.tasks_started < self._max_tasks)
+        )
+
+    def execute(
+        self, command: ChildProcessCommand
+    ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, BaseProcess]]]:
+        """Execute a ChildProcessCommand in this worker.
+
+        Yields the same sequence of objects as execute_child_process_command. Once the command has
+        completed, the worker is returned to its pool, unless it has crashed, failed, or reached
+        its maximum number of tasks, in which case it is retired.
+        """
+        check.inst_param(command, "command", ChildProcessCommand)
+        check.invariant(self.can_accept_task, "Worker process can not accept any more tasks")
+
+        self.tasks_started += 1
+        self.term_event.clear()
+        self._task_queue.put(command)
+        yield self.process
+
+        completed_properly = False
+        try:
+            while not completed_properly:
+                event = _poll_for_event(self.process, self._event_queue)
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    break
+
+                yield event
+
+                if isinstance(event, ChildProcessSystemErrorEvent):
+                    completed_properly = True
+                    # the worker exits after a system error
+                    self.is_retired = True
+                elif isinstance(event, ChildProcessDoneEvent):
+                    completed_properly = True
+
+            if not completed_properly:
+                self.is_retired = True
+                raise ChildProcessCrashException(
+                    pid=self.process.pid, exit_code=self.process.exitcode
+                )
+        finally:
+            self._pool.release(self)
+
+    def shutdown(self, timeout: float = WORKER_SHUTDOWN_TIMEOUT) -> None:
+        self.is_retired = True
+        if self.process.is_alive():
+            try:
+                self._task_queue.put(None)
+            except (ValueError, OSError):
+                pass
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+        self._task_queue.close()
+        self._event_queue.close()
+
+
+class ChildProcessWorkerPool:
+    """A pool of long-lived child processes, used to execute many ChildProcessCommands without
+    paying the cost of starting a new process (and re-importing user code) for each one.
+
+    Workers are started on demand and reused once their current command has completed. A worker is
+    replaced by a new one when it crashes, when a command fails with a system error, or after it has executed max_tasks_per_worker commands.
+
+    Args:
+        multiprocessing_ctx: The multiprocessing context to execute in (spawn, forkserver, fork)
+        max_tasks_per_worker (Optional[int]): The number of commands a worker executes before it is
+            replaced. If not set, workers are reused until the pool is closed.
+        initializer (Optional[Callable[[], None]]): A picklable function, called once in each worker
+            when it starts, e.g. to load user code ahead of the first command.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_tasks_per_worker: Optional[int] = None,
+        initializer: Optional[Callable[[], None]] = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_tasks_per_worker = check.opt_int_param(
+            max_tasks_per_worker, "max_tasks_per_worker"
+        )
+        check.invariant(
+            self._max_tasks_per_worker is None or self._max_tasks_per_worker > 0,
+            "max_tasks_per_worker must be a positive integer",
+        )
+        self._initializer = check.opt_callable_param(initializer, "initializer")
+        self._idle_workers: List[ChildProcessWorker] = []
+        self._workers: List[ChildProcessWorker] = []
+        self._closed = False
+
+    def acquire(self) -> ChildProcessWorker:
+        """Reserve a worker to execute a single command, starting a new one if no idle worker is
+        available.
+        """
+        check.invariant(not self._closed, "Attempted to acquire a worker from a closed pool")
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.can_accept_task:
+                return worker
+            self._retire(worker)
+
+        worker = ChildProcessWorker(
+            self,
+            self._multiprocessing_ctx,
+            self._max_tasks_per_worker,
+            self._initializer,
+        )
+        self._workers.append(worker)
+        return worker
+
+    def release(self, worker: ChildProcessWorker) -> None:
+        if not self._closed and worker.can_accept_task:
+            self._idle_workers.append(worker)
+        else:
+            self._retire(worker)
+
+    def _retire(self, worker: ChildProcessWorker) -> None:
+        worker.shutdown()
+        if worker in self._workers:
+            self._workers.remove(worker)
+
+    def close(self) -> None:
+        self._closed = True
+        for worker in self._workers:
+            worker.shutdown()
+        self._workers = []
+        self._idle_workers = []
+
+    def __enter__(self) -> "ChildProcessWorkerPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -1,3 +1,4 @@
+import functools
 import multiprocessing
 import os
 import sys
@@ -32,6 +33,8 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._core.instance import DagsterInstance
@@ -53,7 +56,7 @@ def __init__(
         dagster_run: "DagsterRun",
         step_key: str,
         instance_ref: "InstanceRef",
-        term_event: Any,
+        term_event: Optional[Any],
         recon_pipeline: ReconstructableJob,
         retry_mode: RetryMode,
         known_state: Optional[KnownExecutionState],
@@ -72,15 +75,21 @@ def __init__(
     def execute(self) -> Iterator[DagsterEvent]:
         recon_job = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
+            # when executing in a reused worker process, the worker manages the termination thread
             done_event = threading.Event()
-            start_termination_thread(self.term_event, done_event)
+            if self.term_event:
+                start_termination_thread(self.term_event, done_event)
             try:
                 log_manager = create_context_free_log_manager(instance, self.dagster_run)
 
                 yield DagsterEvent.step_worker_started(
                     log_manager,
                     self.dagster_run.job_name,
-                    message=f'Executing step "{self.step_key}" in subprocess.',
+                    message=(
+                        f'Executing step "{self.step_key}" in subprocess.'
+                        if self.term_event
+                        else f'Executing step "{self.step_key}" in reused worker process.'
+                    ),
                     metadata={
                         "pid": MetadataValue.text(str(os.getpid())),
                     },
@@ -102,9 +111,21 @@ def execute(self) -> Iterator[DagsterEvent]:
                     instance=instance,
                 )
             finally:
-                # set events to stop the termination thread on exit
-                done_event.set()  # waiting on term_event so set done first
-                self.term_event.set()
+                if self.term_event:
+                    # set events to stop the termination thread on exit
+                    done_event.set()  # waiting on term_event so set done first
+                    self.term_event.set()
+
+
+def _load_job_definition(
+    recon_job: ReconstructableJob, repository_load_data: Optional[RepositoryLoadData]
+) -> None:
+    # Called once in each reused worker process, so that user code is loaded before the first step
+    # is executed. ReconstructableJob.get_definition is cached, so the loaded definition is reused
+    # by every step the worker executes.
+    if repository_load_data is not None:
+        recon_job = recon_job.with_repository_load_data(repository_load_data)
+    recon_job.get_definition()
 
 
 class MultiprocessExecutor(Executor):
@@ -115,6 +136,8 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        reuse_processes: bool = False,
+        max_tasks_per_worker: Optional[int] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -140,6 +163,10 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._reuse_processes = check.bool_param(reuse_processes, "reuse_processes")
+        self._max_tasks_per_worker = check.opt_int_param(
+            max_tasks_per_worker, "max_tasks_per_worker"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -190,6 +217,20 @@ def execute(
         with ExitStack() as stack:
             timer_result = stack.enter_context(time_execution_scope())
 
+            worker_pool = (
+                stack.enter_context(
+                    ChildProcessWorkerPool(
+                        multiproc_ctx,
+                        max_tasks_per_worker=self._max_tasks_per_worker,
+                        initializer=functools.partial(
+                            _load_job_definition, job, execution_plan.repository_load_data
+                        ),
+                    )
+                )
+                if self._reuse_processes
+                else None
+            )
+
             instance_concurrency_context = stack.enter_context(
                 InstanceConcurrencyContext(plan_context.instance, plan_context.dagster_run)
             )
@@ -235,7 +276,10 @@ def execute(
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
-                            term_events[step.key] = multiproc_ctx.Event()
+                            worker = worker_pool.acquire() if worker_pool else None
+                            term_events[step.key] = (
+                                worker.term_event if worker else multiproc_ctx.Event()
+                            )
                             active_iters[step.key] = execute_step_out_of_process(
                                 multiproc_ctx,
                                 job,
@@ -247,6 +291,7 @@ def execute(
                                 self.retries,
                                 active_execution.get_known_state(),
                                 execution_plan.repository_load_data,
+                                worker=worker,
                             )
 
                     # process active iterators
@@ -366,26 +411,37 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    worker: Optional[ChildProcessWorker] = None,
 ) -> Iterator[Optional[DagsterEvent]]:
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
         dagster_run=step_context.dagster_run,
         step_key=step.key,
         instance_ref=step_context.instance.get_ref(),
-        term_event=term_events[step.key],
+        # a reused worker process owns its term event, which is shared by every step it executes
+        term_event=None if worker else term_events[step.key],
         recon_pipeline=recon_job,
         retry_mode=retries,
         known_state=known_state,
         repository_load_data=repository_load_data,
     )
 
-    yield DagsterEvent.step_worker_starting(
-        step_context,
-        f'Launching subprocess for "{step.key}".',
-        metadata={},
-    )
+    if worker:
+        yield DagsterEvent.step_worker_starting(
+            step_context,
+            f'Sending "{step.key}" to worker process (pid: {worker.process.pid}).',
+            metadata={},
+        )
+        child_process_iter = worker.execute(command)
+    else:
+        yield DagsterEvent.step_worker_starting(
+            step_context,
+            f'Launching subprocess for "{step.key}".',
+            metadata={},
+        )
+        child_process_iter = execute_child_process_command(multiproc_ctx, command)
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    for ret in child_process_iter:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -140,6 +140,7 @@ def _pop_events(
     def _get_step_handler_context(
         self, plan_context, steps, active_execution
     ) -> StepHandlerContext:
+        step_keys_to_execute = [step.key for step in steps]
         return StepHandlerContext(
             instance=plan_context.plan_data.instance,
             plan_context=plan_context,
@@ -147,12 +148,15 @@ def _get_step_handler_context(
             execute_step_args=ExecuteStepArgs(
                 job_origin=plan_context.reconstructable_job.get_python_origin(),
                 run_id=plan_context.dagster_run.run_id,
-                step_keys_to_execute=[step.key for step in steps],
+                step_keys_to_execute=step_keys_to_execute,
                 instance_ref=plan_context.plan_data.instance.get_ref(),
                 retry_mode=self.retries.for_inner_plan(),
                 known_state=active_execution.get_known_state(),
                 should_verify_step=self._should_verify_step,
                 print_serialized_events=False,
+                execution_plan_fragment=plan_context.get_execution_plan_fragment(
+                    step_keys_to_execute
+                ),
             ),
             dagster_run=plan_context.dagster_run,
         )
@@ -2,6 +2,7 @@
 import logging.config
 import os
 import sys
+import threading
 import warnings
 import weakref
 from abc import abstractmethod
@@ -17,6 +18,7 @@
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -98,12 +100,15 @@
 RUNLESS_RUN_ID = ""
 RUNLESS_JOB_NAME = ""
 
+# The number of events that `report_runless_asset_events` writes per call to `store_event_batch`
+RUNLESS_ASSET_EVENT_BATCH_SIZE = 100
+
 if TYPE_CHECKING:
     from dagster._core.debug import DebugRunPayload
     from dagster._core.definitions.asset_check_spec import AssetCheckKey
     from dagster._core.definitions.base_asset_graph import BaseAssetGraph
     from dagster._core.definitions.job_definition import JobDefinition
-    from dagster._core.definitions.partition import PartitionsDefinition
+    from dagster._core.definitions.partition import PartitionsDefinition, VersionedDynamicPartitions
     from dagster._core.definitions.repository_definition.repository_definition import (
         RepositoryLoadData,
     )
@@ -200,6 +205,24 @@ def _is_batch_writing_enabled() -> bool:
     return _get_event_batch_size() > 0
 
 
+# Sets the maximum number of seconds that events are held in an in-memory, per-run write-behind
+# buffer before being written to the event log with `store_event_batch`. Unlike explicit batching,
+# this applies to events of every type. Events that other processes wait on (see
+# `WRITE_THROUGH_EVENTS`) flush the buffer for their run immediately, so that ordering is preserved
+# and the event log never lags behind run and step status. Defaults to 0, which turns off
+# write-behind buffering entirely.
+def _get_event_write_behind_interval() -> float:
+    return float(os.getenv("DAGSTER_EVENT_WRITE_BEHIND_INTERVAL", "0"))
+
+
+def _get_event_write_behind_max_events() -> int:
+    return int(os.getenv("DAGSTER_EVENT_WRITE_BEHIND_MAX_EVENTS", "1000"))
+
+
+def _is_write_behind_enabled() -> bool:
+    return _get_event_write_behind_interval() > 0
+
+
 def _check_run_equality(
     pipeline_run: DagsterRun, candidate_run: DagsterRun
 ) -> Mapping[str, Tuple[Any, Any]]:
@@ -496,6 +519,11 @@ def __init__(
         # Used for batched event handling
         self._event_buffer: Dict[str, List[EventLogEntry]] = defaultdict(list)
 
+        # Used for write-behind event handling, keyed by run id
+        self._write_behind_buffer: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        self._write_behind_timers: Dict[str, threading.Timer] = {}
+        self._write_behind_lock = threading.RLock()
+
     # ctors
 
     @public
@@ -835,6 +863,9 @@ def get_sensor_settings(self) -> Mapping[str, Any]:
     def get_auto_materialize_settings(self) -> Mapping[str, Any]:
         return self.get_settings("auto_materialize")
 
+    def get_backfill_settings(self) -> Mapping[str, Any]:
+        return self.get_settings("backfills")
+
     @property
     def telemetry_enabled(self) -> bool:
         if self.is_ephemeral:
@@ -962,6 +993,14 @@ def auto_materialize_use_sensors(self) -> int:
     def global_op_concurrency_default_limit(self) -> Optional[int]:
         return self.get_settings("concurrency").get("default_op_concurrency_limit")
 
+    @property
+    def asset_status_cache_update_on_write(self) -> bool:
+        return self.get_settings("asset_status_cache").get("update_on_write", False)
+
+    @property
+    def asset_status_cache_compaction_threshold(self) -> int:
+        return self.get_settings("asset_status_cache").get("compaction_threshold", 1000)
+
     # python logs
 
     @property
@@ -1015,6 +1054,7 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        self._flush_all_write_behind_buffers()
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         if self._run_coordinator:
@@ -1303,17 +1343,14 @@ def _ensure_persisted_job_snapshot(
                     f"Stored parent snapshot ID {parent_snapshot_id} did not match the parent snapshot ID {job_snapshot.lineage_snapshot.parent_snapshot_id} on the subsetted job"
                 )
 
-            if not self._run_storage.has_job_snapshot(parent_snapshot_id):
-                self._run_storage.add_job_snapshot(
-                    check.not_none(parent_job_snapshot), parent_snapshot_id
-                )
-
-        job_snapshot_id = create_job_snapshot_id(job_snapshot)
-        if not self._run_storage.has_job_snapshot(job_snapshot_id):
-            returned_job_snapshot_id = self._run_storage.add_job_snapshot(job_snapshot)
-            check.invariant(job_snapshot_id == returned_job_snapshot_id)
+            # persist the parent and subsetted snapshots together
+            snapshot_ids = self._run_storage.ensure_snapshots(
+                [check.not_none(parent_job_snapshot), job_snapshot]
+            )
+        else:
+            snapshot_ids = self._run_storage.ensure_snapshots([job_snapshot])
 
-        return job_snapshot_id
+        return snapshot_ids[-1]
 
     def _ensure_persisted_execution_plan_snapshot(
         self,
@@ -1321,10 +1358,7 @@ def _ensure_persisted_execution_plan_snapshot(
         job_snapshot_id: str,
         step_keys_to_execute: Optional[Sequence[str]],
     ) -> str:
-        from dagster._core.snap.execution_plan_snapshot import (
-            ExecutionPlanSnapshot,
-            create_execution_plan_snapshot_id,
-        )
+        from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
 
         check.inst_param(execution_plan_snapshot, "execution_plan_snapshot", ExecutionPlanSnapshot)
         check.str_param(job_snapshot_id, "job_snapshot_id")
@@ -1337,15 +1371,7 @@ def _ensure_persisted_execution_plan_snapshot(
             f'"{job_snapshot_id}"',
         )
 
-        execution_plan_snapshot_id = create_execution_plan_snapshot_id(execution_plan_snapshot)
-
-        if not self._run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id):
-            returned_execution_plan_snapshot_id = self._run_storage.add_execution_plan_snapshot(
-                execution_plan_snapshot
-            )
-
-            check.invariant(execution_plan_snapshot_id == returned_execution_plan_snapshot_id)
-
+        [execution_plan_snapshot_id] = self._run_storage.ensure_snapshots([execution_plan_snapshot])
         return execution_plan_snapshot_id
 
     def _log_materialization_planned_event_for_asset(
@@ -1784,6 +1810,12 @@ def add_snapshot(
     ) -> None:
         return self._run_storage.add_snapshot(snapshot, snapshot_id)
 
+    @traced
+    def ensure_snapshots(
+        self, snapshots: Sequence[Union["JobSnap", "ExecutionPlanSnapshot"]]
+    ) -> Sequence[str]:
+        return self._run_storage.ensure_snapshots(snapshots)
+
     @traced
     def handle_run_event(self, run_id: str, event: "DagsterEvent") -> None:
         return self._run_storage.handle_run_event(run_id, event)
@@ -1902,6 +1934,20 @@ def get_records_for_run(
     ) -> "EventLogConnection":
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit, ascending)
 
+    def iterate_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator["EventLogRecord"]:
+        """Iterate over all of the event log records for a run, in ascending order, fetching them
+        from storage in batches so that the full log is never held in memory at once.
+        """
+        if batch_size is None:
+            return self._event_storage.iterate_records_for_run(run_id, cursor, of_type)
+        return self._event_storage.iterate_records_for_run(run_id, cursor, of_type, batch_size)
+
     def watch_event_logs(self, run_id: str, cursor: Optional[str], cb: "EventHandlerFn") -> None:
         return self._event_storage.watch(run_id, cursor, cb)
 
@@ -2290,7 +2336,23 @@ def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
             partitions_def_name (str): The name of the `DynamicPartitionsDefinition`.
         """
         check.str_param(partitions_def_name, "partitions_def_name")
-        return self._event_storage.get_dynamic_partitions(partitions_def_name)
+        return list(
+            self._event_storage.get_versioned_dynamic_partitions(partitions_def_name).partition_keys
+        )
+
+    @traced
+    def get_versioned_dynamic_partitions(
+        self, partitions_def_name: str
+    ) -> "VersionedDynamicPartitions":
+        """Get the partition keys of the specified :py:class:`DynamicPartitionsDefinition`, along
+        with the version of the definition they were loaded at. Partition keys are cached by the
+        event log storage until the version changes.
+
+        Args:
+            partitions_def_name (str): The name of the `DynamicPartitionsDefinition`.
+        """
+        check.str_param(partitions_def_name, "partitions_def_name")
+        return self._event_storage.get_versioned_dynamic_partitions(partitions_def_name)
 
     @public
     @traced
@@ -2401,10 +2463,19 @@ def handle_new_event(
         to the storage layer in a single batch. If an error occurrs during batch writing, then we
         fall back to iterative individual event writes.
 
+        If write-behind buffering is enabled (via `DAGSTER_EVENT_WRITE_BEHIND_INTERVAL`), events of
+        any type are instead buffered per run and written in a single batch once the buffer is full,
+        the write-behind interval has elapsed, or an event in `WRITE_THROUGH_EVENTS` is received.
+        `batch_metadata` is ignored in this mode.
+
         Args:
             event (EventLogEntry): The event to handle.
             batch_metadata (Optional[DagsterEventBatchMetadata]): Metadata for batch writing.
         """
+        if _is_write_behind_enabled():
+            self._buffer_event_write_behind(event)
+            return
+
         if batch_metadata is None or not _is_batch_writing_enabled():
             events = [event]
         else:
@@ -2416,35 +2487,128 @@ def handle_new_event(
             else:
                 return
 
-        if len(events) == 1:
-            self._event_storage.store_event(events[0])
-        else:
-            try:
-                self._event_storage.store_event_batch(events)
+        self._write_events(events)
 
-            # Fall back to storing events one by one if writing a batch fails. We catch a generic
-            # Exception because that is the parent class of the actually received error,
-            # dagster_cloud_cli.core.errors.GraphQLStorageError, which we cannot import here due to
-            # it living in a cloud package.
-            except Exception as e:
-                sys.stderr.write(f"Exception while storing event batch: {e}\n")
-                sys.stderr.write(
-                    "Falling back to storing multiple single-event storage requests...\n"
-                )
-                for event in events:
-                    self._event_storage.store_event(event)
+    def _write_events(self, events: Sequence["EventLogEntry"]) -> None:
+        """Stores the given events and notifies subscribers. If an error occurs after some of the
+        events have been stored, raises a DagsterEventBatchPartiallyStoredError with the number of
+        events, from the start of `events`, that were stored.
+        """
+        from dagster._core.errors import DagsterEventBatchPartiallyStoredError
 
-        for event in events:
-            run_id = event.run_id
+        num_stored = 0
+        try:
+            if len(events) == 1:
+                self._event_storage.store_event(events[0])
+                num_stored = 1
+            else:
+                try:
+                    self._event_storage.store_event_batch(events)
+                    num_stored = len(events)
+
+                # Fall back to storing events one by one if writing a batch fails. We catch a
+                # generic Exception because that is the parent class of the actually received
+                # error, dagster_cloud_cli.core.errors.GraphQLStorageError, which we cannot import
+                # here due to it living in a cloud package.
+                except Exception as e:
+                    # only the events that were not stored as part of the batch are stored again
+                    if isinstance(e, DagsterEventBatchPartiallyStoredError):
+                        num_stored = e.num_stored
+                    sys.stderr.write(f"Exception while storing event batch: {e}\n")
+                    if num_stored < len(events):
+                        sys.stderr.write(
+                            "Falling back to storing multiple single-event storage requests...\n"
+                        )
+                    for event in events[num_stored:]:
+                        self._event_storage.store_event(event)
+                        num_stored += 1
+        except Exception as e:
+            if not num_stored:
+                raise
+            raise DagsterEventBatchPartiallyStoredError(
+                f"Error while storing events: {e}", num_stored=num_stored
+            ) from e
+        finally:
+            for event in events[:num_stored]:
+                run_id = event.run_id
+                if (
+                    not self._event_storage.handles_run_events_in_store_event
+                    and event.is_dagster_event
+                    and event.get_dagster_event().is_job_event
+                ):
+                    self._run_storage.handle_run_event(run_id, event.get_dagster_event())
+
+                for sub in self._subscribers[run_id]:
+                    sub(event)
+
+    def _buffer_event_write_behind(self, event: "EventLogEntry") -> None:
+        from dagster._core.events import WRITE_THROUGH_EVENTS
+
+        run_id = event.run_id
+        with self._write_behind_lock:
+            buffer = self._write_behind_buffer[run_id]
+            buffer.append(event)
             if (
-                not self._event_storage.handles_run_events_in_store_event
-                and event.is_dagster_event
-                and event.get_dagster_event().is_job_event
+                not run_id
+                or (event.is_dagster_event and event.dagster_event_type in WRITE_THROUGH_EVENTS)
+                or len(buffer) >= _get_event_write_behind_max_events()
             ):
-                self._run_storage.handle_run_event(run_id, event.get_dagster_event())
+                self._flush_write_behind_buffer(run_id)
+            elif run_id not in self._write_behind_timers:
+                self._start_write_behind_timer(run_id)
+
+    def _start_write_behind_timer(self, run_id: str) -> None:
+        timer = threading.Timer(
+            _get_event_write_behind_interval(),
+            self._flush_write_behind_buffer_on_timer,
+            args=(run_id,),
+        )
+        timer.daemon = True
+        self._write_behind_timers[run_id] = timer
+        timer.start()
+
+    def _flush_write_behind_buffer(self, run_id: str) -> None:
+        from dagster._core.errors import DagsterEventBatchPartiallyStoredError
+
+        with self._write_behind_lock:
+            timer = self._write_behind_timers.pop(run_id, None)
+            if timer:
+                timer.cancel()
+            events = self._write_behind_buffer.pop(run_id, None)
+            if not events:
+                return
+
+            try:
+                self._write_events(events)
+            except Exception as e:
+                # keep the events that were not stored at the front of the buffer, and retry them
+                # with the next flush
+                num_stored = (
+                    e.num_stored if isinstance(e, DagsterEventBatchPartiallyStoredError) else 0
+                )
+                self._write_behind_buffer[run_id][:0] = events[num_stored:]
+                self._start_write_behind_timer(run_id)
+                raise
 
-            for sub in self._subscribers[run_id]:
-                sub(event)
+    def _flush_write_behind_buffer_on_timer(self, run_id: str) -> None:
+        try:
+            self._flush_write_behind_buffer(run_id)
+        except Exception as e:
+            sys.stderr.write(
+                f"Exception while flushing buffered events for run {run_id}, the events will be"
+                f" retried: {e}\n"
+            )
+
+    def _flush_all_write_behind_buffers(self) -> None:
+        with self._write_behind_lock:
+            try:
+                for run_id in list(self._write_behind_buffer.keys()):
+                    self._flush_write_behind_buffer(run_id)
+            finally:
+                # called when the instance is disposed, so a failed flush is not retried
+                for timer in self._write_behind_timers.values():
+                    timer.cancel()
+                self._write_behind_timers.clear()
 
     def add_event_listener(self, run_id: str, cb) -> None:
         self._subscribers[run_id].append(cb)
@@ -3058,7 +3222,7 @@ def get_required_daemon_types(self) -> Sequence[str]:
             daemons.append(QueuedRunCoordinatorDaemon.daemon_type())
         if self.run_monitoring_enabled:
             daemons.append(MonitoringDaemon.daemon_type())
-        if self.run_retries_enabled:
+        if self.run_retries_enabled or self.asset_status_cache_update_on_write:
             daemons.append(EventLogConsumerDaemon.daemon_type())
         if self.auto_materialize_enabled or self.auto_materialize_use_sensors:
             daemons.append(AssetDaemon.daemon_type())
@@ -3215,6 +3379,65 @@ def report_runless_asset_event(
         asset_event: Union["AssetMaterialization", "AssetObservation", "AssetCheckEvaluation"],
     ):
         """Record an event log entry related to assets that does not belong to a Dagster run."""
+        return self.report_dagster_event(
+            run_id=RUNLESS_RUN_ID,
+            dagster_event=self._get_runless_asset_dagster_event(asset_event),
+        )
+
+    def report_runless_asset_events(
+        self,
+        asset_events: Sequence[
+            Union["AssetMaterialization", "AssetObservation", "AssetCheckEvaluation"]
+        ],
+        batch_size: int = RUNLESS_ASSET_EVENT_BATCH_SIZE,
+    ) -> None:
+        """Record event log entries related to assets that do not belong to a Dagster run, writing
+        them to the event log storage in batches of `batch_size` events.
+
+        If an error occurs after some of the events have been stored, raises a
+        DagsterEventBatchPartiallyStoredError with the number of events, from the start of
+        `asset_events`, that were stored.
+        """
+        from dagster._core.errors import DagsterEventBatchPartiallyStoredError
+        from dagster._core.events.log import EventLogEntry
+
+        check.int_param(batch_size, "batch_size")
+        dagster_events = [
+            self._get_runless_asset_dagster_event(asset_event) for asset_event in asset_events
+        ]
+        for start in range(0, len(dagster_events), batch_size):
+            chunk = dagster_events[start : start + batch_size]
+            timestamp = get_current_timestamp()
+            try:
+                self._write_events(
+                    [
+                        EventLogEntry(
+                            user_message="",
+                            level=logging.INFO,
+                            job_name=dagster_event.job_name,
+                            run_id=RUNLESS_RUN_ID,
+                            error_info=None,
+                            timestamp=timestamp,
+                            step_key=dagster_event.step_key,
+                            dagster_event=dagster_event,
+                        )
+                        for dagster_event in chunk
+                    ]
+                )
+            except Exception as e:
+                num_stored = start + (
+                    e.num_stored if isinstance(e, DagsterEventBatchPartiallyStoredError) else 0
+                )
+                if not num_stored:
+                    raise
+                raise DagsterEventBatchPartiallyStoredError(
+                    f"Error while storing asset events: {e}", num_stored=num_stored
+                ) from e
+
+    def _get_runless_asset_dagster_event(
+        self,
+        asset_event: Union["AssetMaterialization", "AssetObservation", "AssetCheckEvaluation"],
+    ) -> "DagsterEvent":
         from dagster._core.events import (
             AssetMaterialization,
             AssetObservationData,
@@ -3238,13 +3461,10 @@ def report_runless_asset_event(
                 " AssetMaterialization, AssetObservation or AssetCheckEvaluation"
             )
 
-        return self.report_dagster_event(
-            run_id=RUNLESS_RUN_ID,
-            dagster_event=DagsterEvent(
-                event_type_value=event_type_value,
-                event_specific_data=data_payload,
-                job_name=RUNLESS_JOB_NAME,
-            ),
+        return DagsterEvent(
+            event_type_value=event_type_value,
+            event_specific_data=data_payload,
+            job_name=RUNLESS_JOB_NAME,
         )
 
     def get_asset_check_support(self) -> "AssetCheckInstanceSupport":
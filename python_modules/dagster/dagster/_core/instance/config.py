@@ -317,6 +317,23 @@ def schedules_daemon_config() -> Field:
     )
 
 
+def backfills_daemon_config() -> Field:
+    return Field(
+        {
+            "use_threads": Field(Bool, is_required=False, default_value=False),
+            "num_workers": Field(
+                int,
+                is_required=False,
+                description=(
+                    "How many threads to use to process iterations of multiple backfills in"
+                    " parallel"
+                ),
+            ),
+        },
+        is_required=False,
+    )
+
+
 def secrets_loader_config_schema() -> Field:
     return Field(
         Selector(
@@ -391,6 +408,7 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
         "retention": retention_config_schema(),
         "sensors": sensors_daemon_config(),
         "schedules": schedules_daemon_config(),
+        "backfills": backfills_daemon_config(),
         "auto_materialize": Field(
             {
                 "enabled": Field(BoolSource, is_required=False),
@@ -425,4 +443,25 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                 ),
             }
         ),
+        "asset_status_cache": Field(
+            {
+                "update_on_write": Field(
+                    BoolSource,
+                    is_required=False,
+                    description=(
+                        "Whether to update the cached partition status of assets as their events"
+                        " are stored, rather than when the status is next read"
+                    ),
+                ),
+                "compaction_threshold": Field(
+                    IntSource,
+                    is_required=False,
+                    description=(
+                        "The number of partitions recorded on the cached partition status of an"
+                        " asset as its events are stored before they are merged into its"
+                        " partition subsets by the event log consumer daemon"
+                    ),
+                ),
+            }
+        ),
     }
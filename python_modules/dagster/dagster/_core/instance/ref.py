@@ -453,9 +453,11 @@ def from_dir(
             "retention",
             "sensors",
             "schedules",
+            "backfills",
             "nux",
             "auto_materialize",
             "concurrency",
+            "asset_status_cache",
         }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
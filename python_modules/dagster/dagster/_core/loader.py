@@ -1,6 +1,28 @@
+import threading
+import time
 from abc import ABC, abstractmethod
+from asyncio import get_running_loop
+from collections import OrderedDict
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import partial
-from typing import TYPE_CHECKING, Dict, Generic, Iterable, Optional, Tuple, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Coroutine,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from typing_extensions import Self
 
@@ -36,6 +58,11 @@
     to stand out and make it clear that the method needs to be awaited, which at this time
     is anomalous in a codebase where async is rarely used.
 
+    Loadable types that opt in with `shared_cache_enabled` can additionally be served from a
+    process-wide LoadableCache, shared between LoadingContexts for a short TTL. Long-running
+    processes like the webserver use this to avoid refetching hot objects, such as the run and
+    asset records that many concurrent requests ask for, once per request.
+
 Additional resources:
 * https://xuorig.medium.com/the-graphql-dataloader-pattern-visualized-3064a00f319f
 [1] Brought to you by the 201X Facebook codebase
@@ -68,6 +95,13 @@ def get_loaders_for(
             batch_load_fn = partial(ttype._batch_load, instance=self.instance)  # noqa
             blocking_batch_load_fn = partial(ttype._blocking_batch_load, instance=self.instance)  # noqa
 
+            cache = _shared_loadable_cache.get()
+            if cache is not None and ttype.shared_cache_enabled:
+                batch_load_fn = cache.wrap_batch_load_fn(ttype, batch_load_fn)
+                blocking_batch_load_fn = cache.wrap_blocking_batch_load_fn(
+                    ttype, blocking_batch_load_fn
+                )
+
             self.loaders[ttype] = (
                 DataLoader(batch_load_fn=batch_load_fn),
                 BlockingDataLoader(batch_load_fn=blocking_batch_load_fn),
@@ -86,11 +120,20 @@ def clear_loaders(self) -> None:
 class InstanceLoadableBy(ABC, Generic[TKey]):
     """Make An object Loadable by ID of type TKey using a DagsterInstance."""
 
+    # whether loaded objects may be served from the shared LoadableCache, if one is in use
+    shared_cache_enabled: ClassVar[bool] = False
+
     @classmethod
     async def _batch_load(
         cls, keys: Iterable[TKey], instance: "DagsterInstance"
     ) -> Iterable[Optional[Self]]:
-        return cls._blocking_batch_load(keys, instance)
+        executor = _blocking_load_executor.get()
+        if executor is None:
+            return cls._blocking_batch_load(keys, instance)
+
+        return await get_running_loop().run_in_executor(
+            executor, cls._blocking_batch_load, list(keys), instance
+        )
 
     @classmethod
     @abstractmethod
@@ -140,6 +183,125 @@ def prepare(cls, context: LoadingContext, ids: Iterable[TKey]) -> None:
         blocking_loader.prepare(ids)
 
 
+class LoadableCache:
+    """A process-wide cache of Loadable objects, shared between LoadingContexts.
+
+    Entries expire `ttl_seconds` after they were loaded, which bounds how stale an object served
+    from the cache can be. Only objects that were found are cached, so that newly created objects
+    are visible immediately.
+
+    Args:
+        ttl_seconds (float): How long a loaded object is served from the cache.
+        max_entries (int): The maximum number of cached objects, after which the least recently
+            loaded objects are evicted.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10000):
+        self._ttl_seconds = check.numeric_param(ttl_seconds, "ttl_seconds")
+        self._max_entries = check.int_param(max_entries, "max_entries")
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[Type, Hashable], Tuple[float, Any]]" = OrderedDict()
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds
+
+    def get_many(self, ttype: Type, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """Returns the unexpired cached objects for the given keys, by key."""
+        now = time.monotonic()
+        hits = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get((ttype, key))
+                if entry is None:
+                    continue
+                expires_at, value = entry
+                if expires_at <= now:
+                    del self._entries[(ttype, key)]
+                else:
+                    hits[key] = value
+        return hits
+
+    def set_many(self, ttype: Type, values: Iterable[Tuple[Hashable, Any]]) -> None:
+        expires_at = time.monotonic() + self._ttl_seconds
+        with self._lock:
+            for key, value in values:
+                if value is None:
+                    continue
+                self._entries[(ttype, key)] = (expires_at, value)
+                self._entries.move_to_end((ttype, key))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def wrap_blocking_batch_load_fn(
+        self, ttype: Type, batch_load_fn: Callable[[Iterable[Any]], Iterable[Any]]
+    ) -> Callable[[Iterable[Any]], Iterable[Any]]:
+        def _batch_load(keys: Iterable[Any]) -> Iterable[Any]:
+            keys = list(keys)
+            results = self.get_many(ttype, keys)
+            missing_keys = [key for key in keys if key not in results]
+            if missing_keys:
+                loaded = list(zip(missing_keys, batch_load_fn(missing_keys)))
+                self.set_many(ttype, loaded)
+                results.update(loaded)
+            return [results[key] for key in keys]
+
+        return _batch_load
+
+    def wrap_batch_load_fn(
+        self,
+        ttype: Type,
+        batch_load_fn: Callable[[Iterable[Any]], Coroutine[Any, Any, Iterable[Any]]],
+    ) -> Callable[[Iterable[Any]], Coroutine[Any, Any, Iterable[Any]]]:
+        async def _batch_load(keys: Iterable[Any]) -> Iterable[Any]:
+            keys = list(keys)
+            results = self.get_many(ttype, keys)
+            missing_keys = [key for key in keys if key not in results]
+            if missing_keys:
+                loaded = list(zip(missing_keys, await batch_load_fn(missing_keys)))
+                self.set_many(ttype, loaded)
+                results.update(loaded)
+            return [results[key] for key in keys]
+
+        return _batch_load
+
+
+_shared_loadable_cache: ContextVar[Optional[LoadableCache]] = ContextVar(
+    "shared_loadable_cache", default=None
+)
+_blocking_load_executor: ContextVar[Optional[Executor]] = ContextVar(
+    "blocking_load_executor", default=None
+)
+
+
+@contextmanager
+def use_shared_loadable_cache(cache: Optional[LoadableCache]) -> Iterator[None]:
+    """Serve the Loadable types that opt in from the given cache, for LoadingContexts that create
+    their loaders within this scope.
+    """
+    token = _shared_loadable_cache.set(cache)
+    try:
+        yield
+    finally:
+        _shared_loadable_cache.reset(token)
+
+
+@contextmanager
+def use_blocking_load_executor(executor: Optional[Executor]) -> Iterator[None]:
+    """Run the blocking batch loads behind `gen` and `gen_many` within this scope in the given
+    executor, so that they do not block the event loop that is awaiting them.
+    """
+    token = _blocking_load_executor.set(executor)
+    try:
+        yield
+    finally:
+        _blocking_load_executor.reset(token)
+
+
 class LoadingContextForTest(LoadingContext):
     """Loading context intended to be used in unit tests that would not otherwise construct a LoadingContext."""
 
@@ -1,6 +1,8 @@
 import datetime
 import json
 import os
+import selectors
+import socket
 import sys
 import tempfile
 import time
@@ -8,7 +10,7 @@
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from threading import Event, Thread
-from typing import IO, Dict, Iterator, Optional, Sequence, Tuple, TypeVar
+from typing import IO, Dict, Iterator, Optional, Sequence, Tuple, TypeVar, cast
 
 from dagster_pipes import (
     PIPES_PROTOCOL_VERSION_FIELD,
@@ -38,6 +40,7 @@
 
 _CONTEXT_INJECTOR_FILENAME = "context"
 _MESSAGE_READER_FILENAME = "messages"
+_SOCKET_READ_SIZE = 65536
 
 
 class PipesFileContextInjector(PipesContextInjector):
@@ -218,6 +221,136 @@ def no_messages_debug_text(self) -> str:
         return "Attempted to read messages from a local temporary file."
 
 
+class PipesSocketMessageReader(PipesMessageReader):
+    """Message reader that reads messages from a Unix domain socket, to which the external process
+    writes them with a :py:class:`~dagster_pipes.PipesSocketMessageWriter` (or the
+    :py:class:`~dagster_pipes.PipesDefaultMessageWriter`).
+
+    Unlike with a file, messages are sent in batches and handled as soon as they are received,
+    without polling, and the socket applies backpressure to the external process if it writes
+    messages faster than they are handled. On close of the pipes session, the reader reads each
+    connection until the external process signals the end of its stream, and then acknowledges it.
+
+    Args:
+        path (Optional[str]): The path at which to create the socket. If not provided, the socket
+            is created in an automatically-generated temporary directory. The socket will be deleted
+            on close of the pipes session.
+        close_timeout (float): The maximum number of seconds to wait on close of the pipes session
+            for the external process to signal the end of its stream. Defaults to 60.
+    """
+
+    def __init__(self, path: Optional[str] = None, close_timeout: float = 60):
+        if not hasattr(socket, "AF_UNIX"):
+            raise DagsterInvariantViolationError(
+                "PipesSocketMessageReader requires Unix domain sockets, which are not supported on"
+                " this platform."
+            )
+        self._path = check.opt_str_param(path, "path")
+        self._close_timeout = check.numeric_param(close_timeout, "close_timeout")
+
+    @contextmanager
+    def read_messages(
+        self,
+        handler: "PipesMessageHandler",
+    ) -> Iterator[PipesParams]:
+        """Set up a thread to read streaming messages from the external process over a Unix domain
+        socket.
+
+        Args:
+            handler (PipesMessageHandler): object to process incoming messages
+
+        Yields:
+            PipesParams: A dict of parameters that specifies where a pipes process should write
+            pipes protocol messages.
+        """
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = self._path or os.path.join(tempdir, f"{_MESSAGE_READER_FILENAME}.sock")
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            is_session_closed = Event()
+            thread = None
+            try:
+                server.bind(path)
+                server.listen()
+                server.setblocking(False)
+                thread = Thread(
+                    target=self._reader_thread,
+                    args=(server, handler, is_session_closed),
+                    daemon=True,
+                )
+                thread.start()
+                yield {PipesDefaultMessageWriter.SOCKET_PATH_KEY: path}
+            finally:
+                is_session_closed.set()
+                if thread:
+                    thread.join()
+                server.close()
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def _reader_thread(
+        self,
+        server: socket.socket,
+        handler: "PipesMessageHandler",
+        is_session_closed: Event,
+    ) -> None:
+        selector = selectors.DefaultSelector()
+        # incomplete trailing line received on each open connection
+        buffers: Dict[socket.socket, bytes] = {}
+        close_deadline = None
+        try:
+            selector.register(server, selectors.EVENT_READ)
+            while True:
+                # checked before selecting, so that anything sent before the session closed is read
+                is_closing = is_session_closed.is_set()
+                if is_closing and close_deadline is None:
+                    close_deadline = time.time() + self._close_timeout
+
+                events = selector.select(timeout=0.1)
+                for key, _ in events:
+                    sock = cast(socket.socket, key.fileobj)
+                    if sock is server:
+                        conn, _ = server.accept()
+                        conn.setblocking(False)
+                        selector.register(conn, selectors.EVENT_READ)
+                        buffers[conn] = b""
+                        continue
+
+                    data = sock.recv(_SOCKET_READ_SIZE)
+                    if not data:
+                        # end of stream, closing our end acknowledges it
+                        self._handle_lines(buffers.pop(sock), handler)
+                        selector.unregister(sock)
+                        sock.close()
+                    else:
+                        lines, _, buffers[sock] = (buffers[sock] + data).rpartition(b"\n")
+                        self._handle_lines(lines, handler)
+
+                # the server stays readable while connections are pending, so no events means that
+                # there is nothing left to accept
+                if close_deadline is not None and (
+                    (not buffers and not events) or time.time() > close_deadline
+                ):
+                    break
+        except:
+            handler.report_pipes_framework_exception(
+                f"{self.__class__.__name__} reader thread",
+                sys.exc_info(),
+            )
+            raise
+        finally:
+            for conn in buffers:
+                conn.close()
+            selector.close()
+
+    def _handle_lines(self, data: bytes, handler: "PipesMessageHandler") -> None:
+        for line in data.split(b"\n"):
+            if line.strip():
+                handler.handle_message(json.loads(line))
+
+    def no_messages_debug_text(self) -> str:
+        return "Attempted to read messages from a Unix domain socket."
+
+
 # Time in seconds to wait between attempts when polling for some condition. Default value that is
 # used in several places.
 DEFAULT_SLEEP_INTERVAL = 1
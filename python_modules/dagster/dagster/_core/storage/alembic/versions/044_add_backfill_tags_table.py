@@ -0,0 +1,98 @@
+"""add backfill_tags table
+
+Revision ID: 8a4b6b1ce8d2
+Revises: 284a732df317
+Create Date: 2024-07-30 10:12:41.553204
+
+"""
+
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "8a4b6b1ce8d2"
+down_revision = "284a732df317"
+branch_labels = None
+depends_on = None
+
+TABLE_NAME = "backfill_tags"
+
+
+def upgrade():
+    if not has_table(TABLE_NAME):
+        op.create_table(
+            TABLE_NAME,
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("backfill_id", db.String(255)),
+            db.Column("key", db.Text),
+            db.Column("value", db.Text),
+        )
+
+    if not has_index(TABLE_NAME, "idx_backfill_tags_backfill_id"):
+        op.create_index(
+            "idx_backfill_tags_backfill_id",
+            TABLE_NAME,
+            ["backfill_id", "id"],
+            unique=False,
+            mysql_length={"backfill_id": 255},
+        )
+
+    if not has_index(TABLE_NAME, "idx_backfill_tags_key_value"):
+        op.create_index(
+            "idx_backfill_tags_key_value",
+            TABLE_NAME,
+            ["key", "value"],
+            unique=False,
+            mysql_length={"key": 64, "value": 64},
+        )
+
+    if not has_table("bulk_actions"):
+        return
+
+    if not has_index("bulk_actions", "idx_bulk_actions_status_id"):
+        op.create_index(
+            "idx_bulk_actions_status_id",
+            "bulk_actions",
+            ["status", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            mysql_length={"status": 32},
+        )
+
+    if not has_index("bulk_actions", "idx_bulk_actions_timestamp"):
+        op.create_index(
+            "idx_bulk_actions_timestamp",
+            "bulk_actions",
+            ["timestamp"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    if has_table("bulk_actions"):
+        if has_index("bulk_actions", "idx_bulk_actions_timestamp"):
+            op.drop_index(
+                "idx_bulk_actions_timestamp", "bulk_actions", postgresql_concurrently=True
+            )
+
+        if has_index("bulk_actions", "idx_bulk_actions_status_id"):
+            op.drop_index(
+                "idx_bulk_actions_status_id", "bulk_actions", postgresql_concurrently=True
+            )
+
+    if has_table(TABLE_NAME):
+        if has_index(TABLE_NAME, "idx_backfill_tags_key_value"):
+            op.drop_index("idx_backfill_tags_key_value", TABLE_NAME)
+
+        if has_index(TABLE_NAME, "idx_backfill_tags_backfill_id"):
+            op.drop_index("idx_backfill_tags_backfill_id", TABLE_NAME)
+
+        op.drop_table(TABLE_NAME)
@@ -0,0 +1,50 @@
+"""add dynamic_partitions_versions table
+
+Revision ID: 9aa2124be693
+Revises: 8a4b6b1ce8d2
+Create Date: 2024-08-06 11:24:03.180422
+
+"""
+
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_table
+from dagster._core.storage.sql import MySQLCompatabilityTypes, get_sql_current_timestamp
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "9aa2124be693"
+down_revision = "8a4b6b1ce8d2"
+branch_labels = None
+depends_on = None
+
+TABLE_NAME = "dynamic_partitions_versions"
+
+
+def upgrade():
+    if not has_table("dynamic_partitions"):
+        return
+
+    if not has_table(TABLE_NAME):
+        op.create_table(
+            TABLE_NAME,
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column(
+                "partitions_def_name",
+                MySQLCompatabilityTypes.UniqueText,
+                nullable=False,
+                unique=True,
+            ),
+            db.Column("version", db.BigInteger, nullable=False),
+            db.Column("update_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
+        )
+
+
+def downgrade():
+    if has_table(TABLE_NAME):
+        op.drop_table(TABLE_NAME)
@@ -37,6 +37,7 @@ def mysql_config() -> UserConfigSchema:
 class PostgresStorageConfig(TypedDict):
     postgres_url: str
     postgres_db: "PostgresStorageConfigDb"
+    pool: "PostgresStorageConfigPool"
 
 
 class PostgresStorageConfigDb(TypedDict):
@@ -49,6 +50,15 @@ class PostgresStorageConfigDb(TypedDict):
     scheme: str
 
 
+class PostgresStorageConfigPool(TypedDict):
+    pool_size: int
+    max_overflow: int
+    pool_timeout: int
+    pool_recycle: int
+    pool_pre_ping: bool
+    share_engine: bool
+
+
 def pg_config() -> UserConfigSchema:
     return {
         "postgres_url": Field(StringSource, is_required=False),
@@ -65,4 +75,64 @@ def pg_config() -> UserConfigSchema:
             is_required=False,
         ),
         "should_autocreate_tables": Field(bool, is_required=False, default_value=True),
+        "pool": Field(
+            {
+                "pool_size": Field(
+                    IntSource,
+                    is_required=False,
+                    default_value=5,
+                    description="The number of connections to keep open in the pool.",
+                ),
+                "max_overflow": Field(
+                    IntSource,
+                    is_required=False,
+                    default_value=10,
+                    description=(
+                        "The number of connections that can be opened beyond pool_size when all"
+                        " pooled connections are in use. Overflow connections are closed when they"
+                        " are returned to the pool."
+                    ),
+                ),
+                "pool_timeout": Field(
+                    IntSource,
+                    is_required=False,
+                    default_value=30,
+                    description=(
+                        "The number of seconds to wait for a connection before raising an error."
+                    ),
+                ),
+                "pool_recycle": Field(
+                    IntSource,
+                    is_required=False,
+                    default_value=3600,
+                    description=(
+                        "The number of seconds after which a pooled connection is replaced. Set to"
+                        " -1 to never replace connections."
+                    ),
+                ),
+                "pool_pre_ping": Field(
+                    bool,
+                    is_required=False,
+                    default_value=True,
+                    description=(
+                        "Test each pooled connection for liveness before it is used, replacing"
+                        " connections that were dropped by the server."
+                    ),
+                ),
+                "share_engine": Field(
+                    bool,
+                    is_required=False,
+                    default_value=False,
+                    description=(
+                        "Share a single pool between all storages in a process that are configured"
+                        " with the same database and pool settings."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Hold open a pool of connections that are reused across queries. By default, a new"
+                " connection is opened for each query and closed when the query completes."
+            ),
+        ),
     }
@@ -621,6 +621,8 @@ class RunRecord(
     Users should not invoke this class directly.
     """
 
+    shared_cache_enabled = True
+
     def __new__(
         cls,
         storage_id: int,
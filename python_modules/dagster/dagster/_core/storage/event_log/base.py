@@ -1,7 +1,11 @@
+import threading
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import (
     TYPE_CHECKING,
+    Dict,
     Iterable,
+    Iterator,
     Mapping,
     NamedTuple,
     Optional,
@@ -16,7 +20,7 @@
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
 from dagster._core.definitions.data_version import DATA_VERSION_TAG
 from dagster._core.definitions.events import AssetKey
-from dagster._core.definitions.partition import PartitionsDefinition
+from dagster._core.definitions.partition import PartitionsDefinition, VersionedDynamicPartitions
 from dagster._core.event_api import (
     AssetRecordsFilter,
     EventHandlerFn,
@@ -26,6 +30,7 @@
     EventRecordsResult,
     RunStatusChangeRecordsFilter,
 )
+from dagster._core.errors import DagsterEventBatchPartiallyStoredError
 from dagster._core.events import DagsterEventType
 from dagster._core.execution.stats import (
     RunStepKeyStatsSnapshot,
@@ -47,6 +52,10 @@
     from dagster._core.events.log import EventLogEntry
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
+# The number of event log records fetched from storage at a time when iterating over the records
+# of a run
+DEFAULT_RECORDS_FOR_RUN_BATCH_SIZE = 1000
+
 
 class EventLogConnection(NamedTuple):
     records: Sequence[EventLogRecord]
@@ -136,6 +145,8 @@ class AssetRecord(
     Users should not invoke this class directly.
     """
 
+    shared_cache_enabled = True
+
     @classmethod
     def _blocking_batch_load(
         cls, keys: Iterable[AssetKey], instance: DagsterInstance
@@ -222,21 +233,50 @@ def get_records_for_run(
             limit (Optional[int]): Max number of records to return.
         """
 
+    def iterate_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        batch_size: int = DEFAULT_RECORDS_FOR_RUN_BATCH_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        """Iterate over all of the event log records corresponding to a run, in ascending order.
+
+        Records are fetched from storage in batches of `batch_size`, paginating on storage id, so
+        that the full log of a run never needs to be held in memory at once.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[str]): Only records after this cursor are returned.
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
+            batch_size (int): The number of records to fetch from storage at a time.
+        """
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be a positive integer")
+        while True:
+            connection = self.get_records_for_run(run_id, cursor, of_type, limit=batch_size)
+            yield from connection.records
+            if not connection.has_more:
+                return
+            cursor = connection.cursor
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
-        return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
+        return build_run_stats_from_events(
+            run_id, (record.event_log_entry for record in self.iterate_records_for_run(run_id))
+        )
 
     def get_step_stats_for_run(
         self, run_id: str, step_keys: Optional[Sequence[str]] = None
     ) -> Sequence[RunStepKeyStatsSnapshot]:
         """Get per-step stats for a pipeline run."""
-        logs = self.get_logs_for_run(run_id)
+        logs = (record.event_log_entry for record in self.iterate_records_for_run(run_id))
         if step_keys:
-            logs = [
+            logs = (
                 event
                 for event in logs
                 if event.is_dagster_event and event.get_dagster_event().step_key in step_keys
-            ]
+            )
 
         return build_run_step_stats_from_events(run_id, logs)
 
@@ -249,8 +289,24 @@ def store_event(self, event: "EventLogEntry") -> None:
         """
 
     def store_event_batch(self, events: Sequence["EventLogEntry"]) -> None:
-        for event in events:
-            self.store_event(event)
+        """Store a batch of events.
+
+        If an error occurs after some of the events have been stored, raises a
+        DagsterEventBatchPartiallyStoredError with the number of events, from the start of the
+        batch, that were stored.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        for num_stored, event in enumerate(events):
+            try:
+                self.store_event(event)
+            except Exception as e:
+                if not num_stored:
+                    raise
+                raise DagsterEventBatchPartiallyStoredError(
+                    f"Error while storing event batch: {e}", num_stored=num_stored
+                ) from e
 
     @abstractmethod
     def delete_events(self, run_id: str) -> None:
@@ -492,6 +548,50 @@ def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str)
         """Delete a partition for the specified dynamic partitions definition."""
         raise NotImplementedError()
 
+    def get_dynamic_partitions_version(self, partitions_def_name: str) -> Optional[int]:
+        """Get a counter that is incremented every time partitions are added to or deleted from
+        the specified dynamic partitions definition, or None if the storage does not keep one.
+        """
+        return None
+
+    @cached_property
+    def _versioned_dynamic_partitions_cache(self) -> Dict[str, VersionedDynamicPartitions]:
+        return {}
+
+    @cached_property
+    def _versioned_dynamic_partitions_lock(self) -> threading.Lock:
+        return threading.Lock()
+
+    def get_versioned_dynamic_partitions(
+        self, partitions_def_name: str
+    ) -> VersionedDynamicPartitions:
+        """Get the partition keys of a dynamic partitions definition. The partition keys are cached
+        for the lifetime of the storage, and only reloaded once the version of the partitions
+        definition changes.
+        """
+        version = self.get_dynamic_partitions_version(partitions_def_name)
+        if version is None:
+            return VersionedDynamicPartitions(
+                None, self.get_dynamic_partitions(partitions_def_name)
+            )
+
+        with self._versioned_dynamic_partitions_lock:
+            cached = self._versioned_dynamic_partitions_cache.get(partitions_def_name)
+        if cached and cached.version == version:
+            return cached
+
+        # partitions may be added between fetching the version and the partition keys, in which
+        # case the partition keys are reloaded on the next call once the new version is fetched
+        partition_keys = self.get_dynamic_partitions(partitions_def_name)
+        versioned_partitions = (
+            cached.with_partition_keys(version, partition_keys)
+            if cached
+            else VersionedDynamicPartitions(version, partition_keys)
+        )
+        with self._versioned_dynamic_partitions_lock:
+            self._versioned_dynamic_partitions_cache[partitions_def_name] = versioned_partitions
+        return versioned_partitions
+
     def alembic_version(self) -> Optional[AlembicVersion]:
         return None
 
@@ -1,13 +1,18 @@
+import logging
 import os
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Set
 
 import dagster._check as check
+from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventLogStorage
 
 INIT_POLL_PERIOD = 0.250  # 250ms
 MAX_POLL_PERIOD = 16.0  # 16s
+DEFAULT_MAX_WATCHED_RUNS = 1000
 
 
 class CallbackAfterCursor(NamedTuple):
@@ -22,30 +27,75 @@ class CallbackAfterCursor(NamedTuple):
     callback: Callable[[EventLogEntry, str], None]
 
 
+class _WatchedCallback:
+    """A registered callback, along with the storage id of the last event it has been sent."""
+
+    def __init__(self, callback_after_cursor: CallbackAfterCursor):
+        self.callback = callback_after_cursor.callback
+        self.storage_id: Optional[int] = (
+            EventLogCursor.parse(callback_after_cursor.cursor).storage_id()
+            if callback_after_cursor.cursor
+            else None
+        )
+
+    def should_receive(self, storage_id: int) -> bool:
+        return self.storage_id is None or self.storage_id < storage_id
+
+
+class _RunPollState:
+    """When a watched run is next due to be polled. The interval between polls of a run backs off
+    exponentially while the run has no new events.
+    """
+
+    def __init__(self, now: float):
+        self.interval = INIT_POLL_PERIOD
+        self.next_poll_time = now
+
+    def record_poll(self, has_new_records: bool, now: float) -> None:
+        self.interval = (
+            INIT_POLL_PERIOD if has_new_records else min(self.interval * 2, MAX_POLL_PERIOD)
+        )
+        self.next_poll_time = now + self.interval
+
+
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that uses a polling approach to retrieving new events for run_ids.
+
+    Uses a single thread to watch every run_id. Each run is polled on its own interval, which backs
+    off exponentially while the run has no new events, and resets whenever new events arrive or the
+    run is newly watched. On each poll, the new events of every run that is due are fetched in a
+    single query, each run after the earliest cursor of its callbacks, and fanned out to those
+    callbacks. An error polling, or in one callback, is logged and does not stop the watcher.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: _dict_lock protects _run_id_to_callbacks and _run_ids_to_poll_now
     """
 
-    def __init__(self, event_log_storage: EventLogStorage):
+    def __init__(self, event_log_storage: EventLogStorage, max_watched_runs: Optional[int] = None):
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", EventLogStorage
         )
+        self._max_watched_runs = check.opt_int_param(
+            max_watched_runs,
+            "max_watched_runs",
+            int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_MAX_RUNS", str(DEFAULT_MAX_WATCHED_RUNS))),
+        )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
+        # INVARIANT: dict_lock protects _run_id_to_callbacks and _run_ids_to_poll_now
         self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        self._run_id_to_callbacks: Dict[str, List[_WatchedCallback]] = {}
+        # runs with a new callback, which are polled without waiting for their poll interval
+        self._run_ids_to_poll_now: Set[str] = set()
         self._disposed = False
 
+        self._wake = threading.Event()
+        self._should_thread_exit = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
         with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+            _has_run_id = run_id in self._run_id_to_callbacks
         return _has_run_id
 
     def watch_run(
@@ -60,13 +110,26 @@ def watch_run(
         check.invariant(not self._disposed, "Attempted to watch_run after close")
 
         with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
+            if run_id not in self._run_id_to_callbacks:
+                if len(self._run_id_to_callbacks) >= self._max_watched_runs:
+                    raise DagsterInvariantViolationError(
+                        f"Cannot watch run {run_id}: already watching the maximum of"
+                        f" {self._max_watched_runs} runs. The limit can be raised by setting the"
+                        " DAGSTER_POLLING_EVENT_WATCHER_MAX_RUNS environment variable."
+                    )
+                self._run_id_to_callbacks[run_id] = []
+            self._run_id_to_callbacks[run_id].append(
+                _WatchedCallback(CallbackAfterCursor(cursor, callback))
+            )
+            self._run_ids_to_poll_now.add(run_id)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._watch_runs, name="sql-event-watch", daemon=True
                 )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+                self._thread.start()
+
+        self._wake.set()
 
     def unwatch_run(
         self,
@@ -76,112 +139,165 @@ def unwatch_run(
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
         with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+            if run_id in self._run_id_to_callbacks:
+                self._run_id_to_callbacks[run_id] = [
+                    watched_callback
+                    for watched_callback in self._run_id_to_callbacks[run_id]
+                    if watched_callback.callback != handler
+                ]
+                if not self._run_id_to_callbacks[run_id]:
+                    del self._run_id_to_callbacks[run_id]
 
     def close(self) -> None:
         if not self._disposed:
             self._disposed = True
+            self._should_thread_exit.set()
+            self._wake.set()
+            thread = self._thread
+            if thread:
+                thread.join()
             with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                self._run_id_to_watcher_dict = {}
-
+                self._thread = None
+                self._run_id_to_callbacks = {}
 
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
+    def _watch_runs(self) -> None:
+        """Polling function to update Observers with EventLogEntrys from Event Log DB.
 
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
-    Exits when `self.should_thread_exit` is set.
+        Wakes whenever a watched run is due to be polled (or when a run is newly watched) &
+            1. executes a SELECT query to get the new EventLogEntrys of the runs that are due
+            2. fires each callback (taking into account the callback's cursor) on the new EventLogEntrys
+        """
+        wait_time = INIT_POLL_PERIOD
+        chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
+        poll_states: Dict[str, _RunPollState] = {}
 
-    LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
+        try:
+            while True:
+                self._wake.wait(wait_time)
+                self._wake.clear()
+                if self._should_thread_exit.is_set():
+                    break
 
-    """
+                with self._dict_lock:
+                    run_id_to_callbacks = {
+                        run_id: list(callbacks)
+                        for run_id, callbacks in self._run_id_to_callbacks.items()
+                    }
+                    run_ids_to_poll_now = self._run_ids_to_poll_now
+                    self._run_ids_to_poll_now = set()
 
-    def __init__(self, event_log_storage: EventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", EventLogStorage
-        )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
-        self._should_thread_exit = threading.Event()
-        self.name = f"sql-event-watch-run-id-{self._run_id}"
+                now = time.monotonic()
+                poll_states = {
+                    run_id: (
+                        _RunPollState(now)
+                        if run_id not in poll_states or run_id in run_ids_to_poll_now
+                        else poll_states[run_id]
+                    )
+                    for run_id in run_id_to_callbacks.keys()
+                }
+                due_run_id_to_callbacks = {
+                    run_id: callbacks
+                    for run_id, callbacks in run_id_to_callbacks.items()
+                    if poll_states[run_id].next_poll_time <= now
+                }
 
-    @property
-    def should_thread_exit(self) -> threading.Event:
-        return self._should_thread_exit
+                if due_run_id_to_callbacks:
+                    run_ids_with_new_records = self._poll_runs(due_run_id_to_callbacks, chunk_limit)
+                    now = time.monotonic()
+                    for run_id in due_run_id_to_callbacks.keys():
+                        poll_states[run_id].record_poll(run_id in run_ids_with_new_records, now)
 
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
-        """Observer has started watching this run.
-            Add a callback to execute on new EventLogEntrys after the given cursor.
+                wait_time = (
+                    max(
+                        min(state.next_poll_time for state in poll_states.values())
+                        - time.monotonic(),
+                        0,
+                    )
+                    if poll_states
+                    else MAX_POLL_PERIOD
+                )
+        finally:
+            # allow a new thread to be started by the next call to watch_run if this one exits
+            # unexpectedly
+            with self._dict_lock:
+                if self._thread is threading.current_thread():
+                    self._thread = None
 
-        Args:
-            cursor (Optional[str]): event log cursor for the callback to execute
-            callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
+    def _poll_runs(
+        self, run_id_to_callbacks: Mapping[str, Sequence[_WatchedCallback]], limit: int
+    ) -> Set[str]:
+        """Fetch and dispatch the new events of the given runs, each run after the earliest cursor
+        of its callbacks. Returns the ids of the runs that had new events, or may have more.
         """
-        cursor = check.opt_str_param(cursor, "cursor")
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
+        from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
-        """Observer has stopped watching this run;
-            Remove a callback from the list of callbacks to execute on new EventLogEntrys.
+        after_storage_id_by_run_id: Dict[str, Optional[int]] = {}
+        for run_id, callbacks in run_id_to_callbacks.items():
+            storage_ids = [callback.storage_id for callback in callbacks]
+            after_storage_id_by_run_id[run_id] = (
+                None if None in storage_ids else min(storage_ids)  # type: ignore
+            )
 
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
+        if (
+            isinstance(self._event_log_storage, SqlEventLogStorage)
+            and not self._event_log_storage.is_run_sharded
+        ):
+            try:
+                records = self._event_log_storage.get_records_for_run_cursors(
+                    after_storage_id_by_run_id, limit=limit
+                )
+            except Exception:
+                logging.exception("Error polling for new events for watched runs.")
+                return set()
 
-        Args:
-            callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
-        """
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
-            ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
-
-    def run(self) -> None:
-        """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
-            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
-        """
-        cursor = None
-        wait_time = INIT_POLL_PERIOD
+            records_by_run_id: Dict[str, List[EventLogRecord]] = defaultdict(list)
+            for record in records:
+                records_by_run_id[record.event_log_entry.run_id].append(record)
+            for run_id, run_records in records_by_run_id.items():
+                self._dispatch(run_id_to_callbacks[run_id], run_records)
 
-        chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
+            if len(records) == limit:
+                # the results were truncated, so any of the runs may have more new events
+                return set(run_id_to_callbacks.keys())
+            return set(records_by_run_id.keys())
 
-        while not self._should_thread_exit.wait(wait_time):
-            conn = self._event_log_storage.get_records_for_run(
-                self._run_id,
-                cursor=cursor,
-                limit=chunk_limit,
+        # run-sharded storages can't be queried across runs, so fall back to a query per run
+        run_ids_with_new_records = set()
+        for run_id, after_storage_id in after_storage_id_by_run_id.items():
+            cursor = (
+                None
+                if after_storage_id is None
+                else str(EventLogCursor.from_storage_id(after_storage_id))
             )
-            cursor = conn.cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
-            wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+            try:
+                records = self._event_log_storage.get_records_for_run(
+                    run_id, cursor=cursor, limit=limit
+                ).records
+            except Exception:
+                logging.exception(f"Error polling for new events for run {run_id}.")
+                continue
+
+            self._dispatch(run_id_to_callbacks[run_id], records)
+            if records:
+                run_ids_with_new_records.add(run_id)
+        return run_ids_with_new_records
+
+    def _dispatch(
+        self, callbacks: Sequence[_WatchedCallback], records: Sequence[EventLogRecord]
+    ) -> None:
+        for event_record in records:
+            for callback in callbacks:
+                if callback.should_receive(event_record.storage_id):
+                    # the callback is not sent the event again if it fails
+                    callback.storage_id = event_record.storage_id
+                    try:
+                        callback.callback(
+                            event_record.event_log_entry,
+                            str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                        )
+                    except Exception:
+                        logging.exception(
+                            "Error in callback for event with storage id"
+                            f" {event_record.storage_id} of run"
+                            f" {event_record.event_log_entry.run_id}."
+                        )
@@ -103,6 +103,24 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
 )
 
+# A counter per dynamic partitions definition that is incremented whenever partitions of the
+# definition are added or deleted, so that readers can tell whether cached partitions are current
+DynamicPartitionsVersionsTable = db.Table(
+    "dynamic_partitions_versions",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column(
+        "partitions_def_name", MySQLCompatabilityTypes.UniqueText, nullable=False, unique=True
+    ),
+    db.Column("version", db.BigInteger, nullable=False),
+    db.Column("update_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
+)
+
 ConcurrencyLimitsTable = db.Table(
     "concurrency_limits",
     SqlEventLogStorageMetadata,
@@ -1,13 +1,15 @@
+import itertools
 import logging
 import os
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict
 from contextlib import contextmanager
 from datetime import datetime, timezone
-from functools import cached_property
+from functools import cached_property, partial
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ContextManager,
     Dict,
     Iterable,
@@ -38,7 +40,9 @@
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
 from dagster._core.definitions.data_version import DATA_VERSION_TAG
 from dagster._core.definitions.events import AssetKey, AssetMaterialization
+from dagster._core.definitions.partition import DefaultPartitionsSubset
 from dagster._core.errors import (
+    DagsterEventBatchPartiallyStoredError,
     DagsterEventLogInvalidForRun,
     DagsterInvalidInvocationError,
     DagsterInvariantViolationError,
@@ -61,8 +65,13 @@
     AssetCheckExecutionRecord,
     AssetCheckExecutionRecordStatus,
 )
-from dagster._core.storage.dagster_run import DagsterRunStatsSnapshot
+from dagster._core.storage.dagster_run import (
+    FINISHED_STATUSES,
+    DagsterRunStatsSnapshot,
+    DagsterRunStatus,
+)
 from dagster._core.storage.event_log.base import (
+    DEFAULT_RECORDS_FOR_RUN_BATCH_SIZE,
     AssetCheckSummaryRecord,
     AssetEntry,
     AssetRecord,
@@ -86,6 +95,7 @@
     ConcurrencyLimitsTable,
     ConcurrencySlotsTable,
     DynamicPartitionsTable,
+    DynamicPartitionsVersionsTable,
     PendingStepsTable,
     SecondaryIndexMigrationTable,
     SqlEventLogStorageTable,
@@ -99,8 +109,12 @@
 )
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._serdes.errors import DeserializationError
-from dagster._serdes.serdes import deserialize_values
-from dagster._time import datetime_from_timestamp, get_current_timestamp, utc_datetime_from_naive
+from dagster._time import (
+    datetime_from_timestamp,
+    get_current_datetime,
+    get_current_timestamp,
+    utc_datetime_from_naive,
+)
 from dagster._utils import PrintFn
 from dagster._utils.concurrency import (
     ClaimedSlotInfo,
@@ -118,6 +132,31 @@
 MIN_ASSET_ROWS = 25
 DEFAULT_MAX_LIMIT_EVENT_RECORDS = 10000
 
+# The AssetKeyTable columns that `_get_asset_entry_values` writes for each asset event type. Used to
+# collapse the asset entry upserts for a batch of events into the minimal set of writes.
+ASSET_ENTRY_COLUMNS_BY_EVENT_TYPE: Mapping[DagsterEventType, Set[str]] = {
+    DagsterEventType.ASSET_MATERIALIZATION: {
+        "last_materialization",
+        "last_run_id",
+        "last_materialization_timestamp",
+    },
+    DagsterEventType.ASSET_MATERIALIZATION_PLANNED: {
+        "last_run_id",
+        "last_materialization_timestamp",
+    },
+    DagsterEventType.ASSET_OBSERVATION: {"last_materialization_timestamp"},
+}
+
+# The asset event types that change the partition status of an asset
+ASSET_STATUS_EVENT_TYPES = [
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+]
+
+# The number of times to attempt to update the cached status of an asset on write before giving up
+# and clearing it, so that it is rebuilt on read
+ASSET_STATUS_CACHE_UPDATE_ATTEMPTS = 5
+
 
 def get_max_event_records_limit() -> int:
     max_value = os.getenv("MAX_LIMIT_GET_EVENT_RECORDS")
@@ -465,26 +504,231 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
-    def get_records_for_run(
-        self,
-        run_id,
-        cursor: Optional[str] = None,
-        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
-        limit: Optional[int] = None,
-        ascending: bool = True,
-    ) -> EventLogConnection:
-        """Get all of the logs corresponding to a run.
+        self._update_asset_status_cache_on_write([event], [event_id])
+
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events in as few round trips as possible.
+
+        Events are written in a single transaction per run, and consecutive events that do not need
+        their storage id to update the index tables are inserted with a single multi-row INSERT.
+        Storage ids are assigned in the order of `events`.
 
         Args:
-            run_id (str): The id of the run for which to fetch logs.
-            cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1,
-                i.e., if cursor is -1, all logs will be returned. (default: -1)
-            of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
-            limit (Optional[int]): the maximum number of events to fetch
+            events (Sequence[EventLogEntry]): The events to store.
         """
-        check.str_param(run_id, "run_id")
-        check.opt_str_param(cursor, "cursor")
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        event_ids: List[Optional[int]] = []
+        try:
+            for run_id, run_events in itertools.groupby(events, key=lambda event: event.run_id):
+                with self.run_connection(run_id) as conn:
+                    event_ids.extend(self._insert_event_batch(conn, list(run_events)))
+
+            self._store_index_rows_for_event_batch(events, event_ids)
+            self._update_asset_status_cache_on_write(events, event_ids)
+        except Exception as e:
+            if not event_ids:
+                raise
+            raise DagsterEventBatchPartiallyStoredError(
+                f"Error while storing event batch: {e}", num_stored=len(event_ids)
+            ) from e
+
+    def _insert_event_batch(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
+        """Inserts the given events using the provided connection, returning the storage ids of the
+        events that need them to update the index tables (and None for all other events).
+        """
+        event_ids: List[Optional[int]] = []
+        for requires_storage_id, group in itertools.groupby(
+            events, key=self._requires_storage_id_for_index
+        ):
+            segment = list(group)
+            if requires_storage_id:
+                for event in segment:
+                    result = conn.execute(self.prepare_insert_event(event))
+                    event_ids.append(result.inserted_primary_key[0])
+            else:
+                conn.execute(self.prepare_insert_event_batch(segment))
+                event_ids.extend([None] * len(segment))
+        return event_ids
+
+    def _requires_storage_id_for_index(self, event: EventLogEntry) -> bool:
+        return event.is_dagster_event and (
+            (
+                event.dagster_event_type in ASSET_EVENTS
+                and event.get_dagster_event().asset_key is not None
+            )
+            or event.dagster_event_type in ASSET_CHECK_EVENTS
+        )
+
+    def _store_index_rows_for_event_batch(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[Optional[int]]
+    ) -> None:
+        asset_events: List[EventLogEntry] = []
+        asset_event_ids: List[int] = []
+        for event, event_id in zip(events, event_ids):
+            if not self._requires_storage_id_for_index(event):
+                continue
+
+            if event.dagster_event_type in ASSET_CHECK_EVENTS:
+                self.store_asset_check_event(event, event_id)
+                continue
+
+            if event_id is None:
+                raise DagsterInvariantViolationError(
+                    "Cannot store asset event tags for null event id."
+                )
+            asset_events.append(event)
+            asset_event_ids.append(event_id)
+
+        for event, event_id in _collapse_asset_entry_writes(asset_events, asset_event_ids):
+            self.store_asset_event(event, event_id)
+
+        self.store_asset_event_tags(asset_events, asset_event_ids)
+
+    def _update_asset_status_cache_on_write(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[Optional[int]]
+    ) -> None:
+        """Folds the given asset materializations, planned materializations, and run completions
+        into the cached partition status of the affected assets, if the instance is configured to
+        update the cache on write (the `asset_status_cache.update_on_write` setting).
+
+        Only cached statuses that were built to be updated on write, and that reflect every earlier
+        event of their asset, are updated. All other cached statuses are left to be caught up on
+        read.
+        """
+        if not (
+            self.has_instance
+            and self._instance.asset_status_cache_update_on_write
+            and self._has_cached_status_data_column
+        ):
+            return
+
+        asset_events_by_key: Dict[AssetKey, List[Tuple[int, EventLogEntry]]] = defaultdict(list)
+        finished_runs: List[Tuple[str, DagsterRunStatus]] = []
+        for event, event_id in zip(events, event_ids):
+            if not event.is_dagster_event:
+                continue
+            dagster_event = event.get_dagster_event()
+            if dagster_event.event_type in ASSET_STATUS_EVENT_TYPES and dagster_event.asset_key:
+                asset_events_by_key[dagster_event.asset_key].append(
+                    (check.not_none(event_id), event)
+                )
+            elif (
+                EVENT_TYPE_TO_PIPELINE_RUN_STATUS.get(dagster_event.event_type) in FINISHED_STATUSES
+            ):
+                finished_runs.append(
+                    (event.run_id, EVENT_TYPE_TO_PIPELINE_RUN_STATUS[dagster_event.event_type])
+                )
+
+        if not asset_events_by_key and not finished_runs:
+            return
+
+        with self.index_connection() as conn:
+            for asset_key, asset_events in asset_events_by_key.items():
+                previous_event_id = conn.execute(
+                    db_select([db.func.max(SqlEventLogStorageTable.c.id)]).where(
+                        db.and_(
+                            SqlEventLogStorageTable.c.asset_key == asset_key.to_string(),
+                            SqlEventLogStorageTable.c.dagster_event_type.in_(
+                                [event_type.value for event_type in ASSET_STATUS_EVENT_TYPES]
+                            ),
+                            SqlEventLogStorageTable.c.id
+                            < min(event_id for event_id, _ in asset_events),
+                        )
+                    )
+                ).scalar()
+
+                self._update_asset_status_cache_value(
+                    conn,
+                    asset_key,
+                    partial(
+                        _apply_asset_status_events,
+                        asset_events=asset_events,
+                        previous_event_id=previous_event_id,
+                    ),
+                )
+
+            for run_id, run_status in finished_runs:
+                planned_asset_keys = conn.execute(
+                    db_select([SqlEventLogStorageTable.c.asset_key])
+                    .distinct()
+                    .where(
+                        db.and_(
+                            SqlEventLogStorageTable.c.run_id == run_id,
+                            SqlEventLogStorageTable.c.dagster_event_type
+                            == DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value,
+                        )
+                    )
+                ).fetchall()
+                for (asset_key_str,) in planned_asset_keys:
+                    self._update_asset_status_cache_value(
+                        conn,
+                        check.not_none(AssetKey.from_db_string(asset_key_str)),
+                        partial(_apply_finished_run, run_id=run_id, run_status=run_status),
+                    )
+
+    def _update_asset_status_cache_value(
+        self,
+        conn: Connection,
+        asset_key: AssetKey,
+        update_fn: Callable[["AssetStatusCacheValue"], Optional["AssetStatusCacheValue"]],
+    ) -> None:
+        """Atomically replaces the cached status of the given asset, if it is updated on write, with
+        the result of `update_fn`. Concurrent writers of the same cached status are detected by
+        comparing the stored value, and the update is retried against the new value.
+        """
+        from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
+
+        asset_key_str = asset_key.to_string()
+        for _ in range(ASSET_STATUS_CACHE_UPDATE_ATTEMPTS):
+            serialized_value = conn.execute(
+                db_select([AssetKeyTable.c.cached_status_data]).where(
+                    AssetKeyTable.c.asset_key == asset_key_str
+                )
+            ).scalar()
+            cache_value = (
+                AssetStatusCacheValue.from_db_string(serialized_value) if serialized_value else None
+            )
+            if not cache_value or not cache_value.is_updated_on_write:
+                return
+
+            updated_value = update_fn(cache_value)
+            if updated_value is None or updated_value == cache_value:
+                return
+
+            result = conn.execute(
+                AssetKeyTable.update()
+                .where(
+                    db.and_(
+                        AssetKeyTable.c.asset_key == asset_key_str,
+                        AssetKeyTable.c.cached_status_data == serialized_value,
+                    )
+                )
+                .values(cached_status_data=serialize_value(updated_value))
+            )
+            if result.rowcount:
+                return
+
+        # the cached status may now be missing the update, so clear it to have it rebuilt on read
+        conn.execute(
+            AssetKeyTable.update()
+            .where(AssetKeyTable.c.asset_key == asset_key_str)
+            .values(cached_status_data=None)
+        )
 
+    @cached_property
+    def _has_cached_status_data_column(self) -> bool:
+        return self.can_write_asset_status_cache()
+
+    def _get_records_for_run_query(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]],
+        ascending: bool,
+    ) -> SqlAlchemyQuery:
         check.invariant(not of_type or isinstance(of_type, (DagsterEventType, frozenset, set)))
 
         dagster_event_types = (
@@ -520,6 +764,63 @@ def get_records_for_run(
                 else:
                     query = query.where(SqlEventLogStorageTable.c.id < cursor_obj.storage_id())
 
+        return query
+
+    def iterate_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        batch_size: int = DEFAULT_RECORDS_FOR_RUN_BATCH_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        check.str_param(run_id, "run_id")
+        check.opt_str_param(cursor, "cursor")
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be a positive integer")
+
+        while True:
+            query = self._get_records_for_run_query(run_id, cursor, of_type, ascending=True).limit(
+                batch_size
+            )
+
+            # the connection is released between batches, and each row is only deserialized as it
+            # is consumed
+            with self.run_connection(run_id) as conn:
+                results = conn.execute(query).fetchall()
+
+            for record_id, json_str in results:
+                try:
+                    event_log_entry = deserialize_value(json_str, EventLogEntry)
+                except (seven.JSONDecodeError, DeserializationError) as err:
+                    raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+                yield EventLogRecord(storage_id=record_id, event_log_entry=event_log_entry)
+
+            if len(results) < batch_size:
+                return
+            cursor = EventLogCursor.from_storage_id(results[-1][0]).to_string()
+
+    def get_records_for_run(
+        self,
+        run_id,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+    ) -> EventLogConnection:
+        """Get all of the logs corresponding to a run.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1,
+                i.e., if cursor is -1, all logs will be returned. (default: -1)
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
+            limit (Optional[int]): the maximum number of events to fetch
+        """
+        check.str_param(run_id, "run_id")
+        check.opt_str_param(cursor, "cursor")
+
+        query = self._get_records_for_run_query(run_id, cursor, of_type, ascending)
+
         if limit:
             query = query.limit(limit)
 
@@ -558,6 +859,71 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def get_records_for_run_cursors(
+        self,
+        after_storage_id_by_run_id: Mapping[str, Optional[int]],
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        """Get the events of a set of runs in a single query, in ascending storage id order. Each
+        run is read from its own cursor. Used to poll for new events across many watched runs at
+        once. Not supported for run-sharded storages.
+
+        Since the results are ordered by storage id, the records returned for each run are always
+        the earliest of its new records, even when the results are truncated by the limit.
+
+        Args:
+            after_storage_id_by_run_id (Mapping[str, Optional[int]]): The runs for which to fetch
+                logs, each with the storage id after which to fetch them, or None to fetch all of
+                the run's logs.
+            limit (Optional[int]): Max number of records to return, across all of the runs.
+        """
+        check.mapping_param(after_storage_id_by_run_id, "after_storage_id_by_run_id", key_type=str)
+        check.opt_int_param(limit, "limit")
+        check.invariant(
+            not self.is_run_sharded, "Cannot query events across runs in a run-sharded storage"
+        )
+
+        if not after_storage_id_by_run_id:
+            return []
+
+        query = (
+            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(
+                db.or_(
+                    *(
+                        SqlEventLogStorageTable.c.run_id == run_id
+                        if after_storage_id is None
+                        else db.and_(
+                            SqlEventLogStorageTable.c.run_id == run_id,
+                            SqlEventLogStorageTable.c.id > after_storage_id,
+                        )
+                        for run_id, after_storage_id in after_storage_id_by_run_id.items()
+                    )
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if limit:
+            query = query.limit(limit)
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records = []
+        for record_id, json_str in results:
+            try:
+                records.append(
+                    EventLogRecord(
+                        storage_id=record_id,
+                        event_log_entry=deserialize_value(json_str, EventLogEntry),
+                    )
+                )
+            except (seven.JSONDecodeError, DeserializationError):
+                logging.warning(
+                    "Could not resolve event record as EventLogEntry for id `%s`.", record_id
+                )
+        return records
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
@@ -640,7 +1006,7 @@ def get_step_stats_for_run(
         # choose to revisit this in the future, especially if we are able to do JSON-column queries
         # in SQL as a way of bypassing the serdes layer in all cases.
         raw_event_query = (
-            db_select([SqlEventLogStorageTable.c.event])
+            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
             .where(SqlEventLogStorageTable.c.run_id == run_id)
             .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
             .where(
@@ -666,12 +1032,24 @@ def get_step_stats_for_run(
                 SqlEventLogStorageTable.c.step_key.in_(step_keys)
             )
 
-        with self.run_connection(run_id) as conn:
-            results = conn.execute(raw_event_query).fetchall()
+        def _iterate_step_events() -> Iterator[EventLogEntry]:
+            # fetch the events in batches, paginating on storage id, so that the events of a run with
+            # a very large log are never all held in memory at once
+            after_id = None
+            while True:
+                query = raw_event_query.limit(DEFAULT_RECORDS_FOR_RUN_BATCH_SIZE)
+                if after_id is not None:
+                    query = query.where(SqlEventLogStorageTable.c.id > after_id)
+                with self.run_connection(run_id) as conn:
+                    results = conn.execute(query).fetchall()
+                for _, json_str in results:
+                    yield deserialize_value(json_str, EventLogEntry)
+                if len(results) < DEFAULT_RECORDS_FOR_RUN_BATCH_SIZE:
+                    return
+                after_id = results[-1][0]
 
         try:
-            records = deserialize_values((json_str for (json_str,) in results), EventLogEntry)
-            return build_run_step_stats_from_events(run_id, records)
+            return build_run_step_stats_from_events(run_id, _iterate_step_events())
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
@@ -714,6 +1092,9 @@ def wipe(self) -> None:
             if self.has_table("dynamic_partitions"):
                 conn.execute(DynamicPartitionsTable.delete())
 
+            if self.has_table("dynamic_partitions_versions"):
+                conn.execute(self._increment_dynamic_partitions_version_statement())
+
             if self.has_table("concurrency_limits"):
                 conn.execute(ConcurrencyLimitsTable.delete())
 
@@ -739,6 +1120,9 @@ def _wipe_index(self):
             if self.has_table("dynamic_partitions"):
                 conn.execute(DynamicPartitionsTable.delete())
 
+            if self.has_table("dynamic_partitions_versions"):
+                conn.execute(self._increment_dynamic_partitions_version_statement())
+
             if self.has_table("concurrency_slots"):
                 conn.execute(ConcurrencySlotsTable.delete())
 
@@ -2050,6 +2434,78 @@ def _check_partitions_table(self) -> None:
                 " instance migrate`."
             )
 
+    @cached_property
+    def has_dynamic_partitions_versions_table(self) -> bool:
+        return self.has_table(DynamicPartitionsVersionsTable.name)
+
+    def get_dynamic_partitions_version(self, partitions_def_name: str) -> Optional[int]:
+        if not self.has_dynamic_partitions_versions_table:
+            return None
+
+        with self.index_connection() as conn:
+            version = conn.execute(
+                db_select([DynamicPartitionsVersionsTable.c.version]).where(
+                    DynamicPartitionsVersionsTable.c.partitions_def_name == partitions_def_name
+                )
+            ).scalar()
+
+        # definitions without a version row have not changed since the table was added
+        return version or 0
+
+    def _increment_dynamic_partitions_version_statement(
+        self, partitions_def_name: Optional[str] = None
+    ) -> Any:
+        query = DynamicPartitionsVersionsTable.update().values(
+            version=DynamicPartitionsVersionsTable.c.version + 1,
+            update_timestamp=get_current_datetime(),
+        )
+        if partitions_def_name is not None:
+            query = query.where(
+                DynamicPartitionsVersionsTable.c.partitions_def_name == partitions_def_name
+            )
+        return query
+
+    @cached_property
+    def _dynamic_partitions_version_row_names(self) -> Set[str]:
+        # names of the dynamic partitions definitions known to have a version row. Version rows are
+        # never deleted, so each definition only needs to be checked for a row on its first write
+        return set()
+
+    def _ensure_dynamic_partitions_version_row(self, partitions_def_name: str) -> bool:
+        """Ensures that the given dynamic partitions definition has a version row to increment when
+        its partitions are added or deleted, returning whether partitions versions are stored.
+        """
+        if partitions_def_name in self._dynamic_partitions_version_row_names:
+            return True
+
+        # the table exists once any version row is known. Until then, it is checked on every write
+        # rather than cached, so that writers start incrementing versions as soon as the table is
+        # added by a migration
+        if not self._dynamic_partitions_version_row_names and not self.has_table(
+            DynamicPartitionsVersionsTable.name
+        ):
+            return False
+
+        with self.index_connection() as conn:
+            has_version_row = conn.execute(
+                db_select([DynamicPartitionsVersionsTable.c.id]).where(
+                    DynamicPartitionsVersionsTable.c.partitions_def_name == partitions_def_name
+                )
+            ).fetchone()
+            if not has_version_row:
+                try:
+                    conn.execute(
+                        DynamicPartitionsVersionsTable.insert().values(
+                            partitions_def_name=partitions_def_name, version=0
+                        )
+                    )
+                except db_exc.IntegrityError:
+                    # the row was inserted by a concurrent writer
+                    pass
+
+        self._dynamic_partitions_version_row_names.add(partitions_def_name)
+        return True
+
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         """Get the list of partition keys for a partition definition."""
         self._check_partitions_table()
@@ -2088,7 +2544,10 @@ def add_dynamic_partitions(
         self, partitions_def_name: str, partition_keys: Sequence[str]
     ) -> None:
         self._check_partitions_table()
-        with self.index_connection() as conn:
+        has_versions = self._ensure_dynamic_partitions_version_row(partitions_def_name)
+        # increment the version in the same transaction that adds the partitions, so that readers
+        # never see the added partitions under the previous version
+        with self.index_transaction() as conn:
             existing_rows = conn.execute(
                 db_select([DynamicPartitionsTable.c.partition]).where(
                     db.and_(
@@ -2112,11 +2571,16 @@ def add_dynamic_partitions(
                         for partition_key in new_keys
                     ],
                 )
+                if has_versions:
+                    conn.execute(
+                        self._increment_dynamic_partitions_version_statement(partitions_def_name)
+                    )
 
     def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> None:
         self._check_partitions_table()
-        with self.index_connection() as conn:
-            conn.execute(
+        has_versions = self._ensure_dynamic_partitions_version_row(partitions_def_name)
+        with self.index_transaction() as conn:
+            result = conn.execute(
                 DynamicPartitionsTable.delete().where(
                     db.and_(
                         DynamicPartitionsTable.c.partitions_def_name == partitions_def_name,
@@ -2124,6 +2588,10 @@ def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str)
                     )
                 )
             )
+            if has_versions and result.rowcount:
+                conn.execute(
+                    self._increment_dynamic_partitions_version_statement(partitions_def_name)
+                )
 
     @cached_property
     def supports_global_concurrency_limits(self) -> bool:
@@ -3116,3 +3584,62 @@ def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     if column not in row.keys():
         return None
     return row[column]
+
+
+def _collapse_asset_entry_writes(
+    events: Sequence[EventLogEntry], event_ids: Sequence[int]
+) -> Sequence[Tuple[EventLogEntry, int]]:
+    """Returns the subset of asset events that need to be written to the AssetKeyTable so that the
+    end state matches writing every event in order: for each asset key, the last event that writes
+    each of the asset entry columns, along with the last event overall.
+    """
+    written_columns: Set[Tuple[str, str]] = set()
+    written_keys: Set[str] = set()
+    to_write: List[Tuple[EventLogEntry, int]] = []
+    for event, event_id in reversed(list(zip(events, event_ids))):
+        dagster_event = event.get_dagster_event()
+        asset_key_str = check.not_none(dagster_event.asset_key).to_string()
+        columns = {
+            (asset_key_str, column)
+            for column in ASSET_ENTRY_COLUMNS_BY_EVENT_TYPE.get(dagster_event.event_type, set())
+        }
+        if asset_key_str not in written_keys or not columns.issubset(written_columns):
+            to_write.append((event, event_id))
+            written_keys.add(asset_key_str)
+            written_columns.update(columns)
+
+    return list(reversed(to_write))
+
+
+def _apply_asset_status_events(
+    cache_value: "AssetStatusCacheValue",
+    asset_events: Sequence[Tuple[int, EventLogEntry]],
+    previous_event_id: Optional[int],
+) -> Optional["AssetStatusCacheValue"]:
+    # the cached status can only be updated if it reflects every earlier event of the asset
+    if cache_value.latest_storage_id < (previous_event_id or 0):
+        return None
+
+    for event_id, event in asset_events:
+        dagster_event = event.get_dagster_event()
+        if dagster_event.is_step_materialization:
+            cache_value = cache_value.with_materialization(event_id, dagster_event.partition)
+        elif dagster_event.partitions_subset is not None:
+            cache_value = cache_value.with_planned_materialization(
+                event_id, event.run_id, dagster_event.partitions_subset
+            )
+        else:
+            cache_value = cache_value.with_planned_materialization(
+                event_id,
+                event.run_id,
+                DefaultPartitionsSubset({dagster_event.partition})
+                if dagster_event.partition
+                else None,
+            )
+    return cache_value
+
+
+def _apply_finished_run(
+    cache_value: "AssetStatusCacheValue", run_id: str, run_status: DagsterRunStatus
+) -> "AssetStatusCacheValue":
+    return cache_value.with_finished_run(run_id, failed=run_status == DagsterRunStatus.FAILURE)
@@ -1,19 +1,20 @@
 import contextlib
 import glob
+import itertools
 import logging
 import os
 import re
 import sqlite3
 import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, ContextManager, Iterator, Optional, Sequence, Union
 
 import sqlalchemy as db
 import sqlalchemy.exc as db_exc
 from sqlalchemy.engine import Connection, Engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, StaticPool
 from tqdm import tqdm
 from watchdog.events import FileSystemEvent, PatternMatchingEventHandler
 from watchdog.observers import Observer
@@ -23,7 +24,10 @@
 from dagster._config import StringSource
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.definitions.events import AssetKey
-from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.errors import (
+    DagsterEventBatchPartiallyStoredError,
+    DagsterInvariantViolationError,
+)
 from dagster._core.event_api import EventHandlerFn, EventRecordsResult, RunStatusChangeRecordsFilter
 from dagster._core.events import (
     ASSET_CHECK_EVENTS,
@@ -58,6 +62,23 @@
     from dagster._core.storage.sqlite_storage import SqliteStorageConfig
 INDEX_SHARD_NAME = "index"
 
+# Number of shards (the index shard and the most recently accessed run shards) to keep an open
+# connection to. Can be overridden with the DAGSTER_SQLITE_EVENT_LOG_MAX_CACHED_SHARDS environment
+# variable; set to 0 to open a new connection for every access.
+DEFAULT_MAX_CACHED_SHARDS = 16
+
+
+def _configure_sqlite_connection(dbapi_connection: sqlite3.Connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        (journal_mode,) = cursor.execute("PRAGMA journal_mode").fetchone()
+        if journal_mode == "wal":
+            # In WAL mode, synchronous=NORMAL only risks losing the most recent commits on power
+            # loss (never corrupting the database), and avoids an fsync on every commit.
+            cursor.execute("PRAGMA synchronous=NORMAL")
+    finally:
+        cursor.close()
+
 
 class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """SQLite-backed event log storage.
@@ -81,15 +102,30 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     The ``base_dir`` param tells the event log storage where on disk to store the databases. To
     improve concurrent performance, event logs are stored in a separate SQLite database for each
-    run.
+    run. A connection is kept open to the most recently accessed shards, so that runs writing many
+    events don't pay the cost of opening the database for every write.
     """
 
-    def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        base_dir: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        max_cached_shards: Optional[int] = None,
+    ):
         """Note that idempotent initialization of the SQLite database is done on a per-run_id
         basis in the body of connect, since each run is stored in a separate database.
         """
         self._base_dir = os.path.abspath(check.str_param(base_dir, "base_dir"))
         mkdir_p(self._base_dir)
+        self._max_cached_shards = check.opt_int_param(
+            max_cached_shards,
+            "max_cached_shards",
+            int(
+                os.getenv(
+                    "DAGSTER_SQLITE_EVENT_LOG_MAX_CACHED_SHARDS", str(DEFAULT_MAX_CACHED_SHARDS)
+                )
+            ),
+        )
 
         self._obs = None
 
@@ -103,6 +139,11 @@ def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = N
         # Ensure that multiple threads (like the event log watcher) interact safely with each other
         self._db_lock = threading.Lock()
 
+        # INVARIANT: _db_lock protects _shard_engines, which holds an engine with a single open
+        # connection for each cached shard, in least recently used order
+        self._shard_engines: OrderedDict[str, Engine] = OrderedDict()
+        self._shard_engines_pid = os.getpid()
+
         if not os.path.exists(self.path_for_shard(INDEX_SHARD_NAME)):
             conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
             engine = create_engine(conn_string, poolclass=NullPool)
@@ -210,16 +251,55 @@ def _connect(self, shard: str) -> Iterator[Connection]:
             check.str_param(shard, "shard")
 
             conn_string = self.conn_string_for_shard(shard)
-            engine = create_engine(conn_string, poolclass=NullPool)
 
             if shard not in self._initialized_dbs:
-                self._initdb(engine)
+                self._initdb(create_engine(conn_string, poolclass=NullPool))
                 self._initialized_dbs.add(shard)
 
-            with engine.connect() as conn:
-                with conn.begin():
-                    yield conn
-            engine.dispose()
+            if self._max_cached_shards <= 0:
+                engine = create_engine(conn_string, poolclass=NullPool)
+                with engine.connect() as conn:
+                    with conn.begin():
+                        yield conn
+                engine.dispose()
+            else:
+                with self._get_cached_shard_engine(shard).connect() as conn:
+                    with conn.begin():
+                        yield conn
+
+    def _get_cached_shard_engine(self, shard: str) -> Engine:
+        # Must be called while holding _db_lock. Since all access to a shard is serialized by the
+        # lock, each cached engine can share a single connection across threads.
+        if self._shard_engines_pid != os.getpid():
+            # sqlite connections must not be used across a fork; leave them open for the parent
+            for engine in self._shard_engines.values():
+                engine.dispose(close=False)
+            self._shard_engines = OrderedDict()
+            self._shard_engines_pid = os.getpid()
+
+        engine = self._shard_engines.get(shard)
+        if engine is not None:
+            self._shard_engines.move_to_end(shard)
+            return engine
+
+        engine = create_engine(
+            self.conn_string_for_shard(shard),
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+        db.event.listen(engine, "connect", _configure_sqlite_connection)
+        self._shard_engines[shard] = engine
+        if len(self._shard_engines) > self._max_cached_shards:
+            _, evicted_engine = self._shard_engines.popitem(last=False)
+            evicted_engine.dispose()
+        return engine
+
+    def _dispose_shard_engines(self, keep_index_shard: bool = False) -> None:
+        with self._db_lock:
+            for shard in list(self._shard_engines.keys()):
+                if keep_index_shard and shard == INDEX_SHARD_NAME:
+                    continue
+                self._shard_engines.pop(shard).dispose()
 
     def run_connection(self, run_id: Optional[str] = None) -> Any:
         return self._connect(run_id)  # type: ignore  # bad sig
@@ -241,6 +321,7 @@ def store_event(self, event: EventLogEntry) -> None:
         with self.run_connection(run_id) as conn:
             conn.execute(insert_event_statement)
 
+        event_id = None
         if event.is_dagster_event and event.dagster_event.asset_key:  # type: ignore
             check.invariant(
                 event.dagster_event_type in ASSET_EVENTS,
@@ -248,8 +329,6 @@ def store_event(self, event: EventLogEntry) -> None:
                 " observations in index database",
             )
 
-            event_id = None
-
             # mirror the event in the cross-run index database
             with self.index_connection() as conn:
                 result = conn.execute(insert_event_statement)
@@ -272,6 +351,83 @@ def store_event(self, event: EventLogEntry) -> None:
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
 
+        self._update_asset_status_cache_on_write([event], [event_id])
+
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to write each run's events to its shard in a single multi-row insert,
+        and to mirror asset and run status change events in the index shard in one transaction.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        num_stored = 0
+        try:
+            for run_id, run_events in itertools.groupby(events, key=lambda event: event.run_id):
+                run_events = list(run_events)
+                with self.run_connection(run_id) as conn:
+                    conn.execute(self.prepare_insert_event_batch(run_events))
+                num_stored += len(run_events)
+
+            self._store_index_shard_rows_for_event_batch(events)
+        except Exception as e:
+            if not num_stored:
+                raise
+            raise DagsterEventBatchPartiallyStoredError(
+                f"Error while storing event batch: {e}", num_stored=num_stored
+            ) from e
+
+    def _store_index_shard_rows_for_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        asset_events = [
+            event
+            for event in events
+            if event.is_dagster_event and event.get_dagster_event().asset_key
+        ]
+        check.invariant(
+            all(event.dagster_event_type in ASSET_EVENTS for event in asset_events),
+            "Can only store asset materializations, materialization_planned, and"
+            " observations in index database",
+        )
+        asset_event_ids = []
+        index_events = [
+            event
+            for event in events
+            if event.is_dagster_event
+            and (
+                event.get_dagster_event().asset_key
+                or event.dagster_event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS
+            )
+        ]
+        if index_events:
+            # mirror the events in the cross-run index database
+            with self.index_connection() as conn:
+                for event in index_events:
+                    result = conn.execute(self.prepare_insert_event(event))
+                    if event.get_dagster_event().asset_key:
+                        asset_event_ids.append(result.inserted_primary_key[0])
+
+        asset_check_events = [
+            event
+            for event in events
+            if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS
+        ]
+        self._store_index_rows_for_event_batch(
+            [*asset_events, *asset_check_events],
+            [*asset_event_ids, *([None] * len(asset_check_events))],
+        )
+
+        run_status_events = [
+            event
+            for event in events
+            if event.is_dagster_event
+            and event.dagster_event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS
+        ]
+        self._update_asset_status_cache_on_write(
+            [*asset_events, *run_status_events],
+            [*asset_event_ids, *([None] * len(run_status_events))],
+        )
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -432,6 +588,7 @@ def delete_events(self, run_id: str) -> None:
 
     def wipe(self) -> None:
         # should delete all the run-sharded db files and drop the contents of the index
+        self._dispose_shard_engines(keep_index_shard=True)
         for filename in (
             glob.glob(os.path.join(self._base_dir, "*.db"))
             + glob.glob(os.path.join(self._base_dir, "*.db-wal"))
@@ -484,6 +641,7 @@ def dispose(self) -> None:
         if self._obs:
             self._obs.stop()
             self._obs.join(timeout=15)
+        self._dispose_shard_engines()
 
     def alembic_version(self) -> AlembicVersion:
         alembic_config = get_alembic_config(__file__)
@@ -515,7 +673,11 @@ def __init__(
         self._cb = check.callable_param(callback, "callback")
         self._log_path = event_log_storage.path_for_shard(run_id)
         self._cursor = cursor
-        super(SqliteEventLogStorageWatchdog, self).__init__(patterns=[self._log_path], **kwargs)
+        # In WAL mode, writes made over a connection that stays open only modify the write-ahead
+        # log until it is checkpointed back into the database file
+        super(SqliteEventLogStorageWatchdog, self).__init__(
+            patterns=[self._log_path, f"{self._log_path}-wal"], **kwargs
+        )
 
     def _process_log(self) -> None:
         connection = self._event_log_storage.get_records_for_run(self._run_id, self._cursor)
@@ -538,5 +700,5 @@ def _process_log(self) -> None:
                 self._event_log_storage.end_watch(self._run_id, self._cb)
 
     def on_modified(self, event: FileSystemEvent) -> None:
-        check.invariant(event.src_path == self._log_path)
+        check.invariant(event.src_path in (self._log_path, f"{self._log_path}-wal"))
         self._process_log()
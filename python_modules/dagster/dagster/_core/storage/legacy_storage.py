@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Iterable, Mapping, Optional, Sequence, Set, Tuple, Union
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, Optional, Sequence, Set, Tuple, Union
 
 from dagster import _check as check
 from dagster._config.config_schema import UserConfigSchema
@@ -12,6 +12,7 @@
 from dagster._core.storage.asset_check_execution_record import AssetCheckExecutionRecord
 from dagster._core.storage.base_storage import DagsterStorage
 from dagster._core.storage.event_log.base import (
+    DEFAULT_RECORDS_FOR_RUN_BATCH_SIZE,
     AssetCheckSummaryRecord,
     AssetRecord,
     EventLogConnection,
@@ -29,6 +30,7 @@
 
 if TYPE_CHECKING:
     from dagster._core.definitions.asset_check_spec import AssetCheckKey
+    from dagster._core.definitions.partition import VersionedDynamicPartitions
     from dagster._core.definitions.run_request import InstigatorType
     from dagster._core.event_api import AssetRecordsFilter, RunStatusChangeRecordsFilter
     from dagster._core.events import DagsterEvent, DagsterEventType
@@ -255,6 +257,11 @@ def add_snapshot(
     ) -> None:
         return self._storage.run_storage.add_snapshot(snapshot, snapshot_id)
 
+    def ensure_snapshots(
+        self, snapshots: Sequence[Union["JobSnap", "ExecutionPlanSnapshot"]]
+    ) -> Sequence[str]:
+        return self._storage.run_storage.ensure_snapshots(snapshots)
+
     def has_snapshot(self, snapshot_id: str) -> bool:
         return self._storage.run_storage.has_snapshot(snapshot_id)
 
@@ -410,6 +417,9 @@ def get_step_stats_for_run(
     def store_event(self, event: "EventLogEntry") -> None:
         return self._storage.event_log_storage.store_event(event)
 
+    def store_event_batch(self, events: Sequence["EventLogEntry"]) -> None:
+        return self._storage.event_log_storage.store_event_batch(events)
+
     def delete_events(self, run_id: str) -> None:
         return self._storage.event_log_storage.delete_events(run_id)
 
@@ -582,6 +592,14 @@ def get_latest_asset_partition_materialization_attempts_without_materializations
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         return self._storage.event_log_storage.get_dynamic_partitions(partitions_def_name)
 
+    def get_dynamic_partitions_version(self, partitions_def_name: str) -> Optional[int]:
+        return self._storage.event_log_storage.get_dynamic_partitions_version(partitions_def_name)
+
+    def get_versioned_dynamic_partitions(
+        self, partitions_def_name: str
+    ) -> "VersionedDynamicPartitions":
+        return self._storage.event_log_storage.get_versioned_dynamic_partitions(partitions_def_name)
+
     def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
         return self._storage.event_log_storage.has_dynamic_partition(
             partitions_def_name, partition_key
@@ -637,6 +655,17 @@ def get_records_for_run(
             run_id, cursor, of_type, limit, ascending
         )
 
+    def iterate_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        batch_size: int = DEFAULT_RECORDS_FOR_RUN_BATCH_SIZE,
+    ) -> Iterator[EventLogRecord]:
+        return self._storage.event_log_storage.iterate_records_for_run(
+            run_id, cursor, of_type, batch_size
+        )
+
     def initialize_concurrency_limit_to_default(self, concurrency_key: str) -> bool:
         return self._storage.event_log_storage.initialize_concurrency_limit_to_default(
             concurrency_key
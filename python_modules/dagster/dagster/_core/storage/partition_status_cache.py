@@ -1,5 +1,17 @@
 from enum import Enum
-from typing import TYPE_CHECKING, List, NamedTuple, Optional, Sequence, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from dagster import (
     AssetKey,
@@ -12,12 +24,17 @@
     MultiPartitionsDefinition,
 )
 from dagster._core.definitions.partition import (
+    DefaultPartitionsSubset,
     DynamicPartitionsDefinition,
     PartitionsDefinition,
     PartitionsSubset,
     StaticPartitionsDefinition,
 )
-from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
+from dagster._core.definitions.time_window_partitions import (
+    BaseTimeWindowPartitionsSubset,
+    TimeWindowPartitionsDefinition,
+    TimeWindowPartitionsSubset,
+)
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._core.loader import LoadingContext
 from dagster._core.storage.dagster_run import FINISHED_STATUSES, RunsFilter
@@ -78,6 +95,9 @@ class AssetStatusCacheValue(
             ("serialized_failed_partition_subset", Optional[str]),
             ("serialized_in_progress_partition_subset", Optional[str]),
             ("earliest_in_progress_materialization_event_id", Optional[int]),
+            ("in_progress_partition_subsets_by_run_id", Optional[Mapping[str, PartitionsSubset]]),
+            ("uncompacted_materialized_partition_keys", Optional[Sequence[str]]),
+            ("uncompacted_failed_partition_keys", Optional[Sequence[str]]),
         ],
     )
 ):
@@ -99,6 +119,18 @@ class AssetStatusCacheValue(
         earliest_in_progress_materialization_event_id (Optional(int)): The event id of the earliest
             materialization planned event for a run that is still in progress. This is used to check
             on the status of runs that are still in progress.
+        in_progress_partition_subsets_by_run_id (Optional(Mapping[str, PartitionsSubset])): The in
+            progress partitions, by the id of the run that is materializing them. Time window
+            partitions are kept as time windows, so that runs materializing a range of partitions
+            are stored in size proportional to the number of ranges. Only set if the value is
+            updated as events are stored, in which case materializations, materialization planned
+            events, and run completions are folded into the value on write rather than read.
+        uncompacted_materialized_partition_keys (Optional(Sequence[str])): Partitions materialized
+            since the serialized materialized partition subset was last compacted. Only set if the
+            value is updated as events are stored.
+        uncompacted_failed_partition_keys (Optional(Sequence[str])): Partitions failed since the
+            serialized failed partition subset was last compacted. Only set if the value is updated
+            as events are stored.
     """
 
     def __new__(
@@ -109,6 +141,9 @@ def __new__(
         serialized_failed_partition_subset: Optional[str] = None,
         serialized_in_progress_partition_subset: Optional[str] = None,
         earliest_in_progress_materialization_event_id: Optional[int] = None,
+        in_progress_partition_subsets_by_run_id: Optional[Mapping[str, PartitionsSubset]] = None,
+        uncompacted_materialized_partition_keys: Optional[Sequence[str]] = None,
+        uncompacted_failed_partition_keys: Optional[Sequence[str]] = None,
     ):
         check.int_param(latest_storage_id, "latest_storage_id")
         check.opt_str_param(partitions_def_id, "partitions_def_id")
@@ -121,6 +156,20 @@ def __new__(
         check.opt_str_param(
             serialized_in_progress_partition_subset, "serialized_in_progress_partition_subset"
         )
+        check.opt_mapping_param(
+            in_progress_partition_subsets_by_run_id,
+            "in_progress_partition_subsets_by_run_id",
+            key_type=str,
+            value_type=PartitionsSubset,
+        )
+        check.opt_sequence_param(
+            uncompacted_materialized_partition_keys,
+            "uncompacted_materialized_partition_keys",
+            of_type=str,
+        )
+        check.opt_sequence_param(
+            uncompacted_failed_partition_keys, "uncompacted_failed_partition_keys", of_type=str
+        )
         return super(AssetStatusCacheValue, cls).__new__(
             cls,
             latest_storage_id,
@@ -129,6 +178,108 @@ def __new__(
             serialized_failed_partition_subset,
             serialized_in_progress_partition_subset,
             earliest_in_progress_materialization_event_id,
+            in_progress_partition_subsets_by_run_id,
+            uncompacted_materialized_partition_keys,
+            uncompacted_failed_partition_keys,
+        )
+
+    @property
+    def is_updated_on_write(self) -> bool:
+        return self.in_progress_partition_subsets_by_run_id is not None
+
+    @property
+    def num_uncompacted_partition_keys(self) -> int:
+        return len(self.uncompacted_materialized_partition_keys or []) + len(
+            self.uncompacted_failed_partition_keys or []
+        )
+
+    def with_materialization(
+        self, storage_id: int, partition_key: Optional[str]
+    ) -> "AssetStatusCacheValue":
+        """Returns a copy of this value, updated on write, that includes the materialization with
+        the given storage id.
+        """
+        check.invariant(self.is_updated_on_write, "Cache value is not updated on write")
+        if partition_key is None:
+            return self._replace(latest_storage_id=max(self.latest_storage_id, storage_id))
+
+        in_progress_partition_subsets_by_run_id = _without_partitions(
+            check.not_none(self.in_progress_partition_subsets_by_run_id),
+            DefaultPartitionsSubset({partition_key}),
+        )
+        return self._replace(
+            latest_storage_id=max(self.latest_storage_id, storage_id),
+            uncompacted_materialized_partition_keys=sorted(
+                {*(self.uncompacted_materialized_partition_keys or []), partition_key}
+            ),
+            uncompacted_failed_partition_keys=[
+                key for key in self.uncompacted_failed_partition_keys or [] if key != partition_key
+            ],
+            in_progress_partition_subsets_by_run_id=in_progress_partition_subsets_by_run_id,
+            earliest_in_progress_materialization_event_id=(
+                self.earliest_in_progress_materialization_event_id
+                if in_progress_partition_subsets_by_run_id
+                else None
+            ),
+        )
+
+    def with_planned_materialization(
+        self, storage_id: int, run_id: str, partitions_subset: Optional[PartitionsSubset]
+    ) -> "AssetStatusCacheValue":
+        """Returns a copy of this value, updated on write, that includes the materialization planned
+        event with the given storage id.
+        """
+        check.invariant(self.is_updated_on_write, "Cache value is not updated on write")
+        if partitions_subset is None or partitions_subset.is_empty:
+            return self._replace(latest_storage_id=max(self.latest_storage_id, storage_id))
+
+        partitions_subset = _to_in_progress_subset(partitions_subset)
+        # only the latest planned materialization of a partition determines if it is in progress
+        in_progress_partition_subsets_by_run_id = _without_partitions(
+            check.not_none(self.in_progress_partition_subsets_by_run_id), partitions_subset
+        )
+        in_progress_partition_subsets_by_run_id[run_id] = (
+            _with_partitions(in_progress_partition_subsets_by_run_id[run_id], partitions_subset)
+            if run_id in in_progress_partition_subsets_by_run_id
+            else partitions_subset
+        )
+        return self._replace(
+            latest_storage_id=max(self.latest_storage_id, storage_id),
+            in_progress_partition_subsets_by_run_id=in_progress_partition_subsets_by_run_id,
+            earliest_in_progress_materialization_event_id=min(
+                self.earliest_in_progress_materialization_event_id or storage_id, storage_id
+            ),
+        )
+
+    def with_finished_run(self, run_id: str, failed: bool) -> "AssetStatusCacheValue":
+        """Returns a copy of this value, updated on write, in which the partitions that the given
+        run was materializing are no longer in progress, and are failed if the run failed.
+        """
+        check.invariant(self.is_updated_on_write, "Cache value is not updated on write")
+        in_progress_partition_subsets_by_run_id = dict(
+            check.not_none(self.in_progress_partition_subsets_by_run_id)
+        )
+        if run_id not in in_progress_partition_subsets_by_run_id:
+            return self
+
+        run_partitions_subset = in_progress_partition_subsets_by_run_id.pop(run_id)
+        return self._replace(
+            uncompacted_failed_partition_keys=(
+                sorted(
+                    {
+                        *(self.uncompacted_failed_partition_keys or []),
+                        *run_partitions_subset.get_partition_keys(),
+                    }
+                )
+                if failed
+                else self.uncompacted_failed_partition_keys
+            ),
+            in_progress_partition_subsets_by_run_id=in_progress_partition_subsets_by_run_id,
+            earliest_in_progress_materialization_event_id=(
+                self.earliest_in_progress_materialization_event_id
+                if in_progress_partition_subsets_by_run_id
+                else None
+            ),
         )
 
     @staticmethod
@@ -168,6 +319,59 @@ def deserialize_in_progress_partition_subsets(
         return partitions_def.deserialize_subset(self.serialized_in_progress_partition_subset)
 
 
+def _to_in_progress_subset(partitions_subset: PartitionsSubset) -> PartitionsSubset:
+    # time window partitions are kept as time windows, and all other partitions as their keys
+    if isinstance(partitions_subset, BaseTimeWindowPartitionsSubset):
+        return partitions_subset.to_serializable_subset()
+    return DefaultPartitionsSubset(set(partitions_subset.get_partition_keys()))
+
+
+def _with_partitions(
+    partitions_subset: PartitionsSubset, other: PartitionsSubset
+) -> PartitionsSubset:
+    if isinstance(partitions_subset, TimeWindowPartitionsSubset) and isinstance(
+        other, TimeWindowPartitionsSubset
+    ):
+        return (partitions_subset | other).to_serializable_subset()
+    return DefaultPartitionsSubset(
+        {*partitions_subset.get_partition_keys(), *other.get_partition_keys()}
+    )
+
+
+def _without_partitions(
+    partitions_subsets_by_run_id: Mapping[str, PartitionsSubset], other: PartitionsSubset
+) -> Dict[str, PartitionsSubset]:
+    """Removes the given partitions from each run's partitions, dropping runs that are left with
+    none. Time windows are subtracted without listing the partition keys within them.
+    """
+    result = {}
+    for run_id, partitions_subset in partitions_subsets_by_run_id.items():
+        if isinstance(partitions_subset, TimeWindowPartitionsSubset):
+            if isinstance(other, TimeWindowPartitionsSubset):
+                remaining = (partitions_subset - other).to_serializable_subset()
+            else:
+                contained_keys = [
+                    key for key in other.get_partition_keys() if key in partitions_subset
+                ]
+                remaining = (
+                    (
+                        partitions_subset
+                        - partitions_subset.partitions_def.subset_with_partition_keys(
+                            contained_keys
+                        )
+                    ).to_serializable_subset()
+                    if contained_keys
+                    else partitions_subset
+                )
+        else:
+            remaining = DefaultPartitionsSubset(
+                {key for key in partitions_subset.get_partition_keys() if key not in other}
+            )
+        if not remaining.is_empty:
+            result[run_id] = remaining
+    return result
+
+
 def get_materialized_multipartitions(
     instance: DagsterInstance, asset_key: AssetKey, partitions_def: MultiPartitionsDefinition
 ) -> Sequence[str]:
@@ -247,6 +451,8 @@ def _build_status_cache(
     dynamic_partitions_store: DynamicPartitionsStore,
     stored_cache_value: Optional[AssetStatusCacheValue],
     asset_record: Optional["AssetRecord"],
+    last_planned_materialization_storage_id: int,
+    update_on_write: bool = False,
 ) -> Optional[AssetStatusCacheValue]:
     """This method refreshes the asset status cache for a given asset key. It recalculates
     the materialized partition subset for the asset key and updates the cache value.
@@ -255,10 +461,6 @@ def _build_status_cache(
         asset_record.asset_entry.last_materialization_storage_id if asset_record else None
     )
 
-    last_planned_materialization_storage_id = get_last_planned_storage_id(
-        instance, asset_key, asset_record
-    )
-
     latest_storage_id = max(
         last_materialization_storage_id or 0,
         last_planned_materialization_storage_id or 0,
@@ -328,9 +530,9 @@ def _build_status_cache(
 
     (
         failed_subset,
-        in_progress_subset,
+        in_progress_partition_keys_by_run_id,
         earliest_in_progress_materialization_event_id,
-    ) = build_failed_and_in_progress_partition_subset(
+    ) = _build_failed_subset_and_in_progress_partition_keys(
         instance,
         asset_key,
         partitions_def,
@@ -339,6 +541,9 @@ def _build_status_cache(
         failed_subset=failed_subset,
         after_storage_id=cached_in_progress_cursor,
     )
+    in_progress_subset = _get_in_progress_subset(
+        partitions_def, in_progress_partition_keys_by_run_id
+    )
 
     return AssetStatusCacheValue(
         latest_storage_id=latest_storage_id,
@@ -347,8 +552,22 @@ def _build_status_cache(
         ),
         serialized_materialized_partition_subset=materialized_subset.serialize(),
         serialized_failed_partition_subset=failed_subset.serialize(),
-        serialized_in_progress_partition_subset=in_progress_subset.serialize(),
+        serialized_in_progress_partition_subset=(
+            in_progress_subset.serialize()
+            if not update_on_write or in_progress_partition_keys_by_run_id
+            else None
+        ),
         earliest_in_progress_materialization_event_id=earliest_in_progress_materialization_event_id,
+        in_progress_partition_subsets_by_run_id=(
+            {
+                run_id: _to_in_progress_subset(
+                    partitions_def.empty_subset().with_partition_keys(partition_keys)
+                )
+                for run_id, partition_keys in in_progress_partition_keys_by_run_id.items()
+            }
+            if update_on_write
+            else None
+        ),
     )
 
 
@@ -361,7 +580,34 @@ def build_failed_and_in_progress_partition_subset(
     failed_subset: Optional[PartitionsSubset[str]] = None,
     after_storage_id: Optional[int] = None,
 ) -> Tuple[PartitionsSubset, PartitionsSubset, Optional[int]]:
-    in_progress_partitions: Set[str] = set()
+    failed_subset, in_progress_partition_keys_by_run_id, cursor = (
+        _build_failed_subset_and_in_progress_partition_keys(
+            instance,
+            asset_key,
+            partitions_def,
+            dynamic_partitions_store,
+            last_planned_materialization_storage_id=last_planned_materialization_storage_id,
+            failed_subset=failed_subset,
+            after_storage_id=after_storage_id,
+        )
+    )
+    return (
+        failed_subset,
+        _get_in_progress_subset(partitions_def, in_progress_partition_keys_by_run_id),
+        cursor,
+    )
+
+
+def _build_failed_subset_and_in_progress_partition_keys(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    partitions_def: PartitionsDefinition,
+    dynamic_partitions_store: DynamicPartitionsStore,
+    last_planned_materialization_storage_id: int,
+    failed_subset: Optional[PartitionsSubset[str]] = None,
+    after_storage_id: Optional[int] = None,
+) -> Tuple[PartitionsSubset, Mapping[str, AbstractSet[str]], Optional[int]]:
+    in_progress_partitions_by_run_id: Dict[str, Set[str]] = {}
 
     incomplete_materializations = {}
 
@@ -399,7 +645,7 @@ def build_failed_and_in_progress_partition_subset(
                 if status == DagsterRunStatus.FAILURE:
                     failed_partitions.add(partition)
             elif run_id in unfinished_runs:
-                in_progress_partitions.add(partition)
+                in_progress_partitions_by_run_id.setdefault(run_id, set()).add(partition)
                 # If the run is not finished, keep track of the event id so we can check on it next time
                 if cursor is None or event_id < cursor:
                     cursor = event_id
@@ -415,17 +661,127 @@ def build_failed_and_in_progress_partition_subset(
             )
         )
 
-    return (
-        failed_subset,
-        (
-            partitions_def.empty_subset().with_partition_keys(
-                get_validated_partition_keys(instance, partitions_def, in_progress_partitions)
+    if in_progress_partitions_by_run_id:
+        validated_in_progress_partitions = get_validated_partition_keys(
+            instance, partitions_def, set().union(*in_progress_partitions_by_run_id.values())
+        )
+        in_progress_partitions_by_run_id = {
+            run_id: partitions & validated_in_progress_partitions
+            for run_id, partitions in in_progress_partitions_by_run_id.items()
+            if partitions & validated_in_progress_partitions
+        }
+
+    return failed_subset, in_progress_partitions_by_run_id, cursor
+
+
+def _get_in_progress_subset(
+    partitions_def: PartitionsDefinition,
+    in_progress_partition_keys_by_run_id: Mapping[str, Iterable[str]],
+) -> PartitionsSubset:
+    if not in_progress_partition_keys_by_run_id:
+        return partitions_def.empty_subset()
+    return partitions_def.empty_subset().with_partition_keys(
+        set().union(*in_progress_partition_keys_by_run_id.values())
+    )
+
+
+def _compact_status_cache_value(
+    instance: DagsterInstance,
+    cache_value: AssetStatusCacheValue,
+    partitions_def: PartitionsDefinition,
+    dynamic_partitions_store: DynamicPartitionsStore,
+) -> AssetStatusCacheValue:
+    """Merges the partitions recorded on write into the serialized subsets of a cache value that
+    is updated on write. Partitions of runs that finished without their completion being recorded
+    (for example, because the run was deleted) are no longer considered in progress.
+    """
+    in_progress_run_ids = list(check.not_none(cache_value.in_progress_partition_subsets_by_run_id))
+    run_statuses = {}
+    for i in range(0, len(in_progress_run_ids), RUN_FETCH_BATCH_SIZE):
+        chunk = in_progress_run_ids[i : i + RUN_FETCH_BATCH_SIZE]
+        for run in instance.get_runs(filters=RunsFilter(run_ids=chunk)):
+            run_statuses[run.run_id] = run.status
+    for run_id in in_progress_run_ids:
+        status = run_statuses.get(run_id)
+        if status is None or status in FINISHED_STATUSES:
+            cache_value = cache_value.with_finished_run(
+                run_id, failed=status == DagsterRunStatus.FAILURE
             )
-            if in_progress_partitions
-            else partitions_def.empty_subset()
-        ),
-        cursor,
+
+    if cache_value.num_uncompacted_partition_keys:
+        materialized_subset = cache_value.deserialize_materialized_partition_subsets(partitions_def)
+        failed_subset = cache_value.deserialize_failed_partition_subsets(partitions_def)
+        if cache_value.uncompacted_materialized_partition_keys:
+            new_materialized_subset = partitions_def.empty_subset().with_partition_keys(
+                get_validated_partition_keys(
+                    dynamic_partitions_store,
+                    partitions_def,
+                    set(cache_value.uncompacted_materialized_partition_keys),
+                )
+            )
+            materialized_subset = materialized_subset | new_materialized_subset
+            failed_subset = failed_subset - new_materialized_subset
+        if cache_value.uncompacted_failed_partition_keys:
+            failed_subset = failed_subset.with_partition_keys(
+                get_validated_partition_keys(
+                    dynamic_partitions_store,
+                    partitions_def,
+                    set(cache_value.uncompacted_failed_partition_keys),
+                )
+            )
+        cache_value = cache_value._replace(
+            serialized_materialized_partition_subset=materialized_subset.serialize(),
+            serialized_failed_partition_subset=failed_subset.serialize(),
+            uncompacted_materialized_partition_keys=None,
+            uncompacted_failed_partition_keys=None,
+        )
+
+    in_progress_partition_subsets_by_run_id = check.not_none(
+        cache_value.in_progress_partition_subsets_by_run_id
     )
+    if (
+        in_progress_partition_subsets_by_run_id
+        or cache_value.serialized_in_progress_partition_subset
+    ):
+        cache_value = cache_value._replace(
+            serialized_in_progress_partition_subset=_serialize_in_progress_subset(
+                partitions_def,
+                in_progress_partition_subsets_by_run_id.values(),
+                dynamic_partitions_store,
+            )
+        )
+
+    return cache_value
+
+
+def _serialize_in_progress_subset(
+    partitions_def: PartitionsDefinition,
+    partitions_subsets: Iterable[PartitionsSubset],
+    dynamic_partitions_store: DynamicPartitionsStore,
+) -> Optional[str]:
+    # values that are updated on write omit the in progress subset when nothing is in progress, so
+    # that they can be read without deserializing any subsets
+    in_progress_subset = partitions_def.empty_subset()
+    for partitions_subset in partitions_subsets:
+        if isinstance(partitions_subset, TimeWindowPartitionsSubset) and isinstance(
+            partitions_def, TimeWindowPartitionsDefinition
+        ):
+            # time windows are merged without listing the partition keys within them, and are
+            # limited to the partitions of the definition
+            in_progress_subset = in_progress_subset | (
+                partitions_subset & partitions_def.subset_with_all_partitions()
+            )
+        else:
+            in_progress_subset = in_progress_subset.with_partition_keys(
+                get_validated_partition_keys(
+                    dynamic_partitions_store,
+                    partitions_def,
+                    set(partitions_subset.get_partition_keys()),
+                )
+            )
+    if in_progress_subset.is_empty:
+        return None
+    return in_progress_subset.serialize()
 
 
 def get_and_update_asset_status_cache_value(
@@ -456,13 +812,42 @@ def get_and_update_asset_status_cache_value(
             dynamic_partitions_store=dynamic_partitions_store
         )
     )
+    last_planned_materialization_storage_id = get_last_planned_storage_id(
+        instance, asset_key, asset_record
+    )
+    update_on_write = (
+        instance.asset_status_cache_update_on_write
+        and instance.event_log_storage.can_write_asset_status_cache()
+    )
+
+    cached_value = stored_cache_value if use_cached_value else None
+    if cached_value and cached_value.is_updated_on_write:
+        partitions_def = check.not_none(partitions_def)
+        cached_value = _compact_status_cache_value(
+            instance, cached_value, partitions_def, dynamic_partitions_store
+        )
+        last_materialization_storage_id = check.not_none(
+            asset_record
+        ).asset_entry.last_materialization_storage_id
+        if update_on_write and cached_value.latest_storage_id >= max(
+            last_materialization_storage_id or 0, last_planned_materialization_storage_id
+        ):
+            # every event up to the latest one has been folded into the value as it was stored, so
+            # there is nothing to fetch
+            return cached_value
+
+        # otherwise, catch up on the events that were stored without updating the value
+        cached_value = cached_value._replace(in_progress_partition_subsets_by_run_id=None)
+
     updated_cache_value = _build_status_cache(
         instance=instance,
         asset_key=asset_key,
         partitions_def=partitions_def,
         dynamic_partitions_store=dynamic_partitions_store,
-        stored_cache_value=stored_cache_value if use_cached_value else None,
+        stored_cache_value=cached_value,
         asset_record=asset_record,
+        last_planned_materialization_storage_id=last_planned_materialization_storage_id,
+        update_on_write=update_on_write,
     )
     if (
         updated_cache_value is not None
@@ -472,3 +857,46 @@ def get_and_update_asset_status_cache_value(
         instance.update_asset_cached_status_data(asset_key, updated_cache_value)
 
     return updated_cache_value
+
+
+def compact_asset_status_cache_value(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    partitions_def: Optional[PartitionsDefinition],
+    dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+) -> bool:
+    """Merges the partitions that have been recorded on the cached status of the given asset as its
+    events were stored into the serialized partition subsets, once there are more of them than the
+    `asset_status_cache.compaction_threshold` instance setting, or once a run that was materializing
+    partitions of the asset has finished without updating the cached status. This keeps the work
+    done to read a cached status that is updated on write bounded.
+
+    Returns whether the cached status was compacted.
+    """
+    asset_record = next(iter(instance.get_asset_records(asset_keys=[asset_key])), None)
+    cache_value = asset_record.asset_entry.cached_status if asset_record else None
+    dynamic_partitions_store = dynamic_partitions_store or instance
+    if (
+        not cache_value
+        or not cache_value.is_updated_on_write
+        or not partitions_def
+        or cache_value.partitions_def_id
+        != partitions_def.get_serializable_unique_identifier(
+            dynamic_partitions_store=dynamic_partitions_store
+        )
+    ):
+        return False
+
+    compacted_value = _compact_status_cache_value(
+        instance, cache_value, partitions_def, dynamic_partitions_store
+    )
+    if (
+        cache_value.num_uncompacted_partition_keys
+        < instance.asset_status_cache_compaction_threshold
+        and compacted_value.in_progress_partition_subsets_by_run_id
+        == cache_value.in_progress_partition_subsets_by_run_id
+    ):
+        return False
+
+    instance.update_asset_cached_status_data(asset_key, compacted_value)
+    return True
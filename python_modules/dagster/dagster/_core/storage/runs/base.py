@@ -7,7 +7,12 @@
 from dagster._core.execution.backfill import BulkActionsFilter, BulkActionStatus, PartitionBackfill
 from dagster._core.execution.telemetry import RunTelemetryData
 from dagster._core.instance import MayHaveInstanceWeakref, T_DagsterInstance
-from dagster._core.snap import ExecutionPlanSnapshot, JobSnap
+from dagster._core.snap import (
+    ExecutionPlanSnapshot,
+    JobSnap,
+    create_execution_plan_snapshot_id,
+    create_job_snapshot_id,
+)
 from dagster._core.storage.daemon_cursor import DaemonCursorStorage
 from dagster._core.storage.dagster_run import (
     DagsterRun,
@@ -221,6 +226,31 @@ def add_snapshot(
         else:
             self.add_execution_plan_snapshot(snapshot, snapshot_id)
 
+    def ensure_snapshots(
+        self, snapshots: Sequence[Union[JobSnap, ExecutionPlanSnapshot]]
+    ) -> Sequence[str]:
+        """Add any of the given snapshots that are not already in the storage, e.g. when launching
+        many runs of the same job.
+
+        Args:
+            snapshots (Sequence[Union[PipelineSnapshot, ExecutionPlanSnapshot]])
+
+        Returns:
+            Sequence[str]: The snapshot ids, in the same order as the snapshots.
+        """
+        snapshot_ids = []
+        for snapshot in snapshots:
+            if isinstance(snapshot, JobSnap):
+                snapshot_id = create_job_snapshot_id(snapshot)
+                if not self.has_job_snapshot(snapshot_id):
+                    self.add_job_snapshot(snapshot, snapshot_id)
+            else:
+                snapshot_id = create_execution_plan_snapshot_id(snapshot)
+                if not self.has_execution_plan_snapshot(snapshot_id):
+                    self.add_execution_plan_snapshot(snapshot, snapshot_id)
+            snapshot_ids.append(snapshot_id)
+        return snapshot_ids
+
     def has_snapshot(self, snapshot_id: str):
         return self.has_job_snapshot(snapshot_id) or self.has_execution_plan_snapshot(snapshot_id)
 
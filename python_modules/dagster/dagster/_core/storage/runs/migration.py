@@ -11,7 +11,12 @@
 from dagster._core.execution.job_backfill import PartitionBackfill
 from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunRecord
 from dagster._core.storage.runs.base import RunStorage
-from dagster._core.storage.runs.schema import BulkActionsTable, RunsTable, RunTagsTable
+from dagster._core.storage.runs.schema import (
+    BackfillTagsTable,
+    BulkActionsTable,
+    RunsTable,
+    RunTagsTable,
+)
 from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG, REPOSITORY_LABEL_TAG
 from dagster._serdes import deserialize_value
@@ -22,6 +27,7 @@
 )
 RUN_REPO_LABEL_TAGS = "run_repo_label_tags"
 BULK_ACTION_TYPES = "bulk_action_types"
+BACKFILL_TAGS = "backfill_tags"
 
 PrintFn: TypeAlias = Callable[[Any], None]
 MigrationFn: TypeAlias = Callable[[RunStorage, Optional[PrintFn]], None]
@@ -31,6 +37,7 @@
     RUN_PARTITIONS: lambda: migrate_run_partition,
     RUN_REPO_LABEL_TAGS: lambda: migrate_run_repo_tags,
     BULK_ACTION_TYPES: lambda: migrate_bulk_actions,
+    BACKFILL_TAGS: lambda: migrate_backfill_tags,
 }
 # for `dagster instance reindex`, optionally run for better read performance
 OPTIONAL_DATA_MIGRATIONS: Final[Mapping[str, Callable[[], MigrationFn]]] = {
@@ -259,3 +266,58 @@ def migrate_bulk_actions(run_storage: RunStorage, print_fn: Optional[PrintFn] =
                     .where(BulkActionsTable.c.id == storage_id)
                 )
                 cursor = storage_id
+
+
+def migrate_backfill_tags(run_storage: RunStorage, print_fn: Optional[PrintFn] = None) -> None:
+    """Utility method to build the backfill tags index from the tags stored in the body of each
+    existing backfill.
+    """
+    from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+
+    if not isinstance(run_storage, SqlRunStorage):
+        return
+
+    if print_fn:
+        print_fn("Querying run storage.")
+
+    base_query = (
+        db_select([BulkActionsTable.c.body, BulkActionsTable.c.id])
+        .order_by(db.asc(BulkActionsTable.c.id))
+        .limit(CHUNK_SIZE)
+    )
+
+    cursor = None
+    has_more = True
+    while has_more:
+        if cursor:
+            query = base_query.where(BulkActionsTable.c.id > cursor)
+        else:
+            query = base_query
+
+        with run_storage.connect() as conn:
+            result_proxy = conn.execute(query)
+            rows = result_proxy.fetchall()
+            result_proxy.close()
+
+            has_more = len(rows) >= CHUNK_SIZE
+            for row in rows:
+                backfill = deserialize_value(row[0], PartitionBackfill)  # type: ignore  # (pyright bug)
+                cursor = row[1]
+                write_backfill_tags(conn, backfill)
+
+
+def write_backfill_tags(conn: Connection, backfill: PartitionBackfill) -> None:
+    # clear out any previously written tags so that the migration can be safely re-run
+    conn.execute(
+        BackfillTagsTable.delete().where(BackfillTagsTable.c.backfill_id == backfill.backfill_id)
+    )
+    if not backfill.tags:
+        return
+
+    conn.execute(
+        BackfillTagsTable.insert(),
+        [
+            dict(backfill_id=backfill.backfill_id, key=key, value=value)
+            for key, value in backfill.tags.items()
+        ],
+    )
@@ -122,6 +122,20 @@
     db.Column("selector_id", db.Text),
 )
 
+BackfillTagsTable = db.Table(
+    "backfill_tags",
+    RunStorageSqlMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("backfill_id", db.String(255)),
+    db.Column("key", db.Text),
+    db.Column("value", db.Text),
+)
+
 InstanceInfo = db.Table(
     "instance_info",
     RunStorageSqlMetadata,
@@ -164,6 +178,25 @@
 db.Index("idx_bulk_actions_status", BulkActionsTable.c.status, mysql_length=32)
 db.Index("idx_bulk_actions_action_type", BulkActionsTable.c.action_type, mysql_length=32)
 db.Index("idx_bulk_actions_selector_id", BulkActionsTable.c.selector_id, mysql_length=64)
+db.Index(
+    "idx_bulk_actions_status_id",
+    BulkActionsTable.c.status,
+    BulkActionsTable.c.id,
+    mysql_length={"status": 32},
+)
+db.Index("idx_bulk_actions_timestamp", BulkActionsTable.c.timestamp)
+db.Index(
+    "idx_backfill_tags_backfill_id",
+    BackfillTagsTable.c.backfill_id,
+    BackfillTagsTable.c.id,
+    mysql_length={"backfill_id": 255},
+)
+db.Index(
+    "idx_backfill_tags_key_value",
+    BackfillTagsTable.c.key,
+    BackfillTagsTable.c.value,
+    mysql_length=64,
+)
 db.Index("idx_run_status", RunsTable.c.status, mysql_length=32)
 db.Index(
     "idx_run_range",
@@ -0,0 +1,154 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple, Union
+
+from dagster import _check as check
+from dagster._core.snap import ExecutionPlanSnapshot, JobSnap
+
+DEFAULT_SNAPSHOT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_SNAPSHOT_CACHE_MAX_KNOWN_IDS = 100000
+
+# (storage namespace, snapshot id)
+SnapshotCacheKey = Tuple[str, str]
+
+
+class SnapshotCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    num_entries: int
+    size_bytes: int
+
+
+class SnapshotCache:
+    """Process-wide LRU cache of deserialized job and execution plan snapshots.
+
+    Snapshots are immutable and content-addressed, so an entry never has to be invalidated. Entries
+    are keyed by the snapshot id and a namespace identifying the run storage they were read from,
+    so that a snapshot that only exists in one storage is never reported as existing in another.
+    The cache is bounded by the total size of the serialized snapshots it holds.
+
+    Separately, the cache keeps a bounded set of snapshot ids that are known to exist in storage
+    without holding on to the snapshot itself, which is enough to skip redundant inserts.
+    """
+
+    def __init__(self, max_bytes: int, max_known_ids: int = DEFAULT_SNAPSHOT_CACHE_MAX_KNOWN_IDS):
+        self._max_bytes = check.int_param(max_bytes, "max_bytes")
+        self._max_known_ids = check.int_param(max_known_ids, "max_known_ids")
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[
+            SnapshotCacheKey, Tuple[Union[JobSnap, ExecutionPlanSnapshot], int]
+        ] = OrderedDict()
+        self._known_ids: OrderedDict[SnapshotCacheKey, None] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    def get(self, key: SnapshotCacheKey) -> Optional[Union[JobSnap, ExecutionPlanSnapshot]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def has(self, key: SnapshotCacheKey) -> bool:
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return True
+            if key in self._known_ids:
+                self._hits += 1
+                self._known_ids.move_to_end(key)
+                return True
+
+            self._misses += 1
+            return False
+
+    def put(
+        self,
+        key: SnapshotCacheKey,
+        snapshot: Union[JobSnap, ExecutionPlanSnapshot],
+        size_bytes: int,
+    ) -> None:
+        if size_bytes > self._max_bytes:
+            # never worth evicting the entire cache for a single snapshot
+            self.mark_exists(key)
+            return
+
+        with self._lock:
+            existing = self._entries.pop(key, None)
+            if existing:
+                self._size_bytes -= existing[1]
+            self._known_ids.pop(key, None)
+
+            self._entries[key] = (snapshot, size_bytes)
+            self._size_bytes += size_bytes
+            while self._size_bytes > self._max_bytes:
+                evicted_key, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+                self._evictions += 1
+                self._add_known_id(evicted_key)
+
+    def mark_exists(self, key: SnapshotCacheKey) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            else:
+                self._add_known_id(key)
+
+    def _add_known_id(self, key: SnapshotCacheKey) -> None:
+        self._known_ids[key] = None
+        self._known_ids.move_to_end(key)
+        while len(self._known_ids) > self._max_known_ids:
+            self._known_ids.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._known_ids.clear()
+            self._size_bytes = 0
+
+    @property
+    def stats(self) -> SnapshotCacheStats:
+        with self._lock:
+            return SnapshotCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                num_entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+
+_snapshot_cache: Optional[SnapshotCache] = None
+_snapshot_cache_lock = threading.Lock()
+
+
+def get_snapshot_cache() -> SnapshotCache:
+    """The snapshot cache shared by every run storage in the process. Its size is set with the
+    DAGSTER_SNAPSHOT_CACHE_MAX_BYTES environment variable, and setting it to 0 disables the cache.
+    """
+    global _snapshot_cache  # noqa: PLW0603
+    if _snapshot_cache is None:
+        with _snapshot_cache_lock:
+            if _snapshot_cache is None:
+                _snapshot_cache = SnapshotCache(
+                    int(
+                        os.getenv(
+                            "DAGSTER_SNAPSHOT_CACHE_MAX_BYTES",
+                            str(DEFAULT_SNAPSHOT_CACHE_MAX_BYTES),
+                        )
+                    )
+                )
+    return _snapshot_cache
@@ -57,12 +57,15 @@
 )
 from dagster._core.storage.runs.base import RunStorage
 from dagster._core.storage.runs.migration import (
+    BACKFILL_TAGS,
     OPTIONAL_DATA_MIGRATIONS,
     REQUIRED_DATA_MIGRATIONS,
     RUN_PARTITIONS,
     MigrationFn,
+    write_backfill_tags,
 )
 from dagster._core.storage.runs.schema import (
+    BackfillTagsTable,
     BulkActionsTable,
     DaemonHeartbeatsTable,
     InstanceInfo,
@@ -72,6 +75,7 @@
     SecondaryIndexMigrationTable,
     SnapshotsTable,
 )
+from dagster._core.storage.runs.snapshot_cache import get_snapshot_cache
 from dagster._core.storage.sql import SqlAlchemyQuery
 from dagster._core.storage.sqlalchemy_compat import (
     db_fetch_mappings,
@@ -562,6 +566,14 @@ def delete_run(self, run_id: str) -> None:
         with self.connect() as conn:
             conn.execute(query)
 
+    @property
+    def _snapshot_cache_namespace(self) -> str:
+        # snapshot ids are only unique within a storage, so scope cached snapshots to this storage
+        # object. Wiping the storage starts a new namespace.
+        if not hasattr(self, "_snapshot_cache_namespace_id"):
+            self._snapshot_cache_namespace_id = str(uuid.uuid4())
+        return self._snapshot_cache_namespace_id
+
     def has_job_snapshot(self, job_snapshot_id: str) -> bool:
         check.str_param(job_snapshot_id, "job_snapshot_id")
         return self._has_snapshot_id(job_snapshot_id)
@@ -585,7 +597,7 @@ def get_job_snapshot(self, job_snapshot_id: str) -> JobSnap:
 
     def has_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> bool:
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
-        return bool(self.get_execution_plan_snapshot(execution_plan_snapshot_id))
+        return self._has_snapshot_id(execution_plan_snapshot_id)
 
     def add_execution_plan_snapshot(
         self, execution_plan_snapshot: ExecutionPlanSnapshot, snapshot_id: Optional[str] = None
@@ -606,24 +618,87 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
         return self._get_snapshot(execution_plan_snapshot_id)  # type: ignore  # (allowed to return None?)
 
+    def ensure_snapshots(
+        self, snapshots: Sequence[Union[JobSnap, ExecutionPlanSnapshot]]
+    ) -> Sequence[str]:
+        check.sequence_param(snapshots, "snapshots", of_type=(JobSnap, ExecutionPlanSnapshot))
+
+        snapshot_ids = [_create_snapshot_id(snapshot) for snapshot in snapshots]
+        cache = get_snapshot_cache()
+        snapshots_to_check = {
+            snapshot_id: snapshot
+            for snapshot_id, snapshot in zip(snapshot_ids, snapshots)
+            if not (cache.enabled and cache.has((self._snapshot_cache_namespace, snapshot_id)))
+        }
+        if not snapshots_to_check:
+            return snapshot_ids
+
+        existing_snapshot_ids = {
+            row["snapshot_id"]
+            for row in self.fetchall(
+                db_select([SnapshotsTable.c.snapshot_id]).where(
+                    SnapshotsTable.c.snapshot_id.in_(list(snapshots_to_check.keys()))
+                )
+            )
+        }
+        with self.connect() as conn:
+            for snapshot_id, snapshot in snapshots_to_check.items():
+                if snapshot_id in existing_snapshot_ids:
+                    if cache.enabled:
+                        cache.mark_exists((self._snapshot_cache_namespace, snapshot_id))
+                    continue
+                self._insert_snapshot(
+                    conn,
+                    snapshot_id,
+                    snapshot,
+                    SnapshotType.PIPELINE
+                    if isinstance(snapshot, JobSnap)
+                    else SnapshotType.EXECUTION_PLAN,
+                )
+
+        return snapshot_ids
+
     def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType) -> str:
         check.str_param(snapshot_id, "snapshot_id")
         check.not_none_param(snapshot_obj, "snapshot_obj")
         check.inst_param(snapshot_type, "snapshot_type", SnapshotType)
 
+        cache = get_snapshot_cache()
+        if cache.enabled and cache.has((self._snapshot_cache_namespace, snapshot_id)):
+            # snapshots are content-addressed, so an existing snapshot never needs to be rewritten
+            return snapshot_id
+
         with self.connect() as conn:
-            snapshot_insert = SnapshotsTable.insert().values(
-                snapshot_id=snapshot_id,
-                snapshot_body=zlib.compress(serialize_value(snapshot_obj).encode("utf-8")),
-                snapshot_type=snapshot_type.value,
-            )
-            try:
-                conn.execute(snapshot_insert)
-            except db_exc.IntegrityError:
-                # on_conflict_do_nothing equivalent
-                pass
+            self._insert_snapshot(conn, snapshot_id, snapshot_obj, snapshot_type)
 
-            return snapshot_id
+        return snapshot_id
+
+    def _insert_snapshot(
+        self,
+        conn: Connection,
+        snapshot_id: str,
+        snapshot_obj: Union[JobSnap, ExecutionPlanSnapshot],
+        snapshot_type: SnapshotType,
+    ) -> None:
+        serialized_snapshot = serialize_value(snapshot_obj)
+        snapshot_insert = SnapshotsTable.insert().values(
+            snapshot_id=snapshot_id,
+            snapshot_body=zlib.compress(serialized_snapshot.encode("utf-8")),
+            snapshot_type=snapshot_type.value,
+        )
+        try:
+            conn.execute(snapshot_insert)
+        except db_exc.IntegrityError:
+            # on_conflict_do_nothing equivalent
+            pass
+
+        cache = get_snapshot_cache()
+        if cache.enabled:
+            cache.put(
+                (self._snapshot_cache_namespace, snapshot_id),
+                snapshot_obj,
+                len(serialized_snapshot),
+            )
 
     def get_run_storage_id(self) -> str:
         query = db_select([InstanceInfo.c.run_storage_id])
@@ -637,26 +712,46 @@ def get_run_storage_id(self) -> str:
             return row["run_storage_id"]
 
     def _has_snapshot_id(self, snapshot_id: str) -> bool:
+        cache = get_snapshot_cache()
+        cache_key = (self._snapshot_cache_namespace, snapshot_id)
+        if cache.enabled and cache.has(cache_key):
+            return True
+
         query = db_select([SnapshotsTable.c.snapshot_id]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
 
         row = self.fetchone(query)
 
+        if row and cache.enabled:
+            cache.mark_exists(cache_key)
+
         return bool(row)
 
     def _get_snapshot(self, snapshot_id: str) -> Optional[JobSnap]:
+        cache = get_snapshot_cache()
+        cache_key = (self._snapshot_cache_namespace, snapshot_id)
+        if cache.enabled:
+            cached_snapshot = cache.get(cache_key)
+            if cached_snapshot is not None:
+                return cached_snapshot  # type: ignore
+
         query = db_select([SnapshotsTable.c.snapshot_body]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
 
         row = self.fetchone(query)
+        if not row:
+            return None
 
-        return (
-            defensively_unpack_execution_plan_snapshot_query(logging, [row["snapshot_body"]])  # type: ignore
-            if row
-            else None
-        )
+        unpacked = _defensively_unpack_snapshot_body(logging, row["snapshot_body"])  # type: ignore
+        if not unpacked:
+            return None
+
+        snapshot, size_bytes = unpacked
+        if cache.enabled:
+            cache.put(cache_key, snapshot, size_bytes)
+        return snapshot  # type: ignore
 
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         if self.has_built_index(RUN_PARTITIONS) and self.has_run_stats_index_cols():
@@ -791,6 +886,10 @@ def has_bulk_actions_selector_cols(self) -> bool:
             ]
             return "selector_id" in column_names
 
+    def has_backfill_tags_table(self) -> bool:
+        with self.connect() as conn:
+            return BackfillTagsTable.name in db.inspect(conn).get_table_names()
+
     # Daemon heartbeats
 
     def add_daemon_heartbeat(self, daemon_heartbeat: DaemonHeartbeat) -> None:
@@ -825,6 +924,7 @@ def get_daemon_heartbeats(self) -> Mapping[str, DaemonHeartbeat]:
 
     def wipe(self) -> None:
         """Clears the run storage."""
+        has_backfill_tags_table = self.has_backfill_tags_table()
         with self.connect() as conn:
             # https://stackoverflow.com/a/54386260/324449
             conn.execute(RunsTable.delete())
@@ -832,17 +932,37 @@ def wipe(self) -> None:
             conn.execute(SnapshotsTable.delete())
             conn.execute(DaemonHeartbeatsTable.delete())
             conn.execute(BulkActionsTable.delete())
+            if has_backfill_tags_table:
+                conn.execute(BackfillTagsTable.delete())
+
+        # drop any cached snapshots for this storage
+        self._snapshot_cache_namespace_id = str(uuid.uuid4())
 
     def wipe_daemon_heartbeats(self) -> None:
         with self.connect() as conn:
             # https://stackoverflow.com/a/54386260/324449
             conn.execute(DaemonHeartbeatsTable.delete())
 
-    def _backfills_query(self, filters: Optional[BulkActionsFilter] = None):
+    def _backfills_query(
+        self, filters: Optional[BulkActionsFilter] = None, use_backfill_tags_index: bool = False
+    ):
         query = db_select([BulkActionsTable.c.body, BulkActionsTable.c.timestamp])
-        if filters and filters.tags:
-            # Backfills do not have a corresponding tags table. However, all tags that are on a backfill are
-            # applied to the runs the backfill launches. So we can query for runs that match the tags and
+        if filters and filters.tags and use_backfill_tags_index:
+            for key, value in filters.tags.items():
+                backfills_with_tag_query = db_select([BackfillTagsTable.c.backfill_id]).where(
+                    db.and_(
+                        BackfillTagsTable.c.key == key,
+                        (BackfillTagsTable.c.value == value)
+                        if isinstance(value, str)
+                        else BackfillTagsTable.c.value.in_(value),
+                    )
+                )
+                query = query.where(
+                    BulkActionsTable.c.key.in_(db_subquery(backfills_with_tag_query))
+                )
+        elif filters and filters.tags:
+            # The backfill tags table has not been populated yet. However, all tags that are on a
+            # backfill are applied to the runs the backfill launches. So we can query for runs that match the tags and
             # are also part of a backfill to find the backfills that match the tags.
 
             backfills_with_tags_query = db_select([RunTagsTable.c.value]).where(
@@ -942,13 +1062,18 @@ def get_backfills(
         if status is not None:
             filters = BulkActionsFilter(statuses=[status])
 
-        query = self._backfills_query(filters=filters)
+        use_backfill_tags_index = bool(filters and filters.tags) and self.has_built_index(
+            BACKFILL_TAGS
+        )
+        query = self._backfills_query(
+            filters=filters, use_backfill_tags_index=use_backfill_tags_index
+        )
         query = self._add_cursor_limit_to_backfills_query(query, cursor=cursor, limit=limit)
         query = query.order_by(BulkActionsTable.c.id.desc())
         rows = self.fetchall(query)
         backfill_candidates = deserialize_values((row["body"] for row in rows), PartitionBackfill)
 
-        if filters and filters.tags:
+        if filters and filters.tags and not use_backfill_tags_index:
             # runs can have more tags than the backfill that launched them. Since we filtered tags by
             # querying for runs with those tags, we need to do an additional check that the backfills
             # also have the requested tags
@@ -959,7 +1084,10 @@ def get_backfills(
 
     def get_backfills_count(self, filters: Optional[BulkActionsFilter] = None) -> int:
         check.opt_inst_param(filters, "filters", BulkActionsFilter)
-        if filters and filters.tags:
+        use_backfill_tags_index = bool(filters and filters.tags) and self.has_built_index(
+            BACKFILL_TAGS
+        )
+        if filters and filters.tags and not use_backfill_tags_index:
             # runs can have more tags than the backfill that launched them. Since we filtered tags by
             # querying for runs with those tags, we need to do an additional check that the backfills
             # also have the requested tags. This requires fetching the backfills from the db and filtering them
@@ -972,7 +1100,9 @@ def get_backfills_count(self, filters: Optional[BulkActionsFilter] = None) -> in
                 self._apply_backfill_tags_filter_to_results(backfill_candidates, filters.tags)
             )
 
-        subquery = db_subquery(self._backfills_query(filters=filters))
+        subquery = db_subquery(
+            self._backfills_query(filters=filters, use_backfill_tags_index=use_backfill_tags_index)
+        )
         query = db_select([db.func.count().label("count")]).select_from(subquery)
         row = self.fetchone(query)
         count = row["count"] if row else 0
@@ -997,8 +1127,11 @@ def add_backfill(self, partition_backfill: PartitionBackfill) -> None:
             values["selector_id"] = partition_backfill.selector_id
             values["action_type"] = partition_backfill.bulk_action_type.value
 
+        has_backfill_tags_table = self.has_backfill_tags_table()
         with self.connect() as conn:
             conn.execute(BulkActionsTable.insert().values(**values))
+            if has_backfill_tags_table:
+                write_backfill_tags(conn, partition_backfill)
 
     def update_backfill(self, partition_backfill: PartitionBackfill) -> None:
         check.inst_param(partition_backfill, "partition_backfill", PartitionBackfill)
@@ -1072,16 +1205,24 @@ def defensively_unpack_execution_plan_snapshot_query(
 ) -> Optional[Union[ExecutionPlanSnapshot, JobSnap]]:
     # minimal checking here because sqlalchemy returns a different type based on what version of
     # SqlAlchemy you are using
+    unpacked = _defensively_unpack_snapshot_body(logger, row[0])
+    return unpacked[0] if unpacked else None
+
+
+def _defensively_unpack_snapshot_body(
+    logger: logging.Logger, snapshot_body: Any
+) -> Optional[Tuple[Union[ExecutionPlanSnapshot, JobSnap], int]]:
+    """Returns the unpacked snapshot along with the size of its serialized form."""
 
     def _warn(msg: str) -> None:
         logger.warning(f"get-pipeline-snapshot: {msg}")
 
-    if not isinstance(row[0], bytes):
+    if not isinstance(snapshot_body, bytes):
         _warn("First entry in row is not a binary type.")
         return None
 
     try:
-        uncompressed_bytes = zlib.decompress(row[0])
+        uncompressed_bytes = zlib.decompress(snapshot_body)
     except zlib.error:
         _warn("Could not decompress bytes stored in snapshot table.")
         return None
@@ -1093,7 +1234,16 @@ def _warn(msg: str) -> None:
         return None
 
     try:
-        return deserialize_value(decoded_str, (ExecutionPlanSnapshot, JobSnap))
+        return (
+            deserialize_value(decoded_str, (ExecutionPlanSnapshot, JobSnap)),
+            len(uncompressed_bytes),
+        )
     except JSONDecodeError:
         _warn("Could not parse json in snapshot table.")
         return None
+
+
+def _create_snapshot_id(snapshot: Union[JobSnap, ExecutionPlanSnapshot]) -> str:
+    if isinstance(snapshot, JobSnap):
+        return create_job_snapshot_id(snapshot)
+    return create_execution_plan_snapshot_id(snapshot)
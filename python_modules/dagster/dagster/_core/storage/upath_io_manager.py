@@ -1,8 +1,9 @@
 import asyncio
 import inspect
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Mapping, Optional, Tuple, Union
 
 from fsspec import AbstractFileSystem
 from fsspec.implementations.local import LocalFileSystem
@@ -28,6 +29,10 @@ class UPathIOManager(IOManager):
      - handles loading a single upstream partition
      - handles loading multiple upstream partitions (with respect to :py:class:`PartitionMapping`)
      - supports loading multiple partitions concurrently with async `load_from_path` method
+     - supports loading multiple partitions concurrently in threads, up to
+       `max_concurrent_partition_loads` at a time (or the `max_concurrent_partition_loads` input
+       metadata value)
+     - supports loading multiple partitions in a single scan by overriding `load_from_paths`
      - the `get_metadata` method can be customized to add additional metadata to the output
      - the `allow_missing_partitions` metadata value can be set to `True` to skip missing partitions
        (the default behavior is to raise an error)
@@ -36,6 +41,9 @@ class UPathIOManager(IOManager):
 
     extension: Optional[str] = None  # override in child class
 
+    # override in child classes whose `load_from_path` can safely be called from several threads
+    max_concurrent_partition_loads: int = 1
+
     def __init__(
         self,
         base_path: Optional["UPath"] = None,
@@ -53,41 +61,98 @@ def dump_to_path(self, context: OutputContext, obj: Any, path: "UPath"):
     def load_from_path(self, context: InputContext, path: "UPath") -> Any:
         """Child classes should override this method to load the object from the filesystem."""
 
+    def load_from_paths(self, context: InputContext, paths: Mapping[str, "UPath"]) -> Any:
+        """Child classes can override this method to load multiple partitions with a single scan
+        over their files, rather than calling `load_from_path` for each partition.
+
+        Args:
+            context (InputContext): The context for the I/O operation.
+            paths (Mapping[str, UPath]): The paths of the partitions to load, by partition key.
+
+        Returns:
+            Any: The object loaded from the partitions, which is passed to the input as is.
+        """
+        raise NotImplementedError()
+
     def load_partitions(self, context: InputContext):
         """This method is responsible for loading partitions.
         The default implementation assumes that different partitions are stored as independent files.
         When loading a single partition, it will call `load_from_path` on it.
         When loading multiple partitions, it will invoke `load_from_path` multiple times over paths produced by
         `get_path_for_partition` method, and store the results in a dictionary with formatted partitions as keys.
-        Sometimes, this is not desired. If the serialization format natively supports loading multiple partitions at once, this method should be overridden together with `get_path_for_partition`.
+        Up to `max_concurrent_partition_loads` partitions are loaded at a time.
+        Sometimes, this is not desired. If the serialization format natively supports loading multiple partitions at once,
+        `load_from_paths` should be overridden, or this method should be overridden together with `get_path_for_partition`.
         hint: context.asset_partition_keys can be used to access the partitions to load.
         """
-        paths = self._get_paths_for_partitions(context)  # paths for normal partitions
-        backcompat_paths = self._get_multipartition_backcompat_paths(
-            context
-        )  # paths for multipartitions
-
         context.log.debug(f"Loading {len(context.asset_partition_keys)} partitions...")
 
         if len(context.asset_partition_keys) == 1:
             partition_key = context.asset_partition_keys[0]
             return self._load_partition_from_path(
-                context, partition_key, paths[partition_key], backcompat_paths.get(partition_key)
+                context,
+                partition_key,
+                self._get_path_for_partition_key(context, partition_key),
+                self._get_multipartition_backcompat_path(context, partition_key),
             )
+        elif type(self).load_from_paths is not UPathIOManager.load_from_paths:
+            return self.load_from_paths(context, self._get_paths_for_partitions(context))
         else:
-            objs = {}
-
-            for partition_key in context.asset_partition_keys:
-                obj = self._load_partition_from_path(
-                    context,
-                    partition_key,
-                    paths[partition_key],
-                    backcompat_paths.get(partition_key),
+            loaded_objs = dict(self._iter_loaded_partitions(context))
+
+            # in the order of the partition keys, skipping partitions that were not found
+            return {
+                partition_key: loaded_objs[partition_key]
+                for partition_key in context.asset_partition_keys
+                if loaded_objs.get(partition_key) is not None
+            }
+
+    def _get_max_concurrent_partition_loads(self, context: InputContext) -> int:
+        if context.definition_metadata is not None:
+            max_concurrent_partition_loads = context.definition_metadata.get(
+                "max_concurrent_partition_loads"
+            )
+            if max_concurrent_partition_loads is not None:
+                return check.int_param(
+                    max_concurrent_partition_loads, "max_concurrent_partition_loads"
                 )
-                if obj is not None:  # in case some partitions were skipped
-                    objs[partition_key] = obj
 
-            return objs
+        return self.max_concurrent_partition_loads
+
+    def _iter_loaded_partitions(self, context: InputContext) -> Iterator[Tuple[str, Any]]:
+        """Loads the partitions of the input, yielding each partition key and loaded object as soon
+        as the partition is loaded. The path of each partition is only computed when the partition
+        is about to be loaded.
+        """
+
+        def _load(partition_key: str) -> Any:
+            return self._load_partition_from_path(
+                context,
+                partition_key,
+                self._get_path_for_partition_key(context, partition_key),
+                self._get_multipartition_backcompat_path(context, partition_key),
+            )
+
+        max_workers = self._get_max_concurrent_partition_loads(context)
+        if max_workers <= 1:
+            for partition_key in context.asset_partition_keys:
+                yield partition_key, _load(partition_key)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="upath_io_manager_load_partitions"
+        ) as executor:
+            futures = {
+                executor.submit(_load, partition_key): partition_key
+                for partition_key in context.asset_partition_keys
+            }
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                # don't start loading any more partitions if loading one failed
+                for future in futures:
+                    future.cancel()
 
     @property
     def fs(self) -> AbstractFileSystem:
@@ -225,29 +290,29 @@ def _get_paths_for_partitions(
                 "but the asset is not partitioned"
             )
 
-        def _formatted_multipartitioned_path(partition_key: MultiPartitionKey) -> str:
-            ordered_dimension_keys = [
-                key[1]
-                for key in sorted(partition_key.keys_by_dimension.items(), key=lambda x: x[0])
-            ]
-            return "/".join(ordered_dimension_keys)
-
-        formatted_partition_keys = {
-            partition_key: (
-                _formatted_multipartitioned_path(partition_key)
-                if isinstance(partition_key, MultiPartitionKey)
-                else partition_key
-            )
+        asset_path = self._get_path_without_extension(context)
+        return {
+            partition_key: self._get_path_for_partition_key(context, partition_key, asset_path)
             for partition_key in context.asset_partition_keys
         }
 
-        asset_path = self._get_path_without_extension(context)
-        return {
-            partition_key: self._with_extension(
-                self.get_path_for_partition(context, asset_path, partition)
+    def _get_path_for_partition_key(
+        self,
+        context: Union[InputContext, OutputContext],
+        partition_key: str,
+        asset_path: Optional["UPath"] = None,
+    ) -> "UPath":
+        if isinstance(partition_key, MultiPartitionKey):
+            partition = "/".join(
+                key[1]
+                for key in sorted(partition_key.keys_by_dimension.items(), key=lambda x: x[0])
             )
-            for partition_key, partition in formatted_partition_keys.items()
-        }
+        else:
+            partition = partition_key
+
+        if asset_path is None:
+            asset_path = self._get_path_without_extension(context)
+        return self._with_extension(self.get_path_for_partition(context, asset_path, partition))
 
     def _get_multipartition_backcompat_paths(
         self, context: Union[InputContext, OutputContext]
@@ -267,6 +332,14 @@ def _get_multipartition_backcompat_paths(
             if isinstance(partition_key, MultiPartitionKey)
         }
 
+    def _get_multipartition_backcompat_path(
+        self, context: Union[InputContext, OutputContext], partition_key: str
+    ) -> Optional["UPath"]:
+        if not isinstance(partition_key, MultiPartitionKey):
+            return None
+
+        return self._with_extension(self._get_path_without_extension(context) / partition_key)
+
     def _load_single_input(self, path: "UPath", context: InputContext) -> Any:
         context.log.debug(self.get_loading_input_log_message(path))
         obj = self.load_from_path(context=context, path=path)
@@ -190,6 +190,9 @@ def consume_new_runs_for_automatic_reexecution(
     it won't create another. The only exception is if the new run gets deleted, in which case we'd
     retry the run again.
     """
+    if not workspace_process_context.instance.run_retries_enabled:
+        return
+
     for run, retry_number in filter_runs_to_should_retry(
         [cast(DagsterRun, run_record.dagster_run) for run_record in run_records],
         workspace_process_context.instance,
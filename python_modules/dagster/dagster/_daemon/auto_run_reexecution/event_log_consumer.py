@@ -1,11 +1,12 @@
 import logging
 import os
-from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Mapping, Optional, Sequence
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Set
 
 import dagster._check as check
 from dagster import DagsterEventType
 from dagster._core.instance import DagsterInstance
 from dagster._core.storage.dagster_run import RunRecord, RunsFilter
+from dagster._core.storage.partition_status_cache import compact_asset_status_cache_value
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._daemon.auto_run_reexecution.auto_run_reexecution import (
     consume_new_runs_for_automatic_reexecution,
@@ -13,6 +14,7 @@
 from dagster._daemon.daemon import IntervalDaemon
 
 if TYPE_CHECKING:
+    from dagster._core.definitions.events import AssetKey
     from dagster._core.events.log import EventLogEntry
 
 _INTERVAL_SECONDS = int(os.environ.get("DAGSTER_EVENT_LOG_CONSUMER_DAEMON_INTERVAL_SECONDS", 5))
@@ -39,7 +41,10 @@ def handle_updated_runs_fns(
         self,
     ) -> Sequence[Callable[[IWorkspaceProcessContext, Sequence[RunRecord]], Iterator]]:
         """List of functions that will be called with the list of run records that have new events."""
-        return [consume_new_runs_for_automatic_reexecution]
+        return [
+            consume_new_runs_for_automatic_reexecution,
+            consume_new_runs_for_asset_status_cache_compaction,
+        ]
 
     def run_iteration(self, workspace_process_context: IWorkspaceProcessContext):
         instance = workspace_process_context.instance
@@ -94,6 +99,44 @@ def run_iteration(self, workspace_process_context: IWorkspaceProcessContext):
         _persist_cursors(instance, new_cursors)
 
 
+def consume_new_runs_for_asset_status_cache_compaction(
+    workspace_process_context: IWorkspaceProcessContext,
+    run_records: Sequence[RunRecord],
+) -> Iterator[None]:
+    """Compact the cached partition status of the assets that were planned to be materialized by the
+    finished runs, if the instance is configured to update the cached status on write.
+    """
+    instance = workspace_process_context.instance
+    if not instance.asset_status_cache_update_on_write:
+        return
+
+    asset_keys: Set["AssetKey"] = set()
+    for run_record in run_records:
+        yield
+        # page through the planned events rather than loading them all, since runs can plan
+        # materializations for a large number of assets / partitions
+        for record in instance.iterate_records_for_run(
+            run_record.dagster_run.run_id,
+            of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+            batch_size=_EVENT_LOG_FETCH_LIMIT,
+        ):
+            if record.asset_key:
+                asset_keys.add(record.asset_key)
+
+    if not asset_keys:
+        return
+
+    asset_graph = workspace_process_context.create_request_context().asset_graph
+    for asset_key in asset_keys:
+        yield
+        if not asset_graph.has(asset_key):
+            continue
+
+        compact_asset_status_cache_value(
+            instance, asset_key, asset_graph.get(asset_key).partitions_def
+        )
+
+
 def _create_cursor_key(event_type: DagsterEventType) -> str:
     check.inst_param(event_type, "event_type", DagsterEventType)
 
@@ -1,8 +1,9 @@
 import logging
 import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Iterable, Mapping, Optional, Sequence, cast
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, cast
 
 import dagster._check as check
 from dagster._core.definitions.instigation_logger import InstigationLogger
@@ -50,9 +51,19 @@ def execute_backfill_iteration(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
     debug_crash_flags: Optional[Mapping[str, int]] = None,
+    threadpool_executor: Optional[ThreadPoolExecutor] = None,
+    backfill_futures: Optional[Dict[str, Future]] = None,
 ) -> Iterable[Optional[SerializableErrorInfo]]:
     instance = workspace_process_context.instance
 
+    if backfill_futures:
+        # surface the errors from backfill iterations that finished on the threadpool since the
+        # last daemon iteration
+        for backfill_id, future in list(backfill_futures.items()):
+            if future.done():
+                del backfill_futures[backfill_id]
+                yield from future.result()
+
     in_progress_backfills = instance.get_backfills(
         filters=BulkActionsFilter(statuses=[BulkActionStatus.REQUESTED])
     )
@@ -68,7 +79,12 @@ def execute_backfill_iteration(
     backfill_jobs = [*in_progress_backfills, *canceling_backfills]
 
     yield from execute_backfill_jobs(
-        workspace_process_context, logger, backfill_jobs, debug_crash_flags
+        workspace_process_context,
+        logger,
+        backfill_jobs,
+        debug_crash_flags,
+        threadpool_executor=threadpool_executor,
+        backfill_futures=backfill_futures,
     )
 
 
@@ -87,76 +103,123 @@ def execute_backfill_jobs(
     logger: logging.Logger,
     backfill_jobs: Sequence[PartitionBackfill],
     debug_crash_flags: Optional[Mapping[str, int]] = None,
+    threadpool_executor: Optional[ThreadPoolExecutor] = None,
+    backfill_futures: Optional[Dict[str, Future]] = None,
 ) -> Iterable[Optional[SerializableErrorInfo]]:
-    instance = workspace_process_context.instance
-
     for backfill_job in backfill_jobs:
         backfill_id = backfill_job.backfill_id
 
-        # refetch, in case the backfill was updated in the meantime
-        backfill = cast(PartitionBackfill, instance.get_backfill(backfill_id))
-        with _get_instigation_logger_if_log_storage_enabled(instance, backfill, logger) as _logger:
-            # create a logger that will always include the backfill_id as an `extra`
-            backfill_logger = cast(
-                logging.Logger,
-                logging.LoggerAdapter(_logger, extra={"backfill_id": backfill.backfill_id}),
+        if threadpool_executor:
+            if backfill_futures is None:
+                check.failed("backfill_futures dict must be passed with threadpool_executor")
+
+            # only allow one iteration per backfill to be in flight, so that a long-running
+            # backfill occupies at most one worker and each backfill's updates are written by a
+            # single thread at a time
+            if backfill_id in backfill_futures and not backfill_futures[backfill_id].done():
+                continue
+
+            backfill_futures[backfill_id] = threadpool_executor.submit(
+                _execute_backfill_job_iteration,
+                workspace_process_context,
+                logger,
+                backfill_id,
+                debug_crash_flags,
+            )
+            yield
+        else:
+            # evaluate the backfills in a loop, synchronously, yielding to allow the backfill
+            # daemon to heartbeat
+            yield from _execute_backfill_job_iteration_generator(
+                workspace_process_context, logger, backfill_id, debug_crash_flags
             )
 
-            try:
-                if backfill.is_asset_backfill:
-                    yield from execute_asset_backfill_iteration(
-                        backfill, backfill_logger, workspace_process_context, instance
-                    )
-                else:
-                    yield from execute_job_backfill_iteration(
-                        backfill,
-                        backfill_logger,
-                        workspace_process_context,
-                        debug_crash_flags,
-                        instance,
-                    )
-            except Exception as e:
-                backfill = check.not_none(instance.get_backfill(backfill.backfill_id))
-                if (
-                    backfill.is_asset_backfill
-                    and backfill.status == BulkActionStatus.REQUESTED
-                    and backfill.failure_count < _get_max_asset_backfill_retries()
-                    and _is_retryable_asset_backfill_error(e)
-                ):
-                    if isinstance(
-                        e, (DagsterUserCodeUnreachableError, DagsterCodeLocationLoadError)
-                    ):
-                        try:
-                            raise Exception(
-                                "Unable to reach the code server. Backfill will resume once the code server is available."
-                            ) from e
-                        except:
-                            error_info = DaemonErrorCapture.on_exception(
-                                sys.exc_info(),
-                                logger=backfill_logger,
-                                log_message=f"Backfill failed for {backfill.backfill_id} due to unreachable code server and will retry",
-                            )
-                            instance.update_backfill(backfill.with_error(error_info))
-                    else:
+
+def _execute_backfill_job_iteration(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    backfill_id: str,
+    debug_crash_flags: Optional[Mapping[str, int]],
+) -> List[Optional[SerializableErrorInfo]]:
+    # evaluate the backfill iteration immediately, but from within a thread.  The main thread
+    # should be able to heartbeat to keep the daemon alive
+    return list(
+        _execute_backfill_job_iteration_generator(
+            workspace_process_context, logger, backfill_id, debug_crash_flags
+        )
+    )
+
+
+def _execute_backfill_job_iteration_generator(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    backfill_id: str,
+    debug_crash_flags: Optional[Mapping[str, int]],
+) -> Iterable[Optional[SerializableErrorInfo]]:
+    instance = workspace_process_context.instance
+
+    # refetch, in case the backfill was updated in the meantime
+    backfill = cast(PartitionBackfill, instance.get_backfill(backfill_id))
+    with _get_instigation_logger_if_log_storage_enabled(instance, backfill, logger) as _logger:
+        # create a logger that will always include the backfill_id as an `extra`
+        backfill_logger = cast(
+            logging.Logger,
+            logging.LoggerAdapter(_logger, extra={"backfill_id": backfill.backfill_id}),
+        )
+
+        try:
+            if backfill.is_asset_backfill:
+                yield from execute_asset_backfill_iteration(
+                    backfill, backfill_logger, workspace_process_context, instance
+                )
+            else:
+                yield from execute_job_backfill_iteration(
+                    backfill,
+                    backfill_logger,
+                    workspace_process_context,
+                    debug_crash_flags,
+                    instance,
+                )
+        except Exception as e:
+            backfill = check.not_none(instance.get_backfill(backfill.backfill_id))
+            if (
+                backfill.is_asset_backfill
+                and backfill.status == BulkActionStatus.REQUESTED
+                and backfill.failure_count < _get_max_asset_backfill_retries()
+                and _is_retryable_asset_backfill_error(e)
+            ):
+                if isinstance(e, (DagsterUserCodeUnreachableError, DagsterCodeLocationLoadError)):
+                    try:
+                        raise Exception(
+                            "Unable to reach the code server. Backfill will resume once the code server is available."
+                        ) from e
+                    except:
                         error_info = DaemonErrorCapture.on_exception(
                             sys.exc_info(),
                             logger=backfill_logger,
-                            log_message=f"Backfill failed for {backfill.backfill_id} and will retry.",
-                        )
-                        instance.update_backfill(
-                            backfill.with_error(error_info).with_failure_count(
-                                backfill.failure_count + 1
-                            )
+                            log_message=f"Backfill failed for {backfill.backfill_id} due to unreachable code server and will retry",
                         )
+                        instance.update_backfill(backfill.with_error(error_info))
                 else:
                     error_info = DaemonErrorCapture.on_exception(
                         sys.exc_info(),
                         logger=backfill_logger,
-                        log_message=f"Backfill failed for {backfill.backfill_id}",
+                        log_message=f"Backfill failed for {backfill.backfill_id} and will retry.",
                     )
                     instance.update_backfill(
-                        backfill.with_status(BulkActionStatus.FAILED)
-                        .with_error(error_info)
-                        .with_failure_count(backfill.failure_count + 1)
+                        backfill.with_error(error_info).with_failure_count(
+                            backfill.failure_count + 1
+                        )
                     )
-                yield error_info
+            else:
+                error_info = DaemonErrorCapture.on_exception(
+                    sys.exc_info(),
+                    logger=backfill_logger,
+                    log_message=f"Backfill failed for {backfill.backfill_id}",
+                )
+                instance.update_backfill(
+                    backfill.with_status(BulkActionStatus.FAILED)
+                    .with_error(error_info)
+                    .with_failure_count(backfill.failure_count + 1)
+                )
+            yield error_info
@@ -10,7 +10,7 @@
 from contextlib import AbstractContextManager, ExitStack
 from enum import Enum
 from threading import Event
-from typing import Any, Generator, Generic, Mapping, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Dict, Generator, Generic, Mapping, Optional, TypeVar, Union
 
 from typing_extensions import TypeAlias
 
@@ -34,6 +34,9 @@
 from dagster._time import get_current_datetime
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
 
 def get_default_daemon_logger(daemon_name) -> logging.Logger:
     return logging.getLogger(f"dagster.daemon.{daemon_name}")
@@ -334,15 +337,38 @@ def core_loop(
 
 
 class BackfillDaemon(IntervalDaemon):
+    def __init__(self, settings: Mapping[str, Any], interval_seconds: float) -> None:
+        super().__init__(interval_seconds=interval_seconds)
+        self._exit_stack = ExitStack()
+        self._threadpool_executor: Optional[InheritContextThreadPoolExecutor] = None
+        self._backfill_futures: Dict[str, "Future"] = {}
+
+        if settings.get("use_threads"):
+            self._threadpool_executor = self._exit_stack.enter_context(
+                InheritContextThreadPoolExecutor(
+                    max_workers=settings.get("num_workers"),
+                    thread_name_prefix="backfill_daemon_worker",
+                )
+            )
+
     @classmethod
     def daemon_type(cls) -> str:
         return "BACKFILL"
 
+    def __exit__(self, _exception_type, _exception_value, _traceback):
+        self._exit_stack.close()
+        super().__exit__(_exception_type, _exception_value, _traceback)
+
     def run_iteration(
         self,
         workspace_process_context: IWorkspaceProcessContext,
     ) -> DaemonIterator:
-        yield from execute_backfill_iteration(workspace_process_context, self._logger)
+        yield from execute_backfill_iteration(
+            workspace_process_context,
+            self._logger,
+            threadpool_executor=self._threadpool_executor,
+            backfill_futures=self._backfill_futures,
+        )
 
 
 class MonitoringDaemon(IntervalDaemon):
@@ -4,7 +4,7 @@
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from typing import Dict, Iterator, List, Optional, Sequence
 
 from dagster import (
     DagsterEvent,
@@ -27,10 +27,10 @@
     RunRecord,
     RunsFilter,
 )
-from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import BaseWorkspaceRequestContext, IWorkspaceProcessContext
 from dagster._daemon.daemon import DaemonIterator, IntervalDaemon
+from dagster._daemon.run_coordinator.run_queue_index import RunQueueIndex
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._utils.tags import TagConcurrencyLimitsCounter
 
@@ -50,6 +50,7 @@ def __init__(self, interval_seconds, page_size=PAGE_SIZE) -> None:
         self._page_size = page_size
         self._global_concurrency_blocked_runs_lock = threading.Lock()
         self._global_concurrency_blocked_runs = set()
+        self._run_queue_index = RunQueueIndex(page_size)
         super().__init__(interval_seconds)
 
     def _get_executor(self, max_workers) -> ThreadPoolExecutor:
@@ -210,10 +211,6 @@ def _get_runs_to_dequeue(
                 )
                 return []
 
-        cursor = None
-        has_more = True
-        batch: List[DagsterRun] = []
-
         now = fixed_iteration_time or time.time()
 
         with self._location_timeouts_lock:
@@ -230,109 +227,71 @@ def _get_runs_to_dequeue(
                 + ",".join(list(paused_location_names))
             )
 
-        logged_this_iteration = False
-        # Paginate through our runs list so we don't need to hold every run
-        # in memory at once. The maximum number of runs we'll hold in memory is
-        # max_runs_to_launch + page_size.
-        while has_more:
-            queued_runs = instance.get_runs(
-                RunsFilter(statuses=[DagsterRunStatus.QUEUED]),
-                cursor=cursor,
-                limit=self._page_size,
-                ascending=True,
-            )
-            has_more = len(queued_runs) >= self._page_size
-
-            if not queued_runs:
-                has_more = False
-                return batch
+        # Rather than paging through every queued run, keep an index of the queue that is refreshed
+        # with the runs that changed since the last iteration, so that picking runs costs roughly
+        # the number of runs launched rather than the size of the queue.
+        self._run_queue_index.refresh(instance, tag_concurrency_limits)
+        if not len(self._run_queue_index):
+            return []
 
-            if not logged_this_iteration:
-                logged_this_iteration = True
-                self._logger.info(
-                    "Priority sorting and checking tag concurrency limits for queued runs."
-                    + locations_clause
-                )
+        self._logger.info(
+            "Priority sorting and checking tag concurrency limits for queued runs."
+            + locations_clause
+        )
 
-            cursor = queued_runs[-1].run_id
+        tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
+            tag_concurrency_limits, in_progress_runs
+        )
 
-            tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
-                tag_concurrency_limits, in_progress_runs
-            )
-            batch += queued_runs
-            batch = self._priority_sort(batch)
-
-            if run_queue_config.should_block_op_concurrency_limited_runs:
-                try:
-                    global_concurrency_limits_counter = GlobalOpConcurrencyLimitsCounter(
-                        instance,
-                        batch,
-                        in_progress_run_records,
-                        run_queue_config.op_concurrency_slot_buffer,
-                    )
-                except:
-                    self._logger.exception("Failed to initialize op concurrency counter")
-                    # when we cannot initialize the global concurrency counter, we should fall back
-                    # to not blocking any runs based on op concurrency limits
-                    global_concurrency_limits_counter = None
-            else:
+        if run_queue_config.should_block_op_concurrency_limited_runs:
+            try:
+                global_concurrency_limits_counter = GlobalOpConcurrencyLimitsCounter(
+                    instance,
+                    self._run_queue_index.get_op_concurrency_runs(),
+                    in_progress_run_records,
+                    run_queue_config.op_concurrency_slot_buffer,
+                )
+            except:
+                self._logger.exception("Failed to initialize op concurrency counter")
+                # when we cannot initialize the global concurrency counter, we should fall back
+                # to not blocking any runs based on op concurrency limits
                 global_concurrency_limits_counter = None
+        else:
+            global_concurrency_limits_counter = None
 
-            to_remove = []
-            for run in batch:
-                if tag_concurrency_limits_counter.is_blocked(run):
-                    to_remove.append(run)
-                    continue
-                else:
-                    tag_concurrency_limits_counter.update_counters_with_launched_item(run)
-
-                if (
-                    global_concurrency_limits_counter
-                    and global_concurrency_limits_counter.is_blocked(run)
-                ):
-                    to_remove.append(run)
-                    if run.run_id not in self._global_concurrency_blocked_runs:
-                        with self._global_concurrency_blocked_runs_lock:
-                            self._global_concurrency_blocked_runs.add(run.run_id)
-                        concurrency_blocked_info = json.dumps(
-                            global_concurrency_limits_counter.get_blocked_run_debug_info(run)
-                        )
-                        self._logger.info(
-                            f"Run {run.run_id} is blocked by global concurrency limits: {concurrency_blocked_info}"
-                        )
-                    continue
-                elif global_concurrency_limits_counter:
-                    global_concurrency_limits_counter.update_counters_with_launched_item(run)
+        batch: List[DagsterRun] = []
+        for run in self._run_queue_index.iter_unblocked_runs(tag_concurrency_limits_counter):
+            tag_concurrency_limits_counter.update_counters_with_launched_item(run)
 
-                location_name = (
-                    run.remote_job_origin.location_name if run.remote_job_origin else None
-                )
-                if location_name and location_name in paused_location_names:
-                    to_remove.append(run)
-                    continue
+            if global_concurrency_limits_counter and global_concurrency_limits_counter.is_blocked(
+                run
+            ):
+                if run.run_id not in self._global_concurrency_blocked_runs:
+                    with self._global_concurrency_blocked_runs_lock:
+                        self._global_concurrency_blocked_runs.add(run.run_id)
+                    concurrency_blocked_info = json.dumps(
+                        global_concurrency_limits_counter.get_blocked_run_debug_info(run)
+                    )
+                    self._logger.info(
+                        f"Run {run.run_id} is blocked by global concurrency limits: {concurrency_blocked_info}"
+                    )
+                continue
+            elif global_concurrency_limits_counter:
+                global_concurrency_limits_counter.update_counters_with_launched_item(run)
 
-            for run in to_remove:
-                batch.remove(run)
+            location_name = run.remote_job_origin.location_name if run.remote_job_origin else None
+            if location_name and location_name in paused_location_names:
+                continue
 
-            if max_runs_to_launch >= 1:
-                batch = batch[:max_runs_to_launch]
+            batch.append(run)
+            if max_concurrent_runs_enabled and len(batch) >= max_runs_to_launch:
+                break
 
         return batch
 
     def _get_in_progress_run_records(self, instance: DagsterInstance) -> Sequence[RunRecord]:
         return instance.get_run_records(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
 
-    def _priority_sort(self, runs: Iterable[DagsterRun]) -> List[DagsterRun]:
-        def get_priority(run: DagsterRun) -> int:
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
-
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
-
     def _is_location_pausing_dequeues(self, location_name: str, now: float) -> bool:
         with self._location_timeouts_lock:
             return (
@@ -349,7 +308,12 @@ def _dequeue_run(
         fixed_iteration_time: Optional[float],
     ) -> bool:
         # double check that the run is still queued before dequeing
-        run = check.not_none(instance.get_run_by_id(run.run_id))
+        run_id = run.run_id
+        run = instance.get_run_by_id(run_id)
+        if run is None:
+            self._logger.info("Run %s no longer exists, skipping", run_id)
+            self._run_queue_index.remove(run_id)
+            return False
         with self._global_concurrency_blocked_runs_lock:
             if run.run_id in self._global_concurrency_blocked_runs:
                 self._global_concurrency_blocked_runs.remove(run.run_id)
@@ -362,6 +326,7 @@ def _dequeue_run(
                 run.run_id,
                 run.status,
             )
+            self._run_queue_index.remove(run.run_id)
             return False
 
         # Very old (pre 0.10.0) runs and programatically submitted runs may not have an
@@ -382,6 +347,7 @@ def _dequeue_run(
         )
 
         instance.report_dagster_event(launch_started_event, run_id=run.run_id)
+        self._run_queue_index.remove(run.run_id)
 
         run = check.not_none(instance.get_run_by_id(run.run_id))
 
@@ -0,0 +1,263 @@
+import bisect
+import heapq
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from dagster import _check as check
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunRecord, RunsFilter
+from dagster._core.storage.tags import PRIORITY_TAG
+from dagster._time import get_current_datetime
+from dagster._utils.tags import TagConcurrencyLimitsCounter
+
+DEFAULT_FULL_RESYNC_INTERVAL_SECONDS = 300
+DEFAULT_UPDATE_OVERLAP_SECONDS = 5
+
+# (-priority, storage id, run id): higher priority runs first, then FIFO within a priority
+QueuedRunSortKey = Tuple[int, int, str]
+# the (key, value) pairs of the tags that tag concurrency limits apply to
+TagBucketKey = Tuple[Tuple[str, str], ...]
+
+
+def get_run_priority(run: DagsterRun) -> int:
+    priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
+    try:
+        return int(priority_tag_value)
+    except ValueError:
+        return 0
+
+
+class _QueuedRunEntry(NamedTuple):
+    sort_key: QueuedRunSortKey
+    bucket_key: TagBucketKey
+    run: DagsterRun
+
+
+class RunQueueIndex:
+    """In-memory index of the QUEUED runs in run storage, used by the QueuedRunCoordinatorDaemon to
+    pick the runs to launch without paging through the entire queue on every iteration.
+
+    Runs are grouped into buckets of runs that share the same values for every tag that a tag
+    concurrency limit applies to, and each bucket is kept sorted by priority and then by queue
+    order. Since two runs in the same bucket are affected by the tag concurrency limits in exactly
+    the same way, once the head of a bucket is blocked every other run in the bucket is too, and the
+    rest of the bucket can be skipped.
+
+    The index is refreshed incrementally from the runs whose record was updated since the previous
+    refresh (run status changes and tag updates both bump the update timestamp), with a periodic
+    full resync to pick up anything an incremental refresh cannot see, like deleted runs.
+    """
+
+    def __init__(
+        self,
+        page_size: int,
+        full_resync_interval_seconds: Optional[int] = None,
+        update_overlap_seconds: Optional[int] = None,
+    ):
+        self._page_size = check.int_param(page_size, "page_size")
+        self._full_resync_interval_seconds = check.opt_int_param(
+            full_resync_interval_seconds,
+            "full_resync_interval_seconds",
+            int(
+                os.getenv(
+                    "DAGSTER_RUN_QUEUE_INDEX_FULL_RESYNC_INTERVAL_SECONDS",
+                    str(DEFAULT_FULL_RESYNC_INTERVAL_SECONDS),
+                )
+            ),
+        )
+        # how far back before the previous refresh to look for updated runs, to account for clock
+        # skew between the processes writing to run storage and for in-flight transactions
+        self._update_overlap_seconds = check.opt_int_param(
+            update_overlap_seconds,
+            "update_overlap_seconds",
+            int(
+                os.getenv(
+                    "DAGSTER_RUN_QUEUE_INDEX_UPDATE_OVERLAP_SECONDS",
+                    str(DEFAULT_UPDATE_OVERLAP_SECONDS),
+                )
+            ),
+        )
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _QueuedRunEntry] = {}
+        self._buckets: Dict[TagBucketKey, List[QueuedRunSortKey]] = {}
+        self._op_concurrency_run_ids: set = set()
+        self._limited_tag_keys: AbstractSet[str] = frozenset()
+        self._last_refresh_time: Optional[datetime] = None
+        self._last_full_resync_time: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, run_id: str) -> bool:
+        return run_id in self._entries
+
+    def refresh(
+        self,
+        instance: DagsterInstance,
+        tag_concurrency_limits: Optional[Sequence[Mapping[str, Any]]],
+    ) -> None:
+        limited_tag_keys = frozenset(
+            tag_limit["key"] for tag_limit in (tag_concurrency_limits or [])
+        )
+        # capture the time before querying, so that runs updated while we query are picked up by
+        # the next refresh
+        now = get_current_datetime()
+        if (
+            self._last_refresh_time is None
+            or self._last_full_resync_time is None
+            or limited_tag_keys != self._limited_tag_keys
+            # the clock moved backwards, so the update timestamps can no longer be trusted
+            or now < self._last_refresh_time
+            or (now - self._last_full_resync_time).total_seconds()
+            >= self._full_resync_interval_seconds
+        ):
+            self._full_resync(instance, limited_tag_keys)
+            self._last_full_resync_time = now
+        else:
+            updated_records = instance.get_run_records(
+                RunsFilter(
+                    updated_after=self._last_refresh_time
+                    - timedelta(seconds=self._update_overlap_seconds)
+                ),
+                ascending=True,
+            )
+            with self._lock:
+                for record in updated_records:
+                    if record.dagster_run.status == DagsterRunStatus.QUEUED:
+                        self._add(record)
+                    else:
+                        self._remove(record.dagster_run.run_id)
+
+        self._last_refresh_time = now
+
+    def _full_resync(self, instance: DagsterInstance, limited_tag_keys: AbstractSet[str]) -> None:
+        records: List[RunRecord] = []
+        cursor = None
+        while True:
+            page = instance.get_run_records(
+                RunsFilter(statuses=[DagsterRunStatus.QUEUED]),
+                limit=self._page_size,
+                cursor=cursor,
+                ascending=True,
+            )
+            records.extend(page)
+            if len(page) < self._page_size:
+                break
+            cursor = page[-1].dagster_run.run_id
+
+        with self._lock:
+            self._limited_tag_keys = limited_tag_keys
+            self._entries = {}
+            self._buckets = {}
+            self._op_concurrency_run_ids = set()
+            for record in records:
+                entry = self._make_entry(record)
+                self._entries[record.dagster_run.run_id] = entry
+                self._buckets.setdefault(entry.bucket_key, []).append(entry.sort_key)
+                if record.dagster_run.run_op_concurrency:
+                    self._op_concurrency_run_ids.add(record.dagster_run.run_id)
+            for sort_keys in self._buckets.values():
+                sort_keys.sort()
+
+    def _make_entry(self, record: RunRecord) -> _QueuedRunEntry:
+        run = record.dagster_run
+        return _QueuedRunEntry(
+            sort_key=(-get_run_priority(run), record.storage_id, run.run_id),
+            bucket_key=tuple(
+                sorted(
+                    (key, value) for key, value in run.tags.items() if key in self._limited_tag_keys
+                )
+            ),
+            run=run,
+        )
+
+    def _add(self, record: RunRecord) -> None:
+        run_id = record.dagster_run.run_id
+        entry = self._make_entry(record)
+        existing = self._entries.get(run_id)
+        if (
+            existing
+            and existing.sort_key == entry.sort_key
+            and existing.bucket_key == entry.bucket_key
+        ):
+            # already indexed in the right place, just keep the most recent version of the run
+            self._entries[run_id] = entry
+            return
+
+        if existing:
+            self._remove(run_id)
+
+        self._entries[run_id] = entry
+        bisect.insort(self._buckets.setdefault(entry.bucket_key, []), entry.sort_key)
+        if record.dagster_run.run_op_concurrency:
+            self._op_concurrency_run_ids.add(run_id)
+
+    def _remove(self, run_id: str) -> None:
+        entry = self._entries.pop(run_id, None)
+        if not entry:
+            return
+
+        self._op_concurrency_run_ids.discard(run_id)
+        sort_keys = self._buckets[entry.bucket_key]
+        del sort_keys[bisect.bisect_left(sort_keys, entry.sort_key)]
+        if not sort_keys:
+            del self._buckets[entry.bucket_key]
+
+    def remove(self, run_id: str) -> None:
+        """Drop a run that is known to have left the queue, without waiting for the next refresh."""
+        with self._lock:
+            self._remove(run_id)
+
+    def get_op_concurrency_runs(self) -> Sequence[DagsterRun]:
+        """The queued runs that have root ops with op concurrency keys."""
+        with self._lock:
+            return [self._entries[run_id].run for run_id in self._op_concurrency_run_ids]
+
+    def iter_unblocked_runs(
+        self, tag_concurrency_limits_counter: TagConcurrencyLimitsCounter
+    ) -> Iterator[DagsterRun]:
+        """Yield the queued runs that are not blocked by the tag concurrency limits, in priority
+        order. The caller is expected to update the counter with every yielded run that it
+        launches before resuming iteration, so that the counter stays consistent with the order in
+        which runs are considered.
+
+        Iterates over a copy of the index taken when iteration starts, so runs that are removed
+        from the index while iterating (e.g. because they were launched) do not affect it.
+        """
+        with self._lock:
+            buckets = {
+                bucket_key: list(sort_keys)
+                for bucket_key, sort_keys in self._buckets.items()
+                if sort_keys
+            }
+            runs_by_id = {run_id: entry.run for run_id, entry in self._entries.items()}
+
+        heap = [(sort_keys[0], bucket_key, 0) for bucket_key, sort_keys in buckets.items()]
+        heapq.heapify(heap)
+        while heap:
+            sort_key, bucket_key, position = heapq.heappop(heap)
+            run = runs_by_id[sort_key[2]]
+            if tag_concurrency_limits_counter.is_blocked(run):
+                # counters only increase while picking runs, and every run in the bucket has the
+                # same limited tags, so the rest of the bucket is blocked as well
+                continue
+
+            yield run
+
+            sort_keys = buckets[bucket_key]
+            if position + 1 < len(sort_keys):
+                heapq.heappush(heap, (sort_keys[position + 1], bucket_key, position + 1))
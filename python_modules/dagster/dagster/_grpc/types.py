@@ -19,6 +19,7 @@
     RemoteJobOrigin,
     RemoteRepositoryOrigin,
 )
+from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
 from dagster._serdes import serialize_value, whitelist_for_serdes
 from dagster._serdes.serdes import SetToSequenceFieldSerializer
 from dagster._utils.error import SerializableErrorInfo
@@ -231,7 +232,8 @@ def __new__(
     storage_field_names={
         "job_origin": "pipeline_origin",
         "run_id": "pipeline_run_id",
-    }
+    },
+    skip_when_none_fields={"execution_plan_fragment"},
 )
 class ExecuteStepArgs(
     NamedTuple(
@@ -246,6 +248,9 @@ class ExecuteStepArgs(
             ("known_state", Optional[KnownExecutionState]),
             ("should_verify_step", Optional[bool]),
             ("print_serialized_events", bool),
+            # A snapshot of just the steps to execute and the steps they depend on, so that the
+            # step worker does not need to build the execution plan for the whole job
+            ("execution_plan_fragment", Optional[ExecutionPlanSnapshot]),
         ],
     )
 ):
@@ -259,6 +264,7 @@ def __new__(
         known_state: Optional[KnownExecutionState] = None,
         should_verify_step: Optional[bool] = None,
         print_serialized_events: Optional[bool] = None,
+        execution_plan_fragment: Optional[ExecutionPlanSnapshot] = None,
     ):
         return super(ExecuteStepArgs, cls).__new__(
             cls,
@@ -276,6 +282,9 @@ def __new__(
             print_serialized_events=check.opt_bool_param(
                 print_serialized_events, "print_serialized_events", False
             ),
+            execution_plan_fragment=check.opt_inst_param(
+                execution_plan_fragment, "execution_plan_fragment", ExecutionPlanSnapshot
+            ),
         )
 
     def _get_compressed_args(self) -> str:
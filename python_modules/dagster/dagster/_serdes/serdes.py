@@ -15,6 +15,7 @@
 
 import collections.abc
 import dataclasses
+import os
 from abc import ABC, abstractmethod
 from dataclasses import is_dataclass
 from enum import Enum
@@ -65,6 +66,28 @@
     # protocol.
     from _typeshed import DataclassInstance
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# When enabled and orjson is installed, serialized values are parsed with orjson and then unpacked in
+# a single pass, instead of being parsed by the stdlib json module with an object hook. Opt-in, since
+# object construction rather than parsing dominates deserialization time for most payloads (see the
+# `serdes` benchmark in dagster-test).
+_use_orjson_for_deserialization = orjson is not None and bool(
+    os.getenv("DAGSTER_SERDES_USE_ORJSON")
+)
+
+
+def set_use_orjson_for_deserialization(use_orjson: bool) -> None:
+    """Toggle the orjson parse used by `deserialize_value`. Has no effect if orjson is not
+    installed.
+    """
+    global _use_orjson_for_deserialization  # noqa: PLW0603
+    _use_orjson_for_deserialization = orjson is not None and use_orjson
+
+
 ###################################################################################################
 # Types
 ###################################################################################################
@@ -583,31 +606,9 @@ def unpack(
         context: UnpackContext,
     ) -> T:
         try:
-            unpacked_dict = self.before_unpack(context, unpacked_dict)
-            unpacked: Dict[str, PackableValue] = {}
-            for key, value in unpacked_dict.items():
-                loaded_name = self.loaded_field_names.get(key, key)
-                # Naively implements backwards compatibility by filtering arguments that aren't present in
-                # the constructor. If a property is present in the serialized object, but doesn't exist in
-                # the version of the class loaded into memory, that property will be completely ignored.
-                if loaded_name in self.constructor_param_names:
-                    # custom unpack regardless of hook vs recursive descent
-                    custom = self.field_serializers.get(loaded_name)
-                    if custom:
-                        unpacked[loaded_name] = custom.unpack(
-                            value,
-                            whitelist_map=whitelist_map,
-                            context=context,
-                        )
-                    elif context.observed_unknown_serdes_values:
-                        unpacked[loaded_name] = context.assert_no_unknown_values(value)
-                    else:
-                        unpacked[loaded_name] = value  # type: ignore # 2 hot 4 cast()
-
-                else:
-                    context.clear_ignored_unknown_values(value)
-
-            return self.klass(**unpacked)
+            if self._has_before_unpack_hook:
+                unpacked_dict = self.before_unpack(context, unpacked_dict)
+            return self._compiled_unpack(unpacked_dict, whitelist_map, context)
         except Exception as exc:
             value = self.handle_unpack_error(exc, context, unpacked_dict)
             if isinstance(context, UnpackContext):
@@ -615,6 +616,91 @@ def unpack(
                 context.clear_ignored_unknown_values(unpacked_dict)
             return value
 
+    @cached_property
+    def _has_before_unpack_hook(self) -> bool:
+        return type(self).before_unpack is not ObjectSerializer.before_unpack
+
+    @cached_property
+    def _compiled_unpack(
+        self,
+    ) -> Callable[[Dict[str, UnpackedValue], WhitelistMap, UnpackContext], T]:
+        """Build an unpack function specialized to the fields of this serializer's class.
+
+        The mapping from storage field names to constructor params is resolved once, on first use,
+        rather than for every deserialized object. Classes without custom field serializers skip the
+        per-field loop and construct the object directly from the unpacked dict.
+        """
+        klass = self.klass
+        param_names = frozenset(self.constructor_param_names)
+
+        # storage field name -> (constructor param name, custom field serializer)
+        field_plan: Dict[str, Tuple[str, Optional[FieldSerializer]]] = {}
+        for name in param_names:
+            if name not in self.loaded_field_names:
+                field_plan[name] = (name, self.field_serializers.get(name))
+        for storage_name, loaded_name in self.loaded_field_names.items():
+            if loaded_name in param_names:
+                field_plan[storage_name] = (loaded_name, self.field_serializers.get(loaded_name))
+
+        def _unpack_fields(
+            unpacked_dict: Dict[str, UnpackedValue],
+            whitelist_map: WhitelistMap,
+            context: UnpackContext,
+        ) -> T:
+            unpacked: Dict[str, PackableValue] = {}
+            for key, value in unpacked_dict.items():
+                field = field_plan.get(key)
+                # Naively implements backwards compatibility by filtering arguments that aren't
+                # present in the constructor. If a property is present in the serialized object, but
+                # doesn't exist in the version of the class loaded into memory, that property will be
+                # completely ignored.
+                if field is None:
+                    context.clear_ignored_unknown_values(value)
+                    continue
+
+                loaded_name, custom = field
+                # custom unpack regardless of hook vs recursive descent
+                if custom:
+                    unpacked[loaded_name] = custom.unpack(
+                        value,
+                        whitelist_map=whitelist_map,
+                        context=context,
+                    )
+                elif context.observed_unknown_serdes_values:
+                    unpacked[loaded_name] = context.assert_no_unknown_values(value)
+                else:
+                    unpacked[loaded_name] = value  # type: ignore # 2 hot 4 cast()
+
+            return klass(**unpacked)
+
+        if self.field_serializers:
+            return _unpack_fields
+
+        # storage field name -> constructor param name, for the fields that are passed through as-is
+        loaded_names = {key: loaded_name for key, (loaded_name, _) in field_plan.items()}
+        has_renamed_fields = any(key != loaded_name for key, loaded_name in loaded_names.items())
+
+        def _unpack_direct(
+            unpacked_dict: Dict[str, UnpackedValue],
+            whitelist_map: WhitelistMap,
+            context: UnpackContext,
+        ) -> T:
+            # Unknown values need to be checked field by field. Otherwise, fields that aren't present
+            # in the constructor can be dropped without inspecting their values.
+            if context.observed_unknown_serdes_values:
+                return _unpack_fields(unpacked_dict, whitelist_map, context)
+            if not has_renamed_fields and param_names.issuperset(unpacked_dict):
+                return klass(**unpacked_dict)
+            return klass(
+                **{
+                    loaded_names[key]: value
+                    for key, value in unpacked_dict.items()
+                    if key in loaded_names
+                }
+            )
+
+        return _unpack_direct
+
     # Hook: Modify the contents of the unpacked dict before domain object construction during
     # deserialization.
     def before_unpack(
@@ -1169,10 +1255,7 @@ def deserialize_values(
         unpacked_values = []
         for val in vals:
             context = UnpackContext()
-            unpacked_value = seven.json.loads(
-                val,
-                object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context),
-            )
+            unpacked_value = _parse_and_unpack(val, whitelist_map, context)
             unpacked_value = context.finalize_unpack(unpacked_value)
             if as_type and not (
                 is_named_tuple_instance(unpacked_value)
@@ -1187,6 +1270,47 @@ def deserialize_values(
     return unpacked_values
 
 
+def _parse_and_unpack(
+    val: str, whitelist_map: WhitelistMap, context: UnpackContext
+) -> UnpackedValue:
+    if _use_orjson_for_deserialization:
+        try:
+            parsed = orjson.loads(val)  # type: ignore  # (orjson is installed)
+        except orjson.JSONDecodeError:  # type: ignore  # (orjson is installed)
+            # orjson is stricter than the stdlib parser (e.g. it rejects NaN, unescaped control
+            # characters and integers that overflow 64 bits), so fall back for those values
+            pass
+        else:
+            return _unpack_parsed_value(parsed, whitelist_map, context)
+
+    return seven.json.loads(
+        val,
+        object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context),
+    )
+
+
+def _unpack_parsed_value(
+    val: JsonSerializableValue, whitelist_map: WhitelistMap, context: UnpackContext
+) -> UnpackedValue:
+    # Equivalent to `_unpack_value`, but only for freshly parsed JSON: containers are unpacked in
+    # place, and scalars are never visited on their own.
+    if type(val) is dict:
+        for k, v in val.items():  # type: ignore
+            if type(v) in _JSON_CONTAINER_TYPES:
+                val[k] = _unpack_parsed_value(v, whitelist_map, context)  # type: ignore
+        return _unpack_object(val, whitelist_map, context)  # type: ignore
+
+    if type(val) is list:
+        for i, v in enumerate(val):  # type: ignore
+            if type(v) in _JSON_CONTAINER_TYPES:
+                val[i] = _unpack_parsed_value(v, whitelist_map, context)  # type: ignore
+
+    return val
+
+
+_JSON_CONTAINER_TYPES: Final[FrozenSet[type]] = frozenset([dict, list])
+
+
 class UnknownSerdesValue:
     def __init__(self, message: str, value: Mapping[str, UnpackedValue]):
         self.message = message
@@ -458,7 +458,7 @@ def send_interrupt() -> None:
 #  * https://stefan.sofa-rockers.org/2013/08/15/handling-sub-process-hierarchies-python-linux-os-x/
 def start_termination_thread(
     should_stop_event: threading.Event, is_done_event: threading.Event
-) -> None:
+) -> threading.Thread:
     check.inst_param(should_stop_event, "should_stop_event", ttype=type(multiprocessing.Event()))
 
     int_thread = threading.Thread(
@@ -468,6 +468,7 @@ def start_termination_thread(
         daemon=True,
     )
     int_thread.start()
+    return int_thread
 
 
 # Executes the next() function within an instance of the supplied context manager class
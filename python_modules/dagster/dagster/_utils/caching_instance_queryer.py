@@ -24,7 +24,11 @@
     ValidAssetSubset,
 )
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
-from dagster._core.definitions.partition import PartitionsDefinition, PartitionsSubset
+from dagster._core.definitions.partition import (
+    PartitionsDefinition,
+    PartitionsSubset,
+    VersionedDynamicPartitions,
+)
 from dagster._core.definitions.time_window_partitions import (
     TimeWindowPartitionsDefinition,
     get_time_partition_key,
@@ -86,7 +90,7 @@ def __init__(
             AssetKeyPartitionKey, int
         ] = {}
 
-        self._dynamic_partitions_cache: Dict[str, Sequence[str]] = {}
+        self._dynamic_partitions_cache: Dict[str, VersionedDynamicPartitions] = {}
 
         self._evaluation_time = evaluation_time if evaluation_time else get_current_datetime()
 
@@ -597,16 +601,28 @@ def get_materialized_partitions(
     # DYNAMIC PARTITIONS
     ####################
 
-    def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
-        """Returns a list of partitions for a partitions definition."""
+    def get_versioned_dynamic_partitions(
+        self, partitions_def_name: str
+    ) -> VersionedDynamicPartitions:
+        """Returns the partitions of a partitions definition, as of the first time they were
+        requested during this evaluation.
+        """
         if partitions_def_name not in self._dynamic_partitions_cache:
             self._dynamic_partitions_cache[partitions_def_name] = (
-                self.instance.get_dynamic_partitions(partitions_def_name)
+                self.instance.get_versioned_dynamic_partitions(partitions_def_name)
             )
         return self._dynamic_partitions_cache[partitions_def_name]
 
+    @cached_method
+    def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
+        """Returns a list of partitions for a partitions definition."""
+        return list(self.get_versioned_dynamic_partitions(partitions_def_name).partition_keys)
+
     def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
-        return partition_key in self.get_dynamic_partitions(partitions_def_name)
+        return (
+            partition_key
+            in self.get_versioned_dynamic_partitions(partitions_def_name).partition_key_set
+        )
 
     @cached_method
     def asset_partitions_with_newly_updated_parents_and_new_cursor(
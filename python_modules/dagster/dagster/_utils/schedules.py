@@ -1,9 +1,11 @@
+import bisect
 import calendar
 import datetime
 import functools
 import math
 import re
-from typing import Iterator, Optional, Sequence, Union
+import threading
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Union
 
 from croniter import croniter as _croniter
 
@@ -605,34 +607,16 @@ def has_out_of_range_cron_interval(cron_schedule: Union[str, Sequence[str]]):
     )
 
 
-def cron_string_iterator(
-    start_timestamp: float,
-    cron_string: str,
-    execution_timezone: Optional[str],
-    ascending: bool = True,
-    start_offset: int = 0,
-) -> Iterator[datetime.datetime]:
-    """Generator of datetimes >= start_timestamp for the given cron string."""
-    # leap day special casing
-    if cron_string.endswith(" 29 2 *"):
-        min_hour, _ = cron_string.split(" 29 2 *")
-        day_before = f"{min_hour} 28 2 *"
-        # run the iterator for Feb 28th
-        for dt in cron_string_iterator(
-            start_timestamp=start_timestamp,
-            cron_string=day_before,
-            execution_timezone=execution_timezone,
-            ascending=ascending,
-            start_offset=start_offset,
-        ):
-            # only return on leap years
-            if calendar.isleap(dt.year):
-                # shift 28th back to 29th
-                shifted_dt = dt + datetime.timedelta(days=1)
-                yield shifted_dt
-        return
-    execution_timezone = execution_timezone or "UTC"
+class _KnownSchedule(NamedTuple):
+    schedule_type: Optional[ScheduleType]
+    minutes: Optional[Sequence[int]]
+    hour: Optional[int]
+    day_of_month: Optional[int]
+    day_of_week: Optional[int]
 
+
+@functools.lru_cache(maxsize=256)
+def _get_known_schedule(cron_string: str) -> _KnownSchedule:
     # Croniter < 1.4 returns 2 items
     # Croniter >= 1.4 returns 3 items
     cron_parts, nth_weekday_of_month, *_ = CroniterShim.expand(cron_string)
@@ -646,11 +630,6 @@ def cron_string_iterator(
 
     known_schedule_type: Optional[ScheduleType] = None
 
-    expected_hour = None
-    expected_minutes = None
-    expected_day = None
-    expected_day_of_week = None
-
     # Special-case common intervals (hourly/daily/weekly/monthly) since croniter iteration can be
     # much slower and has correctness issues on DST boundaries
     if not nth_weekday_of_month:
@@ -667,17 +646,50 @@ def cron_string_iterator(
         elif all_numeric_minutes and all(is_wildcard[1:]):  # hourly
             known_schedule_type = ScheduleType.HOURLY
 
-    if is_numeric[1]:
-        expected_hour = cron_parts[1][0]
+    return _KnownSchedule(
+        schedule_type=known_schedule_type,
+        minutes=tuple(cron_parts[0]) if all_numeric_minutes else None,
+        hour=cron_parts[1][0] if is_numeric[1] else None,
+        day_of_month=cron_parts[2][0] if is_numeric[2] else None,
+        day_of_week=cron_parts[4][0] if is_numeric[4] else None,
+    )
 
-    if all_numeric_minutes:
-        expected_minutes = [cron_part for cron_part in cron_parts[0]]
 
-    if is_numeric[2]:
-        expected_day = cron_parts[2][0]
+def cron_string_iterator(
+    start_timestamp: float,
+    cron_string: str,
+    execution_timezone: Optional[str],
+    ascending: bool = True,
+    start_offset: int = 0,
+) -> Iterator[datetime.datetime]:
+    """Generator of datetimes >= start_timestamp for the given cron string."""
+    # leap day special casing
+    if cron_string.endswith(" 29 2 *"):
+        min_hour, _ = cron_string.split(" 29 2 *")
+        day_before = f"{min_hour} 28 2 *"
+        # run the iterator for Feb 28th
+        for dt in cron_string_iterator(
+            start_timestamp=start_timestamp,
+            cron_string=day_before,
+            execution_timezone=execution_timezone,
+            ascending=ascending,
+            start_offset=start_offset,
+        ):
+            # only return on leap years
+            if calendar.isleap(dt.year):
+                # shift 28th back to 29th
+                shifted_dt = dt + datetime.timedelta(days=1)
+                yield shifted_dt
+        return
+    execution_timezone = execution_timezone or "UTC"
 
-    if is_numeric[4]:
-        expected_day_of_week = cron_parts[4][0]
+    (
+        known_schedule_type,
+        expected_minutes,
+        expected_hour,
+        expected_day,
+        expected_day_of_week,
+    ) = _get_known_schedule(cron_string)
 
     if known_schedule_type:
         start_datetime = datetime.datetime.fromtimestamp(
@@ -843,3 +855,256 @@ def get_next_cron_tick(
         execution_timezone=timezone,
     )
     return next(cron_iter)
+
+
+class _CronTickTable:
+    """Every tick of a cron schedule within a contiguous range, extended in either direction as
+    lookups require. Positions are stable as the table is extended backwards.
+    """
+
+    # number of ticks to compute at once when extending the table forwards
+    EXTEND_CHUNK_SIZE = 256
+
+    def __init__(self, cron_string: str, execution_timezone: str):
+        self._cron_string = cron_string
+        self._execution_timezone = execution_timezone
+        self._ticks: List[datetime.datetime] = []
+        # timestamps of the ticks, for bisecting
+        self._timestamps: List[float] = []
+        self._num_prepended = 0
+        self._lock = threading.Lock()
+
+    def _prepend_until(self, timestamp: float, min_ticks: int = 0) -> None:
+        # ticks are found in descending order, so collect them and prepend them all at once
+        ticks: List[datetime.datetime] = []
+        for tick in reverse_cron_string_iterator(
+            self._timestamps[0], self._cron_string, self._execution_timezone
+        ):
+            tick_timestamp = tick.timestamp()
+            if tick_timestamp >= self._timestamps[0]:
+                continue
+            ticks.append(tick)
+            if tick_timestamp < timestamp and len(ticks) >= min_ticks:
+                break
+
+        ticks.reverse()
+        self._ticks[:0] = ticks
+        self._timestamps[:0] = [tick.timestamp() for tick in ticks]
+        self._num_prepended += len(ticks)
+
+    def _append_until(self, timestamp: float, min_ticks: int = 0) -> None:
+        min_ticks = max(min_ticks, self.EXTEND_CHUNK_SIZE)
+        num_appended = 0
+        for tick in cron_string_iterator(
+            self._timestamps[-1], self._cron_string, self._execution_timezone
+        ):
+            tick_timestamp = tick.timestamp()
+            if tick_timestamp <= self._timestamps[-1]:
+                continue
+            self._ticks.append(tick)
+            self._timestamps.append(tick_timestamp)
+            num_appended += 1
+            if tick_timestamp >= timestamp and num_appended >= min_ticks:
+                break
+
+    def _ensure_covers(self, timestamp: float) -> None:
+        if not self._ticks:
+            previous_tick = next(
+                tick
+                for tick in reverse_cron_string_iterator(
+                    timestamp, self._cron_string, self._execution_timezone
+                )
+                if tick.timestamp() < timestamp
+            )
+            self._ticks.append(previous_tick)
+            self._timestamps.append(previous_tick.timestamp())
+
+        if timestamp < self._timestamps[0]:
+            self._prepend_until(timestamp)
+        if timestamp > self._timestamps[-1]:
+            self._append_until(timestamp)
+
+    def get_position(self, timestamp: float, after: bool) -> int:
+        """Returns the position of the first tick at or after (or strictly after, if `after` is
+        set) the given timestamp.
+        """
+        with self._lock:
+            self._ensure_covers(timestamp)
+            bisect_fn = bisect.bisect_right if after else bisect.bisect_left
+            return bisect_fn(self._timestamps, timestamp) - self._num_prepended
+
+    def get_tick(self, position: int) -> datetime.datetime:
+        with self._lock:
+            offset = position + self._num_prepended
+            if offset < 0:
+                self._prepend_until(self._timestamps[0], min_ticks=-offset)
+                offset = position + self._num_prepended
+            elif offset >= len(self._ticks):
+                self._append_until(self._timestamps[-1], min_ticks=offset - len(self._ticks) + 1)
+            return self._ticks[offset]
+
+
+@functools.lru_cache(maxsize=64)
+def _get_cron_tick_table(cron_string: str, execution_timezone: str) -> _CronTickTable:
+    return _CronTickTable(cron_string, execution_timezone)
+
+
+class CronTickIndex:
+    """Random access to the ticks of a cron schedule, numbered so that the first tick at or after
+    the anchor timestamp has index 0 (earlier ticks have negative indexes). Ticks are the same
+    datetimes that `cron_string_iterator` yields, but finding the tick for an index or the index
+    for a timestamp does not require iterating over all of the ticks in between.
+
+    Hourly schedules (including every-n-minutes schedules) tick at fixed offsets into every UTC
+    hour, so their ticks are computed arithmetically. Daily, weekly, and monthly schedules tick once per
+    local day, week, or month, so the period containing a tick is computed arithmetically, and the
+    tick within the period is found with a single step of `cron_string_iterator`, which keeps its
+    handling of DST transitions. Ticks of any other cron string are looked up in a table that is
+    shared by all indexes with the same cron string and timezone.
+    """
+
+    MAX_CACHED_PERIOD_TICKS = 4096
+
+    def __init__(
+        self, cron_string: str, execution_timezone: Optional[str], anchor_timestamp: float
+    ):
+        self._cron_string = cron_string
+        self._execution_timezone = execution_timezone or "UTC"
+        self._tzinfo = get_timezone(self._execution_timezone)
+
+        # leap day cron strings are special cased by cron_string_iterator
+        self._known_schedule = (
+            _get_known_schedule(cron_string)
+            if not cron_string.endswith(" 29 2 *")
+            else _KnownSchedule(None, None, None, None, None)
+        )
+        self._table = (
+            _get_cron_tick_table(cron_string, self._execution_timezone)
+            if self._known_schedule.schedule_type is None
+            else None
+        )
+
+        if self._known_schedule.schedule_type == ScheduleType.HOURLY:
+            minutes = check.not_none(self._known_schedule.minutes)
+            if len(minutes) == 1:
+                # cron_string_iterator steps from one tick to the next by adding an hour, so the
+                # ticks are at the same offset into every UTC hour as the first tick, which is not
+                # the cron string's minute if the UTC offset is not a whole number of hours
+                first_tick = next(
+                    cron_string_iterator(anchor_timestamp, cron_string, self._execution_timezone)
+                )
+                self._minute_offsets = [
+                    first_tick.timestamp() % (SECONDS_PER_MINUTE * MINUTES_PER_HOUR)
+                ]
+            else:
+                self._minute_offsets = sorted(minute * SECONDS_PER_MINUTE for minute in minutes)
+        elif self._known_schedule.schedule_type == ScheduleType.WEEKLY:
+            # the ordinal of the first date (0001-01-01 is a Monday) that falls on the cron
+            # string's day of the week, which is 0 or 7 for Sunday
+            self._first_weekday_ordinal = (
+                1 + (check.not_none(self._known_schedule.day_of_week) - 1) % 7
+            )
+
+        # ticks of daily, weekly, and monthly schedules, by the period that they are in
+        self._period_ticks: Dict[int, datetime.datetime] = {}
+
+        self._anchor_position = 0
+        self._anchor_position = self._get_position(anchor_timestamp, after=False)
+
+    def _get_period(self, date: datetime.date) -> int:
+        schedule_type = self._known_schedule.schedule_type
+        if schedule_type == ScheduleType.DAILY:
+            return date.toordinal()
+        elif schedule_type == ScheduleType.WEEKLY:
+            return (date.toordinal() - self._first_weekday_ordinal) // 7
+        else:
+            return date.year * 12 + date.month - 1
+
+    def _get_period_start(self, period: int) -> datetime.date:
+        schedule_type = self._known_schedule.schedule_type
+        if schedule_type == ScheduleType.DAILY:
+            return datetime.date.fromordinal(period)
+        elif schedule_type == ScheduleType.WEEKLY:
+            return datetime.date.fromordinal(self._first_weekday_ordinal + 7 * period)
+        else:
+            return datetime.date(period // 12, period % 12 + 1, 1)
+
+    def _get_tick_in_period(self, period: int) -> datetime.datetime:
+        tick = self._period_ticks.get(period)
+        if tick is None:
+            if len(self._period_ticks) >= self.MAX_CACHED_PERIOD_TICKS:
+                self._period_ticks.clear()
+            tick = self._period_ticks[period] = self._find_tick_in_period(period)
+        return tick
+
+    def _find_tick_in_period(self, period: int) -> datetime.datetime:
+        period_start = self._get_period_start(period)
+        # local midnight may be shifted by a DST transition, so start searching an hour before it
+        start_timestamp = (
+            datetime.datetime(
+                period_start.year, period_start.month, period_start.day, tzinfo=self._tzinfo
+            ).timestamp()
+            - SECONDS_PER_MINUTE * MINUTES_PER_HOUR
+        )
+        for tick in cron_string_iterator(
+            start_timestamp, self._cron_string, self._execution_timezone
+        ):
+            if self._get_period(tick.date()) >= period:
+                return tick
+
+        check.failed("Cron string iterator should be infinite")
+
+    def _get_position(self, timestamp: float, after: bool) -> int:
+        # returns the position of the first tick at or after (or strictly after) the timestamp,
+        # relative to the anchor tick
+        schedule_type = self._known_schedule.schedule_type
+        if schedule_type == ScheduleType.HOURLY:
+            hour, offset = divmod(timestamp, SECONDS_PER_MINUTE * MINUTES_PER_HOUR)
+            bisect_fn = bisect.bisect_right if after else bisect.bisect_left
+            position = int(hour) * len(self._minute_offsets) + bisect_fn(
+                self._minute_offsets, offset
+            )
+        elif schedule_type is not None:
+            period = self._get_period(
+                datetime.datetime.fromtimestamp(timestamp, self._tzinfo).date()
+            )
+            tick = self._get_tick_in_period(period)
+            is_before = tick.timestamp() <= timestamp if after else tick.timestamp() < timestamp
+            position = period + 1 if is_before else period
+        else:
+            position = check.not_none(self._table).get_position(timestamp, after=after)
+
+        return position - self._anchor_position
+
+    def _get_hourly_tick_timestamp(self, position: int) -> float:
+        hour, minute_index = divmod(position, len(self._minute_offsets))
+        return float(
+            hour * SECONDS_PER_MINUTE * MINUTES_PER_HOUR + self._minute_offsets[minute_index]
+        )
+
+    def get_tick(self, index: int) -> datetime.datetime:
+        """Returns the tick with the given index."""
+        position = index + self._anchor_position
+        schedule_type = self._known_schedule.schedule_type
+        if schedule_type == ScheduleType.HOURLY:
+            return datetime.datetime.fromtimestamp(
+                self._get_hourly_tick_timestamp(position), tz=self._tzinfo
+            )
+        elif schedule_type is not None:
+            return self._get_tick_in_period(position)
+        else:
+            return check.not_none(self._table).get_tick(position)
+
+    def get_tick_timestamp(self, index: int) -> float:
+        """Returns the timestamp of the tick with the given index."""
+        if self._known_schedule.schedule_type == ScheduleType.HOURLY:
+            return self._get_hourly_tick_timestamp(index + self._anchor_position)
+        return self.get_tick(index).timestamp()
+
+    def get_index_at_or_after(self, timestamp: float) -> int:
+        """Returns the index of the first tick at or after the given timestamp."""
+        return self._get_position(timestamp, after=False)
+
+    def get_index_after(self, timestamp: float) -> int:
+        """Returns the index of the first tick strictly after the given timestamp."""
+        return self._get_position(timestamp, after=True)
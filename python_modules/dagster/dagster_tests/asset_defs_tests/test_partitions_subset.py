@@ -1,8 +1,15 @@
+import random
 from typing import cast
 from unittest.mock import Mock
 
 import pytest
-from dagster import DailyPartitionsDefinition, MultiPartitionsDefinition, StaticPartitionsDefinition
+from dagster import (
+    DailyPartitionsDefinition,
+    HourlyPartitionsDefinition,
+    MultiPartitionsDefinition,
+    StaticPartitionsDefinition,
+)
+from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
 from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
 from dagster._core.definitions.time_window_partitions import (
     PartitionKeysTimeWindowPartitionsSubset,
@@ -198,6 +205,106 @@ def test_all_partitions_subset_time_window_partitions_def() -> None:
         assert set(round_trip_subset.get_partition_keys()) == set(all_subset.get_partition_keys())
 
 
+def test_multi_partitions_subset_set_operations() -> None:
+    assert type(composite.empty_subset()) is MultiPartitionsSubset
+    assert (
+        type(
+            MultiPartitionsDefinition(
+                {"abc": static_partitions, "xyz": StaticPartitionsDefinition(["x", "y"])}
+            ).empty_subset()
+        )
+        is DefaultPartitionsSubset
+    )
+
+    keys_1 = {"a|2021-05-05", "a|2021-05-06", "a|2021-05-07", "b|2021-05-06"}
+    keys_2 = {"a|2021-05-06", "a|2021-05-08", "b|2021-05-06", "c|2021-05-06"}
+    subset_1 = composite.empty_subset().with_partition_keys(keys_1)
+    subset_2 = composite.empty_subset().with_partition_keys(keys_2)
+
+    assert subset_1.get_partition_keys() == keys_1
+    assert len(subset_1) == 4
+    assert "b|2021-05-06" in subset_1
+    assert "c|2021-05-06" not in subset_1
+    assert "not a key" not in subset_1
+    # the included partitions are stored as one time window per key of the static dimension
+    assert cast(MultiPartitionsSubset, subset_1).time_windows_by_secondary_key.keys() == {"a", "b"}
+    assert len(cast(MultiPartitionsSubset, subset_1).time_windows_by_secondary_key["a"]) == 1
+
+    assert (subset_1 | subset_2).get_partition_keys() == keys_1 | keys_2
+    assert (subset_1 & subset_2).get_partition_keys() == keys_1 & keys_2
+    assert (subset_1 - subset_2).get_partition_keys() == keys_1 - keys_2
+
+    # set operations with subsets of other types operate on partition keys
+    default_subset = DefaultPartitionsSubset(keys_2)
+    assert (subset_1 | default_subset).get_partition_keys() == keys_1 | keys_2
+    assert (subset_1 & default_subset).get_partition_keys() == keys_1 & keys_2
+    assert (subset_1 - default_subset).get_partition_keys() == keys_1 - keys_2
+
+    with freeze_time(create_datetime(2021, 5, 8)):
+        all_subset = AllPartitionsSubset(composite, Mock(), get_current_datetime())
+        assert (all_subset - subset_1).get_partition_keys() == {
+            f"{static_key}|{date}"
+            for date in ["2021-05-05", "2021-05-06", "2021-05-07"]
+            for static_key in ["a", "b", "c"]
+        } - keys_1
+
+
+def test_multi_partitions_subset_serialization() -> None:
+    subset = composite.empty_subset().with_partition_keys(
+        ["a|2021-05-05", "a|2021-05-06", "b|2021-05-06"]
+    )
+
+    serialized = subset.serialize()
+    assert composite.can_deserialize_subset(serialized, None, "MultiPartitionsDefinition")
+    assert composite.deserialize_subset(serialized) == subset
+
+    # subsets stored before the time windows representation was introduced
+    default_serialized = DefaultPartitionsSubset(
+        {"a|2021-05-05", "a|2021-05-06", "b|2021-05-06"}
+    ).serialize()
+    assert composite.can_deserialize_subset(default_serialized, None, "MultiPartitionsDefinition")
+    assert composite.deserialize_subset(default_serialized) == subset
+
+    renamed_composite = MultiPartitionsDefinition(
+        {"date": time_window_partitions, "other": static_partitions}
+    )
+    assert not renamed_composite.can_deserialize_subset(
+        serialized, None, "MultiPartitionsDefinition"
+    )
+
+    round_trip_subset = deserialize_value(serialize_value(subset.to_serializable_subset()))
+    assert isinstance(round_trip_subset, MultiPartitionsSubset)
+    assert round_trip_subset == subset
+
+
+def test_multi_partitions_subset_unrepresentable_keys() -> None:
+    subset = composite.empty_subset().with_partition_keys(["a|2021-05-05", "b|2021-05-06"])
+
+    # keys outside the bounds of the time dimension are still represented as time windows
+    out_of_bounds_subset = subset.with_partition_keys(["a|2019-01-01"])
+    assert isinstance(out_of_bounds_subset, MultiPartitionsSubset)
+    assert out_of_bounds_subset.get_partition_keys() == {
+        "a|2019-01-01",
+        "a|2021-05-05",
+        "b|2021-05-06",
+    }
+
+    # keys that aren't keys of a time window fall back to a DefaultPartitionsSubset
+    for key in ["a|not-a-date", "a|2021-05-05-01:00", "not a key"]:
+        fallback_subset = subset.with_partition_keys([key])
+        assert isinstance(fallback_subset, DefaultPartitionsSubset)
+        assert fallback_subset.get_partition_keys() == {key, "a|2021-05-05", "b|2021-05-06"}
+        assert composite.deserialize_subset(fallback_subset.serialize()) == fallback_subset
+        assert (fallback_subset - subset).get_partition_keys() == {key}
+
+    # subsets with the same partition keys are equal, regardless of their type
+    default_subset = DefaultPartitionsSubset({"a|2021-05-05", "b|2021-05-06"})
+    assert subset == default_subset
+    assert default_subset == subset
+    assert subset != DefaultPartitionsSubset({"a|2021-05-05"})
+    assert DefaultPartitionsSubset({"a|2021-05-05"}) != subset
+
+
 def test_partitions_set_short_circuiting() -> None:
     static_partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d"])
     default_ps = DefaultPartitionsSubset({"a", "b", "c"})
@@ -213,3 +320,76 @@ def test_partitions_set_short_circuiting() -> None:
 
     # Test short-circuiting of -. Returns an empty DefaultPartitionsSubset
     assert (default_ps - all_ps) == DefaultPartitionsSubset.empty_subset()
+
+
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        DailyPartitionsDefinition(start_date="2023-01-01"),
+        TimeWindowPartitionsDefinition(
+            start="2023-01-01-00:00",
+            cron_schedule="0 * * * *",
+            fmt="%Y-%m-%d-%H:%M",
+            timezone="America/Los_Angeles",
+        ),
+        TimeWindowPartitionsDefinition(
+            start="2023-01-02", cron_schedule="0 9 * * 1-5", fmt="%Y-%m-%d"
+        ),
+        HourlyPartitionsDefinition(start_date="2023-11-01-00:00", timezone="Asia/Kolkata"),
+        HourlyPartitionsDefinition(start_date="2023-11-01-00:00", timezone="Asia/Kathmandu"),
+    ],
+)
+def test_time_window_partitions_subset_set_operations(
+    partitions_def: TimeWindowPartitionsDefinition,
+) -> None:
+    rng = random.Random(0)
+    with freeze_time(create_datetime(2023, 12, 1)):
+        all_keys = partitions_def.get_partition_keys()
+
+        for _ in range(5):
+            keys = set(rng.sample(all_keys, 50)) | set(all_keys[100:150])
+            other_keys = set(rng.sample(all_keys, 50)) | set(all_keys[120:200])
+            key_subset = partitions_def.subset_with_partition_keys(keys)
+            other_key_subset = partitions_def.subset_with_partition_keys(other_keys)
+            subset = cast(TimeWindowPartitionsSubset, key_subset).to_serializable_subset()
+            other_subset = partitions_def.empty_subset().with_partition_keys(other_keys)
+            other_subset = cast(TimeWindowPartitionsSubset, other_subset).to_serializable_subset()
+
+            assert set(subset.get_partition_keys()) == keys
+            assert len(subset) == len(keys)
+            assert all(key in subset for key in keys)
+            assert not any(key in subset for key in set(all_keys) - keys)
+
+            for result, expected_keys in [
+                (subset | other_subset, keys | other_keys),
+                (subset - other_subset, keys - other_keys),
+                (subset & other_subset, keys & other_keys),
+                (subset | other_key_subset, keys | other_keys),
+                (key_subset - other_subset, keys - other_keys),
+            ]:
+                assert isinstance(result, TimeWindowPartitionsSubset)
+                assert set(result.get_partition_keys()) == expected_keys
+                assert len(result) == len(expected_keys)
+                assert (
+                    set(result.get_partition_keys_not_in_subset(partitions_def))
+                    == set(all_keys) - expected_keys
+                )
+
+                # the subset's time windows are minimal, and serialization is unchanged
+                windows = result.included_time_windows
+                assert all(
+                    window.start.strftime(partitions_def.fmt) in all_keys for window in windows
+                )
+                assert all(
+                    window.end.timestamp() < next_window.start.timestamp()
+                    for window, next_window in zip(windows, windows[1:])
+                )
+                deserialized = partitions_def.deserialize_subset(result.serialize())
+                assert deserialized == result
+                serializable_result = result.to_serializable_subset()
+                assert (
+                    deserialize_value(
+                        serialize_value(serializable_result), TimeWindowPartitionsSubset
+                    )
+                    == serializable_result
+                )
@@ -0,0 +1,148 @@
+import os
+from enum import Enum as PythonEnum
+
+import pytest
+from dagster import Enum, EnumValue, Field, Map, Noneable, Permissive, Selector, Shape, StringSource
+from dagster._config import Array, ConfigType, IntSource, resolve_to_config_type
+from dagster._config.post_process import post_process_config
+from dagster._config.validate import process_config, validate_config, validate_config_from_snap
+from dagster._core.test_utils import environ
+
+
+class Color(PythonEnum):
+    RED = 1
+    GREEN = 2
+
+
+COLOR = Enum.from_python_enum(Color)
+
+SCHEMA = Shape(
+    {
+        "name": str,
+        "count": Field(int, is_required=False, default_value=3),
+        "ratio": Field(float, is_required=False),
+        "color": Field(COLOR, is_required=False, default_value="RED"),
+        "source": Field(StringSource, is_required=False),
+        "port": Field(IntSource, is_required=False),
+        "tags": Field(Map(str, Noneable(int)), is_required=False),
+        "items": Field(
+            Array(Shape({"key": str, "flag": Field(bool, is_required=False, default_value=True)})),
+            is_required=False,
+        ),
+        "storage": Field(
+            Selector(
+                {
+                    "filesystem": Field(
+                        {"base_dir": Field(str, is_required=False, default_value="/tmp")}
+                    ),
+                    "in_memory": Field(Noneable(dict)),
+                }
+            ),
+            is_required=False,
+        ),
+        "extra": Field(Permissive({"known": Field(int, is_required=False, default_value=1)})),
+        "anything": Field(Array(Noneable(Enum("Letter", [EnumValue("a"), EnumValue("b")])))),
+    },
+    field_aliases={"name": "alias_name"},
+)
+
+VALUES = [
+    # valid
+    {"name": "a", "extra": {}, "anything": []},
+    {
+        "alias_name": "a",
+        "count": 5,
+        "ratio": 1,
+        "color": "GREEN",
+        "source": {"env": "COMPILED_TEST_VAR"},
+        "port": {"env": "COMPILED_TEST_PORT"},
+        "tags": {"x": 1, "y": None},
+        "items": [{"key": "k"}, {"key": "j", "flag": False}],
+        "storage": {"filesystem": None},
+        "extra": {"known": 2, "unknown": {"nested": [1]}},
+        "anything": ["a", None, "b"],
+    },
+    {"name": "a", "storage": {}, "extra": {}, "anything": []},
+    {"name": "a", "storage": {"in_memory": {"x": 1}}, "extra": {"other": 1}, "anything": [None]},
+    # invalid
+    None,
+    [],
+    {},
+    {"name": 1, "extra": {}, "anything": []},
+    {"name": "a", "bad": 1, "worse": 2, "extra": {}, "anything": []},
+    {"name": "a", "count": True, "ratio": "1", "extra": {}, "anything": []},
+    {"name": "a", "color": "BLUE", "extra": {}, "anything": ["c", 1]},
+    {"name": "a", "tags": {1: "x"}, "items": [None, {"flag": 1}], "extra": {}, "anything": []},
+    {"name": "a", "storage": {"filesystem": {}, "in_memory": {}}, "extra": {}, "anything": []},
+    {"name": "a", "storage": {"s3": {}}, "extra": None, "anything": []},
+    {"name": "a", "source": {"env": "COMPILED_TEST_UNSET_VAR"}, "extra": {}, "anything": []},
+    {"name": "a", "port": {"env": "COMPILED_TEST_VAR"}, "extra": {}, "anything": []},
+]
+
+
+def interpreted_validate(config_type: ConfigType, value):
+    return validate_config_from_snap(config_type.get_schema_snapshot(), config_type.key, value)
+
+
+def interpreted_process(config_type: ConfigType, value):
+    evr = interpreted_validate(config_type, value)
+    return post_process_config(config_type, evr.value) if evr.success else evr
+
+
+def assert_same_result(result, expected):
+    assert result.success == expected.success
+    assert result.value == expected.value
+    assert result.errors == expected.errors
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_compiled_matches_interpreter(value):
+    config_type = resolve_to_config_type(SCHEMA)
+    assert isinstance(config_type, ConfigType)
+
+    with environ({"COMPILED_TEST_VAR": "foo", "COMPILED_TEST_PORT": "4000"}):
+        expected_validate = interpreted_validate(config_type, value)
+        expected_process = interpreted_process(config_type, value)
+
+        # the compiled program only handles config that the interpreter considers valid
+        program = config_type.get_compiled_program()
+        assert program.try_validate(value)[0] == expected_validate.success
+        assert program.try_process(value)[0] == expected_process.success
+
+        assert_same_result(validate_config(config_type, value), expected_validate)
+        assert_same_result(process_config(config_type, value), expected_process)
+
+
+def test_compiled_program_is_memoized():
+    config_type = resolve_to_config_type(SCHEMA)
+    assert isinstance(config_type, ConfigType)
+    assert config_type.get_compiled_program() is config_type.get_compiled_program()
+
+    # equivalent shapes are interned, and so share a program
+    same_config_type = resolve_to_config_type(Shape({"name": str}))
+    other_config_type = resolve_to_config_type(Shape({"name": str}))
+    assert same_config_type.get_compiled_program() is other_config_type.get_compiled_program()  # type: ignore
+
+
+def test_compiled_process_defaults():
+    config_type = resolve_to_config_type(SCHEMA)
+    assert isinstance(config_type, ConfigType)
+
+    assert "COMPILED_TEST_VAR" not in os.environ
+    success, value = config_type.get_compiled_program().try_process(
+        {"name": "a", "storage": {"filesystem": None}, "extra": {}, "anything": []}
+    )
+    assert success
+    assert value == {
+        "name": "a",
+        "count": 3,
+        "color": Color.RED,
+        "storage": {"filesystem": {"base_dir": "/tmp"}},
+        "extra": {"known": 1},
+        "anything": [],
+    }
+
+    success, _ = config_type.get_compiled_program().try_process(
+        {"name": "a", "source": {"env": "COMPILED_TEST_VAR"}, "extra": {}, "anything": []}
+    )
+    assert not success
@@ -4,7 +4,7 @@
 from typing import List, Set
 
 import pytest
-from dagster import job, op
+from dagster import DynamicOut, DynamicOutput, job, op
 from dagster._core.errors import DagsterExecutionInterruptedError, DagsterInvariantViolationError
 from dagster._core.events import DagsterEvent, DagsterEventType
 from dagster._core.execution.api import create_execution_plan
@@ -352,3 +352,95 @@ def test_active_concurrency_sleep():
             )
             assert math.isclose(active_execution.sleep_interval(), 2.0, abs_tol=0.1)
             active_execution.mark_interrupted()
+
+
+def define_dynamic_fan_out_job():
+    @op(out=DynamicOut())
+    def emit():
+        for i in range(3):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def process(x):
+        return x
+
+    @op
+    def collect(xs):
+        return xs
+
+    @job
+    def dynamic_fan_out_job():
+        collect(emit().map(process).collect())
+
+    return dynamic_fan_out_job
+
+
+def test_dynamic_fan_out_ready_queue():
+    dynamic_fan_out_job = define_dynamic_fan_out_job()
+
+    def _complete(step_key):
+        for event in [
+            DagsterEvent(
+                DagsterEventType.STEP_START.value,
+                job_name=dynamic_fan_out_job.name,
+                step_key=step_key,
+            ),
+            DagsterEvent(
+                DagsterEventType.STEP_OUTPUT.value,
+                job_name=dynamic_fan_out_job.name,
+                event_specific_data=StepOutputData(
+                    StepOutputHandle(step_key=step_key, output_name="result")
+                ),
+                step_key=step_key,
+            ),
+            DagsterEvent(
+                DagsterEventType.STEP_SUCCESS.value,
+                job_name=dynamic_fan_out_job.name,
+                event_specific_data=StepSuccessData(duration_ms=10.0),
+                step_key=step_key,
+            ),
+        ]:
+            active_execution.handle_event(event)
+
+    with create_execution_plan(dynamic_fan_out_job).start(
+        RetryMode.DISABLED, max_concurrent=2
+    ) as active_execution:
+        [emit_step] = active_execution.get_steps_to_execute()
+        assert emit_step.key == "emit"
+        for i in range(3):
+            active_execution.handle_event(
+                DagsterEvent(
+                    DagsterEventType.STEP_OUTPUT.value,
+                    job_name=dynamic_fan_out_job.name,
+                    event_specific_data=StepOutputData(
+                        StepOutputHandle(step_key="emit", output_name="result", mapping_key=str(i))
+                    ),
+                    step_key="emit",
+                )
+            )
+        active_execution.handle_event(
+            DagsterEvent(
+                DagsterEventType.STEP_SUCCESS.value,
+                job_name=dynamic_fan_out_job.name,
+                event_specific_data=StepSuccessData(duration_ms=10.0),
+                step_key="emit",
+            )
+        )
+
+        # max_concurrent caps the launched mapped steps, in mapping key order
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["process[0]", "process[1]"]
+
+        _complete("process[0]")
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["process[2]"]
+
+        # collect stays pending until every mapped step has completed
+        _complete("process[1]")
+        assert not active_execution.get_steps_to_execute()
+        _complete("process[2]")
+
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["collect"]
+        _complete("collect")
+        assert active_execution.is_complete
@@ -27,10 +27,12 @@
 from dagster._core.definitions.events import AssetMaterialization, AssetObservation
 from dagster._core.definitions.unresolved_asset_job_definition import define_asset_job
 from dagster._core.errors import (
+    DagsterEventBatchPartiallyStoredError,
     DagsterHomeNotSetError,
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
 )
+from dagster._core.events import DagsterEventType
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
@@ -771,6 +773,68 @@ def test_report_runless_asset_event():
         assert len(records) == 1
 
 
+def test_report_runless_asset_events():
+    with instance_for_test() as instance:
+        asset_keys = [AssetKey(f"asset_{i}") for i in range(5)]
+        my_check = "my_check"
+
+        with patch.object(
+            instance.event_log_storage,
+            "store_event_batch",
+            wraps=instance.event_log_storage.store_event_batch,
+        ) as store_event_batch:
+            instance.report_runless_asset_events(
+                [
+                    *(AssetMaterialization(asset_key) for asset_key in asset_keys),
+                    *(AssetObservation(asset_key) for asset_key in asset_keys),
+                    AssetCheckEvaluation(
+                        asset_key=asset_keys[0], check_name=my_check, passed=True, metadata={}
+                    ),
+                ],
+                batch_size=4,
+            )
+            assert [len(call.args[0]) for call in store_event_batch.call_args_list] == [4, 4, 3]
+
+        mats = instance.get_latest_materialization_events(asset_keys)
+        assert all(mats[asset_key] for asset_key in asset_keys)
+        for asset_key in asset_keys:
+            assert len(instance.fetch_observations(asset_key, limit=1).records) == 1
+        records = instance.event_log_storage.get_asset_check_execution_history(
+            check_key=AssetCheckKey(asset_key=asset_keys[0], name=my_check),
+            limit=1,
+        )
+        assert len(records) == 1
+
+
+def test_report_runless_asset_events_partially_stored():
+    with instance_for_test() as instance:
+        asset_keys = [AssetKey(f"asset_{i}") for i in range(6)]
+        store_event_batch = instance.event_log_storage.store_event_batch
+        num_batches = 0
+
+        def _fail_second_batch(events):
+            nonlocal num_batches
+            num_batches += 1
+            if num_batches == 2:
+                raise Exception("Storage is down")
+            store_event_batch(events)
+
+        with patch.object(
+            instance.event_log_storage, "store_event_batch", side_effect=_fail_second_batch
+        ), patch.object(
+            instance.event_log_storage, "store_event", side_effect=Exception("Storage is down")
+        ):
+            with pytest.raises(DagsterEventBatchPartiallyStoredError) as exc_info:
+                instance.report_runless_asset_events(
+                    [AssetMaterialization(asset_key) for asset_key in asset_keys], batch_size=2
+                )
+
+        # the events of the first batch were stored, and writing stopped at the failed batch
+        assert exc_info.value.num_stored == 2
+        mats = instance.get_latest_materialization_events(asset_keys)
+        assert [asset_key for asset_key in asset_keys if mats.get(asset_key)] == asset_keys[:2]
+
+
 def test_invalid_run_id():
     with instance_for_test() as instance:
         with pytest.raises(
@@ -778,3 +842,74 @@ def test_invalid_run_id():
             match="run_id must be a valid UUID. Got invalid_run_id",
         ):
             create_run_for_test(instance, job_name="foo_job", run_id="invalid_run_id")
+
+
+def test_write_behind_event_buffering():
+    @op
+    def chatty_op(context):
+        for i in range(5):
+            context.log.info(f"message {i}")
+
+    @job
+    def chatty_job():
+        chatty_op()
+
+    with environ({"DAGSTER_EVENT_WRITE_BEHIND_INTERVAL": "60"}):
+        with instance_for_test() as instance:
+            with patch.object(
+                instance.event_log_storage,
+                "store_event_batch",
+                wraps=instance.event_log_storage.store_event_batch,
+            ) as store_event_batch:
+                result = chatty_job.execute_in_process(instance=instance)
+                assert result.success
+                assert store_event_batch.call_count > 0
+
+            records = instance.get_records_for_run(result.run_id).records
+            assert [record.storage_id for record in records] == sorted(
+                record.storage_id for record in records
+            )
+            messages = [record.event_log_entry.user_message for record in records]
+            assert all(f"message {i}" in messages for i in range(5))
+
+            dagster_run = create_run_for_test(instance, job_name="foo_job")
+            instance.report_engine_event("buffered", dagster_run)
+            assert not instance.all_logs(dagster_run.run_id)
+
+            instance.report_run_failed(dagster_run)
+            logs = instance.all_logs(dagster_run.run_id)
+            assert logs[0].message == "buffered"
+            assert logs[-1].dagster_event_type == DagsterEventType.RUN_FAILURE
+
+
+def test_write_behind_failed_flush_retains_events():
+    with environ({"DAGSTER_EVENT_WRITE_BEHIND_INTERVAL": "60"}):
+        with instance_for_test() as instance:
+            dagster_run = create_run_for_test(instance, job_name="foo_job")
+            for i in range(3):
+                instance.report_engine_event(f"buffered {i}", dagster_run)
+
+            store_event_batch = instance.event_log_storage.store_event_batch
+
+            def _store_first_event_then_fail(events):
+                store_event_batch(events[:1])
+                raise DagsterEventBatchPartiallyStoredError("Storage is down", num_stored=1)
+
+            with patch.object(
+                instance.event_log_storage,
+                "store_event_batch",
+                side_effect=_store_first_event_then_fail,
+            ), patch.object(
+                instance.event_log_storage, "store_event", side_effect=Exception("Storage is down")
+            ):
+                # the timer flush fails, and logs the error instead of raising it
+                instance._flush_write_behind_buffer_on_timer(dagster_run.run_id)  # noqa: SLF001
+
+            # the event that was stored is not buffered (and stored) again
+            assert [log.message for log in instance.all_logs(dagster_run.run_id)] == ["buffered 0"]
+
+            instance.report_run_failed(dagster_run)
+            logs = instance.all_logs(dagster_run.run_id)
+            assert [log.message for log in logs[:3]] == ["buffered 0", "buffered 1", "buffered 2"]
+            assert len(logs) == 4
+            assert logs[-1].dagster_event_type == DagsterEventType.RUN_FAILURE
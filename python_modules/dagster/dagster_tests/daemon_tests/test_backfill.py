@@ -70,11 +70,13 @@
     PARTITION_NAME_TAG,
 )
 from dagster._core.test_utils import (
+    SingleThreadPoolExecutor,
     create_run_for_test,
     environ,
     step_did_not_run,
     step_failed,
     step_succeeded,
+    wait_for_futures,
 )
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._core.workspace.context import WorkspaceProcessContext
@@ -535,6 +537,49 @@ def test_simple_backfill(
     assert three.tags[PARTITION_NAME_TAG] == "three"
 
 
+def test_simple_backfill_with_threadpool(
+    instance: DagsterInstance,
+    workspace_context: WorkspaceProcessContext,
+    remote_repo: RemoteRepository,
+):
+    partition_set = remote_repo.get_partition_set("the_job_partition_set")
+    for backfill_id in ["simple_1", "simple_2"]:
+        instance.add_backfill(
+            PartitionBackfill(
+                backfill_id=backfill_id,
+                partition_set_origin=partition_set.get_remote_origin(),
+                status=BulkActionStatus.REQUESTED,
+                partition_names=["one", "two", "three"],
+                from_failure=False,
+                reexecution_steps=None,
+                tags=None,
+                backfill_timestamp=get_current_timestamp(),
+            )
+        )
+    assert instance.get_runs_count() == 0
+
+    backfill_futures = {}
+    with SingleThreadPoolExecutor() as executor:
+        list(
+            execute_backfill_iteration(
+                workspace_context,
+                get_default_daemon_logger("BackfillDaemon"),
+                threadpool_executor=executor,
+                backfill_futures=backfill_futures,
+            )
+        )
+        assert set(backfill_futures.keys()) == {"simple_1", "simple_2"}
+        wait_for_futures(backfill_futures)
+
+    assert instance.get_runs_count() == 6
+    for backfill_id in ["simple_1", "simple_2"]:
+        runs = instance.get_runs(filters=RunsFilter.for_backfill(backfill_id))
+        assert {run.tags[PARTITION_NAME_TAG] for run in runs} == {"one", "two", "three"}
+        backfill = instance.get_backfill(backfill_id)
+        assert backfill
+        assert backfill.status == BulkActionStatus.COMPLETED_SUCCESS
+
+
 def test_canceled_backfill(
     instance: DagsterInstance,
     workspace_context: WorkspaceProcessContext,
@@ -22,9 +22,11 @@
 from dagster._core.utils import make_new_run_id
 from dagster._core.workspace.load_target import EmptyWorkspaceTarget, PythonFileTarget
 from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
+from dagster._daemon.run_coordinator.run_queue_index import RunQueueIndex
 from dagster._record import copy
 from dagster._time import create_datetime
 from dagster._utils import file_relative_path
+from dagster._utils.tags import TagConcurrencyLimitsCounter
 
 from dagster_tests.api_tests.utils import get_foo_job_handle
 
@@ -330,6 +332,75 @@ def test_tag_limits(self, workspace_context, job_handle, daemon, instance):
         # exact order non-deterministic due to threaded dequeue
         assert set(self.get_run_ids(instance.run_launcher.queue())) == {tiny_run_id, large_run_id}
 
+    @pytest.mark.parametrize(
+        "run_coordinator_config",
+        [
+            dict(
+                max_concurrent_runs=10,
+                tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+            ),
+        ],
+    )
+    def test_run_queue_index_refresh(self, workspace_context, job_handle, daemon, instance):
+        tiny_run_id, tiny_run_id_2, tiny_run_id_3, hi_pri_run_id = [
+            make_new_run_id() for _ in range(4)
+        ]
+        self.create_queued_run(instance, job_handle, run_id=tiny_run_id, tags={"database": "tiny"})
+        list(daemon.run_iteration(workspace_context))
+        assert self.get_run_ids(instance.run_launcher.queue()) == [tiny_run_id]
+
+        # runs queued after the index was built are picked up by the incremental refresh
+        self.create_queued_run(
+            instance, job_handle, run_id=tiny_run_id_2, tags={"database": "tiny"}
+        )
+        self.create_queued_run(
+            instance, job_handle, run_id=tiny_run_id_3, tags={"database": "tiny"}
+        )
+        self.create_queued_run(instance, job_handle, run_id=hi_pri_run_id, tags={PRIORITY_TAG: "5"})
+        list(daemon.run_iteration(workspace_context))
+        assert self.get_run_ids(instance.run_launcher.queue()) == [tiny_run_id, hi_pri_run_id]
+
+        index = daemon._run_queue_index  # noqa: SLF001
+        assert tiny_run_id not in index
+        assert hi_pri_run_id not in index
+        assert tiny_run_id_2 in index
+
+        # a deleted run is only dropped from the index once the daemon fails to find it
+        instance.report_run_failed(instance.get_run_by_id(tiny_run_id))
+        instance.delete_run(tiny_run_id_2)
+        list(daemon.run_iteration(workspace_context))
+        assert tiny_run_id_2 not in index
+        assert tiny_run_id_3 in index
+
+        list(daemon.run_iteration(workspace_context))
+        assert self.get_run_ids(instance.run_launcher.queue()) == [
+            tiny_run_id,
+            hi_pri_run_id,
+            tiny_run_id_3,
+        ]
+        assert not len(index)
+
+    def test_run_queue_index_removal_during_iteration(self, instance, job_handle):
+        tag_concurrency_limits = [{"key": "database", "value": "tiny", "limit": 2}]
+        run_ids = [make_new_run_id() for _ in range(4)]
+        for run_id in run_ids:
+            self.create_queued_run(instance, job_handle, run_id=run_id, tags={"database": "tiny"})
+
+        index = RunQueueIndex(page_size=2)
+        index.refresh(instance, tag_concurrency_limits)
+        counter = TagConcurrencyLimitsCounter(tag_concurrency_limits, [])
+
+        # launched runs are removed from the index while it is being iterated over
+        launched_run_ids = []
+        for run in index.iter_unblocked_runs(counter):
+            counter.update_counters_with_launched_item(run)
+            index.remove(run.run_id)
+            launched_run_ids.append(run.run_id)
+
+        assert launched_run_ids == run_ids[:2]
+        assert len(index) == 2
+        assert index.get_op_concurrency_runs() == []
+
     @pytest.mark.parametrize(
         "run_coordinator_config",
         [
@@ -1152,3 +1223,4 @@ def instance(self, run_coordinator_config):
     @pytest.fixture()
     def daemon(self, page_size):
         return QueuedRunCoordinatorDaemon(interval_seconds=1, page_size=page_size)
+
@@ -12,7 +12,12 @@
     materialize_to_memory,
 )
 from dagster._check import CheckError
-from dagster._core.definitions.partition import DynamicPartitionsDefinition, Partition
+from dagster._core.definitions.partition import (
+    DynamicPartitionsDefinition,
+    Partition,
+    PartitionsDefinition,
+    VersionedDynamicPartitions,
+)
 from dagster._core.test_utils import instance_for_test
 
 
@@ -204,3 +209,55 @@ def test_has_partition_key():
         assert partitions_def.has_partition_key("apple", dynamic_partitions_store=instance)
         assert partitions_def.has_partition_key("banana", dynamic_partitions_store=instance)
         assert not partitions_def.has_partition_key("peach", dynamic_partitions_store=instance)
+
+
+def test_versioned_dynamic_partitions_identifier():
+    partitions_def = DynamicPartitionsDefinition(name="fruits")
+
+    def _unversioned_identifier(instance):
+        return PartitionsDefinition.get_serializable_unique_identifier(partitions_def, instance)
+
+    with instance_for_test() as instance:
+        identifiers = {partitions_def.get_serializable_unique_identifier(instance)}
+        assert _unversioned_identifier(instance) in identifiers
+
+        instance.add_dynamic_partitions("fruits", ["apple", "banana"])
+        identifiers.add(partitions_def.get_serializable_unique_identifier(instance))
+        assert _unversioned_identifier(instance) in identifiers
+
+        instance.add_dynamic_partitions("fruits", ["cherry", "dürian"])
+        identifiers.add(partitions_def.get_serializable_unique_identifier(instance))
+        assert _unversioned_identifier(instance) in identifiers
+
+        instance.delete_dynamic_partition("fruits", "apple")
+        identifiers.add(partitions_def.get_serializable_unique_identifier(instance))
+        assert _unversioned_identifier(instance) in identifiers
+
+        assert len(identifiers) == 4
+
+
+def test_versioned_dynamic_partitions_with_partition_keys():
+    versioned_partitions = VersionedDynamicPartitions(1, ["a", "b"])
+    assert versioned_partitions.partition_key_set == {"a", "b"}
+
+    for version, partition_keys in [
+        (2, ["a", "b", "c"]),
+        (3, ["a", "c"]),
+        (4, []),
+        (5, ["b", "a"]),
+    ]:
+        updated_partitions = versioned_partitions.with_partition_keys(version, partition_keys)
+        expected_partitions = VersionedDynamicPartitions(version, partition_keys)
+        assert updated_partitions.version == version
+        assert updated_partitions.partition_keys == tuple(partition_keys)
+        assert (
+            updated_partitions.serializable_unique_identifier
+            == expected_partitions.serializable_unique_identifier
+        )
+
+    assert (
+        VersionedDynamicPartitions(0, [])
+        .with_partition_keys(1, ["a", "b"])
+        .serializable_unique_identifier
+        == versioned_partitions.serializable_unique_identifier
+    )
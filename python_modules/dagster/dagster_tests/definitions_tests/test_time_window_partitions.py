@@ -33,6 +33,7 @@
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._time import create_datetime, parse_time_string
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
+from dagster._utils.schedules import cron_string_iterator
 
 DATE_FORMAT = "%Y-%m-%d"
 
@@ -1197,6 +1198,67 @@ def test_unique_identifier():
     )
 
 
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        HourlyPartitionsDefinition(start_date="2021-05-05-01:00", timezone="America/Los_Angeles"),
+        DailyPartitionsDefinition(start_date="2021-05-05", end_offset=-3),
+        WeeklyPartitionsDefinition(start_date="2021-05-05", end_offset=2),
+        MonthlyPartitionsDefinition(
+            start_date="2021-05-01", end_date="2022-05-01", timezone="Europe/Berlin"
+        ),
+        TimeWindowPartitionsDefinition(
+            start="2021-05-05", cron_schedule="0 9 * * 1-5", fmt="%Y-%m-%d", end_offset=-1
+        ),
+    ],
+)
+def test_time_window_partitions_counts_match_keys(partitions_def: TimeWindowPartitionsDefinition):
+    for current_time in [
+        datetime(2021, 5, 1),
+        datetime(2021, 5, 12, 9),
+        datetime(2021, 11, 7, 1, 30),
+        datetime(2023, 1, 1),
+    ]:
+        partition_keys = partitions_def.get_partition_keys(current_time=current_time)
+        assert partitions_def.get_num_partitions(current_time=current_time) == len(partition_keys)
+        for start_idx, end_idx in [(0, 1), (3, 10), (len(partition_keys) - 2, 10000)]:
+            assert (
+                partitions_def.get_partition_keys_between_indexes(
+                    start_idx, end_idx, current_time=current_time
+                )
+                == partition_keys[max(start_idx, 0) : end_idx]
+            )
+
+        last_window = partitions_def.get_last_partition_window(current_time=current_time)
+        if partition_keys:
+            assert last_window == partitions_def.time_window_for_partition_key(partition_keys[-1])
+        else:
+            assert last_window is None
+
+
+@pytest.mark.parametrize("timezone", ["Asia/Kolkata", "Asia/Kathmandu"])
+def test_hourly_partitions_non_whole_hour_utc_offset(timezone: str):
+    partitions_def = HourlyPartitionsDefinition(start_date="2024-01-01-00:00", timezone=timezone)
+    current_time = datetime(2024, 1, 2)
+    partition_keys = partitions_def.get_partition_keys(current_time=current_time)
+    assert partition_keys[:3] == ["2024-01-01-00:00", "2024-01-01-01:00", "2024-01-01-02:00"]
+    assert partitions_def.get_partition_keys_between_indexes(
+        3, 7, current_time=current_time
+    ) == ["2024-01-01-03:00", "2024-01-01-04:00", "2024-01-01-05:00", "2024-01-01-06:00"]
+
+    start_timestamp = create_datetime(2024, 1, 1, tz=timezone).timestamp()
+    expected_starts = []
+    for tick in cron_string_iterator(start_timestamp, partitions_def.cron_schedule, timezone):
+        if len(expected_starts) == len(partition_keys):
+            break
+        expected_starts.append(tick)
+    assert [
+        partitions_def.time_window_for_partition_key(partition_key).start
+        for partition_key in partition_keys
+    ] == expected_starts
+    assert partitions_def.get_num_partitions(current_time=current_time) == len(partition_keys)
+
+
 def test_time_window_partition_len():
     partitions_def = HourlyPartitionsDefinition(start_date="2021-05-05-01:00", minute_offset=15)
     assert partitions_def.get_num_partitions() == len(partitions_def.get_partition_keys())
@@ -11,6 +11,7 @@
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._utils import segfault
@@ -109,3 +110,37 @@ def test_child_process_segfault():
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing, LongRunningCommand()))
+
+
+def test_worker_pool_reuses_worker():
+    with ChildProcessWorkerPool(multiprocessing) as pool:
+        pids = set()
+        for a_str in ["aa", "bb"]:
+            worker = pool.acquire()
+            events = [
+                event for event in worker.execute(DoubleAStringChildProcessCommand(a_str)) if event
+            ]
+            assert events[2] == a_str + a_str
+            assert isinstance(events[3], ChildProcessDoneEvent)
+            # the worker's term event is reset before the command is reported as done, so that it
+            # can not interrupt the next command
+            assert not worker.term_event.is_set()
+            pids.add(events[3].pid)
+        assert len(pids) == 1
+
+
+def failing_initializer():
+    raise AnError("Could not initialize")
+
+
+def test_worker_pool_initializer_error():
+    with ChildProcessWorkerPool(multiprocessing, initializer=failing_initializer) as pool:
+        worker = pool.acquire()
+        results = [
+            event
+            for event in worker.execute(DoubleAStringChildProcessCommand("aa"))
+            if isinstance(event, ChildProcessSystemErrorEvent)
+        ]
+        assert len(results) == 1
+        assert "Could not initialize" in str(results[0].error_info.message)
+        assert not worker.can_accept_task
@@ -107,6 +107,58 @@ def test_forkserver_preload():
             assert result.output_for_node("adder") == 11
 
 
+def _step_worker_pids(result: execution_result.ExecutionResult):
+    return {
+        event.step_key: event.event_specific_data.metadata["pid"].value  # type: ignore
+        for event in result.all_events
+        if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+    }
+
+
+def test_reuse_processes():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {"multiprocess": {"max_concurrent": 1, "reuse_processes": {}}}
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+            pids = _step_worker_pids(result)
+            assert len(pids) == 4
+            assert len(set(pids.values())) == 1
+            assert int(next(iter(pids.values()))) != os.getpid()
+
+
+def test_reuse_processes_max_tasks_per_worker():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "max_concurrent": 1,
+                            "reuse_processes": {"max_tasks_per_worker": 2},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+            pids = _step_worker_pids(result)
+            assert len(pids) == 4
+            assert len(set(pids.values())) == 2
+
+
 JUST_ADDER_CONFIG = {
     "ops": {"adder": {"inputs": {"left": {"value": 1}, "right": {"value": 1}}}},
 }
@@ -439,6 +491,44 @@ def test_crash_multiprocessing():
             # )
 
 
+@op
+def sys_exit_op(context):
+    os._exit(1)
+
+
+@op
+def after_sys_exit_op():
+    return 1
+
+
+@job
+def reuse_processes_crash_job():
+    sys_exit_op()
+    after_sys_exit_op()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_crash_reuse_processes():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(reuse_processes_crash_job),
+            run_config={
+                "execution": {
+                    "config": {"multiprocess": {"max_concurrent": 1, "reuse_processes": {}}}
+                },
+            },
+            instance=instance,
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("sys_exit_op")
+            assert failure_data
+            assert failure_data.error.cls_name == "ChildProcessCrashException"
+
+            # the crashed worker is replaced, and the other step still executes
+            assert result.output_for_node("after_sys_exit_op") == 1
+
+
 # segfault test
 @op
 def segfault_op(context):
@@ -1,7 +1,23 @@
-from dagster import DependencyDefinition, GraphDefinition, In, Int, Out, Output, op
+import dagster._check as check
+from dagster import (
+    DependencyDefinition,
+    DynamicOut,
+    DynamicOutput,
+    GraphDefinition,
+    In,
+    Int,
+    Out,
+    Output,
+    job,
+    op,
+)
 from dagster._core.definitions.job_base import InMemoryJob
 from dagster._core.execution.api import create_execution_plan, execute_plan
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.instance import DagsterInstance
+from dagster._core.snap.execution_plan_snapshot import snapshot_from_execution_plan
+from dagster._core.test_utils import instance_for_test
 
 
 def define_two_int_pipeline():
@@ -114,3 +130,147 @@ def has_tag(context):
     )
 
     assert called["yup"]
+
+
+def define_dynamic_fan_in_job():
+    @op(out=DynamicOut())
+    def emit():
+        for key in ["a", "b"]:
+            yield DynamicOutput(key, mapping_key=key)
+
+    @op
+    def return_one():
+        return 1
+
+    @op
+    def echo(x, num):
+        return x * num
+
+    @op
+    def total(xs):
+        return len(xs)
+
+    @op
+    def add(a, b):
+        return a + b
+
+    @job
+    def dynamic_fan_in_job():
+        num = return_one()
+        collected = total(emit().map(lambda x: echo(x, num)).collect())
+        add(collected, num)
+
+    return dynamic_fan_in_job
+
+
+def test_step_fragment_matches_subset_plan():
+    job_def = define_dynamic_fan_in_job()
+    known_state = KnownExecutionState(dynamic_mappings={"emit": {"result": ["a", "b"]}})
+    execution_plan = create_execution_plan(job_def, known_state=known_state)
+
+    step_keys = {step.key for step in execution_plan.get_steps_to_execute_in_topo_order()}
+    assert step_keys == {"emit", "return_one", "echo[a]", "echo[b]", "total", "add"}
+
+    for step_key in step_keys:
+        fragment = check.not_none(execution_plan.build_step_fragment([step_key], job_def))
+        fragment_snapshot = snapshot_from_execution_plan(fragment, "job_snapshot_id")
+        rebuilt_plan = ExecutionPlan.rebuild_from_snapshot(
+            job_def.name, fragment_snapshot._replace(initial_known_state=known_state)
+        )
+        subset_plan = create_execution_plan(
+            job_def, step_keys_to_execute=[step_key], known_state=known_state
+        )
+
+        assert rebuilt_plan.step_keys_to_execute == subset_plan.step_keys_to_execute
+        assert rebuilt_plan.get_executable_step_deps() == subset_plan.get_executable_step_deps()
+        assert rebuilt_plan.artifacts_persisted == subset_plan.artifacts_persisted
+        assert rebuilt_plan.known_state == subset_plan.known_state
+
+        # the fragment only holds the step, the same as in the plan built for the whole job, and
+        # the steps it loads inputs from, trimmed to the outputs that it loads
+        subset_steps_by_key = {
+            step_snap.key: step_snap
+            for step_snap in snapshot_from_execution_plan(subset_plan, "job_snapshot_id").steps
+        }
+        subset_step = subset_plan.get_step_by_key(step_key)
+        assert {step_snap.key for step_snap in fragment_snapshot.steps} == {
+            step_key,
+            *subset_step.get_execution_dependency_keys(),
+        }
+        loaded_outputs = {
+            (step_output_handle.step_key, step_output_handle.output_name)
+            for step_input in subset_step.step_inputs
+            for step_output_handle in step_input.get_step_output_handle_dependencies()
+        }
+        for step_snap in fragment_snapshot.steps:
+            if step_snap.key == step_key:
+                assert step_snap == subset_steps_by_key[step_snap.key]
+            else:
+                assert step_snap.inputs == []
+                assert step_snap.outputs == [
+                    output_snap
+                    for output_snap in subset_steps_by_key[step_snap.key].outputs
+                    if (step_snap.key, output_snap.name) in loaded_outputs
+                ]
+
+
+def test_step_fragment_unresolved_step():
+    job_def = define_dynamic_fan_in_job()
+    execution_plan = create_execution_plan(job_def)
+
+    assert execution_plan.build_step_fragment(["echo[?]"], job_def) is None
+    assert execution_plan.build_step_fragment(["emit"], job_def)
+
+
+def test_step_fragment_max_steps():
+    job_def = define_dynamic_fan_in_job()
+    known_state = KnownExecutionState(dynamic_mappings={"emit": {"result": ["a", "b"]}})
+    execution_plan = create_execution_plan(job_def, known_state=known_state)
+
+    # total, echo[a] and echo[b]
+    assert execution_plan.build_step_fragment(["total"], job_def, max_steps=3)
+    assert execution_plan.build_step_fragment(["total"], job_def, max_steps=2) is None
+
+
+def test_execute_step_fragment():
+    @op(out={"num_one": Out(Int), "num_two": Out(Int)})
+    def return_one_two(x):
+        yield Output(x, "num_one")
+        yield Output(x + 1, "num_two")
+
+    @op
+    def return_one():
+        return 1
+
+    @op
+    def add_one(num):
+        return num + 1
+
+    @job
+    def fragment_job():
+        num_one, _ = return_one_two(return_one())
+        add_one(num_one)
+
+    with instance_for_test() as instance:
+        execution_plan = create_execution_plan(fragment_job)
+        dagster_run = instance.create_run_for_job(
+            job_def=fragment_job, execution_plan=execution_plan
+        )
+        execute_plan(
+            create_execution_plan(
+                fragment_job, step_keys_to_execute=["return_one", "return_one_two"]
+            ),
+            InMemoryJob(fragment_job),
+            dagster_run=dagster_run,
+            instance=instance,
+        )
+
+        fragment = check.not_none(execution_plan.build_step_fragment(["add_one"], fragment_job))
+        fragment_snapshot = snapshot_from_execution_plan(fragment, "job_snapshot_id")
+        events = execute_plan(
+            ExecutionPlan.rebuild_from_snapshot(fragment_job.name, fragment_snapshot),
+            InMemoryJob(fragment_job),
+            dagster_run=dagster_run,
+            instance=instance,
+        )
+        assert [event.step_key for event in find_events(events, "STEP_SUCCESS")] == ["add_one"]
@@ -44,6 +44,7 @@
 from dagster._core.pipes.subprocess import PipesSubprocessClient
 from dagster._core.pipes.utils import (
     PipesEnvContextInjector,
+    PipesSocketMessageReader,
     PipesTempFileContextInjector,
     PipesTempFileMessageReader,
     open_pipes_session,
@@ -102,6 +103,8 @@ def script_fn():
         ("user/file", "user/file"),
         ("user/env", "default"),
         ("user/env", "user/file"),
+        ("default", "user/socket"),
+        ("user/env", "user/socket"),
     ],
 )
 def test_pipes_subprocess(
@@ -120,7 +123,8 @@ def test_pipes_subprocess(
         message_reader = None
     elif message_reader_spec == "user/file":
         message_reader = PipesTempFileMessageReader()
-
+    elif message_reader_spec == "user/socket":
+        message_reader = PipesSocketMessageReader()
     else:
         assert False, "Unreachable"
 
@@ -163,6 +167,40 @@ def foo(context: AssetExecutionContext, ext: PipesSubprocessClient):
         assert asset_check_executions[0].status == AssetCheckExecutionRecordStatus.SUCCEEDED
 
 
+def test_pipes_subprocess_socket_message_reader():
+    def script_fn():
+        from dagster_pipes import PipesSocketMessageWriter, open_dagster_pipes
+
+        with open_dagster_pipes(
+            message_writer=PipesSocketMessageWriter(batch_size=7, interval=0.01)
+        ) as context:
+            for i in range(500):
+                context.log.info(f"message {i}")
+            for i in range(50):
+                context.report_asset_materialization(asset_key=f"foo_{i}", metadata={"index": i})
+
+    @multi_asset(specs=[AssetSpec(f"foo_{i}") for i in range(50)])
+    def foo(context: AssetExecutionContext, ext: PipesSubprocessClient):
+        with temp_script(script_fn) as script_path:
+            cmd = [_PYTHON_EXECUTABLE, script_path]
+            return ext.run(command=cmd, context=context).get_results()
+
+    resource = PipesSubprocessClient(message_reader=PipesSocketMessageReader())
+
+    with instance_for_test() as instance:
+        result = materialize([foo], instance=instance, resources={"ext": resource})
+        assert result.success
+        mats = result.asset_materializations_for_node("foo")
+        assert [mat.metadata["index"].value for mat in mats] == list(range(50))
+        assert [mat.asset_key for mat in mats] == [AssetKey(f"foo_{i}") for i in range(50)]
+        logs = [
+            event.message
+            for event in instance.all_logs(result.run_id)
+            if event.message and event.message.startswith("message ")
+        ]
+        assert logs == [f"message {i}" for i in range(500)]
+
+
 def test_pipes_subprocess_client_no_return():
     def script_fn():
         from dagster_pipes import open_dagster_pipes
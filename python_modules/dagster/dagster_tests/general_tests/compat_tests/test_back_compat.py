@@ -1025,6 +1025,43 @@ def test_add_kvs_table():
             assert get_sqlite3_indexes(db_path, "kvs") == []
 
 
+def test_add_backfill_tags_table():
+    from dagster._core.storage.runs.migration import BACKFILL_TAGS
+    from dagster._core.storage.runs.schema import BackfillTagsTable
+
+    src_dir = file_relative_path(__file__, "snapshot_0_14_16_bulk_actions_columns/sqlite")
+
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs.db")
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            assert "backfill_tags" not in get_sqlite3_tables(db_path)
+            assert "idx_bulk_actions_status_id" not in get_sqlite3_indexes(db_path, "bulk_actions")
+
+            instance.upgrade()
+
+            assert "backfill_tags" in get_sqlite3_tables(db_path)
+            assert set(get_sqlite3_indexes(db_path, "backfill_tags")) == {
+                "idx_backfill_tags_backfill_id",
+                "idx_backfill_tags_key_value",
+            }
+            assert "idx_bulk_actions_status_id" in get_sqlite3_indexes(db_path, "bulk_actions")
+            assert "idx_bulk_actions_timestamp" in get_sqlite3_indexes(db_path, "bulk_actions")
+
+            # check data migration
+            assert instance._run_storage.has_built_index(BACKFILL_TAGS)
+            expected_tag_count = sum(len(backfill.tags) for backfill in instance.get_backfills())
+            migrated_tag_count = instance._run_storage.fetchone(
+                db_select([db.func.count().label("count")]).select_from(BackfillTagsTable)
+            )["count"]
+            assert migrated_tag_count == expected_tag_count
+
+            instance._run_storage._alembic_downgrade(rev="284a732df317")
+
+            assert "backfill_tags" not in get_sqlite3_tables(db_path)
+            assert "idx_bulk_actions_status_id" not in get_sqlite3_indexes(db_path, "bulk_actions")
+
+
 def test_add_asset_event_tags_table():
     @op
     def yields_materialization_w_tags(_):
@@ -1106,6 +1143,28 @@ def test_add_dynamic_partitions_table():
             assert instance.get_dynamic_partitions("foo") == []
 
 
+def test_add_dynamic_partitions_versions_table():
+    src_dir = file_relative_path(
+        __file__, "snapshot_1_0_17_pre_add_cached_status_data_column/sqlite"
+    )
+
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs", "index.db")
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            assert "dynamic_partitions_versions" not in get_sqlite3_tables(db_path)
+            assert instance.event_log_storage.get_dynamic_partitions_version("foo") is None
+
+            instance.upgrade()
+            assert "dynamic_partitions_versions" in get_sqlite3_tables(db_path)
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            assert instance.event_log_storage.get_dynamic_partitions_version("foo") == 0
+            instance.add_dynamic_partitions("foo", ["a", "b"])
+            assert instance.event_log_storage.get_dynamic_partitions_version("foo") == 1
+            assert instance.get_versioned_dynamic_partitions("foo").partition_keys == ("a", "b")
+
+
 def _get_table_row_count(run_storage, table, with_non_null_id=False):
     query = db_select([db.func.count()]).select_from(table)
     if with_non_null_id:
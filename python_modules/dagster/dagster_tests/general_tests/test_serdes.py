@@ -23,6 +23,7 @@
     deserialize_value,
     pack_value,
     serialize_value,
+    set_use_orjson_for_deserialization,
     unpack_value,
 )
 from dagster._serdes.utils import hash_str
@@ -1190,3 +1191,68 @@ def foo(self):
     assert (
         deserialize_value(serialize_value(r, whitelist_map=test_env), whitelist_map=test_env) == r
     )
+
+
+def test_unpack_renamed_and_removed_fields() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env, storage_field_names={"color": "colour"})
+    class Fruit(NamedTuple):
+        name: str
+        color: str
+
+    # an object serialized by a version of the class with an extra field, and with the stored
+    # field name also present as a legacy field
+    serialized = (
+        '{"__class__": "Fruit", "colour": "red", "name": "apple", "weight": 1, "removed":'
+        ' {"__class__": "Unknown"}}'
+    )
+    assert deserialize_value(serialized, whitelist_map=test_env) == Fruit("apple", "red")
+
+    # unknown values in fields that are still present are an error
+    with pytest.raises(DeserializationError, match="Unknown"):
+        deserialize_value(
+            '{"__class__": "Fruit", "colour": {"__class__": "Unknown"}, "name": "apple"}',
+            whitelist_map=test_env,
+        )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_orjson_deserialization(use_orjson: bool) -> None:
+    pytest.importorskip("orjson")
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Color(Enum):
+        RED = "red"
+
+    @_whitelist_for_serdes(test_env)
+    class Inner(NamedTuple):
+        colors: AbstractSet[Color]
+        value: float
+
+    @_whitelist_for_serdes(test_env)
+    class Outer(NamedTuple):
+        inners: Sequence[Inner]
+        by_name: Mapping[str, Inner]
+        big: int
+
+    set_use_orjson_for_deserialization(use_orjson)
+    try:
+        inner = Inner(colors={Color.RED}, value=1.5)
+        outer = Outer(inners=[inner, inner], by_name={"a": inner}, big=2**70)
+        # the integer overflows 64 bits, which orjson can't parse, so this falls back to the
+        # stdlib parser
+        assert deserialize_value(serialize_value(outer, test_env), whitelist_map=test_env) == outer
+
+        outer = Outer(inners=[inner], by_name={}, big=1)
+        assert deserialize_value(serialize_value(outer, test_env), whitelist_map=test_env) == outer
+
+        nan_inner = deserialize_value(
+            serialize_value(Inner(colors=set(), value=float("nan")), test_env),
+            Inner,
+            whitelist_map=test_env,
+        )
+        assert nan_inner.value != nan_inner.value
+    finally:
+        set_use_orjson_for_deserialization(False)
@@ -4,6 +4,7 @@
 import pytest
 from dagster._time import create_datetime, get_timezone
 from dagster._utils.schedules import (
+    CronTickIndex,
     _croniter_string_iterator,
     cron_string_iterator,
     reverse_cron_string_iterator,
@@ -617,3 +618,77 @@ def test_last_day_of_month_cron_schedule():
 
     for i in range(len(expected_datetimes)):
         assert next(cron_iter) == expected_datetimes[-(i + 1)]
+
+
+@pytest.mark.parametrize(
+    "execution_timezone", ["UTC", "America/Los_Angeles", "Asia/Kolkata", "America/Havana"]
+)
+@pytest.mark.parametrize(
+    "cron_string",
+    [
+        "15 * * * *",
+        "*/15 * * * *",
+        "30 1 * * *",
+        "0 0 * * *",
+        "30 2 * * 0",
+        "0 0 15 * *",
+        "0 */4 * * *",
+        "0 9 * * 1-5",
+        "0 0 29 2 *",
+    ],
+)
+def test_cron_tick_index(execution_timezone, cron_string):
+    anchor_timestamp = create_datetime(2021, 3, 1, 12, 34, tz=execution_timezone).timestamp()
+    num_ticks = 5 if cron_string.endswith(" 29 2 *") else 800
+
+    ticks = []
+    for tick in cron_string_iterator(anchor_timestamp, cron_string, execution_timezone):
+        ticks.append(tick)
+        if len(ticks) == num_ticks:
+            break
+    prev_ticks = []
+    for tick in reverse_cron_string_iterator(anchor_timestamp, cron_string, execution_timezone):
+        prev_ticks.append(tick)
+        if len(prev_ticks) == 3:
+            break
+
+    tick_index = CronTickIndex(cron_string, execution_timezone, anchor_timestamp)
+    # later ticks are fetched first, to cover skipping over ticks that have not been computed yet
+    for index in reversed(range(num_ticks)):
+        tick = tick_index.get_tick(index)
+        assert tick.isoformat() == ticks[index].isoformat()
+
+        timestamp = tick.timestamp()
+        assert tick_index.get_index_at_or_after(timestamp) == index
+        assert tick_index.get_index_after(timestamp) == index + 1
+        assert tick_index.get_index_at_or_after(timestamp - 1) == index
+        assert tick_index.get_index_after(timestamp + 1) == index + 1
+
+    for index, prev_tick in enumerate(prev_ticks):
+        assert tick_index.get_tick(-index - 1).isoformat() == prev_tick.isoformat()
+        assert tick_index.get_index_at_or_after(prev_tick.timestamp()) == -index - 1
+
+
+@pytest.mark.parametrize("execution_timezone", ["Asia/Kolkata", "Asia/Kathmandu"])
+@pytest.mark.parametrize("cron_string", ["0 * * * *", "15 * * * *"])
+def test_cron_tick_index_hourly_non_whole_hour_offset(execution_timezone, cron_string):
+    # anchored on a tick, as a partitions definition's index is, in a timezone whose UTC offset
+    # is not a whole number of hours
+    anchor_timestamp = create_datetime(
+        2024, 1, 1, 0, int(cron_string.split(" ")[0]), tz=execution_timezone
+    ).timestamp()
+
+    ticks = []
+    for tick in cron_string_iterator(anchor_timestamp, cron_string, execution_timezone):
+        ticks.append(tick)
+        if len(ticks) == 50:
+            break
+
+    tick_index = CronTickIndex(cron_string, execution_timezone, anchor_timestamp)
+    for index, tick in enumerate(ticks):
+        assert tick_index.get_tick(index).isoformat() == tick.isoformat()
+        assert tick_index.get_index_at_or_after(tick.timestamp()) == index
+        assert tick_index.get_index_after(tick.timestamp()) == index + 1
+
+    assert tick_index.get_tick(0).timestamp() == anchor_timestamp
+    assert tick_index.get_tick(-1).timestamp() == anchor_timestamp - 3600
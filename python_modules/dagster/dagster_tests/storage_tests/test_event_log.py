@@ -28,7 +28,10 @@
 from sqlalchemy import __version__ as sqlalchemy_version
 from sqlalchemy.engine import Connection
 
-from dagster_tests.storage_tests.utils.event_log_storage import TestEventLogStorage
+from dagster_tests.storage_tests.utils.event_log_storage import (
+    TestEventLogStorage,
+    create_test_event_log_record,
+)
 
 
 class TestInMemoryEventLogStorage(TestEventLogStorage):
@@ -133,6 +136,37 @@ def test_concurrent_sqlite_event_log_connections(self, storage):
             excs.append(exceptions.get())
         assert not excs, excs
 
+    def test_shard_connection_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir_path:
+            storage = SqliteEventLogStorage(tmpdir_path, max_cached_shards=2)
+            run_ids = [make_new_run_id() for _ in range(3)]
+            for run_id in run_ids:
+                storage.store_event(create_test_event_log_record("message", run_id))
+
+            # only the most recently used shards keep an open connection
+            assert list(storage._shard_engines.keys()) == run_ids[1:]  # noqa: SLF001
+            for run_id in run_ids:
+                assert len(storage.get_logs_for_run(run_id)) == 1
+
+            with storage.run_connection(run_ids[0]) as conn:
+                assert conn.execute(db.text("PRAGMA journal_mode")).scalar() == "wal"
+                # synchronous=NORMAL
+                assert conn.execute(db.text("PRAGMA synchronous")).scalar() == 1
+
+            storage.wipe()
+            assert list(storage._shard_engines.keys()) == ["index"]  # noqa: SLF001
+            assert storage.get_logs_for_run(run_ids[0]) == []
+            storage.dispose()
+
+    def test_shard_connection_cache_disabled(self):
+        with tempfile.TemporaryDirectory() as tmpdir_path:
+            storage = SqliteEventLogStorage(tmpdir_path, max_cached_shards=0)
+            run_id = make_new_run_id()
+            storage.store_event(create_test_event_log_record("message", run_id))
+            assert len(storage.get_logs_for_run(run_id)) == 1
+            assert not storage._shard_engines  # noqa: SLF001
+            storage.dispose()
+
 
 class TestConsolidatedSqliteEventLogStorage(TestEventLogStorage):
     __test__ = True
@@ -1,6 +1,34 @@
+import time
+from unittest import mock
+
 import pytest
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    DagsterEventType,
+    DailyPartitionsDefinition,
+    EventLogEntry,
+    StaticPartitionsDefinition,
+    asset,
+    define_asset_job,
+)
+from dagster._core.definitions.asset_graph import AssetGraph
+from dagster._core.definitions.partition import PartitionKeyRange
+from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsSubset
+from dagster._core.events import (
+    AssetMaterializationPlannedData,
+    DagsterEvent,
+    StepMaterializationData,
+)
+from dagster._core.storage.partition_status_cache import (
+    compact_asset_status_cache_value,
+    get_and_update_asset_status_cache_value,
+)
 from dagster._core.test_utils import instance_for_test
+from dagster._core.utils import make_new_run_id
+from dagster._daemon.auto_run_reexecution import event_log_consumer
 
+from dagster_tests.storage_tests.utils.event_log_storage import create_and_delete_test_runs
 from dagster_tests.storage_tests.utils.partition_status_cache import TestPartitionStatusCache
 
 
@@ -9,3 +37,198 @@ class TestSqlPartitionStatusCache(TestPartitionStatusCache):
     def instance(self):
         with instance_for_test() as the_instance:
             yield the_instance
+
+
+class TestSqlPartitionStatusCacheUpdateOnWrite(TestPartitionStatusCache):
+    @pytest.fixture
+    def instance(self):
+        with instance_for_test(
+            overrides={"asset_status_cache": {"update_on_write": True}}
+        ) as the_instance:
+            yield the_instance
+
+    def test_cached_status_updated_on_write(self, instance):
+        partitions_def = StaticPartitionsDefinition(["good1", "good2", "fail1"])
+
+        @asset(partitions_def=partitions_def)
+        def asset1(context):
+            if context.partition_key.startswith("fail"):
+                raise Exception()
+
+        asset_key = AssetKey("asset1")
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+
+        def _get_stored_value():
+            return next(iter(instance.get_asset_records([asset_key]))).asset_entry.cached_status
+
+        asset_job.execute_in_process(instance=instance, partition_key="good1")
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status.is_updated_on_write
+        assert _get_stored_value() == cached_status
+
+        asset_job.execute_in_process(instance=instance, partition_key="good2")
+        asset_job.execute_in_process(instance=instance, partition_key="fail1", raise_on_error=False)
+
+        # the stored value reflects the new runs without having been read
+        stored_value = _get_stored_value()
+        assert stored_value.latest_storage_id > cached_status.latest_storage_id
+        assert stored_value.uncompacted_materialized_partition_keys == ["good2"]
+        assert stored_value.uncompacted_failed_partition_keys == ["fail1"]
+        assert stored_value.in_progress_partition_subsets_by_run_id == {}
+
+        # reads merge the recorded partitions without writing the cached status
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert _get_stored_value() == stored_value
+        assert cached_status.deserialize_materialized_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"good1", "good2"}
+        assert cached_status.deserialize_failed_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"fail1"}
+
+        # recorded partitions are only compacted once there are enough of them
+        assert not compact_asset_status_cache_value(instance, asset_key, partitions_def)
+
+    def test_ranged_planned_materialization_stored_as_time_windows(self, instance):
+        partitions_def = DailyPartitionsDefinition(start_date="2023-01-01", end_date="2023-04-11")
+        asset_key = AssetKey("asset1")
+        run_id = make_new_run_id()
+
+        def _get_stored_value():
+            return next(iter(instance.get_asset_records([asset_key]))).asset_entry.cached_status
+
+        def _store_event(event_type, event_specific_data):
+            instance.event_log_storage.store_event(
+                EventLogEntry(
+                    error_info=None,
+                    user_message="",
+                    level="debug",
+                    run_id=run_id,
+                    timestamp=time.time(),
+                    dagster_event=DagsterEvent(
+                        event_type.value, "nonce", event_specific_data=event_specific_data
+                    ),
+                )
+            )
+
+        with create_and_delete_test_runs(instance, [run_id]):
+            _store_event(
+                DagsterEventType.ASSET_MATERIALIZATION,
+                StepMaterializationData(AssetMaterialization(asset_key, partition="2023-01-01")),
+            )
+            get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+
+            planned_keys = partitions_def.get_partition_keys_in_range(
+                PartitionKeyRange("2023-01-02", "2023-04-10")
+            )
+            _store_event(
+                DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+                AssetMaterializationPlannedData(
+                    asset_key,
+                    partitions_subset=partitions_def.subset_with_partition_keys(
+                        planned_keys
+                    ).to_serializable_subset(),
+                ),
+            )
+
+            # the planned range is stored as a single time window, rather than as its keys
+            run_subset = _get_stored_value().in_progress_partition_subsets_by_run_id[run_id]
+            assert isinstance(run_subset, TimeWindowPartitionsSubset)
+            assert len(run_subset.included_time_windows) == 1
+            assert len(run_subset) == len(planned_keys)
+
+            _store_event(
+                DagsterEventType.ASSET_MATERIALIZATION,
+                StepMaterializationData(AssetMaterialization(asset_key, partition="2023-02-01")),
+            )
+            run_subset = _get_stored_value().in_progress_partition_subsets_by_run_id[run_id]
+            assert len(run_subset.included_time_windows) == 2
+            assert len(run_subset) == len(planned_keys) - 1
+
+            cached_status = get_and_update_asset_status_cache_value(
+                instance, asset_key, partitions_def
+            )
+            assert set(
+                cached_status.deserialize_in_progress_partition_subsets(
+                    partitions_def
+                ).get_partition_keys()
+            ) == set(planned_keys) - {"2023-02-01"}
+            assert set(
+                cached_status.deserialize_materialized_partition_subsets(
+                    partitions_def
+                ).get_partition_keys()
+            ) == {"2023-01-01", "2023-02-01"}
+
+    def test_compact_cached_status(self):
+        partitions_def = StaticPartitionsDefinition(["good1", "good2", "good3"])
+
+        @asset(partitions_def=partitions_def)
+        def asset1():
+            pass
+
+        asset_key = AssetKey("asset1")
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+
+        with instance_for_test(
+            overrides={"asset_status_cache": {"update_on_write": True, "compaction_threshold": 2}}
+        ) as instance:
+            asset_job.execute_in_process(instance=instance, partition_key="good1")
+            get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+
+            asset_job.execute_in_process(instance=instance, partition_key="good2")
+            assert not compact_asset_status_cache_value(instance, asset_key, partitions_def)
+
+            asset_job.execute_in_process(instance=instance, partition_key="good3")
+            assert compact_asset_status_cache_value(instance, asset_key, partitions_def)
+
+            stored_value = next(
+                iter(instance.get_asset_records([asset_key]))
+            ).asset_entry.cached_status
+            assert stored_value.num_uncompacted_partition_keys == 0
+            assert stored_value.deserialize_materialized_partition_subsets(
+                partitions_def
+            ).get_partition_keys() == {"good1", "good2", "good3"}
+
+    def test_consumer_compacts_planned_assets(self, instance):
+        partitions_def = StaticPartitionsDefinition(["a", "b"])
+
+        @asset(partitions_def=partitions_def)
+        def asset1():
+            pass
+
+        @asset(partitions_def=partitions_def)
+        def asset2():
+            pass
+
+        @asset(partitions_def=partitions_def)
+        def asset3():
+            pass
+
+        asset_graph = AssetGraph.from_assets([asset1, asset2, asset3])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+        result = asset_job.execute_in_process(instance=instance, partition_key="a")
+        run_records = instance.get_run_records()
+        assert [record.dagster_run.run_id for record in run_records] == [result.run_id]
+
+        workspace_process_context = mock.MagicMock()
+        workspace_process_context.instance = instance
+        workspace_process_context.create_request_context.return_value.asset_graph = asset_graph
+
+        compacted_keys = []
+        # a fetch limit of one record makes the consumer page through the planned events
+        with mock.patch.object(event_log_consumer, "_EVENT_LOG_FETCH_LIMIT", 1), mock.patch.object(
+            event_log_consumer,
+            "compact_asset_status_cache_value",
+            side_effect=lambda _instance, asset_key, _partitions_def: compacted_keys.append(
+                asset_key
+            ),
+        ):
+            list(
+                event_log_consumer.consume_new_runs_for_asset_status_cache_compaction(
+                    workspace_process_context, run_records
+                )
+            )
+
+        assert set(compacted_keys) == {AssetKey("asset1"), AssetKey("asset2"), AssetKey("asset3")}
@@ -4,9 +4,15 @@
 from typing import Any, Callable, Mapping, Optional
 
 import dagster._check as check
+import pytest
+from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+    SqlPollingEventWatcher,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.utils import make_new_run_id
 from dagster._serdes.config_class import ConfigurableClassData
@@ -146,3 +152,142 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+class ConsolidatedSqlitePollingEventLogStorage(ConsolidatedSqliteEventLogStorage):
+    """Non-run-sharded SQLite event log storage that uses SqlPollingEventWatcher for watching runs,
+    exercising a single polling thread across all watched runs.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super(ConsolidatedSqlitePollingEventLogStorage, self).__init__(*args, **kwargs)
+        self._watcher = SqlPollingEventWatcher(self, max_watched_runs=3)
+
+    def watch(self, run_id, cursor, callback):
+        self._watcher.watch_run(run_id, cursor, callback)
+
+    def end_watch(self, run_id, handler):
+        self._watcher.unwatch_run(run_id, handler)
+
+    def dispose(self) -> None:
+        self._watcher.close()
+
+
+def test_multiplexed_watch_many_runs():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        run_ids = [make_new_run_id() for _ in range(3)]
+        watched = {run_id: [] for run_id in run_ids}
+
+        def _make_callback(run_id):
+            return lambda event, _cursor: watched[run_id].append(event)
+
+        callbacks = {run_id: _make_callback(run_id) for run_id in run_ids}
+
+        storage.store_event(create_event(0, run_id=run_ids[0]))
+        for run_id in run_ids:
+            storage.watch(run_id, None, callbacks[run_id])
+
+        with pytest.raises(DagsterInvariantViolationError, match="maximum of 3 runs"):
+            storage.watch(make_new_run_id(), None, lambda event, _cursor: None)
+
+        for i in range(1, 4):
+            for run_id in run_ids:
+                storage.store_event(create_event(i, run_id=run_id))
+
+        attempts = 20
+        while sum(len(events) for events in watched.values()) < 10 and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(evt.message) for evt in watched[run_ids[0]]] == [0, 1, 2, 3]
+        assert [int(evt.message) for evt in watched[run_ids[1]]] == [1, 2, 3]
+        assert [int(evt.message) for evt in watched[run_ids[2]]] == [1, 2, 3]
+
+        storage.end_watch(run_ids[0], callbacks[run_ids[0]])
+        assert not storage._watcher.has_run_id(run_ids[0])  # noqa: SLF001
+        assert storage._watcher.has_run_id(run_ids[1])  # noqa: SLF001
+
+        storage.dispose()
+
+
+def test_watch_errors_do_not_stop_other_runs():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        failing_run_id, erroring_run_id, run_id = [make_new_run_id() for _ in range(3)]
+        watched = []
+        num_failed_polls = []
+
+        get_records_for_run_cursors = storage.get_records_for_run_cursors
+
+        def _get_records_for_run_cursors(after_storage_id_by_run_id, *args, **kwargs):
+            if erroring_run_id in after_storage_id_by_run_id and len(num_failed_polls) < 2:
+                num_failed_polls.append(1)
+                raise Exception("Could not poll")
+            return get_records_for_run_cursors(after_storage_id_by_run_id, *args, **kwargs)
+
+        storage.get_records_for_run_cursors = _get_records_for_run_cursors  # type: ignore
+
+        def _failing_callback(_event, _cursor):
+            raise Exception("Callback failed")
+
+        storage.watch(failing_run_id, None, _failing_callback)
+        storage.watch(erroring_run_id, None, lambda event, _cursor: watched.append(event))
+        storage.watch(run_id, None, lambda event, _cursor: watched.append(event))
+
+        for i in range(1, 4):
+            for watched_run_id in [failing_run_id, erroring_run_id, run_id]:
+                storage.store_event(create_event(i, run_id=watched_run_id))
+
+        attempts = 50
+        while len(watched) < 6 and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert len(num_failed_polls) == 2
+        assert sorted((event.run_id, int(event.message)) for event in watched) == sorted(
+            (watched_run_id, i)
+            for watched_run_id in [erroring_run_id, run_id]
+            for i in range(1, 4)
+        )
+        assert storage._watcher._thread is not None  # noqa: SLF001
+
+        storage.dispose()
+
+
+def test_idle_runs_back_off_independently():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        active_run_id, idle_run_id = make_new_run_id(), make_new_run_id()
+        watched = []
+        polled_run_ids = []
+
+        get_records_for_run_cursors = storage.get_records_for_run_cursors
+
+        def _get_records_for_run_cursors(after_storage_id_by_run_id, *args, **kwargs):
+            polled_run_ids.append(set(after_storage_id_by_run_id.keys()))
+            return get_records_for_run_cursors(after_storage_id_by_run_id, *args, **kwargs)
+
+        storage.get_records_for_run_cursors = _get_records_for_run_cursors  # type: ignore
+
+        storage.watch(active_run_id, None, lambda event, _cursor: watched.append(event))
+        storage.watch(idle_run_id, None, lambda event, _cursor: watched.append(event))
+
+        for i in range(30):
+            storage.store_event(create_event(i, run_id=active_run_id))
+            time.sleep(0.1)
+
+        attempts = 20
+        while len(watched) < 30 and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(evt.message) for evt in watched] == list(range(30))
+        # each poll is a single query for every run that is due
+        assert all(run_ids for run_ids in polled_run_ids)
+        num_active_polls = sum(1 for run_ids in polled_run_ids if active_run_id in run_ids)
+        num_idle_polls = sum(1 for run_ids in polled_run_ids if idle_run_id in run_ids)
+        assert num_active_polls >= 8
+        assert num_idle_polls <= 6
+
+        storage.dispose()
@@ -0,0 +1,32 @@
+from dagster._core.definitions import GraphDefinition
+from dagster._core.storage.runs.snapshot_cache import SnapshotCache, SnapshotCacheStats
+
+
+def test_snapshot_cache_lru():
+    snapshot = GraphDefinition(name="some_pipeline", node_defs=[]).to_job().get_job_snapshot()
+    cache = SnapshotCache(max_bytes=100, max_known_ids=1)
+
+    cache.put(("storage", "a"), snapshot, 40)
+    cache.put(("storage", "b"), snapshot, 40)
+    assert cache.get(("storage", "a")) is snapshot
+    assert cache.get(("other_storage", "a")) is None
+
+    # "b" is the least recently used, so it is evicted but still known to exist
+    cache.put(("storage", "c"), snapshot, 40)
+    assert cache.get(("storage", "b")) is None
+    assert cache.has(("storage", "b"))
+    assert cache.get(("storage", "c")) is snapshot
+
+    # known ids are bounded separately
+    cache.mark_exists(("storage", "d"))
+    assert not cache.has(("storage", "b"))
+    assert cache.has(("storage", "d"))
+
+    # snapshots bigger than the cache are never held
+    cache.put(("storage", "e"), snapshot, 1000)
+    assert cache.get(("storage", "e")) is None
+    assert cache.has(("storage", "e"))
+
+    assert cache.stats == SnapshotCacheStats(
+        hits=5, misses=4, evictions=1, num_entries=2, size_bytes=80
+    )
@@ -2,6 +2,8 @@
 import json
 import pickle
 import sys
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, cast
@@ -253,6 +255,120 @@ def downstream_asset(upstream_asset):
     assert set(downstream_asset_data.keys()) == {"1|a", "1|b"}
 
 
+class ThreadRecordingPickleIOManager(PickleIOManager):
+    max_concurrent_partition_loads = 4
+
+    def __init__(self, base_path: UPath):
+        super().__init__(base_path)
+        self.loading_threads = set()
+
+    def load_from_path(self, context: InputContext, path: UPath) -> List:
+        self.loading_threads.add(threading.get_ident())
+        time.sleep(0.01)
+        return super().load_from_path(context, path)
+
+
+@pytest.mark.parametrize("max_concurrent_partition_loads", [None, 1])
+def test_upath_io_manager_concurrent_partition_loads(
+    tmp_path: Path, max_concurrent_partition_loads: Optional[int]
+):
+    my_io_manager = ThreadRecordingPickleIOManager(UPath(tmp_path))
+    partition_keys = [str(i) for i in range(20)]
+
+    @asset(partitions_def=StaticPartitionsDefinition(partition_keys), io_manager_def=my_io_manager)
+    def upstream_asset(context: AssetExecutionContext) -> str:
+        return context.partition_key
+
+    @asset(
+        io_manager_def=my_io_manager,
+        ins={
+            "upstream_asset": AssetIn(
+                partition_mapping=AllPartitionMapping(),
+                metadata=(
+                    {"allow_missing_partitions": True}
+                    if max_concurrent_partition_loads is None
+                    else {
+                        "allow_missing_partitions": True,
+                        "max_concurrent_partition_loads": max_concurrent_partition_loads,
+                    }
+                ),
+            )
+        },
+    )
+    def downstream_asset(
+        context: AssetExecutionContext, upstream_asset: Dict[str, str]
+    ) -> Dict[str, str]:
+        # partitions are returned in the order of the input partition keys
+        assert list(upstream_asset.keys()) == [
+            partition_key
+            for partition_key in context.asset_partition_keys_for_input("upstream_asset")
+            if partition_key in upstream_asset
+        ]
+        return upstream_asset
+
+    for partition_key in partition_keys[:-1]:
+        materialize([upstream_asset], partition_key=partition_key)
+
+    my_io_manager.loading_threads.clear()
+    result = materialize([upstream_asset.to_source_asset(), downstream_asset])
+    downstream_asset_data = result.output_for_node("downstream_asset", "result")
+
+    # the missing partition is skipped
+    assert downstream_asset_data == {
+        partition_key: partition_key for partition_key in partition_keys[:-1]
+    }
+    if max_concurrent_partition_loads == 1:
+        assert my_io_manager.loading_threads == {threading.get_ident()}
+    else:
+        assert len(my_io_manager.loading_threads) > 1
+        assert threading.get_ident() not in my_io_manager.loading_threads
+
+
+def test_upath_io_manager_concurrent_partition_loads_missing_partition(tmp_path: Path):
+    my_io_manager = ThreadRecordingPickleIOManager(UPath(tmp_path))
+    partitions_def = StaticPartitionsDefinition(["A", "B", "C"])
+
+    @asset(partitions_def=partitions_def, io_manager_def=my_io_manager)
+    def upstream_asset(context: AssetExecutionContext) -> str:
+        return context.partition_key
+
+    @asset(
+        io_manager_def=my_io_manager,
+        ins={"upstream_asset": AssetIn(partition_mapping=AllPartitionMapping())},
+    )
+    def downstream_asset(upstream_asset: Dict[str, str]) -> Dict[str, str]:
+        return upstream_asset
+
+    materialize([upstream_asset], partition_key="A")
+
+    with pytest.raises(FileNotFoundError):
+        materialize([upstream_asset.to_source_asset(), downstream_asset])
+
+
+def test_upath_io_manager_load_from_paths(tmp_path: Path):
+    class ListingIOManager(PickleIOManager):
+        def load_from_paths(self, context: InputContext, paths) -> List:
+            return sorted(path.name for path in paths.values())
+
+    my_io_manager = ListingIOManager(UPath(tmp_path))
+
+    @asset(partitions_def=StaticPartitionsDefinition(["A", "B"]), io_manager_def=my_io_manager)
+    def upstream_asset(context: AssetExecutionContext) -> str:
+        return context.partition_key
+
+    @asset(
+        io_manager_def=my_io_manager,
+        ins={"upstream_asset": AssetIn(partition_mapping=AllPartitionMapping())},
+    )
+    def downstream_asset(upstream_asset: List[str]) -> List[str]:
+        return upstream_asset
+
+    result = materialize(
+        [upstream_asset, downstream_asset], selection=[downstream_asset]
+    )
+    assert result.output_for_node("downstream_asset", "result") == ["A", "B"]
+
+
 def test_upath_io_manager_multiple_partitions_from_non_partitioned_run(tmp_path: Path):
     my_io_manager = PickleIOManager(UPath(tmp_path))
 
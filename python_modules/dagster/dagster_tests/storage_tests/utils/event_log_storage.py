@@ -57,7 +57,11 @@
 from dagster._core.definitions.dependency import NodeHandle
 from dagster._core.definitions.job_base import InMemoryJob
 from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionKey
-from dagster._core.definitions.partition import PartitionKeyRange, StaticPartitionsDefinition
+from dagster._core.definitions.partition import (
+    DefaultPartitionsSubset,
+    PartitionKeyRange,
+    StaticPartitionsDefinition,
+)
 from dagster._core.definitions.time_window_partitions import (
     DailyPartitionsDefinition,
     HourlyPartitionsDefinition,
@@ -928,6 +932,38 @@ def test_get_logs_for_run_cursor_limit(self, test_run_id, storage):
 
         assert _event_types(out_events) == _event_types(events)
 
+    def test_iterate_records_for_run(self, test_run_id, storage):
+        events, result = _synthesize_events(return_one_op_func, run_id=test_run_id)
+
+        for event in events:
+            storage.store_event(event)
+
+        event_records = storage.get_records_for_run(result.run_id).records
+        storage_ids = [r.storage_id for r in event_records]
+
+        # batch sizes smaller than, equal to, and larger than the number of records
+        for batch_size in [1, 2, len(event_records), len(event_records) + 1]:
+            iterated = list(storage.iterate_records_for_run(result.run_id, batch_size=batch_size))
+            assert [r.storage_id for r in iterated] == storage_ids
+            assert _event_types([r.event_log_entry for r in iterated]) == _event_types(events)
+
+        cursor = EventLogCursor.from_storage_id(storage_ids[1]).to_string()
+        assert [
+            r.storage_id
+            for r in storage.iterate_records_for_run(result.run_id, cursor=cursor, batch_size=2)
+        ] == storage_ids[2:]
+
+        assert _event_types(
+            [
+                r.event_log_entry
+                for r in storage.iterate_records_for_run(
+                    result.run_id,
+                    of_type={DagsterEventType.STEP_SUCCESS, DagsterEventType.RUN_SUCCESS},
+                    batch_size=1,
+                )
+            ]
+        ) == [DagsterEventType.STEP_SUCCESS, DagsterEventType.RUN_SUCCESS]
+
     def test_get_logs_for_run_cursor_offset_limit(self, test_run_id, storage):
         if not self.supports_offset_cursor_queries():
             pytest.skip("storage does not support deprecated offset cursor queries")
@@ -1071,6 +1107,40 @@ def test_basic_get_logs_for_run_multiple_runs_cursors(self, instance, storage):
 
             assert set(map(lambda e: e.run_id, out_events_two)) == {result_two.run_id}
 
+    def test_get_records_for_run_cursors(self, instance, storage):
+        if not isinstance(storage, SqlEventLogStorage) or storage.is_run_sharded:
+            pytest.skip("storage cannot query events across runs")
+
+        events_one, result_one = _synthesize_events(return_one_op_func)
+        events_two, result_two = _synthesize_events(return_one_op_func)
+
+        with create_and_delete_test_runs(instance, [result_one.run_id, result_two.run_id]):
+            for event in events_one:
+                storage.store_event(event)
+            for event in events_two:
+                storage.store_event(event)
+
+            records_one = storage.get_records_for_run(result_one.run_id).records
+            records_two = storage.get_records_for_run(result_two.run_id).records
+            cursor_one = records_one[1].storage_id
+
+            records = storage.get_records_for_run_cursors(
+                {result_one.run_id: cursor_one, result_two.run_id: None}
+            )
+            assert [record.storage_id for record in records] == sorted(
+                [record.storage_id for record in records_one[2:]]
+                + [record.storage_id for record in records_two]
+            )
+
+            records = storage.get_records_for_run_cursors(
+                {result_one.run_id: cursor_one, result_two.run_id: None}, limit=2
+            )
+            assert [record.storage_id for record in records] == [
+                record.storage_id for record in records_one[2:4]
+            ]
+
+            assert storage.get_records_for_run_cursors({}) == []
+
     # .watch() is async, there's a small chance they don't run before the asserts
     @pytest.mark.flaky(reruns=1)
     def test_event_watcher_single_run_event(self, storage, test_run_id):
@@ -1262,6 +1332,45 @@ def foo():
         result = storage.fetch_materializations(foo.key, limit=100)
         assert len(result.records) == 2
 
+    def test_store_event_batch_mixed_event_types(self, storage, test_run_id):
+        asset_key = AssetKey(["batch_asset"])
+
+        @op
+        def materialize(context):
+            context.log.info("before")
+            yield AssetMaterialization(asset_key=asset_key, partition="1")
+            context.log.info("between")
+            yield AssetMaterialization(asset_key=asset_key, partition="2")
+            yield Output(1)
+
+        def _ops():
+            materialize()
+
+        with instance_for_test() as test_instance:
+            events, _ = _synthesize_events(_ops, instance=test_instance, run_id=test_run_id)
+
+        storage.store_event_batch(events)
+
+        stored = storage.get_logs_for_run(test_run_id)
+        assert [event.message for event in stored] == [event.message for event in events]
+
+        records = storage.get_records_for_run(test_run_id).records
+        assert [record.storage_id for record in records] == sorted(
+            record.storage_id for record in records
+        )
+
+        result = storage.fetch_materializations(asset_key, limit=100, ascending=True)
+        assert [record.event_log_entry.dagster_event.partition for record in result.records] == [
+            "1",
+            "2",
+        ]
+        asset_record = storage.get_asset_records([asset_key])[0]
+        assert asset_record.asset_entry.last_materialization_record
+        assert (
+            asset_record.asset_entry.last_materialization_record.event_log_entry.dagster_event.partition
+            == "2"
+        )
+
     def test_asset_materialization_fetch(self, storage, instance):
         asset_key = AssetKey(["path", "to", "asset_one"])
 
@@ -4685,6 +4794,9 @@ def yields_materialization():
                 serialized_failed_partition_subset="baz",
                 serialized_in_progress_partition_subset="qux",
                 earliest_in_progress_materialization_event_id=42,
+                in_progress_partition_subsets_by_run_id={"run": DefaultPartitionsSubset({"quux"})},
+                uncompacted_materialized_partition_keys=["corge"],
+                uncompacted_failed_partition_keys=["grault"],
             )
 
             # Check that AssetStatusCacheValue has all fields set. This ensures that we test that the
@@ -4801,6 +4913,52 @@ def test_has_dynamic_partition(self, storage: EventLogStorage):
         assert not storage.has_dynamic_partition(partitions_def_name="foo", partition_key="qux")
         assert not storage.has_dynamic_partition(partitions_def_name="bar", partition_key="foo")
 
+    def test_dynamic_partitions_version(self, storage: EventLogStorage):
+        assert storage
+        if storage.get_dynamic_partitions_version("foo") is None:
+            pytest.skip("storage does not version dynamic partitions")
+
+        assert storage.get_dynamic_partitions_version("foo") == 0
+        versioned_partitions = storage.get_versioned_dynamic_partitions("foo")
+        assert versioned_partitions.partition_keys == ()
+
+        storage.add_dynamic_partitions(partitions_def_name="foo", partition_keys=["foo", "bar"])
+        assert storage.get_dynamic_partitions_version("foo") == 1
+        versioned_partitions = storage.get_versioned_dynamic_partitions("foo")
+        assert versioned_partitions.version == 1
+        assert versioned_partitions.partition_keys == ("foo", "bar")
+        # cached until the version changes
+        assert storage.get_versioned_dynamic_partitions("foo") is versioned_partitions
+
+        # adding existing partitions or deleting missing partitions doesn't change the version
+        storage.add_dynamic_partitions(partitions_def_name="foo", partition_keys=["foo"])
+        storage.delete_dynamic_partition(partitions_def_name="foo", partition_key="baz")
+        assert storage.get_dynamic_partitions_version("foo") == 1
+
+        if isinstance(storage, SqlEventLogStorage):
+            # the versions table isn't checked for again once a version row is known
+            with mock.patch.object(
+                type(storage), "has_table", wraps=storage.has_table
+            ) as has_table:
+                storage.add_dynamic_partitions(partitions_def_name="foo", partition_keys=["foo"])
+                storage.delete_dynamic_partition(partitions_def_name="foo", partition_key="baz")
+            assert mock.call("dynamic_partitions_versions") not in has_table.call_args_list
+
+        storage.add_dynamic_partitions(partitions_def_name="foo", partition_keys=["foo", "baz"])
+        assert storage.get_dynamic_partitions_version("foo") == 2
+        assert storage.get_versioned_dynamic_partitions("foo").partition_keys == (
+            "foo",
+            "bar",
+            "baz",
+        )
+
+        storage.delete_dynamic_partition(partitions_def_name="foo", partition_key="foo")
+        assert storage.get_dynamic_partitions_version("foo") == 3
+        assert storage.get_versioned_dynamic_partitions("foo").partition_keys == ("bar", "baz")
+
+        # versions are per partitions definition
+        assert storage.get_dynamic_partitions_version("bar") == 0
+
     def test_concurrency(self, storage: EventLogStorage):
         if not storage.supports_global_concurrency_limits:
             pytest.skip("storage does not support global op concurrency")
@@ -30,7 +30,11 @@
 from dagster._core.storage.noop_compute_log_manager import NoOpComputeLogManager
 from dagster._core.storage.root import LocalArtifactStorage
 from dagster._core.storage.runs.base import RunStorage
-from dagster._core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
+from dagster._core.storage.runs.migration import (
+    BACKFILL_TAGS,
+    REQUIRED_DATA_MIGRATIONS,
+    migrate_backfill_tags,
+)
 from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
 from dagster._core.storage.tags import (
     BACKFILL_ID_TAG,
@@ -1161,6 +1165,33 @@ def test_add_get_execution_snapshot(self, storage: RunStorage):
 
             assert not storage.has_execution_plan_snapshot(snapshot_id)
 
+    def test_ensure_snapshots(self, storage: RunStorage):
+        from dagster._core.execution.api import create_execution_plan
+        from dagster._core.snap import snapshot_from_execution_plan
+
+        job_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
+        job_snapshot = job_def.get_job_snapshot()
+        job_snapshot_id = create_job_snapshot_id(job_snapshot)
+        ep_snapshot = snapshot_from_execution_plan(create_execution_plan(job_def), job_snapshot_id)
+
+        snapshot_ids = storage.ensure_snapshots([job_snapshot, ep_snapshot])
+        assert snapshot_ids[0] == job_snapshot_id
+        assert storage.has_job_snapshot(job_snapshot_id)
+        assert storage.has_execution_plan_snapshot(snapshot_ids[1])
+
+        # idempotent
+        assert storage.ensure_snapshots([ep_snapshot, job_snapshot]) == list(reversed(snapshot_ids))
+        assert serialize_pp(storage.get_job_snapshot(job_snapshot_id)) == serialize_pp(job_snapshot)
+        assert serialize_pp(storage.get_execution_plan_snapshot(snapshot_ids[1])) == serialize_pp(
+            ep_snapshot
+        )
+
+        if self.can_delete_runs():
+            storage.wipe()
+
+            assert not storage.has_job_snapshot(job_snapshot_id)
+            assert not storage.has_execution_plan_snapshot(snapshot_ids[1])
+
     def test_fetch_run_filter(self, storage):
         assert storage
         one = make_new_run_id()
@@ -1655,6 +1686,41 @@ def test_backfill_tags_filtering_multiple_results(self, storage: RunStorage):
         not_present_filter = BulkActionsFilter(tags={"not": "present"})
         self.get_backfills_and_assert_expected_count(storage, not_present_filter, 0)
 
+    def test_backfill_tags_filtering_without_runs(self, storage: RunStorage):
+        if not self.supports_backfill_tags_filtering_queries():
+            pytest.skip("storage does not support filtering backfills by tag")
+        if not isinstance(storage, SqlRunStorage) or not storage.has_built_index(BACKFILL_TAGS):
+            pytest.skip("storage does not index backfill tags")
+        origin = self.fake_partition_set_origin("fake_partition_set")
+
+        for i in range(5):
+            storage.add_backfill(
+                PartitionBackfill(
+                    f"backfill_{i}",
+                    partition_set_origin=origin,
+                    status=BulkActionStatus.REQUESTED,
+                    partition_names=["a", "b", "c"],
+                    from_failure=False,
+                    tags={"foo": "bar", "even": str(i % 2 == 0)},
+                    backfill_timestamp=time.time(),
+                )
+            )
+
+        # backfills that have not launched any runs yet are matched by their own tags
+        even_filter = BulkActionsFilter(tags={"even": "True"})
+        self.get_backfills_and_assert_expected_count(storage, even_filter, 3)
+
+        foo_filter = BulkActionsFilter(tags={"foo": "bar"})
+        first_page = storage.get_backfills(filters=foo_filter, limit=2)
+        assert [backfill.backfill_id for backfill in first_page] == ["backfill_4", "backfill_3"]
+        second_page = storage.get_backfills(filters=foo_filter, cursor="backfill_3", limit=2)
+        assert [backfill.backfill_id for backfill in second_page] == ["backfill_2", "backfill_1"]
+
+        # the index can be rebuilt from the stored backfills
+        migrate_backfill_tags(storage)
+        self.get_backfills_and_assert_expected_count(storage, even_filter, 3)
+        self.get_backfills_and_assert_expected_count(storage, foo_filter, 5)
+
     def test_backfill_simple_job_name_filtering(self, storage: RunStorage):
         if not self.supports_backfill_job_name_filtering_queries():
             pytest.skip("storage does not support filtering backfills by job_name")
@@ -1,11 +1,20 @@
 import asyncio
 import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
-from typing import Iterable, List, NamedTuple
+from typing import Iterable, List, NamedTuple, Optional
 from unittest import mock
 
 import pytest
-from dagster._core.loader import InstanceLoadableBy, LoadingContext
+from dagster._core.loader import (
+    InstanceLoadableBy,
+    LoadableCache,
+    LoadingContext,
+    use_blocking_load_executor,
+    use_shared_loadable_cache,
+)
 from dagster._model import DagsterModel
 from dagster._utils.aiodataloader import DataLoader
 
@@ -197,3 +206,74 @@ def test_sync_loadable_by() -> None:
     d2 = LoadableThing.blocking_get(context, "d")
     assert d1 == d2
     assert context.instance.query.call_count == 2
+
+
+class SharedLoadableThing(LoadableThing):
+    shared_cache_enabled = True
+
+    @classmethod
+    def _blocking_batch_load(
+        cls, keys: Iterable[str], instance: mock.MagicMock
+    ) -> List[Optional["LoadableThing"]]:
+        instance.query(keys, threading.current_thread().name)
+        return [None if key == "missing" else LoadableThing(key, 0) for key in keys]
+
+
+def test_shared_loadable_cache() -> None:
+    cache = LoadableCache(ttl_seconds=60)
+    instance = mock.MagicMock()
+
+    def _context() -> BasicLoadingContext:
+        context = BasicLoadingContext()
+        context._mock_instance = instance  # noqa: SLF001
+        return context
+
+    with use_shared_loadable_cache(cache):
+        a1 = SharedLoadableThing.blocking_get(_context(), "a")
+        assert instance.query.call_count == 1
+
+        # served from the cache in another context, only misses are queried
+        assert SharedLoadableThing.blocking_get(_context(), "a") is a1
+        assert SharedLoadableThing.blocking_get(_context(), "missing") is None
+        assert SharedLoadableThing.blocking_get(_context(), "missing") is None
+        assert instance.query.call_count == 3
+
+        # shared with async loads
+        context = _context()
+        b1 = asyncio.run(SharedLoadableThing.gen(context, "b"))
+        assert SharedLoadableThing.blocking_get(_context(), "b") is b1
+        results = asyncio.run(SharedLoadableThing.gen_many(_context(), ["a", "b", "c"]))
+        assert list(results)[:2] == [a1, b1]
+        instance.query.assert_called_with(["c"], mock.ANY)
+
+    # not used outside of the scope, or for types that do not opt in
+    SharedLoadableThing.blocking_get(_context(), "a")
+    assert instance.query.call_count == 6
+    with use_shared_loadable_cache(cache):
+        LoadableThing.blocking_get(_context(), "a")
+        LoadableThing.blocking_get(_context(), "a")
+    assert instance.query.call_count == 8
+
+    # entries expire
+    cache = LoadableCache(ttl_seconds=0.01)
+    with use_shared_loadable_cache(cache):
+        SharedLoadableThing.blocking_get(_context(), "a")
+        time.sleep(0.02)
+        SharedLoadableThing.blocking_get(_context(), "a")
+    assert instance.query.call_count == 10
+
+    # evicts the least recently loaded entries
+    cache = LoadableCache(ttl_seconds=60, max_entries=2)
+    cache.set_many(SharedLoadableThing, [("a", 1), ("b", 2), ("c", 3)])
+    assert cache.get_many(SharedLoadableThing, ["a", "b", "c"]) == {"b": 2, "c": 3}
+
+
+def test_blocking_load_executor() -> None:
+    context = BasicLoadingContext()
+
+    with ThreadPoolExecutor(thread_name_prefix="blocking_load") as executor:
+        with use_blocking_load_executor(executor):
+            asyncio.run(SharedLoadableThing.gen(context, "a"))
+
+    context.instance.query.assert_called_once_with(["a"], mock.ANY)
+    assert context.instance.query.call_args[0][1].startswith("blocking_load")
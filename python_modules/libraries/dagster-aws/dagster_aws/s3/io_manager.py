@@ -23,6 +23,9 @@
 
 
 class PickledObjectS3IOManager(UPathIOManager):
+    # boto3 clients can be shared between threads, so partitions are downloaded concurrently
+    max_concurrent_partition_loads = 8
+
     def __init__(
         self,
         s3_bucket: str,
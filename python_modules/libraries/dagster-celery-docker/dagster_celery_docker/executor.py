@@ -197,6 +197,7 @@ def _submit_task_docker(app, plan_context, step, queue, priority, known_state):
         retry_mode=plan_context.executor.retries.for_inner_plan(),
         known_state=known_state,
         print_serialized_events=True,
+        execution_plan_fragment=plan_context.get_execution_plan_fragment([step.key]),
     )
 
     task = create_docker_task(app)
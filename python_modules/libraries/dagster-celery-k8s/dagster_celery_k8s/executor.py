@@ -213,6 +213,7 @@ def _submit_task_k8s_job(app, plan_context, step, queue, priority, known_state):
         known_state=known_state,
         should_verify_step=True,
         print_serialized_events=True,
+        execution_plan_fragment=plan_context.get_execution_plan_fragment([step.key]),
     )
 
     job_config = plan_context.executor.job_config
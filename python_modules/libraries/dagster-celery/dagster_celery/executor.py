@@ -115,6 +115,7 @@ def _submit_task(app, plan_context, step, queue, priority, known_state):
         retry_mode=plan_context.executor.retries.for_inner_plan(),
         known_state=known_state,
         print_serialized_events=True,  # Not actually checked by the celery task
+        execution_plan_fragment=plan_context.get_execution_plan_fragment([step.key]),
     )
 
     task = create_task(app)
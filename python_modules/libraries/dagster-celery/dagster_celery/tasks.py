@@ -10,6 +10,7 @@
 from dagster._core.definitions.reconstruct import ReconstructableJob
 from dagster._core.events import EngineEventData
 from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._grpc.types import ExecuteRunArgs, ExecuteStepArgs, ResumeRunArgs
 from dagster._serdes import serialize_value, unpack_value
 from dagster._serdes.serdes import JsonSerializableValue
@@ -46,12 +47,20 @@ def _execute_plan(self, execute_step_args_packed, executable_dict):
 
         step_keys_str = ", ".join(execute_step_args.step_keys_to_execute)
 
-        execution_plan = create_execution_plan(
-            recon_job,
-            dagster_run.run_config,
-            step_keys_to_execute=execute_step_args.step_keys_to_execute,
-            known_state=execute_step_args.known_state,
-        )
+        if execute_step_args.execution_plan_fragment:
+            execution_plan = ExecutionPlan.rebuild_from_snapshot(
+                dagster_run.job_name,
+                execute_step_args.execution_plan_fragment._replace(
+                    initial_known_state=execute_step_args.known_state
+                ),
+            )
+        else:
+            execution_plan = create_execution_plan(
+                recon_job,
+                dagster_run.run_config,
+                step_keys_to_execute=execute_step_args.step_keys_to_execute,
+                known_state=execute_step_args.known_state,
+            )
 
         engine_event = instance.report_engine_event(
             f"Executing steps {step_keys_str} in celery worker",
@@ -586,3 +586,24 @@ def self_dependent_asset(
         # drop table so we start with an empty db for the next io manager
         duckdb_conn.execute("DELETE FROM my_schema.self_dependent_asset")
         duckdb_conn.close()
+
+
+def test_duckdb_io_manager_with_cached_connections(tmp_path):
+    db_file = os.path.join(tmp_path, "unit_test.duckdb")
+    io_manager = DuckDBPandasIOManager(database=db_file, cache_connections=True, single_writer=True)
+
+    # materialize asset twice to ensure that tables get properly deleted
+    for _ in range(2):
+        res = materialize([b_df, b_plus_one], resources={"io_manager": io_manager})
+        assert res.success
+
+        # the database stays open in this process, so reuse the cached connection's configuration
+        duckdb_conn = duckdb.connect(database=db_file, config={"custom_user_agent": "dagster"})
+
+        out_df = duckdb_conn.execute("SELECT * FROM my_schema.b_df").fetch_df()
+        assert out_df["a"].tolist() == [1, 2, 3]
+
+        out_df = duckdb_conn.execute("SELECT * FROM my_schema.b_plus_one").fetch_df()
+        assert out_df["a"].tolist() == [2, 3, 4]
+
+        duckdb_conn.close()
@@ -1,4 +1,4 @@
-from typing import Optional, Sequence, Type
+from typing import Optional, Sequence, Type, cast
 
 import polars as pl
 from dagster import InputContext, MetadataValue, OutputContext, TableColumn, TableSchema
@@ -75,7 +75,9 @@ def load_input(
             DuckDbClient.get_select_statement(table_slice=table_slice)
         )
         duckdb_to_arrow = select_statement.arrow()
-        return pl.DataFrame(duckdb_to_arrow)
+        # keep the record batches returned by duckdb as chunks rather than copying them into
+        # contiguous columns
+        return cast(pl.DataFrame, pl.from_arrow(duckdb_to_arrow, rechunk=False))
 
     @property
     def supported_types(self):
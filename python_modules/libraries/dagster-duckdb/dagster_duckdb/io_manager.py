@@ -1,9 +1,13 @@
+import json
+import os
+import re
+import threading
 from abc import abstractmethod
 from contextlib import contextmanager
-from typing import Any, Dict, Optional, Sequence, Type, cast
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence, Tuple, Type, cast
 
 import duckdb
-from dagster import IOManagerDefinition, OutputContext, io_manager
+from dagster import InputContext, IOManagerDefinition, OutputContext, io_manager
 from dagster._config.pythonic_config import ConfigurableIOManagerFactory
 from dagster._core.definitions.time_window_partitions import TimeWindow
 from dagster._core.storage.db_io_manager import (
@@ -15,6 +19,7 @@
 )
 from dagster._core.storage.io_manager import dagster_maintained_io_manager
 from dagster._utils.backoff import backoff
+from filelock import FileLock
 from packaging.version import Version
 from pydantic import Field
 
@@ -221,6 +226,20 @@ def my_table_a(my_table: pd.DataFrame):
                                                        connection_config={"arrow_large_buffer_size": True})}
         )
 
+    By default, a new connection to the database is opened for every output and input, and inputs
+    are loaded through read-only connections so that steps in other processes can read the
+    database at the same time. When many steps run in the same process, set ``cache_connections``
+    to reuse a single connection per database in each process instead. When steps in several
+    processes write to the same database file, set ``single_writer`` to have them wait their turn
+    to write rather than retrying until the file lock on the database is released.
+
+    .. code-block:: python
+
+        defs = Definitions(
+            assets=[my_table],
+            resources={"io_manager": MyDuckDBIOManager(database="my_db.duckdb", single_writer=True)}
+        )
+
     """
 
     database: str = Field(description="Path to the DuckDB database.")
@@ -234,6 +253,22 @@ def my_table_a(my_table: pd.DataFrame):
     schema_: Optional[str] = Field(
         default=None, alias="schema", description="Name of the schema to use."
     )  # schema is a reserved word for pydantic
+    cache_connections: bool = Field(
+        default=False,
+        description=(
+            "Whether to keep a connection to the database open in each process and reuse it for"
+            " every output and input, rather than opening a new connection each time. A cached"
+            " connection holds the lock on the database file until the process exits."
+        ),
+    )
+    single_writer: bool = Field(
+        default=False,
+        description=(
+            "Whether steps writing to the database should wait on a lock file next to the"
+            " database, so that only one process writes at a time, rather than retrying until the"
+            " database file lock is released."
+        ),
+    )
 
     @staticmethod
     @abstractmethod
@@ -280,6 +315,7 @@ def get_select_statement(table_slice: TableSlice) -> str:
     @staticmethod
     @contextmanager
     def connect(context, _):
+        database = context.resource_config["database"]
         config = context.resource_config["connection_config"]
 
         # support for `custom_user_agent` was added in v1.0.0
@@ -290,20 +326,72 @@ def connect(context, _):
                 **config,
             }
 
-        conn = backoff(
+        is_write = not isinstance(context, InputContext)
+        with _single_writer_lock(
+            database, enabled=is_write and context.resource_config.get("single_writer", False)
+        ):
+            if context.resource_config.get("cache_connections", False):
+                # cursors are separate connections to the same database instance, which can be
+                # closed without closing the cached connection
+                cursor = _get_cached_connection(database, config).cursor()
+                try:
+                    yield cursor
+                finally:
+                    cursor.close()
+            else:
+                conn = _connect(database, config, read_only=not is_write)
+                try:
+                    yield conn
+                finally:
+                    conn.close()
+
+
+def _is_local_database_file(database: str) -> bool:
+    # excludes in-memory databases and remote databases like "md:my_db", but not windows paths
+    return not database.startswith(":memory:") and not re.match(r"^\w{2,}:", database)
+
+
+def _connect(database: str, config: Mapping[str, Any], read_only: bool) -> Any:
+    # read-only connections share the lock on the database file with other readers, so only
+    # open one for a database file that already exists
+    read_only = read_only and _is_local_database_file(database) and os.path.exists(database)
+    try:
+        return backoff(
             fn=duckdb.connect,
             retry_on=(RuntimeError, duckdb.IOException),
-            kwargs={
-                "database": context.resource_config["database"],
-                "read_only": False,
-                "config": config,
-            },
+            kwargs={"database": database, "read_only": read_only, "config": config},
             max_retries=10,
         )
+    except duckdb.ConnectionException:
+        if not read_only:
+            raise
+        # the database is already open for writing in this process, and a database can only be
+        # open with a single configuration per process
+        return _connect(database, config, read_only=False)
+
+
+_connection_cache_lock = threading.Lock()
+_connection_cache: Dict[Tuple[int, str, str], Any] = {}
+
+
+def _get_cached_connection(database: str, config: Mapping[str, Any]) -> Any:
+    # keyed by process id, since connections inherited from a parent process cannot be used
+    # after a fork
+    key = (os.getpid(), database, json.dumps(config, sort_keys=True, default=str))
+    with _connection_cache_lock:
+        if key not in _connection_cache:
+            _connection_cache[key] = _connect(database, config, read_only=False)
+        return _connection_cache[key]
+
 
-        yield conn
+@contextmanager
+def _single_writer_lock(database: str, enabled: bool) -> Iterator[None]:
+    if not enabled or not _is_local_database_file(database):
+        yield
+        return
 
-        conn.close()
+    with FileLock(f"{database}.lock"):
+        yield
 
 
 def _get_cleanup_statement(table_slice: TableSlice) -> str:
@@ -1,8 +1,10 @@
+import os
 from datetime import datetime
 
+import duckdb
 from dagster import TimeWindow
 from dagster._core.storage.db_io_manager import TablePartitionDimension, TableSlice
-from dagster_duckdb.io_manager import DuckDbClient, _get_cleanup_statement
+from dagster_duckdb.io_manager import DuckDbClient, _connect, _get_cleanup_statement
 
 
 def test_get_select_statement():
@@ -158,3 +160,35 @@ def test_get_cleanup_statement_multi_partitioned():
         == "DELETE FROM schema1.table1 WHERE\nmy_fruit_col in ('apple') AND\nmy_timestamp_col >="
         " '2020-01-02 00:00:00' AND my_timestamp_col < '2020-02-03 00:00:00'"
     )
+
+
+def _is_read_only(conn) -> bool:
+    try:
+        conn.execute("create table if not exists writable as select 1 as a")
+    except duckdb.InvalidInputException:
+        return True
+    return False
+
+
+def test_connect_read_only(tmp_path):
+    db_file = os.path.join(tmp_path, "unit_test.duckdb")
+
+    # the database file does not exist yet, so it can't be opened read-only
+    conn = _connect(db_file, {}, read_only=True)
+    assert not _is_read_only(conn)
+    conn.close()
+
+    conn = _connect(db_file, {}, read_only=True)
+    assert _is_read_only(conn)
+    conn.close()
+
+    # the database is already open for writing in this process
+    write_conn = _connect(db_file, {}, read_only=False)
+    conn = _connect(db_file, {}, read_only=True)
+    assert not _is_read_only(conn)
+    conn.close()
+    write_conn.close()
+
+    conn = _connect(":memory:", {}, read_only=True)
+    assert not _is_read_only(conn)
+    conn.close()
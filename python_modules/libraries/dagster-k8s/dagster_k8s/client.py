@@ -1,11 +1,14 @@
 import logging
+import os
 import sys
+import threading
 import time
 from enum import Enum
-from typing import Any, Callable, List, Optional, Set, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Set, TypeVar
 
 import kubernetes.client
 import kubernetes.client.rest
+import kubernetes.watch
 import six
 from dagster import (
     DagsterInstance,
@@ -233,16 +236,165 @@ class KubernetesWaitingReasons:
     CreateContainerConfigError = "CreateContainerConfigError"
 
 
+DAGSTER_JOB_LABEL_SELECTOR = "app.kubernetes.io/part-of=dagster"
+DEFAULT_INFORMER_RESYNC_INTERVAL = 300  # 5 minutes
+DEFAULT_INFORMER_MIN_BACKOFF = 1.0
+DEFAULT_INFORMER_MAX_BACKOFF = 60.0
+
+
+class DagsterK8sJobInformer:
+    """Watch-based cache of the status of the dagster Kubernetes jobs in a namespace.
+
+    Rather than reading each job from the API server whenever its health is checked, a background
+    thread lists the jobs matching the label selector once and then watches them for changes, so
+    that job statuses can be read locally. The list is redone every `resync_interval` seconds, and
+    after an error (e.g. an expired resource version) with an exponential backoff. Reads return
+    None while the cache is not synced, so that callers can fall back to the API.
+    """
+
+    def __init__(
+        self,
+        batch_api,
+        namespace: str,
+        label_selector: str = DAGSTER_JOB_LABEL_SELECTOR,
+        resync_interval: int = DEFAULT_INFORMER_RESYNC_INTERVAL,
+        min_backoff: float = DEFAULT_INFORMER_MIN_BACKOFF,
+        max_backoff: float = DEFAULT_INFORMER_MAX_BACKOFF,
+        watch_factory: Optional[Callable[[], Any]] = None,
+        logger=None,
+    ):
+        self._batch_api = batch_api
+        self._namespace = check.str_param(namespace, "namespace")
+        self._label_selector = check.str_param(label_selector, "label_selector")
+        self._resync_interval = check.int_param(resync_interval, "resync_interval")
+        self._min_backoff = check.numeric_param(min_backoff, "min_backoff")
+        self._max_backoff = check.numeric_param(max_backoff, "max_backoff")
+        self._watch_factory = watch_factory or kubernetes.watch.Watch
+        self._logger = logger or logging.getLogger("dagster_k8s")
+
+        self._lock = threading.Lock()
+        self._job_statuses: Dict[str, V1JobStatus] = {}
+        self._synced = threading.Event()
+        self._shutdown = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def namespace(self) -> str:
+        return self._namespace
+
+    @property
+    def has_synced(self) -> bool:
+        return self._synced.is_set()
+
+    def start(self) -> "DagsterK8sJobInformer":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"dagster_k8s_job_informer_{self._namespace}",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._shutdown.set()
+
+    def get_cached_job_status(self, job_name: str) -> Optional[V1JobStatus]:
+        """The status of the job from the cache, or None if the job is not cached or the cache is
+        not synced.
+        """
+        if not self.has_synced:
+            return None
+        with self._lock:
+            return self._job_statuses.get(job_name)
+
+    def _run(self) -> None:
+        backoff = self._min_backoff
+        while not self._shutdown.is_set():
+            try:
+                self.sync_once()
+                backoff = self._min_backoff
+            except Exception:
+                self._synced.clear()
+                self._logger.warning(
+                    f"Error watching Kubernetes jobs in namespace {self._namespace}, retrying in"
+                    f" {backoff} seconds",
+                    exc_info=True,
+                )
+                self._shutdown.wait(backoff)
+                backoff = min(backoff * 2, self._max_backoff)
+
+    def sync_once(self) -> None:
+        """List the jobs, then apply watch events to the cache until the watch times out after
+        `resync_interval` seconds.
+        """
+        job_list = self._batch_api.list_namespaced_job(
+            namespace=self._namespace, label_selector=self._label_selector
+        )
+        with self._lock:
+            self._job_statuses = {
+                job.metadata.name: job.status for job in job_list.items if job.status is not None
+            }
+        self._synced.set()
+
+        watch = self._watch_factory()
+        for event in watch.stream(
+            self._batch_api.list_namespaced_job,
+            namespace=self._namespace,
+            label_selector=self._label_selector,
+            resource_version=job_list.metadata.resource_version,
+            timeout_seconds=self._resync_interval,
+        ):
+            if self._shutdown.is_set():
+                watch.stop()
+                return
+
+            event_type = event["type"]
+            if event_type == "ERROR":
+                # most commonly a 410 Gone for an expired resource version, which requires a relist
+                raise DagsterK8sError(
+                    f"Error event while watching Kubernetes jobs: {event['raw_object']}"
+                )
+
+            job = event["object"]
+            with self._lock:
+                if event_type == "DELETED":
+                    self._job_statuses.pop(job.metadata.name, None)
+                elif job.status is not None:
+                    self._job_statuses[job.metadata.name] = job.status
+
+
+_job_informers: Dict[str, DagsterK8sJobInformer] = {}
+_job_informers_lock = threading.Lock()
+
+
+def get_shared_job_informer(batch_api, namespace: str) -> DagsterK8sJobInformer:
+    """The job informer for the namespace shared by every client in the process, started on first
+    use.
+    """
+    with _job_informers_lock:
+        if namespace not in _job_informers:
+            _job_informers[namespace] = DagsterK8sJobInformer(batch_api, namespace).start()
+        return _job_informers[namespace]
+
+
 class DagsterKubernetesClient:
-    def __init__(self, batch_api, core_api, logger, sleeper, timer):
+    def __init__(self, batch_api, core_api, logger, sleeper, timer, use_job_informer=False):
         self.batch_api = batch_api
         self.core_api = core_api
         self.logger = logger
         self.sleeper = sleeper
         self.timer = timer
+        self.use_job_informer = check.bool_param(use_job_informer, "use_job_informer")
 
     @staticmethod
-    def production_client(batch_api_override=None, core_api_override=None):
+    def production_client(batch_api_override=None, core_api_override=None, use_job_informer=None):
+        if use_job_informer is None:
+            use_job_informer = str(os.getenv("DAGSTER_K8S_USE_JOB_INFORMER")).lower() in (
+                "1",
+                "true",
+                "t",
+            )
         return DagsterKubernetesClient(
             batch_api=(
                 batch_api_override or kubernetes.client.BatchV1Api(api_client=PatchedApiClient())
@@ -253,6 +405,7 @@ def production_client(batch_api_override=None, core_api_override=None):
             logger=logging.info,
             sleeper=time.sleep,
             timer=time.time,
+            use_job_informer=use_job_informer,
         )
 
     ### Job operations ###
@@ -462,6 +615,15 @@ def get_job_status(
         namespace: str,
         wait_time_between_attempts=DEFAULT_WAIT_BETWEEN_ATTEMPTS,
     ) -> Optional[V1JobStatus]:
+        if self.use_job_informer:
+            # jobs that are not in the informer's cache yet, e.g. because they were just created,
+            # are read from the API
+            cached_status = get_shared_job_informer(
+                self.batch_api, namespace
+            ).get_cached_job_status(job_name)
+            if cached_status is not None:
+                return cached_status
+
         def _get_job_status():
             try:
                 job = self.batch_api.read_namespaced_job_status(job_name, namespace=namespace)
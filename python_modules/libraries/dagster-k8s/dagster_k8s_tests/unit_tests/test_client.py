@@ -5,8 +5,10 @@
 import kubernetes
 import pytest
 from dagster_k8s.client import (
+    DAGSTER_JOB_LABEL_SELECTOR,
     DagsterK8sAPIRetryLimitExceeded,
     DagsterK8sError,
+    DagsterK8sJobInformer,
     DagsterK8sUnrecoverableAPIError,
     DagsterKubernetesClient,
     KubernetesWaitingReasons,
@@ -21,6 +23,7 @@
     V1Job,
     V1JobList,
     V1JobStatus,
+    V1ListMeta,
     V1ObjectMeta,
     V1Pod,
     V1PodList,
@@ -1185,3 +1188,83 @@ def test_wait_for_ready_pod_is_deleted():
         mock_client.wait_for_pod(pod_name=pod_name, namespace="namespace")
 
     assert str(exc_info.value).startswith(f'Pod "{pod_name}" was unexpectedly killed')
+
+
+class FakeJobsApi:
+    """In-process stand-in for the batch API that serves a fixed set of jobs and watch events."""
+
+    def __init__(self, jobs, events):
+        self.jobs = jobs
+        self.events = events
+        self.list_calls = 0
+
+    def list_namespaced_job(self, namespace, label_selector=None, **kwargs):
+        self.list_calls += 1
+        return V1JobList(items=self.jobs, metadata=V1ListMeta(resource_version="1"))
+
+
+class FakeWatch:
+    def __init__(self, api):
+        self._api = api
+        self.stream_kwargs = None
+
+    def stream(self, fn, **kwargs):
+        self.stream_kwargs = kwargs
+        yield from self._api.events
+
+    def stop(self):
+        pass
+
+
+def _job(name, **status_kwargs):
+    return V1Job(metadata=V1ObjectMeta(name=name), status=V1JobStatus(**status_kwargs))
+
+
+def test_job_informer():
+    api = FakeJobsApi(
+        jobs=[_job("running", active=1), _job("deleted", active=1)],
+        events=[
+            {"type": "ADDED", "object": _job("added", active=1)},
+            {"type": "MODIFIED", "object": _job("running", succeeded=1)},
+            {"type": "DELETED", "object": _job("deleted", active=1)},
+        ],
+    )
+    watch = FakeWatch(api)
+    informer = DagsterK8sJobInformer(api, "namespace", watch_factory=lambda: watch)
+
+    assert not informer.has_synced
+    assert informer.get_cached_job_status("running") is None
+
+    informer.sync_once()
+
+    assert informer.has_synced
+    assert watch.stream_kwargs["resource_version"] == "1"
+    assert watch.stream_kwargs["label_selector"] == DAGSTER_JOB_LABEL_SELECTOR
+    assert informer.get_cached_job_status("running").succeeded == 1
+    assert informer.get_cached_job_status("added").active == 1
+    assert informer.get_cached_job_status("deleted") is None
+
+    api.events = [{"type": "ERROR", "raw_object": {"code": 410}}]
+    with pytest.raises(DagsterK8sError):
+        informer.sync_once()
+    assert api.list_calls == 2
+
+
+def test_get_job_status_from_informer():
+    mock_client = create_mocked_client()
+    mock_client.use_job_informer = True
+
+    informer = mock.MagicMock()
+    informer.get_cached_job_status.side_effect = lambda job_name: (
+        V1JobStatus(succeeded=1) if job_name == "cached" else None
+    )
+    with mock.patch("dagster_k8s.client.get_shared_job_informer", return_value=informer):
+        assert mock_client.get_job_status("cached", namespace="namespace").succeeded == 1
+        mock_client.batch_api.read_namespaced_job_status.assert_not_called()
+
+        # jobs missing from the cache are read from the API
+        mock_client.batch_api.read_namespaced_job_status.return_value = V1Job(
+            status=V1JobStatus(active=1)
+        )
+        assert mock_client.get_job_status("uncached", namespace="namespace").active == 1
+        mock_client.batch_api.read_namespaced_job_status.assert_called_once()
@@ -3,6 +3,7 @@
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     Dict,
     Literal,
     Mapping,
@@ -168,6 +169,10 @@ class BasePolarsUPathIOManager(ConfigurableIOManager, UPathIOManager):
 
     # If a child IOManager supports loading multiple partitions at once, it should override .load_partitions to immidiately return a LazyFrame (by using scan_df_from_path)
 
+    # partitions are scanned concurrently, since fsspec filesystems and polars can be used from
+    # several threads
+    max_concurrent_partition_loads: ClassVar[int] = 8
+
     base_dir: Optional[str] = Field(default=None, description="Base directory for storing files.")
     cloud_storage_options: Optional[Mapping[str, Any]] = Field(
         default=None,
@@ -6,9 +6,12 @@
 import sqlalchemy.dialects as db_dialects
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
-from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.errors import (
+    DagsterEventBatchPartiallyStoredError,
+    DagsterInvariantViolationError,
+)
 from dagster._core.event_api import EventHandlerFn
-from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS, BATCH_WRITABLE_EVENTS
+from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.config import pg_config
 from dagster._core.storage.event_log import (
@@ -30,16 +33,19 @@
 )
 from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._serdes import ConfigurableClass, ConfigurableClassData, deserialize_value
-from sqlalchemy import event
 from sqlalchemy.engine import Connection
 
 from dagster_postgres.utils import (
+    PostgresConnectionMetrics,
     create_pg_connection,
+    create_pg_engine,
+    create_webserver_pg_engine,
+    dispose_pg_engine,
+    get_pg_connection_metrics,
     pg_alembic_config,
     pg_url_from_config,
     retry_pg_connection_fn,
     retry_pg_creation_fn,
-    set_pg_statement_timeout,
 )
 
 CHANNEL_NAME = "run_events"
@@ -79,6 +85,7 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[Mapping[str, Any]] = None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
@@ -86,10 +93,8 @@ def __init__(
             should_autocreate_tables, "should_autocreate_tables"
         )
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
-        )
+        self.pool_config = check.opt_nullable_mapping_param(pool_config, "pool_config")
+        self._engine = create_pg_engine(self.postgres_url, self.pool_config)
         self._event_watcher: Optional[SqlPollingEventWatcher] = None
 
         self._secondary_index_cache = {}
@@ -113,20 +118,21 @@ def _init_db(self) -> None:
 
     def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> None:
         # When running in dagster-webserver, hold an open connection and set statement_timeout
-        kwargs = {
-            "isolation_level": "AUTOCOMMIT",
-            "pool_size": 1,
-            "pool_recycle": pool_recycle,
-        }
-        existing_options = self._engine.url.query.get("options")
-        if existing_options:
-            kwargs["connect_args"] = {"options": existing_options}
-        self._engine = create_engine(self.postgres_url, **kwargs)
-        event.listen(
+        webserver_engine = create_webserver_pg_engine(
+            self.postgres_url,
             self._engine,
-            "connect",
-            lambda connection, _: set_pg_statement_timeout(connection, statement_timeout),
+            self.pool_config,
+            statement_timeout=statement_timeout,
+            pool_recycle=pool_recycle,
         )
+        # close the pooled connections of the replaced engine, unless other storages share it
+        dispose_pg_engine(self._engine)
+        self._engine = webserver_engine
+
+    @property
+    def connection_metrics(self) -> PostgresConnectionMetrics:
+        """Counts of the database connections opened and used by this storage."""
+        return get_pg_connection_metrics(self._engine)
 
     def upgrade(self) -> None:
         alembic_config = pg_alembic_config(__file__)
@@ -149,6 +155,7 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -207,26 +214,31 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+        self._update_asset_status_cache_on_write([event], [event_id])
+
     def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
-        check.sequence_param(events, "event", of_type=EventLogEntry)
+        """Store a batch of events in a single multi-row insert, returning the storage ids of all
+        events in one round trip.
 
-        check.invariant(
-            all(event.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS for event in events),
-            f"{BATCH_WRITABLE_EVENTS} are the only currently supported events for batch writes.",
-        )
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
 
         insert_event_statement = self.prepare_insert_event_batch(events)
         with self._connect() as conn:
             result = conn.execute(insert_event_statement.returning(SqlEventLogStorageTable.c.id))
             event_ids = [cast(int, row[0]) for row in result.fetchall()]
 
-        # We only update the asset table with the last event
-        self.store_asset_event(events[-1], event_ids[-1])
-
-        if any((event_id is None for event_id in event_ids)):
-            raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
-
-        self.store_asset_event_tags(events, event_ids)
+        try:
+            self._store_index_rows_for_event_batch(events, event_ids)
+            self._update_asset_status_cache_on_write(events, event_ids)
+        except Exception as e:
+            raise DagsterEventBatchPartiallyStoredError(
+                f"Error while storing event batch: {e}", num_stored=len(events)
+            ) from e
 
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
@@ -288,8 +300,9 @@ def add_dynamic_partitions(
 
         # Overload base implementation to push upsert logic down into the db layer
         self._check_partitions_table()
-        with self.index_connection() as conn:
-            conn.execute(
+        has_versions = self._ensure_dynamic_partitions_version_row(partitions_def_name)
+        with self.index_transaction() as conn:
+            result = conn.execute(
                 db_dialects.postgresql.insert(DynamicPartitionsTable)
                 .values(
                     [
@@ -299,6 +312,10 @@ def add_dynamic_partitions(
                 )
                 .on_conflict_do_nothing(),
             )
+            if has_versions and result.rowcount:
+                conn.execute(
+                    self._increment_dynamic_partitions_version_statement(partitions_def_name)
+                )
 
     def _connect(self) -> ContextManager[Connection]:
         return create_pg_connection(self._engine)
@@ -321,7 +338,8 @@ def index_transaction(self) -> Iterator[Connection]:
                     yield conn
 
     def has_table(self, table_name: str) -> bool:
-        return bool(self._engine.dialect.has_table(self._engine.connect(), table_name))
+        with self._engine.connect() as conn:
+            return bool(self._engine.dialect.has_table(conn, table_name))
 
     def has_secondary_index(self, name: str) -> bool:
         if name not in self._secondary_index_cache:
@@ -365,6 +383,7 @@ def dispose(self) -> None:
         if self._event_watcher:
             self._event_watcher.close()
             self._event_watcher = None
+        dispose_pg_engine(self._engine)
 
     def alembic_version(self) -> AlembicVersion:
         alembic_config = pg_alembic_config(__file__)
@@ -1,4 +1,4 @@
-from typing import ContextManager, Optional, Sequence
+from typing import Any, ContextManager, Mapping, Optional, Sequence
 
 import dagster._check as check
 import sqlalchemy as db
@@ -25,16 +25,19 @@
 )
 from dagster._serdes import ConfigurableClass, ConfigurableClassData, serialize_value
 from dagster._time import get_current_datetime
-from sqlalchemy import event
 from sqlalchemy.engine import Connection
 
 from dagster_postgres.utils import (
+    PostgresConnectionMetrics,
     create_pg_connection,
+    create_pg_engine,
+    create_webserver_pg_engine,
+    dispose_pg_engine,
+    get_pg_connection_metrics,
     pg_alembic_config,
     pg_url_from_config,
     retry_pg_connection_fn,
     retry_pg_creation_fn,
-    set_pg_statement_timeout,
 )
 
 
@@ -71,6 +74,7 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[Mapping[str, Any]] = None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = postgres_url
@@ -78,10 +82,8 @@ def __init__(
             should_autocreate_tables, "should_autocreate_tables"
         )
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
-        )
+        self.pool_config = check.opt_nullable_mapping_param(pool_config, "pool_config")
+        self._engine = create_pg_engine(self.postgres_url, self.pool_config)
 
         # Stamp and create tables if the main table does not exist (we can't check alembic
         # revision because alembic config may be shared with other storage classes)
@@ -105,20 +107,24 @@ def _init_db(self) -> None:
 
     def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> None:
         # When running in dagster-webserver, hold an open connection and set statement_timeout
-        kwargs = {
-            "isolation_level": "AUTOCOMMIT",
-            "pool_size": 1,
-            "pool_recycle": pool_recycle,
-        }
-        existing_options = self._engine.url.query.get("options")
-        if existing_options:
-            kwargs["connect_args"] = {"options": existing_options}
-        self._engine = create_engine(self.postgres_url, **kwargs)
-        event.listen(
+        webserver_engine = create_webserver_pg_engine(
+            self.postgres_url,
             self._engine,
-            "connect",
-            lambda connection, _: set_pg_statement_timeout(connection, statement_timeout),
+            self.pool_config,
+            statement_timeout=statement_timeout,
+            pool_recycle=pool_recycle,
         )
+        # close the pooled connections of the replaced engine, unless other storages share it
+        dispose_pg_engine(self._engine)
+        self._engine = webserver_engine
+
+    @property
+    def connection_metrics(self) -> PostgresConnectionMetrics:
+        """Counts of the database connections opened and used by this storage."""
+        return get_pg_connection_metrics(self._engine)
+
+    def dispose(self) -> None:
+        dispose_pg_engine(self._engine)
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
@@ -136,6 +142,7 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
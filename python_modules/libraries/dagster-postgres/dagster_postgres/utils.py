@@ -1,7 +1,9 @@
 import logging
+import threading
 import time
+import weakref
 from contextlib import contextmanager
-from typing import Any, Callable, Iterator, Mapping, Optional, TypeVar
+from typing import Any, Callable, Dict, Iterator, Mapping, NamedTuple, Optional, Tuple, TypeVar
 from urllib.parse import quote, urlencode
 
 import alembic.config
@@ -10,13 +12,15 @@
 import psycopg2.extensions
 import sqlalchemy
 import sqlalchemy.exc
+import sqlalchemy.pool as db_pool
 from dagster import _check as check
 from dagster._core.definitions.policy import Backoff, Jitter, calculate_delay
 
 # re-export
 from dagster._core.storage.config import pg_config as pg_config
 from dagster._core.storage.event_log.sql_event_log import SqlDbConnection
-from dagster._core.storage.sql import get_alembic_config
+from dagster._core.storage.sql import create_engine, get_alembic_config
+from sqlalchemy import event
 from sqlalchemy.engine import Connection
 
 T = TypeVar("T")
@@ -154,6 +158,173 @@ def pg_alembic_config(
     )
 
 
+class PostgresConnectionMetrics(
+    NamedTuple(
+        "_PostgresConnectionMetrics",
+        [
+            ("connections_opened", int),
+            ("connections_closed", int),
+            ("connections_invalidated", int),
+            ("checkouts", int),
+            ("checked_out", int),
+        ],
+    )
+):
+    """Counts of the database connections opened and used by a postgres storage engine.
+
+    Args:
+        connections_opened (int): The number of new connections opened to the database.
+        connections_closed (int): The number of connections closed.
+        connections_invalidated (int): The number of connections discarded because they were found
+            to be disconnected, or were replaced after exceeding pool_recycle.
+        checkouts (int): The number of times a connection was used to run queries. Without a
+            connection pool, each checkout opens a new connection.
+        checked_out (int): The number of connections currently in use.
+    """
+
+
+class _ConnectionMetricsCounter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {field: 0 for field in PostgresConnectionMetrics._fields}
+
+    def increment(self, field: str, value: int = 1) -> None:
+        with self._lock:
+            self._counts[field] += value
+
+    def snapshot(self) -> PostgresConnectionMetrics:
+        with self._lock:
+            return PostgresConnectionMetrics(**self._counts)
+
+
+# connection metrics for each engine created by create_pg_engine
+_engine_metrics: "weakref.WeakKeyDictionary[sqlalchemy.engine.Engine, _ConnectionMetricsCounter]"
+_engine_metrics = weakref.WeakKeyDictionary()
+
+_shared_engines_lock = threading.Lock()
+_shared_engines: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], sqlalchemy.engine.Engine] = {}
+
+
+def _instrument_pg_engine(engine: sqlalchemy.engine.Engine) -> sqlalchemy.engine.Engine:
+    counter = _ConnectionMetricsCounter()
+    _engine_metrics[engine] = counter
+
+    def _on_connect(_dbapi_connection, _connection_record):
+        counter.increment("connections_opened")
+
+    def _on_close(_dbapi_connection, _connection_record):
+        counter.increment("connections_closed")
+
+    def _on_invalidate(_dbapi_connection, _connection_record, _exception):
+        counter.increment("connections_invalidated")
+
+    def _on_checkout(_dbapi_connection, _connection_record, _connection_proxy):
+        counter.increment("checkouts")
+        counter.increment("checked_out")
+
+    def _on_checkin(_dbapi_connection, _connection_record):
+        counter.increment("checked_out", -1)
+
+    event.listen(engine, "connect", _on_connect)
+    event.listen(engine, "close", _on_close)
+    event.listen(engine, "invalidate", _on_invalidate)
+    event.listen(engine, "soft_invalidate", _on_invalidate)
+    event.listen(engine, "checkout", _on_checkout)
+    event.listen(engine, "checkin", _on_checkin)
+    return engine
+
+
+def get_pg_connection_metrics(engine: sqlalchemy.engine.Engine) -> PostgresConnectionMetrics:
+    """Returns the connection metrics for an engine created by create_pg_engine."""
+    counter = _engine_metrics.get(engine)
+    return counter.snapshot() if counter else PostgresConnectionMetrics(0, 0, 0, 0, 0)
+
+
+def _pg_pool_kwargs(pool_config: Mapping[str, Any]) -> Mapping[str, Any]:
+    return {
+        "pool_size": pool_config.get("pool_size", 5),
+        "max_overflow": pool_config.get("max_overflow", 10),
+        "pool_timeout": pool_config.get("pool_timeout", 30),
+        "pool_recycle": pool_config.get("pool_recycle", 3600),
+        "pool_pre_ping": pool_config.get("pool_pre_ping", True),
+    }
+
+
+def create_pg_engine(
+    postgres_url: str, pool_config: Optional[Mapping[str, Any]] = None
+) -> sqlalchemy.engine.Engine:
+    """Create the engine used by a postgres storage.
+
+    Without a pool config, no connections are held open, to prevent accumulating connections per
+    DagsterInstance. With a pool config, connections are pooled according to its settings, and if
+    `share_engine` is set, a single engine is shared by every storage in the process that uses the
+    same url and pool settings.
+    """
+    check.str_param(postgres_url, "postgres_url")
+    check.opt_nullable_mapping_param(pool_config, "pool_config")
+
+    if pool_config is None:
+        return _instrument_pg_engine(
+            create_engine(postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool)
+        )
+
+    pool_kwargs = _pg_pool_kwargs(pool_config)
+    if not pool_config.get("share_engine", False):
+        return _instrument_pg_engine(
+            create_engine(postgres_url, isolation_level="AUTOCOMMIT", **pool_kwargs)
+        )
+
+    key = (postgres_url, tuple(sorted(pool_kwargs.items())))
+    with _shared_engines_lock:
+        if key not in _shared_engines:
+            _shared_engines[key] = _instrument_pg_engine(
+                create_engine(postgres_url, isolation_level="AUTOCOMMIT", **pool_kwargs)
+            )
+        return _shared_engines[key]
+
+
+def create_webserver_pg_engine(
+    postgres_url: str,
+    existing_engine: sqlalchemy.engine.Engine,
+    pool_config: Optional[Mapping[str, Any]],
+    statement_timeout: int,
+    pool_recycle: int,
+) -> sqlalchemy.engine.Engine:
+    """Create the engine used by a postgres storage in dagster-webserver, which holds connections
+    open and sets a statement timeout on each of them.
+
+    The engine is never shared, since the statement timeout is set per storage.
+    """
+    kwargs: Dict[str, Any] = {
+        "isolation_level": "AUTOCOMMIT",
+        "pool_size": 1,
+        "pool_recycle": pool_recycle,
+    }
+    if pool_config is not None:
+        kwargs.update(_pg_pool_kwargs(pool_config))
+        kwargs["pool_recycle"] = pool_recycle
+    existing_options = existing_engine.url.query.get("options")
+    if existing_options:
+        kwargs["connect_args"] = {"options": existing_options}
+    engine = create_engine(postgres_url, **kwargs)
+    event.listen(
+        engine,
+        "connect",
+        lambda connection, _: set_pg_statement_timeout(connection, statement_timeout),
+    )
+    return _instrument_pg_engine(engine)
+
+
+def dispose_pg_engine(engine: sqlalchemy.engine.Engine) -> None:
+    """Close the pooled connections of an engine created by create_pg_engine, unless it is shared
+    with other storages.
+    """
+    with _shared_engines_lock:
+        if any(shared_engine is engine for shared_engine in _shared_engines.values()):
+            return
+    engine.dispose()
+
+
 @contextmanager
 def create_pg_connection(
     engine: sqlalchemy.engine.Engine,
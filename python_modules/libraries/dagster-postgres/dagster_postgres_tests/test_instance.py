@@ -158,6 +158,22 @@ def schema_specified_pg_config(hostname):
     """
 
 
+def pooled_pg_config(hostname, share_engine=False):
+    return f"""
+      storage:
+        postgres:
+          postgres_db:
+            username: test
+            password: test
+            hostname: {hostname}
+            db_name: test
+          pool:
+            pool_size: 2
+            max_overflow: 0
+            share_engine: {str(share_engine).lower()}
+    """
+
+
 def test_load_instance(hostname):
     with instance_for_test(overrides=yaml.safe_load(full_pg_config(hostname))):
         pass
@@ -313,3 +329,76 @@ def test_configured_other_schema(hostname):
         instance.get_runs()
         instance.all_asset_keys()
         instance.all_instigator_state()
+
+
+def test_connection_pool(hostname):
+    with instance_for_test(overrides=yaml.safe_load(unified_pg_config(hostname))) as instance:
+        run_storage = instance._run_storage._storage.run_storage  # noqa: SLF001
+        before = run_storage.connection_metrics
+        for _ in range(5):
+            instance.get_runs()
+        after = run_storage.connection_metrics
+
+        # without a pool, every query opens a new connection
+        assert after.checkouts - before.checkouts >= 5
+        assert after.connections_opened - before.connections_opened >= 5
+
+    with instance_for_test(overrides=yaml.safe_load(pooled_pg_config(hostname))) as instance:
+        storage = instance._run_storage._storage  # noqa: SLF001
+        before = storage.run_storage.connection_metrics
+        for _ in range(5):
+            instance.get_runs()
+        after = storage.run_storage.connection_metrics
+
+        assert after.checkouts - before.checkouts >= 5
+        assert after.connections_opened <= 2
+        assert after.checked_out == 0
+        assert storage.run_storage._engine is not storage.event_log_storage._engine  # noqa: SLF001
+
+
+def test_shared_connection_pool(hostname):
+    with instance_for_test(
+        overrides=yaml.safe_load(pooled_pg_config(hostname, share_engine=True))
+    ) as instance:
+        storage = instance._run_storage._storage  # noqa: SLF001
+        engine = storage.run_storage._engine  # noqa: SLF001
+        assert storage.event_log_storage._engine is engine  # noqa: SLF001
+        assert storage.schedule_storage._engine is engine  # noqa: SLF001
+
+        instance.get_runs()
+        instance.all_asset_keys()
+        instance.all_instigator_state()
+        assert storage.run_storage.connection_metrics.connections_opened <= 2
+
+    # disposing an instance does not close the connections of a shared pool
+    with instance_for_test(
+        overrides=yaml.safe_load(pooled_pg_config(hostname, share_engine=True))
+    ) as instance:
+        assert instance._run_storage._storage.run_storage._engine is engine  # noqa: SLF001
+        instance.get_runs()
+
+
+def test_optimize_for_webserver_disposes_replaced_engine(hostname):
+    with instance_for_test(overrides=yaml.safe_load(pooled_pg_config(hostname))) as instance:
+        run_storage = instance._run_storage._storage.run_storage  # noqa: SLF001
+        instance.get_runs()
+        engine = run_storage._engine  # noqa: SLF001
+        assert engine.pool.checkedin() > 0
+
+        instance.optimize_for_webserver(statement_timeout=100, pool_recycle=100)
+        assert run_storage._engine is not engine  # noqa: SLF001
+        assert engine.pool.checkedin() == 0
+        instance.get_runs()
+
+    with instance_for_test(
+        overrides=yaml.safe_load(pooled_pg_config(hostname, share_engine=True))
+    ) as instance:
+        storage = instance._run_storage._storage  # noqa: SLF001
+        shared_engine = storage.event_log_storage._engine  # noqa: SLF001
+        instance.get_runs()
+        storage.run_storage.optimize_for_webserver(statement_timeout=100, pool_recycle=100)
+
+        # an engine shared with other storages is left open
+        assert storage.event_log_storage._engine is shared_engine  # noqa: SLF001
+        assert shared_engine.pool.checkedin() > 0
+        instance.all_asset_keys()